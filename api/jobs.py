@@ -0,0 +1,145 @@
+"""API 작업(Job) 저장소
+
+요청마다 작업 ID를 발급하고 진행 이벤트(상태, 토큰, 필드, 결과)를 순서대로 보관합니다.
+SSE 클라이언트는 끊긴 지점(Last-Event-ID) 이후 이벤트부터 다시 받을 수 있고,
+같은 Idempotency-Key로 재시도한 요청은 새 LLM 호출 없이 기존 작업에 연결됩니다.
+모든 메서드는 서버 이벤트 루프 스레드에서 호출해야 합니다.
+"""
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from api.schemas import JobStatus
+
+
+class IdempotencyConflictError(ValueError):
+    """같은 Idempotency-Key로 다른 내용의 요청이 들어옴"""
+    pass
+
+
+@dataclass
+class Job:
+    """비동기로 실행되는 파이프라인 작업 하나"""
+    job_id: str
+    kind: str
+    tenant: str
+    request_hash: str
+    status: JobStatus = "queued"
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+    events: list[tuple[str, Any]] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def publish(self, event: str, data: Any) -> None:
+        """이벤트 추가 후 대기 중인 구독자 깨우기"""
+        self.events.append((event, data))
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def subscribe(self, after: int = 0) -> AsyncIterator[tuple[int, str, Any]]:
+        """(이벤트 번호, 이벤트명, 데이터)를 작업이 끝날 때까지 순서대로 반환
+
+        Args:
+            after: 이미 받은 마지막 이벤트 번호 (1부터 시작, 재연결 시 Last-Event-ID)
+        """
+        cursor = after
+        while True:
+            waiter = self._changed
+            while cursor < len(self.events):
+                event, data = self.events[cursor]
+                cursor += 1
+                yield cursor, event, data
+            if self.finished:
+                return
+            await waiter.wait()
+
+
+class JobStore:
+    """작업과 Idempotency-Key 매핑 보관소 (오래된 완료 작업부터 제거)"""
+
+    def __init__(self, max_jobs: int, ttl_seconds: float) -> None:
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._idempotency: dict[tuple[str, str], str] = {}
+
+    def get(self, job_id: str, tenant: str) -> Optional[Job]:
+        """작업 조회 (다른 사용자의 작업은 보이지 않음)"""
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.tenant == tenant else None
+
+    def create(
+        self,
+        kind: str,
+        tenant: str,
+        request_hash: str,
+        idempotency_key: Optional[str],
+    ) -> tuple[Job, bool]:
+        """작업 생성 또는 같은 Idempotency-Key의 기존 작업 반환
+
+        Returns:
+            (작업, 새로 만들었는지 여부)
+
+        Raises:
+            IdempotencyConflictError: 같은 키로 다른 종류/내용의 요청을 보낸 경우
+        """
+        self._evict()
+        scoped_key = (tenant, idempotency_key) if idempotency_key else None
+        if scoped_key and scoped_key in self._idempotency:
+            job = self._jobs[self._idempotency[scoped_key]]
+            if job.kind != kind or job.request_hash != request_hash:
+                raise IdempotencyConflictError("같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다.")
+            return job, False
+
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, tenant=tenant, request_hash=request_hash)
+        self._jobs[job.job_id] = job
+        if scoped_key:
+            self._idempotency[scoped_key] = job.job_id
+        return job, True
+
+    def start(self, job: Job, run: Callable[[Job], Awaitable[Any]]) -> None:
+        """작업 실행 태스크 시작 (결과/오류는 이벤트로도 발행)"""
+        job.task = asyncio.get_running_loop().create_task(self._run(job, run))
+
+    async def _run(self, job: Job, run: Callable[[Job], Awaitable[Any]]) -> None:
+        job.status = "running"
+        job.publish("status", {"status": job.status})
+        try:
+            job.result = await run(job)
+            job.status = "succeeded"
+            job.publish("result", job.result)
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+            job.publish("error", {"message": job.error})
+        finally:
+            job.finished_at = time.monotonic()
+            job.publish("status", {"status": job.status})
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.ttl_seconds
+        ]
+        overflow = len(self._jobs) - len(expired) - self.max_jobs + 1
+        if overflow > 0:
+            expired += [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished and job_id not in expired
+            ][:overflow]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if expired:
+            removed = set(expired)
+            self._idempotency = {k: v for k, v in self._idempotency.items() if v not in removed}
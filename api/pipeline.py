@@ -0,0 +1,124 @@
+"""API 엔드포인트별 파이프라인 실행 함수
+
+UI와 같은 체인, 모델 인스턴스, 공용 캐시(공고 중복 인덱스, 리서치 캐시)를 사용합니다.
+모든 함수는 작업 스레드에서 실행되며 `emit(이벤트명, 데이터)`로 중간 결과를 전달합니다.
+"""
+from dataclasses import asdict
+from typing import Any, Callable, cast
+
+from pydantic_core import to_jsonable_python
+
+from api.schemas import (
+    BulkDraftRequest,
+    BulkReviewRequest,
+    DraftRequest,
+    ReviewRequest,
+    StrategyRequest,
+    ValidationRequest,
+)
+from chains.batch_chain import run_bulk_drafts, run_bulk_reviews
+from chains.review_chain import generate_final_essays, plan_final_reviews
+from chains.strategy_chain import (
+    build_initial_strategy_inputs,
+    create_initial_strategy_chain,
+    extract_writing_strategy,
+)
+from chains.validation_chain import (
+    find_cached_validation,
+    remember_validation,
+    stream_resume_input_validation,
+)
+from chains.writing_chain import generate_draft_candidates
+from config.settings import settings
+from models.output_models import CompanyResearch
+from models.state import ResumeState
+from tools.research_cache import get_research_cache
+
+Emit = Callable[[str, Any], None]
+
+
+def run_validation(request: ValidationRequest, emit: Emit) -> dict:
+    """입력 검증 (근접 중복 공고의 이전 결과가 있으면 재사용, 없으면 필드 단위 스트리밍)"""
+    state = cast(ResumeState, request.to_state())
+    cached = find_cached_validation(state)
+    if cached is not None:
+        result, similarity = cached
+        emit("cache_hit", {"source": "posting_index", "similarity": similarity})
+        return result.model_dump()
+
+    stream = stream_resume_input_validation(state)
+    for name, value in stream:
+        emit("field", {"name": name, "value": to_jsonable_python(value)})
+    assert stream.result is not None
+    remember_validation(state, stream.result)
+    return stream.result.model_dump()
+
+
+def run_strategy(request: StrategyRequest, emit: Emit) -> dict:
+    """초기 전략 수립 (리서치가 없으면 공용 리서치 캐시 사용)"""
+    state = request.to_state()
+    research = request.company_research
+    if not research:
+        cached = get_research_cache().latest(
+            request.company_name, request.position_name, settings.research_cache_ttl_days
+        )
+        if cached is not None:
+            research = cached.content
+            emit("cache_hit", {"source": "research_cache", "version": cached.version})
+    state["company_research"] = CompanyResearch(content=research) if research else None
+
+    result = create_initial_strategy_chain(model=request.model).invoke(build_initial_strategy_inputs(state))
+    return {"content": result.content}  # type: ignore[union-attr]
+
+
+def run_drafts(request: DraftRequest, emit: Emit) -> dict:
+    """문항별 초안 토너먼트 (점수 내림차순 후보 목록)"""
+    candidates = generate_draft_candidates(
+        _draft_state(request),
+        request.model_pool or settings.draft_model_pool,
+        request.candidates_per_question or settings.draft_candidates_per_question,
+        settings.draft_min_good_candidates,
+        settings.draft_good_score,
+    )
+    return to_jsonable_python(candidates)
+
+
+def run_review(request: ReviewRequest, emit: Emit) -> dict:
+    """선택한 초안과 피드백으로 문항별 최종본 생성 (문항별 검토 경로는 triage 이벤트로 전달)"""
+    state = _review_state(request)
+    plan = plan_final_reviews(state)  # type: ignore[arg-type]
+    emit("triage", {q_idx: asdict(triage) for q_idx, triage in plan.items()})
+    return generate_final_essays(state, plan)  # type: ignore[arg-type]
+
+
+def run_batch_drafts(request: BulkDraftRequest, emit: Emit) -> dict:
+    """여러 지원서의 초안 후보를 provider 배치 API로 생성 (배치 상태는 batch 이벤트로 전달)"""
+    applications = {app_id: _draft_state(draft) for app_id, draft in request.applications.items()}
+    candidates = run_bulk_drafts(
+        applications,
+        request.model_pool or settings.draft_model_pool,
+        request.candidates_per_question or settings.draft_candidates_per_question,
+        on_status=lambda batches: emit("batch", batches),
+    )
+    return to_jsonable_python(candidates)
+
+
+def run_batch_reviews(request: BulkReviewRequest, emit: Emit) -> dict:
+    """여러 지원서의 최종 검토를 provider 배치 API로 실행"""
+    applications = {app_id: _review_state(review) for app_id, review in request.applications.items()}
+    return run_bulk_reviews(applications, on_status=lambda batches: emit("batch", batches))
+
+
+def _draft_state(request: DraftRequest) -> dict[str, Any]:
+    state = request.to_state()
+    state["writing_strategy"] = extract_writing_strategy(request.writing_strategy)
+    state["writing_guidelines"] = request.writing_guidelines
+    return state
+
+
+def _review_state(request: ReviewRequest) -> dict[str, Any]:
+    state = request.to_state()
+    state["generated_drafts"] = {key: [draft] for key, draft in request.drafts.items()}
+    state["draft_feedbacks"] = request.feedbacks
+    state["writing_guidelines"] = request.writing_guidelines
+    return state
@@ -0,0 +1,103 @@
+"""API 요청/응답 모델"""
+from typing import Annotated, Any, Literal, Optional
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from config.settings import MAX_CANDIDATES_PER_QUESTION, settings
+from tools.llm_util import MODEL_PROVIDER_MAP
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+def _known_model(model: str) -> str:
+    if model not in MODEL_PROVIDER_MAP:
+        raise ValueError(f"지원하지 않는 모델입니다: {model} (사용 가능: {', '.join(MODEL_PROVIDER_MAP)})")
+    return model
+
+
+# MODEL_PROVIDER_MAP에 등록된 모델명
+ModelName = Annotated[str, AfterValidator(_known_model)]
+
+
+class EssayQuestion(BaseModel):
+    question_text: str = Field(description="자기소개서 문항")
+    char_limit: Optional[int] = Field(default=None, description="글자 수 제한")
+
+
+class ApplicationInput(BaseModel):
+    """모든 엔드포인트가 공통으로 받는 지원 정보 (ResumeState의 입력 필드)"""
+    company_name: str
+    position_name: str
+    job_posting: str
+    essay_questions: list[EssayQuestion] = Field(min_length=1)
+    user_experiences: str
+
+    def to_state(self) -> dict[str, Any]:
+        """체인에 전달할 ResumeState 형태의 dict"""
+        state = self.model_dump(exclude={"essay_questions"})
+        state["essay_questions"] = [q.model_dump() for q in self.essay_questions]
+        return state
+
+
+class ValidationRequest(ApplicationInput):
+    job_posting_structured: bool = Field(
+        default=False, description="job_posting이 채용 페이지 구조화 데이터(JSON-LD) 정리본이면 true (공고 정리 생략)"
+    )
+
+    def to_state(self) -> dict[str, Any]:
+        state = super().to_state()
+        state["structured_job_posting"] = state.pop("job_posting_structured") and self.job_posting or None
+        return state
+
+
+class StrategyRequest(ApplicationInput):
+    company_research: str = Field(
+        default="", description="기업 리서치 리포트 (비어 있으면 공용 리서치 캐시에서 조회)"
+    )
+    model: Optional[ModelName] = Field(default=None, description="전략 수립 모델 (없으면 모델 라우터가 선택)")
+
+
+class DraftRequest(ApplicationInput):
+    writing_strategy: str = Field(description="확정된 전략 Markdown 문서")
+    writing_guidelines: Optional[str] = Field(default=None, description="작성 가이드 (없으면 기본 가이드)")
+    model_pool: Optional[list[ModelName]] = Field(
+        default=None, min_length=1, description="초안 모델 풀 (기본: settings.draft_model_pool)"
+    )
+    candidates_per_question: Optional[int] = Field(
+        default=None, ge=1, le=MAX_CANDIDATES_PER_QUESTION, description="문항별 초안 후보 수"
+    )
+
+
+class ReviewRequest(ApplicationInput):
+    drafts: dict[str, str] = Field(description="문항 번호(1부터) -> 선택한 초안")
+    feedbacks: dict[str, str] = Field(default_factory=dict, description="문항 번호 -> 수정 요청사항")
+    writing_guidelines: Optional[str] = None
+
+
+class BulkDraftRequest(BaseModel):
+    """여러 지원서의 초안을 provider 배치 API로 생성 (결과는 수 분~24시간 뒤)"""
+    applications: dict[str, DraftRequest] = Field(
+        min_length=1, max_length=settings.batch_max_applications, description="지원서 ID -> 초안 요청"
+    )
+    model_pool: Optional[list[ModelName]] = Field(
+        default=None, min_length=1, description="초안 모델 풀 (기본: settings.draft_model_pool)"
+    )
+    candidates_per_question: Optional[int] = Field(
+        default=None, ge=1, le=MAX_CANDIDATES_PER_QUESTION, description="문항별 초안 후보 수"
+    )
+
+
+class BulkReviewRequest(BaseModel):
+    """여러 지원서의 최종 검토를 provider 배치 API로 실행"""
+    applications: dict[str, ReviewRequest] = Field(
+        min_length=1, max_length=settings.batch_max_applications, description="지원서 ID -> 검토 요청"
+    )
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: JobStatus
+    events_url: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
@@ -0,0 +1,184 @@
+"""파이프라인 HTTP API (FastAPI)
+
+검증/전략/초안/최종본 생성을 작업(Job)으로 실행하고 진행 상황을 SSE로 스트리밍합니다.
+
+- POST /v1/{validation|strategy|drafts|reviews}: 작업 생성 (202, 같은 Idempotency-Key 재시도는 200 + 기존 작업)
+- POST /v1/batch/{drafts|reviews}: 여러 지원서를 provider 배치 API로 일괄 실행 (배치 상태는 batch 이벤트)
+- GET /v1/jobs/{job_id}: 작업 상태/결과
+- GET /v1/jobs/{job_id}/events: SSE 이벤트 (status, token, field, cache_hit, batch, result, error)
+  재연결 시 Last-Event-ID 헤더 이후 이벤트부터 다시 전송
+- Authorization: Bearer <API 키> 필수. 사용자는 키로 결정되며(settings.api_keys, 공용 settings.access_key)
+  사용자별 동시 호출/토큰 한도(config.tenancy)와 작업 조회 범위에 쓰입니다.
+
+실행: pip install -e ".[api]" && uvicorn api.server:app
+"""
+import asyncio
+import contextvars
+import hashlib
+import hmac
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from dotenv import load_dotenv
+
+# 환경 변수 먼저 로드 (settings 임포트 전에 실행)
+load_dotenv()
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from api import pipeline
+from api.jobs import IdempotencyConflictError, Job, JobStore
+from api.schemas import (
+    BulkDraftRequest,
+    BulkReviewRequest,
+    DraftRequest,
+    JobResponse,
+    ReviewRequest,
+    StrategyRequest,
+    ValidationRequest,
+)
+from api.streaming import stream_tokens
+from config.settings import settings
+from config.tenancy import tenant_context
+
+# settings.access_key로 인증한 요청의 사용자 ID
+_ACCESS_KEY_USER = "access-key"
+
+_bearer = HTTPBearer(auto_error=False)
+
+# 기본 executor(CPU 수 + 4)는 LLM 응답을 기다리는 작업만으로 가득 차므로 별도 풀 사용
+_job_executor = ThreadPoolExecutor(max_workers=settings.api_job_workers, thread_name_prefix="api-job")
+
+
+def create_app() -> FastAPI:
+    """API 앱 생성 (앱마다 독립된 작업 저장소 사용)"""
+    app = FastAPI(title="Resume Assistant API")
+    store = JobStore(settings.api_max_jobs, settings.api_job_ttl_seconds)
+
+    def add_job_route(path: str, kind: str, request_model: type[BaseModel], run: Callable[[Any, Any], Any]) -> None:
+        async def submit(
+            body: request_model,  # type: ignore[valid-type]
+            response: Response,
+            idempotency_key: Optional[str] = Header(default=None),
+            tenant: str = Depends(authenticate),
+        ) -> JobResponse:
+            request: BaseModel = body
+            request_hash = hashlib.sha256(request.model_dump_json().encode("utf-8")).hexdigest()
+            try:
+                job, created = store.create(kind, tenant, request_hash, idempotency_key)
+            except IdempotencyConflictError as e:
+                raise HTTPException(status_code=409, detail=str(e))
+            if created:
+                store.start(job, lambda job: _run_in_thread(job, run, body))
+                response.status_code = 202
+            return _job_response(job)
+
+        app.post(path, response_model=JobResponse, name=kind)(submit)
+
+    add_job_route("/v1/validation", "validation", ValidationRequest, pipeline.run_validation)
+    add_job_route("/v1/strategy", "strategy", StrategyRequest, pipeline.run_strategy)
+    add_job_route("/v1/drafts", "drafts", DraftRequest, pipeline.run_drafts)
+    add_job_route("/v1/reviews", "reviews", ReviewRequest, pipeline.run_review)
+    add_job_route("/v1/batch/drafts", "batch_drafts", BulkDraftRequest, pipeline.run_batch_drafts)
+    add_job_route("/v1/batch/reviews", "batch_reviews", BulkReviewRequest, pipeline.run_batch_reviews)
+
+    @app.get("/v1/jobs/{job_id}", response_model=JobResponse)
+    async def get_job(job_id: str, tenant: str = Depends(authenticate)) -> JobResponse:
+        return _job_response(_find_job(store, job_id, tenant))
+
+    @app.get("/v1/jobs/{job_id}/events")
+    async def job_events(
+        job_id: str,
+        request: Request,
+        tenant: str = Depends(authenticate),
+        last_event_id: Optional[str] = Header(default=None),
+    ) -> StreamingResponse:
+        job = _find_job(store, job_id, tenant)
+        after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+
+        async def event_source():
+            async for event_id, event, data in job.subscribe(after):
+                if await request.is_disconnected():
+                    return
+                payload = json.dumps(to_jsonable_python(data), ensure_ascii=False)
+                yield f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+        return StreamingResponse(
+            event_source(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/healthz")
+    async def healthz() -> dict:
+        return {"status": "ok", "llm_backend": settings.llm_backend}
+
+    return app
+
+
+async def _run_in_thread(job: Job, run: Callable[[Any, Any], Any], body: BaseModel) -> Any:
+    """체인을 작업 스레드에서 실행하고 토큰/중간 이벤트를 이벤트 루프로 전달
+
+    체인은 동기 API(invoke/batch, 내부 asyncio.run)이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    사용자 컨텍스트와 토큰 핸들러는 ContextVar로 스레드와 하위 LLM 호출에 전파됩니다.
+    """
+    loop = asyncio.get_running_loop()
+
+    def emit(event: str, data: Any) -> None:
+        loop.call_soon_threadsafe(job.publish, event, data)
+
+    with tenant_context(job.tenant), stream_tokens(emit):
+        context = contextvars.copy_context()
+    return await loop.run_in_executor(_job_executor, context.run, run, body, emit)
+
+
+async def authenticate(credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)) -> str:
+    """Bearer API 키를 검증하고 키에 연결된 사용자 키(tenant) 반환
+
+    Raises:
+        HTTPException: 키가 없거나 등록되지 않은 키 (401)
+    """
+    if credentials is not None:
+        user_id = _user_for_key(credentials.credentials)
+        if user_id is not None:
+            return f"api:{user_id}"
+    raise HTTPException(
+        status_code=401, detail="유효한 API 키가 필요합니다.", headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def _user_for_key(key: str) -> Optional[str]:
+    # 키 비교 시간으로 등록된 키를 추측할 수 없도록 모든 키를 상수 시간 비교
+    user_id = None
+    for known, user in settings.api_keys.items():
+        if hmac.compare_digest(known.encode("utf-8"), key.encode("utf-8")):
+            user_id = user
+    if settings.access_key and hmac.compare_digest(settings.access_key.encode("utf-8"), key.encode("utf-8")):
+        user_id = user_id or _ACCESS_KEY_USER
+    return user_id
+
+
+def _find_job(store: JobStore, job_id: str, tenant: str) -> Job:
+    job = store.get(job_id, tenant)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        events_url=f"/v1/jobs/{job.job_id}/events",
+        result=to_jsonable_python(job.result),
+        error=job.error,
+    )
+
+
+app = create_app()
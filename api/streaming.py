@@ -0,0 +1,64 @@
+"""체인 내부 LLM 토큰을 API 작업 이벤트로 전달
+
+체인 함수(validate/generate_draft_candidates 등)는 콜백 인자를 받지 않으므로,
+ContextVar에 담은 핸들러를 LangChain configure hook으로 모든 하위 실행에 자동 부착합니다.
+(batch 스레드, asyncio 태스크에도 컨텍스트가 복사되어 전파)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+
+class TokenStreamHandler(BaseCallbackHandler):
+    """LLM 토큰을 `publish("token", {...})`로 전달하는 콜백
+
+    `tap_output_iter`/`tap_output_aiter`를 구현하면 LangChain이 스트리밍 핸들러로 인식해
+    `invoke`/`ainvoke` 호출도 스트리밍 API로 실행하므로 토큰 단위 이벤트를 받을 수 있습니다.
+    publish는 어느 스레드에서든 호출될 수 있으므로 스레드 안전해야 합니다.
+    """
+
+    run_inline = True
+
+    def __init__(self, publish: Callable[[str, Any], None]) -> None:
+        self.publish = publish
+        self._models: dict[UUID, str] = {}
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        metadata = kwargs.get("metadata") or {}
+        self._models[run_id] = metadata.get("ls_model_name", "")
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        if token:
+            self.publish("token", {"run_id": str(run_id), "model": self._models.get(run_id, ""), "text": token})
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._models.pop(run_id, None)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._models.pop(run_id, None)
+
+    def tap_output_aiter(self, run_id: UUID, output: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        return output
+
+    def tap_output_iter(self, run_id: UUID, output: Iterator[Any]) -> Iterator[Any]:
+        return output
+
+
+_token_handler: ContextVar[Optional[TokenStreamHandler]] = ContextVar("api_token_handler", default=None)
+register_configure_hook(_token_handler, inheritable=True)
+
+
+@contextmanager
+def stream_tokens(publish: Callable[[str, Any], None]) -> Iterator[None]:
+    """블록 안의 모든 LLM 호출 토큰을 publish로 전달"""
+    token = _token_handler.set(TokenStreamHandler(publish))
+    try:
+        yield
+    finally:
+        _token_handler.reset(token)
@@ -1,5 +1,8 @@
 import streamlit as st
 import os
+from collections import deque
+from contextlib import nullcontext
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from dotenv import load_dotenv
 
 # 환경 변수 먼저 로드 (settings 임포트 전에 실행)
@@ -7,12 +10,16 @@ load_dotenv()
 
 # 로컬 모듈 (환경 변수 로드 후 임포트)
 from config.settings import settings
+from config.profiling import profile_rerun, timed
+from config.tenancy import tenant_context
 from models.state import ResumeState
+from ui.components.profile_form import current_profile_key
+from ui.components.session_io import trim_session_state
 from ui.components.sidebar import render_sidebar
-from ui.pages.step1_input import render_step1
+from ui.pages.step1_input import render_step1, resolve_experience_parsing
 from ui.pages.step2_validation import render_step2
 from ui.pages.step3_research import render_step3
-from ui.pages.step4_strategy import render_step4
+from ui.pages.step4_strategy import render_step4, resolve_strategy_extraction
 from ui.pages.step5_guidelines import render_step5
 from ui.pages.step6_essay import render_step6
 from ui.pages.step7_review import render_step7
@@ -28,6 +35,7 @@ def init_session_state():
             job_posting_url="",
             essay_questions=[],
             user_experiences="",
+            structured_job_posting=None,
             validation_status={},
             additional_questions=[],
             current_step=1,
@@ -39,17 +47,45 @@ def init_session_state():
             writing_guidelines=None,
         )
 
+def current_tenant_key() -> str:
+    """사용량 집계 단위 (프로필 이름, 없으면 브라우저 세션 ID)"""
+    profile_key = current_profile_key()
+    if profile_key:
+        return f"profile:{profile_key}"
+    ctx = get_script_run_ctx()
+    return f"session:{ctx.session_id}" if ctx else ""
+
 def main():
     init_session_state()
+    trim_session_state(st.session_state)
+    
+    with tenant_context(current_tenant_key()), _rerun_profiling():
+        _render_app()
+
+def _rerun_profiling():
+    """디버그 모드: rerun 구간별 시간 측정 (사이드바에서 고른 rerun은 프로파일러도 실행)"""
+    if not settings.debug:
+        return nullcontext()
+    history = st.session_state.setdefault("rerun_profiles", deque(maxlen=settings.profiling_history))
+    return profile_rerun(history, st.session_state.pop("profile_next_rerun", "off"))
+
+def _render_app():
+    # 1단계/4단계에서 백그라운드로 넘긴 경험 파싱, 전략 추출 결과 반영
+    with timed("resolve_background"):
+        resolve_experience_parsing(st.session_state.resume_state)
+        resolve_strategy_extraction(st.session_state.resume_state)
     
     # 사이드바 렌더링
-    with st.sidebar:
+    with st.sidebar, timed("render_sidebar"):
         st.title("Resume Assistant 📝")
         render_sidebar()
     
     # 메인 영역 라우팅
     step = st.session_state.resume_state["current_step"]
-    
+    with timed(f"render_step{step}"):
+        _render_step(step)
+
+def _render_step(step: int):
     if step == 1:
         render_step1()
     elif step == 2:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""카세트 재생 파이프라인 벤치마크
+
+입력 검증(2단계) -> 전략 수립(4단계) -> 초안 토너먼트(6단계) -> 최종 검토(7/8단계)의 모델 호출을
+카세트(config/cassette.py)로 녹화한 뒤, 네트워크 없이 녹화 속도/가속 재생하여 단계별 시간을 비교합니다.
+카세트 파일이 없으면 현재 설정의 모델로 먼저 녹화합니다 (기본은 가짜 모델 백엔드, --real이면 실제 모델).
+
+실행: python benchmarks/bench_cassette_replay.py [--cassette data/cassettes/bench.jsonl.gz] [--real] [--rerecord]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Literal
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from chains.review_chain import generate_final_essays, plan_final_reviews
+from chains.strategy_chain import build_initial_strategy_inputs, create_initial_strategy_chain
+from chains.validation_chain import stream_resume_input_validation
+from chains.writing_chain import generate_draft_candidates
+from config import llm_factory
+from config.settings import settings
+
+REPLAY_SPEEDS = [1.0, 10.0, 0.0]
+CANDIDATES_PER_QUESTION = 3
+
+
+def _state() -> dict:
+    return {
+        "company_name": "예시페이",
+        "position_name": "백엔드 개발자",
+        "job_posting": "결제 플랫폼 백엔드 개발자 채용. 주요 업무: 결제 API 설계 및 운영, 정산 배치 개발. " * 4,
+        "user_experiences": "결제 시스템 백엔드 개발 3년. 정산 배치 처리 시간을 40% 단축하고 장애 대응을 자동화했습니다. " * 3,
+        "essay_questions": [
+            {"question_text": "지원 동기를 작성해주세요.", "char_limit": 700},
+            {"question_text": "가장 도전적이었던 경험을 작성해주세요.", "char_limit": 1000},
+        ],
+        "writing_guidelines": None,
+        "company_research": None,
+    }
+
+
+def _run_pipeline() -> list[tuple[str, float]]:
+    """단계별 소요 시간 (모든 단계가 같은 입력으로 같은 순서의 모델 호출을 만듦)"""
+    state = _state()
+    timings: list[tuple[str, float]] = []
+
+    def stage(name: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = fn()
+        timings.append((name, time.perf_counter() - start))
+        return result
+
+    def validate():
+        stream = stream_resume_input_validation(state)  # type: ignore[arg-type]
+        for _ in stream:
+            pass
+        return stream.result
+
+    stage("validation", validate)
+    strategy = stage("strategy", lambda: create_initial_strategy_chain().invoke(build_initial_strategy_inputs(state)))
+    state["writing_strategy"] = strategy
+    drafts = stage("drafts", lambda: generate_draft_candidates(
+        state, settings.draft_model_pool, CANDIDATES_PER_QUESTION, CANDIDATES_PER_QUESTION, settings.draft_good_score,
+    ))
+    # 동점 후보의 순서는 완료 순서에 따라 달라지므로 모델명으로 정렬해 검토 입력(선택 초안)을 고정
+    state["generated_drafts"] = {
+        key: [c.text for c in sorted(candidates, key=lambda c: c.model)]
+        for key, candidates in drafts.items()
+    }
+    state["draft_feedbacks"] = {"1": "어색한 표현을 다듬어주세요", "2": "성과 수치를 더 강조해주세요"}
+    stage("review", lambda: generate_final_essays(state, plan_final_reviews(state)))  # type: ignore[arg-type]
+    return timings
+
+
+def _run_with_cassette(mode: Literal["record", "replay"], path: str, speed: float = 1.0) -> list[tuple[str, float]]:
+    settings.cassette_mode = mode
+    settings.cassette_path = path
+    settings.cassette_replay_speed = speed
+    llm_factory._models.clear()
+    return _run_pipeline()
+
+
+def run_benchmark():
+    parser = argparse.ArgumentParser(description="카세트 재생 파이프라인 벤치마크")
+    parser.add_argument("--cassette", default=os.path.join(tempfile.gettempdir(), "bench_cassette.jsonl.gz"))
+    parser.add_argument("--real", action="store_true", help="실제 모델로 녹화 (API 키 필요)")
+    parser.add_argument("--rerecord", action="store_true", help="기존 카세트를 지우고 다시 녹화")
+    args = parser.parse_args()
+
+    if not args.real:
+        settings.llm_backend = "fake"
+        settings.fake_llm_first_token_seconds = 0.3
+        settings.fake_llm_chunk_seconds = 0.005
+    settings.model_routing_log_path = ""
+
+    rows = []
+    if args.rerecord and os.path.exists(args.cassette):
+        os.remove(args.cassette)
+    if not os.path.exists(args.cassette):
+        rows.append(("record", _run_with_cassette("record", args.cassette)))
+    for speed in REPLAY_SPEEDS:
+        label = "replay x" + (f"{speed:g}" if speed > 0 else "inf")
+        rows.append((label, _run_with_cassette("replay", args.cassette, speed)))
+
+    stages = [name for name, _ in rows[0][1]]
+    print("=" * 80)
+    print(f"Cassette replay: validation -> strategy -> drafts -> review ({os.path.basename(args.cassette)}, "
+          f"{os.path.getsize(args.cassette) / 1024:.1f} KiB)")
+    print("=" * 80)
+    print(f"{'Run':<14} | " + " | ".join(f"{name:>10}" for name in stages) + f" | {'Total (s)':>9}")
+    print("-" * 80)
+    for label, timings in rows:
+        cells = " | ".join(f"{seconds:>10.2f}" for _, seconds in timings)
+        print(f"{label:<14} | {cells} | {sum(s for _, s in timings):>9.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
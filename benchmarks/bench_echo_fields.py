@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""구조화 출력 완료 토큰 벤치마크: 입력 원문을 다시 출력하는 필드(echo) 제거 전후
+
+- 전략 추출: WritingStrategy(content 포함) vs StrategyExtraction(추출 항목만)
+- 가이드라인 검수: improved_guideline(전체 재출력) vs edits(수정 연산), 승인/소폭 수정 두 경우
+
+같은 내용의 응답 JSON을 두 스키마로 직렬화하여 완료 토큰(추정치)을 비교합니다.
+
+실행: python benchmarks/bench_echo_fields.py
+"""
+import os
+import sys
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from chains.guideline_chain import GuidelineReview, apply_guideline_review
+from config.prompts import DEFAULT_GUIDELINE_TEXT
+from models.output_models import StrategyExtraction, TextEdit, WritingStrategy
+from tools.llm_util import estimate_tokens
+from tools.strategy_parser import parse_strategy_markdown
+
+
+def _strategy_document(questions: int) -> str:
+    """실제 전략 문서와 비슷한 구조의 Markdown (문항 수에 비례한 분량)"""
+    question_sections = "\n\n".join(
+        f"- **문항 {q}**: 문항 {q}의 의도는 지원자의 문제 해결 역량 확인\n"
+        f"- **소재 추천**: 결제 시스템 p99 지연 40% 단축 경험, 장애 대응 자동화 프로젝트\n"
+        f"- **작성 포인트**: 문제 정의 -> 원인 분석(쿼리 실행 계획, 캐시 적중률) -> 해결 -> 정량 성과 순으로 서술하고,"
+        f" 입사 후 커머스 플랫폼의 프로모션 트래픽 대응과 연결"
+        for q in range(1, questions + 1)
+    )
+    return (
+        "전략을 정리했습니다. 아래 내용을 바탕으로 초안을 작성하시면 됩니다.\n\n"
+        "# 1. 핵심 직무 역량 & 인재상 매칭\n"
+        "- **핵심 키워드**: 대용량 트래픽 처리, 결제 도메인 이해, 장애 대응\n"
+        "- **인재상**: 주도성 · 협업 · 데이터 기반 의사결정\n"
+        "- **매칭되는 강점**:\n  - 결제 API 응답 시간 40% 단축\n  - 분산 추적 기반 장애 대응 체계 구축\n"
+        "- **보완이 필요한 약점(Gap)**: 대규모 조직 협업 경험 부족, 쿠버네티스 운영 경험\n\n"
+        f"# 2. 문항별 작성 전략\n{question_sections}\n\n"
+        "# 3. 전체적인 작성 컨셉 및 주의사항\n"
+        "- 담백한 업무 문서 톤 유지, 수치 근거 제시\n- 추상적인 포부 대신 입사 후 6개월 계획 제시"
+    )
+
+
+def _tokens(model) -> int:
+    return estimate_tokens(model.model_dump_json())
+
+
+def run_benchmark():
+    print("=" * 80)
+    print("Completion tokens: echoed fields vs locally filled fields")
+    print("=" * 80)
+    print(f"{'Case':<36} | {'Before':>8} | {'After':>8} | {'Reduction':>9}")
+    print("-" * 80)
+
+    rows = []
+    for questions in (2, 4, 6):
+        content = _strategy_document(questions)
+        strategy = parse_strategy_markdown(content)
+        assert strategy is not None
+        before = WritingStrategy(**strategy.model_dump())
+        after = StrategyExtraction(**strategy.model_dump(exclude={"content"}))
+        rows.append((f"Strategy extraction ({questions} questions)", _tokens(before), _tokens(after)))
+
+    approved = GuidelineReview(is_valid=True, suggestions=["현재 가이드로 충분합니다."])
+    small_fix = GuidelineReview(
+        is_valid=False,
+        issues=["글자 수 기준이 모호함"],
+        suggestions=["제한 대비 목표 비율을 명시"],
+        edits=[TextEdit(
+            op="replace",
+            target="제한 글자 수에 최대한 근접하게 작성",
+            text="제한 글자 수의 90% 이상으로 작성",
+        )],
+    )
+    for name, review in (("Guideline review (approved)", approved), ("Guideline review (1 edit)", small_fix)):
+        result = apply_guideline_review(DEFAULT_GUIDELINE_TEXT, review)
+        # 이전 스키마: 수정 연산 없이 개선본 전체를 출력
+        before = result.model_copy(update={"edits": []})
+        rows.append((name, _tokens(before), _tokens(review)))
+
+    for name, before_tokens, after_tokens in rows:
+        print(f"{name:<36} | {before_tokens:>8} | {after_tokens:>8} | {1 - after_tokens / before_tokens:>9.0%}")
+
+    total_before = sum(r[1] for r in rows)
+    total_after = sum(r[2] for r in rows)
+    print("-" * 80)
+    print(f"{'Total':<36} | {total_before:>8} | {total_after:>8} | {1 - total_after / total_before:>9.0%}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""가이드라인 검사기 처리량 벤치마크: 금지 표현 수별 Aho-Corasick vs 단순 반복 vs 정규식 alternation
+
+자기소개서 1천 자 분량의 본문 코퍼스에 대해 금지 표현 검색 방식별 처리량을 비교하고,
+형식 규칙(정규식)까지 포함한 전체 검사기(`GuidelineLinter.lint`)의 문서당 시간을 측정합니다.
+
+실행: python benchmarks/bench_guideline_linter.py
+"""
+import os
+import random
+import re
+import sys
+import time
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from config.prompts import DEFAULT_GUIDELINE_TEXT
+from tools.guideline_linter import AhoCorasick, GuidelineLinter, enabled_regex_rules, extract_banned_phrases
+
+CORPUS_SIZE = 2000
+ESSAY_CHARS = 1000
+PHRASE_COUNTS = [3, 50, 500, 2000]
+
+_SYLLABLES = "가나다라마바사아자차카타파하결제정산주문배포장애복구지표협업개선성과운영자동화트래픽"
+_WORDS = ["열정적인", "최선을 다하는", "도움이 되겠습니다", "(Kafka)", "성장하겠습니다", "API", "p99", "40%"]
+
+
+def _essay(rng: random.Random) -> str:
+    parts = []
+    length = 0
+    while length < ESSAY_CHARS:
+        if rng.random() < 0.05:
+            word = rng.choice(_WORDS)
+        else:
+            word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5)))
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)[:ESSAY_CHARS]
+
+
+def _phrases(rng: random.Random, count: int) -> list[str]:
+    base = extract_banned_phrases(DEFAULT_GUIDELINE_TEXT)
+    extra = {"".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(3, 8))) for _ in range(count * 2)}
+    return (base + sorted(extra))[:count]
+
+
+def _naive(corpus: list[str], phrases: list[str]) -> int:
+    # 표현별로 본문 전체를 다시 훑는 방식 (기존 채점기의 `phrase in body`와 같은 방식, 위치 포함)
+    hits = 0
+    for text in corpus:
+        for phrase in phrases:
+            start = text.find(phrase)
+            while start >= 0:
+                hits += 1
+                start = text.find(phrase, start + 1)
+    return hits
+
+
+def _alternation(corpus: list[str], phrases: list[str]) -> int:
+    # 겹치는 일치도 세도록 lookahead 사용
+    pattern = re.compile("(?=(" + "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)) + "))")
+    return sum(1 for text in corpus for _ in pattern.finditer(text))
+
+
+def _aho_corasick(corpus: list[str], automaton: AhoCorasick) -> int:
+    return sum(1 for text in corpus for _ in automaton.finditer(text))
+
+
+def _timed(fn, *args) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run_benchmark():
+    rng = random.Random(42)
+    corpus = [_essay(rng) for _ in range(CORPUS_SIZE)]
+    total_chars = sum(len(t) for t in corpus)
+
+    print("=" * 80)
+    print(f"Banned phrase search: {CORPUS_SIZE} essays x {ESSAY_CHARS} chars ({total_chars / 1e6:.1f}M chars)")
+    print("=" * 80)
+    print(f"{'Phrases':>7} | {'Naive find':>11} | {'Regex alt':>11} | {'Aho-Corasick':>12} | {'AC build':>9} | {'Hits':>6}")
+    print(f"{'':>7} | {'(ms/essay)':>11} | {'(ms/essay)':>11} | {'(ms/essay)':>12} | {'(ms)':>9} |")
+    print("-" * 80)
+
+    for count in PHRASE_COUNTS:
+        phrases = _phrases(rng, count)
+        build_s, automaton = _timed(AhoCorasick, phrases)
+        naive_s, naive_hits = _timed(_naive, corpus, phrases)
+        alt_s, alt_hits = _timed(_alternation, corpus, phrases)
+        ac_s, ac_hits = _timed(_aho_corasick, corpus, automaton)
+        assert naive_hits == alt_hits == ac_hits, (naive_hits, alt_hits, ac_hits)
+        print(
+            f"{count:>7} | {naive_s / CORPUS_SIZE * 1000:>11.3f} | {alt_s / CORPUS_SIZE * 1000:>11.3f}"
+            f" | {ac_s / CORPUS_SIZE * 1000:>12.3f} | {build_s * 1000:>9.1f} | {ac_hits:>6}"
+        )
+
+    print("-" * 80)
+    rules = enabled_regex_rules(DEFAULT_GUIDELINE_TEXT)
+    for count in (len(extract_banned_phrases(DEFAULT_GUIDELINE_TEXT)), PHRASE_COUNTS[-1]):
+        linter = GuidelineLinter(_phrases(random.Random(count), count), rules)
+        lint_s, violations = _timed(lambda: sum(len(linter.lint(t)) for t in corpus))
+        engine = "Aho-Corasick" if linter._automaton is not None else "str.find"
+        print(
+            f"Full lint ({count} phrases via {engine} + {len(rules)} regex rules): "
+            f"{lint_s / CORPUS_SIZE * 1000:.3f} ms/essay, {total_chars / lint_s / 1e6:.2f}M chars/s, "
+            f"{violations} violations"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""채용공고 하위 페이지 수집 벤치마크: 순차 요청 vs 병렬 요청(도메인별 동시 요청 제한)
+
+로컬 HTTP 서버 두 개(포털, 채용 관리 시스템)에 응답 지연을 주고, iframe 1개 + 탭 N개로 나뉜 공고를
+`scrape_job_posting_page`로 수집하는 시간을 동시 요청 설정별로 비교합니다.
+
+실행: python benchmarks/bench_posting_assembly.py
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from config.settings import settings
+from tools import web_scraper
+from tools.web_scraper import scrape_job_posting_page
+
+RESPONSE_DELAY_SECONDS = 0.15
+TAB_COUNTS = [3, 6]
+# (라벨, 동시 요청 수, 도메인별 제한)
+CONFIGS = [("Sequential", 1, 1), ("Concurrent (cap 2/domain)", 6, 2), ("Concurrent (cap 4/domain)", 6, 4)]
+
+
+def _start_server(routes: dict[str, str]) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(RESPONSE_DELAY_SECONDS)
+            body = routes.get(self.path, "")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run_benchmark():
+    print("=" * 80)
+    print(f"Posting assembly: 1 iframe + N tabs, {RESPONSE_DELAY_SECONDS * 1000:.0f} ms per response")
+    print("=" * 80)
+    print(f"{'Tabs':>4} | {'Config':<28} | {'Pages':>5} | {'Time (s)':>8} | {'Speedup':>7}")
+    print("-" * 80)
+
+    header = "<header>예시페이 채용</header>\n<nav>채용공고 인재상 FAQ</nav>\n"
+    for tabs in TAB_COUNTS:
+        ats = _start_server({"/embed": f"<html><body>{header}<p>결제 API 설계 및 운영</p></body></html>"})
+        tab_links = "".join(f"<a role='tab' href='/jobs/1/tab/{i}'>탭 {i}</a>\n" for i in range(tabs))
+        routes = {
+            "/jobs/1": f"<html><body>{header}<iframe src='{_url(ats)}/embed'></iframe>\n{tab_links}</body></html>",
+            **{f"/jobs/1/tab/{i}": f"<html><body>{header}<p>탭 {i} 내용</p></body></html>" for i in range(tabs)},
+        }
+        portal = _start_server(routes)
+
+        baseline = None
+        for label, workers, per_domain in CONFIGS:
+            settings.scrape_max_workers = workers
+            settings.scrape_per_domain_concurrency = per_domain
+            web_scraper._domain_slots.clear()
+            start = time.perf_counter()
+            page = scrape_job_posting_page(f"{_url(portal)}/jobs/1")
+            elapsed = time.perf_counter() - start
+            assert page is not None and f"탭 {tabs - 1} 내용" in page.text
+            baseline = baseline or elapsed
+            print(f"{tabs:>4} | {label:<28} | {len(page.sources):>5} | {elapsed:>8.2f} | {baseline / elapsed:>6.1f}x")
+
+        portal.shutdown()
+        ats.shutdown()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""채용공고 근접 중복 조회 벤치마크: 색인된 공고 수 대비 LSH 조회 지연
+
+10만 건 공고 텍스트를 모두 만들면 서명 계산에만 수 분이 걸리므로, 배경 공고는
+난수 서명으로 색인하고 실제 텍스트 공고(원본 + 수정본 질의)만 섞어서 측정합니다.
+
+실행: python benchmarks/bench_posting_index.py
+"""
+import os
+import statistics
+import sys
+import time
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from tools.posting_index import PostingIndex
+
+INDEX_SIZES = [1_000, 10_000, 100_000]
+REAL_POSTINGS = 50
+QUERIES = 200
+THRESHOLD = 0.9
+
+
+def _posting(i: int) -> str:
+    """실제 공고와 비슷한 분량(약 1.5천 자)의 서로 다른 공고 텍스트"""
+    duties = "\n".join(f"- 주요 업무 {i}-{j}: 서비스 {i * 7 + j} 서버 개발 및 운영, 장애 대응" for j in range(20))
+    reqs = "\n".join(f"- 자격 요건 {i}-{j}: 관련 경력 {j}년 이상, 기술 스택 {i % 13}-{j}" for j in range(15))
+    return f"[회사 {i}] 직무 {i} 채용\n{duties}\n{reqs}\n복리후생: 항목 {i}"
+
+
+def _edited(text: str, seed: int) -> str:
+    """다른 플랫폼에서 가져온 듯한 소폭 수정본 (URL, 머리말, 한 줄 변경)"""
+    lines = text.splitlines()
+    lines[seed % len(lines)] += " (수정됨)"
+    return f"https://aggregator.example.com/{seed}\n지원하기 | 공유하기\n" + "\n".join(lines)
+
+
+def _build_index(size: int, rng: np.random.Generator) -> tuple[PostingIndex, float]:
+    index = PostingIndex()
+    started = time.perf_counter()
+    for i in range(REAL_POSTINGS):
+        index.add(_posting(i), i)
+    noise = rng.integers(0, 1 << 32, size=(size - REAL_POSTINGS, index.hasher.num_perm), dtype=np.uint32)
+    for row in noise:
+        index.add_signature(row, None)
+    return index, time.perf_counter() - started
+
+
+def run_benchmark():
+    rng = np.random.default_rng(0)
+    queries = [_edited(_posting(q % REAL_POSTINGS), q) for q in range(QUERIES)]
+
+    print("=" * 80)
+    print(f"{'Indexed':>10} | {'Build (s)':>10} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'Hit rate':>9} | {'Sig only (ms)':>13}")
+    print("-" * 80)
+
+    for size in INDEX_SIZES:
+        index, build_seconds = _build_index(size, rng)
+
+        latencies, sig_latencies, hits = [], [], 0
+        for q, text in enumerate(queries):
+            started = time.perf_counter()
+            signature = index.hasher.signature(text)
+            sig_latencies.append(time.perf_counter() - started)
+            matches = index.query_signature(signature, THRESHOLD)
+            latencies.append(time.perf_counter() - started)
+            hits += bool(matches) and matches[0][0] == q % REAL_POSTINGS
+
+        latencies.sort()
+        print(
+            f"{size:>10,} | {build_seconds:>10.2f} | {statistics.median(latencies) * 1000:>9.2f} | "
+            f"{latencies[int(len(latencies) * 0.95)] * 1000:>9.2f} | {hits / QUERIES:>9.0%} | "
+            f"{statistics.median(sig_latencies) * 1000:>13.2f}"
+        )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""페이지 재실행(rerender) 시간 벤치마크: 전체 앱 재실행 vs fragment 범위 재실행
+
+문항 10개(문항별 초안 후보 3개)와 3만 자 분량의 채용공고/리서치/경험 입력으로 측정합니다.
+AppTest는 fragment 단위 재실행을 지원하지 않으므로, fragment 재실행 비용은 해당 fragment
+함수만 실행하는 스크립트로 측정합니다.
+
+실행: python benchmarks/bench_rerender.py
+"""
+import os
+import statistics
+import sys
+import time
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from streamlit.testing.v1 import AppTest
+
+from models.output_models import CompanyResearch, WritingStrategy
+
+QUESTIONS = 10
+CANDIDATES = 3
+INPUT_CHARS = 30_000
+REPEAT = 10
+
+
+def _long_text(label: str) -> str:
+    line = f"{label}: 대용량 트래픽 처리와 MSA 전환 경험을 바탕으로 결제 플랫폼을 개발합니다.\n"
+    return (line * (INPUT_CHARS // len(line) + 1))[:INPUT_CHARS]
+
+
+def _build_state() -> dict:
+    questions = [
+        {"id": str(q), "question_text": f"문항 {q}: 지원 동기와 입사 후 포부를 기술하시오.", "char_limit": 1000}
+        for q in range(1, QUESTIONS + 1)
+    ]
+    keys = [str(q) for q in range(1, QUESTIONS + 1)]
+    drafts = {k: [f"문항 {k} 후보 {c}\n" + "주문 시스템을 MSA로 전환했습니다. " * 50 for c in range(CANDIDATES)] for k in keys}
+    score = {"total": 0.8, "char_fit": 0.9, "keyword_coverage": 0.7, "char_count": 950, "violations": []}
+    return {
+        "company_name": "카카오",
+        "position_name": "백엔드 개발",
+        "job_posting": _long_text("채용공고"),
+        "job_posting_url": "https://careers.example.com/jobs/1",
+        "essay_questions": questions,
+        "user_experiences": _long_text("경험"),
+        "validation_status": {},
+        "additional_questions": [],
+        "company_research": CompanyResearch(content=_long_text("리서치")),
+        "writing_strategy": WritingStrategy(
+            core_competencies=[], talent_traits=[], user_strengths=[], user_gaps=[],
+            question_strategy={}, cautions=[], content=_long_text("전략")[:8000],
+        ),
+        "writing_guidelines": "1. 두괄식으로 작성\n" * 50,
+        "generated_drafts": drafts,
+        "draft_models": {k: ["gemini-3-pro-preview", "gpt-4.1", "gemini-2.5-pro"] for k in keys},
+        "draft_scores": {k: [score] * CANDIDATES for k in keys},
+        "draft_selections": {k: 0 for k in keys},
+        "draft_feedbacks": {k: "" for k in keys},
+        "confirmed_essays": {k: drafts[k][0] for k in keys},
+        "current_step": 6,
+        "completed_steps": list(range(1, 8)),
+        "step_status": "진행중",
+        "messages": [],
+    }
+
+
+def _question_panel_script():
+    from ui.pages.step6_essay import _render_question_panel
+    import streamlit as st
+    _render_question_panel(0, st.session_state.resume_state["essay_questions"][0])
+
+
+def _lazy_section_script():
+    from ui.pages.step8_final import _render_lazy_section, _render_research_section
+    _render_lazy_section("2. 기업 리서치 결과 (Research)", "research", _render_research_section)
+
+
+def _time_runs(at: AppTest) -> float:
+    """재실행 시간 중앙값 (ms)"""
+    at.run()  # 임포트/캐시 워밍업
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - started)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return statistics.median(samples) * 1000
+
+
+def _app(step: int, **session) -> AppTest:
+    at = AppTest.from_file("app.py", default_timeout=60)
+    state = _build_state()
+    state["current_step"] = step
+    at.session_state["resume_state"] = state
+    for key, value in session.items():
+        at.session_state[key] = value
+    return at
+
+
+def _fragment(script) -> AppTest:
+    at = AppTest.from_function(script, default_timeout=60)
+    at.session_state["resume_state"] = _build_state()
+    return at
+
+
+def run_benchmark():
+    sections_open = {f"show_final_{k}": True for k in ("input", "research", "strategy", "guidelines")}
+    scenarios = [
+        ("Step 6 full rerun (10 questions)", _app(6)),
+        ("Step 6 question panel fragment", _fragment(_question_panel_script)),
+        ("Step 8 full rerun (sections collapsed)", _app(8)),
+        ("Step 8 full rerun (sections open)", _app(8, **sections_open)),
+        ("Step 8 research section fragment", _fragment(_lazy_section_script)),
+    ]
+
+    print("=" * 80)
+    print(f"{'Scenario':<44} | {'Rerun p50 (ms)':>14}")
+    print("-" * 80)
+    for name, at in scenarios:
+        print(f"{name:<44} | {_time_runs(at):>14.1f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    run_benchmark()
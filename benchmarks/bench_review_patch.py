@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""최종 검토(7단계) 벤치마크: 전체 재작성 vs 수정 연산(patch) 모드의 출력 토큰/지연
+
+실제 모델 대신 정해진 응답을 출력 속도에 맞춰 스트리밍하는 모델로 `_generate_single_final_draft`를
+그대로 실행합니다. 재작성 응답은 문단 목록에서 따로 만든 기대 최종본이고, patch 모드 결과가
+이 기대 최종본과 일치하는지도 확인합니다 (수정 연산 적용기를 거치지 않고 만든 문자열과 비교).
+
+실행: python benchmarks/bench_review_patch.py
+"""
+import asyncio
+import os
+import sys
+import time
+from typing import Literal
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+import chains.review_chain as review_chain
+from config.fake_llm import FakeChatModel
+from config.settings import settings
+from models.output_models import EssayPatch, TextEdit
+from tools.llm_util import estimate_tokens
+
+# 출력 속도 가정 (대형 모델 스트리밍 기준) 및 측정 시간 단축 배율
+FIRST_TOKEN_SECONDS = 2.0
+OUTPUT_TOKENS_PER_SECOND = 60.0
+TIME_SCALE = 50.0
+
+_PARAGRAPHS = [
+    "저는 결제 플랫폼 백엔드 개발자로서 초당 수천 건의 트래픽을 안정적으로 처리하는 일에 집중해 왔습니다.",
+    "주문 API의 응답 지연이 피크 시간대마다 급증하는 문제를 맡아, 쿼리 실행 계획과 캐시 적중률을 분석했습니다.",
+    "그 결과 불필요한 조인과 N+1 쿼리를 제거하고 Redis 캐시 계층을 도입하여 p99 응답 시간을 40% 단축했습니다.",
+    "또한 장애가 발생했을 때 원인을 빠르게 찾을 수 있도록 분산 추적과 대시보드를 구축하여 평균 복구 시간을 절반으로 줄였습니다.",
+    "이 과정에서 기획, 운영 조직과 매주 지표를 공유하며 개선 우선순위를 함께 조율했습니다.",
+    "귀사의 커머스 플랫폼은 대규모 프로모션 기간에 트래픽이 몰리는 특성이 있어, 제 경험이 바로 기여할 수 있다고 생각합니다.",
+    "입사 후에는 결제와 주문 도메인의 안정성을 높이고, 팀의 운영 자동화를 주도하는 개발자가 되겠습니다.",
+]
+DRAFT = " ".join(_PARAGRAPHS * 2)
+
+
+def _expected(first: dict[int, str], second: dict[int, str]) -> str:
+    """초안 앞/뒤 반복의 문단을 바꾼 기대 최종본 (빈 문자열이면 문단 삭제)"""
+    def half(changes: dict[int, str]) -> list[str]:
+        return [changes.get(i, p) for i, p in enumerate(_PARAGRAPHS) if changes.get(i, p)]
+    return " ".join(half(first) + half(second))
+
+
+# (피드백, 수정 연산, 기대 최종본) — 문장 단위로 끝나는 일반적인 7단계 피드백
+# 수정 연산은 직전 연산 이후의 첫 일치 위치에 적용되므로 반복된 문단은 앞쪽부터 바뀜
+CASES = [
+    (
+        "수치 근거를 조금 더 구체적으로 써 주세요.",
+        [TextEdit(op="replace", target="p99 응답 시간을 40% 단축했습니다.",
+                  text="p99 응답 시간을 820ms에서 490ms로 40% 단축했습니다.")],
+        _expected({2: _PARAGRAPHS[2].replace("40% 단축", "820ms에서 490ms로 40% 단축")}, {}),
+    ),
+    (
+        "마지막 포부 문장이 너무 평범해요.",
+        [TextEdit(op="replace", target="팀의 운영 자동화를 주도하는 개발자가 되겠습니다.",
+                  text="배포와 장애 대응을 자동화해 팀이 기능 개발에 집중할 수 있는 환경을 만들겠습니다.")],
+        _expected({6: "입사 후에는 결제와 주문 도메인의 안정성을 높이고, "
+                      "배포와 장애 대응을 자동화해 팀이 기능 개발에 집중할 수 있는 환경을 만들겠습니다."}, {}),
+    ),
+    (
+        "협업 부분에 갈등 조율 사례를 한 문장 추가하고, 중복 문장은 빼 주세요.",
+        [
+            TextEdit(op="insert", target="개선 우선순위를 함께 조율했습니다.",
+                     text=" 일정이 충돌할 때는 장애 비용을 수치로 제시해 합의를 이끌어냈습니다."),
+            TextEdit(op="delete", target="이 과정에서 기획, 운영 조직과 매주 지표를 공유하며 개선 우선순위를 함께 조율했습니다."),
+        ],
+        _expected({4: _PARAGRAPHS[4] + " 일정이 충돌할 때는 장애 비용을 수치로 제시해 합의를 이끌어냈습니다."}, {4: ""}),
+    ),
+]
+
+
+class ScriptedChatModel(FakeChatModel):
+    """구조화 출력이면 수정 연산 JSON, 아니면 재작성 본문을 출력 속도에 맞춰 반환하는 모델"""
+
+    rewrite_text: str = ""
+    patch_json: str = ""
+
+    def _response_text(self, messages) -> str:
+        return self.patch_json if self.response_schema is not None else self.rewrite_text
+
+
+def _scripted_model(rewrite_text: str, patch: EssayPatch) -> ScriptedChatModel:
+    # _CHUNK_CHARS(8자) 청크 하나의 출력 시간
+    chunk_tokens = estimate_tokens("가" * 8) - 1
+    return ScriptedChatModel(
+        first_token_seconds=FIRST_TOKEN_SECONDS / TIME_SCALE,
+        chunk_seconds=chunk_tokens / OUTPUT_TOKENS_PER_SECOND / TIME_SCALE,
+        rewrite_text=rewrite_text,
+        patch_json=patch.model_dump_json(),
+    )
+
+
+def _context(feedback: str) -> review_chain.ReviewContext:
+    return review_chain.ReviewContext(
+        question="지원 동기와 입사 후 포부를 기술하시오. (1000자)",
+        draft=DRAFT,
+        feedback=feedback,
+        guidelines="",
+        company_name="테스트커머스",
+        position_name="백엔드 개발자",
+        user_experiences="",
+    )
+
+
+async def _measure(mode: Literal["patch", "rewrite"], context: review_chain.ReviewContext) -> tuple[str, float]:
+    settings.review_mode = mode
+    start = time.perf_counter()
+    _, text = await review_chain._generate_single_final_draft("1", context)
+    return text, (time.perf_counter() - start) * TIME_SCALE
+
+
+def run_benchmark():
+    original_factory = review_chain.get_task_chat_model
+    original_mode = settings.review_mode
+
+    print("=" * 80)
+    print(f"Review output: rewrite vs patch (draft {len(DRAFT)} chars, "
+          f"TTFT {FIRST_TOKEN_SECONDS}s, {OUTPUT_TOKENS_PER_SECOND:.0f} tok/s)")
+    print("=" * 80)
+    print(f"{'Case':<6} | {'Rewrite tok':>11} | {'Patch tok':>9} | {'Rewrite s':>9} | {'Patch s':>8} | {'Match':>5}")
+    print("-" * 80)
+
+    totals = [0, 0, 0.0, 0.0]
+    try:
+        for i, (feedback, edits, expected) in enumerate(CASES, 1):
+            patch = EssayPatch(edits=edits)
+            model = _scripted_model(expected, patch)
+            review_chain.get_task_chat_model = lambda *args, **kwargs: model
+            context = _context(feedback)
+
+            _, rewrite_s = asyncio.run(_measure("rewrite", context))
+            patched, patch_s = asyncio.run(_measure("patch", context))
+            rewrite_tokens = estimate_tokens(model.rewrite_text)
+            patch_tokens = estimate_tokens(model.patch_json)
+
+            totals[0] += rewrite_tokens
+            totals[1] += patch_tokens
+            totals[2] += rewrite_s
+            totals[3] += patch_s
+            # patch 모드 결과와 독립적으로 만든 기대 최종본 비교
+            match = "yes" if patched == expected else "NO"
+            print(f"{i:<6} | {rewrite_tokens:>11} | {patch_tokens:>9} | {rewrite_s:>9.2f} | {patch_s:>8.2f} | {match:>5}")
+    finally:
+        review_chain.get_task_chat_model = original_factory
+        settings.review_mode = original_mode
+
+    print("-" * 80)
+    print(f"{'Total':<6} | {totals[0]:>11} | {totals[1]:>9} | {totals[2]:>9.2f} | {totals[3]:>8.2f} |")
+    print(f"Output tokens: -{1 - totals[1] / totals[0]:.0%}, latency: -{1 - totals[3] / totals[2]:.0%}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""ResumeState 직렬화 벤치마크: pickle / JSON / msgpack+zstd(인턴) 크기와 속도
+
+실행: python benchmarks/bench_state_serializer.py
+"""
+import json
+import os
+import pickle
+import sys
+import time
+import zlib
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, messages_from_dict, messages_to_dict
+
+from models.output_models import CompanyResearch, WritingStrategy
+from tools.state_serializer import dumps, loads
+
+QUESTIONS = 5
+CANDIDATES = 3
+STRATEGY_TURNS = 8
+REPEAT = 20
+
+
+def _strategy_document(version: int) -> str:
+    body = "\n".join(
+        f"- 문항 {q} 작성 포인트 v{version}: 대용량 트래픽 처리 경험과 MSA 전환 성과를 연결하여 서술"
+        for q in range(1, 40)
+    )
+    return f"# 1. 핵심 직무 역량\n- 키워드 v{version}\n\n# 2. 문항별 작성 전략\n{body}\n\n# 3. 주의사항\n- 추상적 표현 지양"
+
+
+def _build_snapshot() -> dict:
+    """8단계까지 진행한 세션과 비슷한 규모의 스냅샷"""
+    messages: list[BaseMessage] = []
+    for turn in range(STRATEGY_TURNS):
+        messages.append(AIMessage(content=_strategy_document(turn)))
+        messages.append(HumanMessage(content=f"{turn}번째 피드백: 문항 {turn % 3 + 1}의 소재를 바꿔주세요."))
+    messages.append(AIMessage(content=_strategy_document(STRATEGY_TURNS)))
+
+    latest = _strategy_document(STRATEGY_TURNS)
+    drafts = {
+        str(q): [f"문항 {q} 후보 {c}: " + "저는 주문 시스템을 MSA로 전환하며 처리 속도를 개선했습니다. " * 25
+                 for c in range(CANDIDATES)]
+        for q in range(1, QUESTIONS + 1)
+    }
+    state = {
+        "company_name": "카카오",
+        "position_name": "백엔드 개발",
+        "job_posting": "주요 업무: 결제 플랫폼 서버 개발. " * 300,
+        "job_posting_url": "https://careers.example.com/jobs/1",
+        "essay_questions": [
+            {"id": str(q), "question_text": f"문항 {q}: 지원 동기와 입사 후 포부를 기술하시오.", "char_limit": 1000}
+            for q in range(1, QUESTIONS + 1)
+        ],
+        "user_experiences": "- 주문 시스템 MSA 전환 (2023.01 - 2023.12)\n  Kafka 도입, 처리 속도 50% 향상\n" * 40,
+        "validation_status": {"company_name": "충분", "job_posting": "충분"},
+        "additional_questions": [],
+        "company_research": CompanyResearch(content="[기업 개요] 카카오는 플랫폼 기업입니다. " * 500),
+        "writing_strategy": WritingStrategy(
+            core_competencies=["대용량 트래픽", "MSA 전환"],
+            talent_traits=["주도성"],
+            user_strengths=["주문 처리 속도 50% 향상"],
+            user_gaps=["쿠버네티스"],
+            question_strategy={str(q): f"문항 {q} 전략" for q in range(1, QUESTIONS + 1)},
+            cautions=["추상적 표현 지양"],
+            content=latest,
+        ),
+        "writing_guidelines": "1. 두괄식으로 작성\n2. '열정적인' 등 추상적 표현 금지\n" * 20,
+        "generated_drafts": drafts,
+        "draft_selections": {str(q): 0 for q in range(1, QUESTIONS + 1)},
+        "draft_feedbacks": {str(q): "수치를 더 구체적으로" for q in range(1, QUESTIONS + 1)},
+        "confirmed_essays": {str(q): drafts[str(q)][0] for q in range(1, QUESTIONS + 1)},
+        "current_step": 8,
+        "completed_steps": list(range(1, 8)),
+        "step_status": "완료",
+        "messages": [],
+    }
+    return {"resume_state": state, "strategy_messages": messages}
+
+
+def _json_dumps(snapshot: dict) -> bytes:
+    state = dict(snapshot["resume_state"])
+    state["company_research"] = state["company_research"].model_dump()
+    state["writing_strategy"] = state["writing_strategy"].model_dump()
+    payload = {"resume_state": state, "strategy_messages": messages_to_dict(snapshot["strategy_messages"])}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> dict:
+    payload = json.loads(data)
+    state = payload["resume_state"]
+    state["company_research"] = CompanyResearch.model_validate(state["company_research"])
+    state["writing_strategy"] = WritingStrategy.model_validate(state["writing_strategy"])
+    return {"resume_state": state, "strategy_messages": messages_from_dict(payload["strategy_messages"])}
+
+
+def _measure(encode, decode, snapshot) -> tuple[int, float, float]:
+    data = encode(snapshot)
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        encode(snapshot)
+    encode_ms = (time.perf_counter() - started) / REPEAT * 1000
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        decode(data)
+    decode_ms = (time.perf_counter() - started) / REPEAT * 1000
+    return len(data), encode_ms, decode_ms
+
+
+def run_benchmark():
+    snapshot = _build_snapshot()
+    codecs = {
+        "pickle": (lambda s: pickle.dumps(s, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "pickle+zlib": (
+            lambda s: zlib.compress(pickle.dumps(s, protocol=pickle.HIGHEST_PROTOCOL)),
+            lambda d: pickle.loads(zlib.decompress(d)),
+        ),
+        "json": (_json_dumps, _json_loads),
+        "msgpack+zstd": (dumps, loads),
+    }
+
+    assert loads(dumps(snapshot)) == snapshot
+
+    print("=" * 80)
+    print(f"{'Codec':<14} | {'Size (bytes)':>13} | {'vs pickle':>9} | {'Encode (ms)':>11} | {'Decode (ms)':>11}")
+    print("-" * 80)
+    base_size = None
+    for name, (encode, decode) in codecs.items():
+        size, encode_ms, decode_ms = _measure(encode, decode, snapshot)
+        base_size = base_size or size
+        print(f"{name:<14} | {size:>13,} | {size / base_size:>8.1%} | {encode_ms:>11.2f} | {decode_ms:>11.2f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""전략 피드백 요청 크기 벤치마크: 턴 수 대비 전체 이력 vs 제한된 이력
+
+실행: python benchmarks/bench_strategy_history.py
+"""
+import os
+import sys
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from config.prompts import FEEDBACK_STRATEGY_PROMPT
+from config.settings import settings
+from tools.chat_history import build_strategy_feedback_history
+from tools.llm_util import estimate_tokens, format_messages_to_text
+
+MAX_TURNS = 12
+
+
+def _strategy_document(version: int) -> str:
+    """실제 전략 문서와 비슷한 분량(약 2천 자)의 Markdown 생성"""
+    body = "\n".join(
+        f"- 문항 {q} 작성 포인트 v{version}: 대용량 트래픽 처리 경험과 MSA 전환 성과를 연결하여 서술"
+        for q in range(1, 40)
+    )
+    return f"# 1. 핵심 직무 역량\n- 키워드 v{version}\n\n# 2. 문항별 작성 전략\n{body}\n\n# 3. 주의사항\n- 추상적 표현 지양"
+
+
+def _request_size(chat_history: list, user_input: str) -> tuple[int, int]:
+    messages = FEEDBACK_STRATEGY_PROMPT.format_messages(
+        chat_history=chat_history, user_input=user_input
+    )
+    text = format_messages_to_text(messages)
+    return len(text), estimate_tokens(text)
+
+
+def run_benchmark():
+    messages: list = [AIMessage(content=_strategy_document(0))]
+
+    print("=" * 80)
+    print(f"History token budget: {settings.strategy_history_token_budget:,} (settings.strategy_history_token_budget)")
+    print(f"{'Turn':<6} | {'Full chars':>12} | {'Full tokens':>12} | {'Window chars':>12} | {'Window tokens':>13}")
+    print("-" * 80)
+
+    for turn in range(1, MAX_TURNS + 1):
+        user_input = f"{turn}번째 피드백: 문항 {turn % 3 + 1}의 소재를 더 구체적으로 바꿔주세요."
+
+        full_chars, full_tokens = _request_size(messages, user_input)
+        window = build_strategy_feedback_history(messages, token_budget=settings.strategy_history_token_budget)
+        window_chars, window_tokens = _request_size(window, user_input)
+
+        print(f"{turn:<6} | {full_chars:>12,} | {full_tokens:>12,} | {window_chars:>12,} | {window_tokens:>13,}")
+
+        messages.append(HumanMessage(content=user_input))
+        messages.append(AIMessage(content=_strategy_document(turn)))
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    run_benchmark()
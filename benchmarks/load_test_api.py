@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""API 서버 부하 테스트 (가짜 LLM 백엔드)
+
+동시 사용자 N명이 각자 초안 생성 작업을 요청하고 SSE로 끝까지 스트리밍받는 시나리오입니다.
+사용자마다 같은 Idempotency-Key로 한 번 재시도하여 중복 작업이 생기지 않는지도 확인합니다.
+--url을 주지 않으면 LLM_BACKEND=fake로 서버를 같은 프로세스에서 띄우고 사용자별 API 키를 등록합니다.
+--url을 주면 모든 사용자가 --api-key 하나로 요청합니다.
+
+실행: python benchmarks/load_test_api.py --users 100
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+# 현재 디렉토리를 path에 추가하여 로컬 모듈 임포트 가능하게 함
+sys.path.append(os.getcwd())
+
+os.environ.setdefault("LLM_BACKEND", "fake")
+os.environ.setdefault("GOOGLE_API_KEY", "fake")
+os.environ.setdefault("OPENAI_API_KEY", "fake")
+
+import httpx
+
+REQUEST = {
+    "company_name": "카카오페이",
+    "position_name": "백엔드 개발",
+    "job_posting": "결제 플랫폼 백엔드 개발자를 채용합니다. 대용량 트래픽 처리 경험 우대. " * 20,
+    "essay_questions": [
+        {"question_text": "지원 동기와 입사 후 포부를 작성해주세요.", "char_limit": 800},
+        {"question_text": "가장 어려웠던 기술적 문제와 해결 과정을 작성해주세요.", "char_limit": 1000},
+    ],
+    "user_experiences": "결제 API 응답 시간을 40% 단축한 프로젝트를 주도했습니다. " * 20,
+    "writing_strategy": "# 전략\n## 핵심 역량\n- 대용량 트래픽 처리\n- 장애 대응",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _api_key(user: int) -> str:
+    return f"load-key-{user}"
+
+
+def _start_local_server(users: int) -> str:
+    import uvicorn
+
+    from api.server import app
+    from config.settings import settings
+
+    settings.api_keys = {_api_key(user): f"load-{user}" for user in range(users)}
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+async def _run_user(client: httpx.AsyncClient, user: int, api_key: str | None) -> dict:
+    headers = {"Authorization": f"Bearer {api_key or _api_key(user)}", "Idempotency-Key": f"drafts-{user}"}
+    start = time.perf_counter()
+    job = (await client.post("/v1/drafts", json=REQUEST, headers=headers)).json()
+    retry = (await client.post("/v1/drafts", json=REQUEST, headers=headers)).json()
+
+    first_token = None
+    tokens = 0
+    event = ""
+    async with client.stream("GET", job["events_url"], headers=headers) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line.removeprefix("event: ")
+                if event == "token":
+                    tokens += 1
+                    first_token = first_token or time.perf_counter() - start
+    return {
+        "ttft": first_token or 0.0,
+        "total": time.perf_counter() - start,
+        "tokens": tokens,
+        "deduped": retry["job_id"] == job["job_id"],
+        "status": (await client.get(f"/v1/jobs/{job['job_id']}", headers=headers)).json()["status"],
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _main(base_url: str, users: int, api_key: str | None) -> None:
+    # 서버(uvicorn 기본 keep-alive 5초)가 먼저 닫은 연결을 재사용하지 않도록 더 짧게 유지
+    limits = httpx.Limits(max_connections=users * 2, max_keepalive_connections=users * 2, keepalive_expiry=2)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[_run_user(client, user, api_key) for user in range(users)])
+        elapsed = time.perf_counter() - start
+
+    ttft = [r["ttft"] for r in results]
+    total = [r["total"] for r in results]
+    print("=" * 80)
+    print(f"API load test: {users} users x {len(REQUEST['essay_questions'])} questions (drafts + SSE)")
+    print("=" * 80)
+    print(f"{'Metric':<28} | {'p50':>10} | {'p95':>10} | {'max':>10}")
+    print("-" * 80)
+    print(f"{'Time to first token (s)':<28} | {statistics.median(ttft):>10.3f} | {_percentile(ttft, 0.95):>10.3f} | {max(ttft):>10.3f}")
+    print(f"{'Job completion (s)':<28} | {statistics.median(total):>10.3f} | {_percentile(total, 0.95):>10.3f} | {max(total):>10.3f}")
+    print("-" * 80)
+    print(f"Succeeded jobs      : {sum(r['status'] == 'succeeded' for r in results)}/{users}")
+    print(f"Idempotent retries  : {sum(r['deduped'] for r in results)}/{users} reused the same job")
+    print(f"Token events        : {sum(r['tokens'] for r in results):,}")
+    print(f"Throughput          : {users / elapsed:.1f} jobs/s (wall {elapsed:.2f}s)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100, help="동시 사용자 수")
+    parser.add_argument("--url", default=None, help="대상 서버 주소 (없으면 가짜 백엔드 서버를 직접 실행)")
+    parser.add_argument("--api-key", default=None, help="--url 서버의 API 키")
+    args = parser.parse_args()
+    asyncio.run(_main(args.url or _start_local_server(args.users), args.users, args.api_key if args.url else None))
@@ -0,0 +1,184 @@
+"""여러 지원서의 초안/최종 검토를 provider 배치 API로 일괄 실행
+
+대화형 단계(UI)와 같은 프롬프트(`WRITER_*`, `REVIEW_*`)와 채점/검토 경로 결정을 그대로 사용하고,
+모델 호출만 `config/batch_backend.run_batch`로 모아 제출합니다. 요청 ID(custom_id)는 로컬에서
+(지원서, 문항, 모델) 매핑으로 관리하므로 provider가 결과를 어떤 순서로 돌려줘도 원래 위치로 돌아갑니다.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from pydantic import ValidationError
+
+from chains.review_chain import (
+    _initialize_context as _initialize_review_context,
+    _make_prompt as _make_review_prompt,
+    needs_full_rewrite,
+    plan_final_reviews,
+)
+from chains.writing_chain import DraftCandidate, _make_prompt as _make_writer_prompt, _strategy_keywords
+from config.batch_backend import BatchError, BatchRequest, BatchResult, run_batch
+from config.prompts import DEFAULT_GUIDELINE_TEXT, REVIEW_PATCH_HUMAN_PROMPT
+from config.settings import settings
+from models.output_models import EssayPatch
+from tools.draft_scorer import score_draft
+from tools.guideline_linter import get_linter
+from tools.llm_util import parse_llm_response_content
+from tools.text_patch import PatchApplyError, apply_edits
+
+StatusCallback = Callable[[list[dict[str, Any]]], None]
+
+
+@dataclass
+class _Slot:
+    """custom_id가 가리키는 (지원서, 문항, 모델) 위치"""
+    app_id: str
+    question_key: str
+    model: str
+    patch: bool = False
+
+
+def run_bulk_drafts(
+    applications: dict[str, dict[str, Any]],
+    model_pool: list[str],
+    candidates_per_question: int,
+    on_status: Optional[StatusCallback] = None,
+) -> dict[str, dict[str, list[DraftCandidate]]]:
+    """지원서별 모든 문항의 초안 후보를 배치 하나(provider/모델별)로 생성하고 로컬 채점기로 순위 결정
+
+    배치는 모든 요청이 끝나야 결과가 오므로 토너먼트의 조기 종료 없이 후보를 모두 채점합니다.
+
+    Args:
+        applications: 지원서 ID -> 세션 상태 (writing_strategy/writing_guidelines 포함)
+        model_pool: 순환 사용할 모델 목록
+        candidates_per_question: 문항별 후보 수
+        on_status: 배치 상태 콜백 (`run_batch` 참고)
+
+    Returns:
+        지원서 ID -> 문항 번호(1-based 문자열) -> 점수 내림차순 후보 리스트 (실패한 요청은 제외)
+    """
+    models = [model_pool[i % len(model_pool)] for i in range(candidates_per_question)]
+    slots: dict[str, _Slot] = {}
+    batch: list[BatchRequest] = []
+    for app_id, state in applications.items():
+        for i, question in enumerate(state.get("essay_questions", [])):
+            question_key = str(i + 1)
+            messages = _make_writer_prompt(state, question, question_key)
+            for model in models:
+                custom_id = f"draft-{len(batch)}"
+                slots[custom_id] = _Slot(app_id, question_key, model)
+                batch.append(BatchRequest(custom_id, model, messages, temperature=1.0))
+
+    results = run_batch(batch, on_status) if batch else {}
+
+    drafts: dict[str, dict[str, list[DraftCandidate]]] = {
+        app_id: {str(i + 1): [] for i in range(len(state.get("essay_questions", [])))}
+        for app_id, state in applications.items()
+    }
+    scoring = {
+        app_id: (
+            _strategy_keywords(state.get("writing_strategy")),
+            get_linter(state.get("writing_guidelines") or DEFAULT_GUIDELINE_TEXT),
+        )
+        for app_id, state in applications.items()
+    }
+    for custom_id, slot in slots.items():
+        result = results[custom_id]
+        if result.error is not None:
+            # 한 요청의 실패는 다른 후보로 대체
+            print(f"Batch draft error ({slot.app_id}/{slot.question_key}/{slot.model}): {result.error}")
+            continue
+        text = parse_llm_response_content(result.text)
+        question = applications[slot.app_id]["essay_questions"][int(slot.question_key) - 1]
+        keywords, linter = scoring[slot.app_id]
+        score = score_draft(text, question.get("char_limit"), keywords, linter)
+        drafts[slot.app_id][slot.question_key].append(DraftCandidate(model=slot.model, text=text, score=score))
+
+    for questions in drafts.values():
+        for candidates in questions.values():
+            candidates.sort(key=lambda c: c.score.total, reverse=True)
+    return drafts
+
+
+def run_bulk_reviews(
+    applications: dict[str, dict[str, Any]],
+    on_status: Optional[StatusCallback] = None,
+) -> dict[str, dict[str, str]]:
+    """지원서별 선택 초안과 피드백으로 최종본을 배치 생성
+
+    문항별 경로는 `plan_final_reviews`를 따릅니다(accept는 호출 없이 채택). settings.review_mode가 "patch"이면
+    수정 연산(EssayPatch JSON)을 요청해 로컬에서 적용하고, 파싱/적용에 실패한 문항만 두 번째 배치에서
+    전체 재작성합니다.
+
+    Args:
+        applications: 지원서 ID -> 세션 상태 (generated_drafts/draft_selections/draft_feedbacks 포함)
+        on_status: 배치 상태 콜백 (`run_batch` 참고)
+
+    Returns:
+        지원서 ID -> 문항 번호 -> 최종본
+
+    Raises:
+        BatchError: 전체 재작성 요청까지 실패한 문항이 있는 경우
+    """
+    finals: dict[str, dict[str, str]] = {app_id: {} for app_id in applications}
+    contexts = {}
+    slots: dict[str, _Slot] = {}
+    batch: list[BatchRequest] = []
+    for app_id, state in applications.items():
+        for question_key, triage in plan_final_reviews(state).items():  # type: ignore[arg-type]
+            context = _initialize_review_context(state, int(question_key) - 1)  # type: ignore[arg-type]
+            contexts[(app_id, question_key)] = context
+            if triage.decision == "accept":
+                finals[app_id][question_key] = context.draft
+                continue
+            patch = settings.review_mode == "patch" and not needs_full_rewrite(context)
+            custom_id = f"review-{len(batch)}"
+            slots[custom_id] = _Slot(app_id, question_key, triage.model or "", patch)
+            batch.append(_review_request(custom_id, context, slots[custom_id]))
+
+    retry: dict[str, _Slot] = {}
+    retry_batch: list[BatchRequest] = []
+    results = run_batch(batch, on_status) if batch else {}
+    for custom_id, slot in slots.items():
+        context = contexts[(slot.app_id, slot.question_key)]
+        text = _review_text(results[custom_id], context.draft, slot.patch)
+        if text is not None:
+            finals[slot.app_id][slot.question_key] = text
+            continue
+        # 형식 오류나 문구 불일치, 실패한 패치 요청은 전체 재작성으로 다시 제출
+        rewrite = _Slot(slot.app_id, slot.question_key, slot.model)
+        retry_id = f"rewrite-{len(retry_batch)}"
+        retry[retry_id] = rewrite
+        retry_batch.append(_review_request(retry_id, context, rewrite))
+
+    retry_results = run_batch(retry_batch, on_status) if retry_batch else {}
+    failed = []
+    for custom_id, slot in retry.items():
+        text = _review_text(retry_results[custom_id], "", patch=False)
+        if text is None:
+            failed.append(f"{slot.app_id}/{slot.question_key}: {retry_results[custom_id].error}")
+            continue
+        finals[slot.app_id][slot.question_key] = text
+    if failed:
+        raise BatchError(f"최종 검토 배치 실패: {'; '.join(failed)}")
+    return finals
+
+
+def _review_request(custom_id: str, context: Any, slot: _Slot) -> BatchRequest:
+    if slot.patch:
+        return BatchRequest(
+            custom_id, slot.model, _make_review_prompt(context, REVIEW_PATCH_HUMAN_PROMPT),
+            temperature=0.7, json_schema=EssayPatch.model_json_schema(),
+        )
+    return BatchRequest(custom_id, slot.model, _make_review_prompt(context), temperature=0.7)
+
+
+def _review_text(result: BatchResult, draft: str, patch: bool) -> Optional[str]:
+    """검토 응답을 최종본으로 변환 (실패하면 None)"""
+    if result.error is not None:
+        return None
+    if not patch:
+        return parse_llm_response_content(result.text)
+    try:
+        return apply_edits(draft, EssayPatch.model_validate_json(result.text or "").edits)
+    except (ValidationError, PatchApplyError):
+        return None
@@ -0,0 +1,74 @@
+"""문항별 경험 컨텍스트 구성
+
+파싱된 Experience 목록이 있으면 문항과 관련된 경험(BM25 상위 k개 + 문항별 전략에서
+언급된 경험)만 프롬프트에 넣고, 없으면 기존처럼 전체 경험 텍스트를 사용합니다.
+"""
+import hashlib
+import re
+from typing import Any, List
+
+from config.settings import settings
+from tools.experience_index import ExperienceIndex, find_named_experiences, format_experiences
+
+def experience_text_hash(text: str) -> str:
+    """경험 원문 해시 (원문이 바뀌면 파싱 결과를 다시 만들기 위한 키)"""
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+def has_parsed_experiences(state: Any) -> bool:
+    """현재 경험 원문에 대한 파싱 결과가 State에 있는지 여부"""
+    return (
+        state.get("parsed_experiences") is not None
+        and state.get("parsed_experiences_hash") == experience_text_hash(state.get("user_experiences", ""))
+    )
+
+def store_parsed_experiences(state: Any, experiences: List[dict], source_text: str) -> None:
+    """파싱 결과를 원문 해시와 함께 State에 저장"""
+    state["parsed_experiences"] = experiences
+    state["parsed_experiences_hash"] = experience_text_hash(source_text)
+
+def experiences_for_question(state: Any, question_text: str, question_key: str) -> str:
+    """문항 프롬프트에 넣을 경험 텍스트
+    
+    Args:
+        state: 현재 세션 상태
+        question_text: 문항 원문
+        question_key: 문항 번호 (1-based 문자열, WritingStrategy.question_strategy 키)
+        
+    Returns:
+        관련 경험만 정리한 텍스트 (파싱 결과가 없거나 관련 경험을 못 찾으면 전체 원문)
+    """
+    full_text = state.get("user_experiences", "")
+    if not has_parsed_experiences(state) or not state["parsed_experiences"]:
+        return full_text
+    
+    experiences = state["parsed_experiences"]
+    strategy_text = question_strategy_text(state.get("writing_strategy"), question_key)
+    
+    index = ExperienceIndex(experiences)
+    query = f"{question_text}\n{strategy_text}"
+    selected = [exp for exp, _ in index.search(query, settings.experience_top_k)]
+    for exp in find_named_experiences(experiences, strategy_text):
+        if exp not in selected:
+            selected.append(exp)
+    
+    if not selected:
+        return full_text
+    return format_experiences(selected)
+
+def question_strategy_text(writing_strategy: Any, question_key: str) -> str:
+    """작성 전략에서 해당 문항의 전략 텍스트 조회 (키 표기가 'Q1', '문항 1' 등이어도 번호로 매칭)"""
+    if not writing_strategy:
+        return ""
+    if hasattr(writing_strategy, "question_strategy"):
+        question_strategy = writing_strategy.question_strategy
+    elif isinstance(writing_strategy, dict):
+        question_strategy = writing_strategy.get("question_strategy", {})
+    else:
+        return ""
+    
+    if question_key in question_strategy:
+        return question_strategy[question_key]
+    for key, value in question_strategy.items():
+        if re.sub(r"\D", "", str(key)) == question_key:
+            return value
+    return ""
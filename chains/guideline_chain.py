@@ -1,11 +1,18 @@
+from typing import Any, Iterator, Optional
+
 from pydantic import BaseModel, Field
 
 from config.llm_factory import get_chat_model
+from config.model_router import route_model
 from config.prompts import GUIDELINE_VALIDATION_PROMPT, DEFAULT_GUIDELINE_TEXT
+from models.output_models import TextEdit
+from tools.llm_util import get_provider_for_model
+from tools.partial_json import StructuredOutputStream
+from tools.text_patch import PatchApplyError, apply_edits
 
 
-class GuidelineValidationResult(BaseModel):
-    """가이드라인 검증 결과"""
+class GuidelineReview(BaseModel):
+    """가이드라인 검토 (모델 출력용, 개선본 전체 대신 수정 연산만 반환)"""
     is_valid: bool = Field(description="가이드라인이 적절한지 여부")
     issues: list[str] = Field(
         default_factory=list,
@@ -15,38 +22,116 @@ class GuidelineValidationResult(BaseModel):
         default_factory=list,
         description="개선 제안 목록"
     )
+    edits: list[TextEdit] = Field(
+        default_factory=list,
+        description="가이드라인 원문에 적용할 수정 연산 목록 (그대로 승인하면 빈 목록)"
+    )
+
+class GuidelineValidationResult(GuidelineReview):
+    """가이드라인 검증 결과 (improved_guideline은 수정 연산을 원문에 적용해 로컬에서 채움)"""
     improved_guideline: str = Field(
         description="개선된 가이드라인 (문제가 있는 경우) 또는 승인된 원본"
     )
 
+class GuidelineReviewStream:
+    """검토 필드를 스트리밍하고, 반복 종료 후 `result`에 개선본을 채운 GuidelineValidationResult를 담는 스트림"""
+
+    def __init__(self, stream: StructuredOutputStream[GuidelineReview], user_text: str) -> None:
+        self._stream = stream
+        self.user_text = user_text
+        self.result: Optional[GuidelineValidationResult] = None
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        yield from self._stream
+        assert self._stream.result is not None
+        self.result = apply_guideline_review(self.user_text, self._stream.result)
+
+def apply_guideline_review(user_text: str, review: GuidelineReview) -> GuidelineValidationResult:
+    """수정 연산을 원문에 적용하여 검증 결과 구성
+
+    원문에서 문구를 찾지 못한 연산은 건너뛰고 문제점 목록에 알립니다.
+
+    Args:
+        user_text: 사용자가 입력한 가이드라인
+        review: 모델의 검토 결과
+
+    Returns:
+        improved_guideline이 채워진 GuidelineValidationResult
+    """
+    improved = user_text
+    applied: list[TextEdit] = []
+    for edit in review.edits:
+        try:
+            improved = apply_edits(improved, [edit])
+        except PatchApplyError:
+            continue
+        applied.append(edit)
+    
+    issues = list(review.issues)
+    if len(applied) < len(review.edits):
+        issues.append(f"개선안 {len(review.edits) - len(applied)}건은 원문에서 위치를 찾지 못해 반영하지 않았습니다.")
+    return GuidelineValidationResult(
+        is_valid=review.is_valid,
+        issues=issues,
+        suggestions=review.suggestions,
+        edits=applied,
+        improved_guideline=improved,
+    )
+
 def ai_validate_guidelines(
     user_text: str,
-    model: str = "gemini-2.5-flash",
-    provider: str = "google_genai"
+    model: Optional[str] = None,
+    provider: Optional[str] = None
 ) -> GuidelineValidationResult:
     """AI 모델을 사용하여 사용자의 가이드라인을 검수
     
     Args:
         user_text: 사용자가 입력한 가이드라인
-        model: 사용할 모델
-        provider: LLM 프로바이더
+        model: 사용할 모델 (None이면 라우터가 "guideline" 정책으로 선택)
+        provider: LLM 프로바이더 (None이면 모델명으로 결정)
         
     Returns:
         GuidelineValidationResult: 검증 결과 및 개선된 가이드라인
     """
-    llm = get_chat_model(provider=provider, model=model, temperature=0.3)
+    model = model or route_model("guideline")
+    llm = get_chat_model(provider=provider or get_provider_for_model(model), model=model, temperature=0.3)
     
     chain = (
         GUIDELINE_VALIDATION_PROMPT
-        | llm.with_structured_output(GuidelineValidationResult)
+        | llm.with_structured_output(GuidelineReview)
     )
     
     result = chain.invoke({"user_guideline": user_text})
     if isinstance(result, dict):
-        return GuidelineValidationResult(**result)
-    if isinstance(result, GuidelineValidationResult):
-        return result
-    # If result is a BaseModel (but not GuidelineValidationResult), convert it
+        return apply_guideline_review(user_text, GuidelineReview(**result))
+    if isinstance(result, GuidelineReview):
+        return apply_guideline_review(user_text, result)
+    # If result is a BaseModel (but not GuidelineReview), convert it
     if isinstance(result, BaseModel):
-        return GuidelineValidationResult(**result.model_dump())
-    raise TypeError("Unexpected result type: {}".format(type(result)))
\ No newline at end of file
+        return apply_guideline_review(user_text, GuidelineReview(**result.model_dump()))
+    raise TypeError("Unexpected result type: {}".format(type(result)))
+
+def stream_guideline_validation(
+    user_text: str,
+    model: Optional[str] = None,
+    provider: Optional[str] = None
+) -> GuidelineReviewStream:
+    """가이드라인 검수 결과를 필드 단위로 스트리밍
+    
+    issues/suggestions를 edits보다 먼저 표시할 수 있습니다.
+    
+    Args:
+        user_text: 사용자가 입력한 가이드라인
+        model: 사용할 모델 (None이면 라우터가 "guideline" 정책으로 선택)
+        provider: LLM 프로바이더 (None이면 모델명으로 결정)
+        
+    Returns:
+        (필드명, 값)을 순서대로 방출하고 반복 종료 후 `result`에 GuidelineValidationResult를 담는 스트림
+    """
+    model = model or route_model("guideline")
+    llm = get_chat_model(provider=provider or get_provider_for_model(model), model=model, temperature=0.3)
+    
+    return GuidelineReviewStream(
+        StructuredOutputStream(llm, GUIDELINE_VALIDATION_PROMPT, {"user_guideline": user_text}, GuidelineReview),
+        user_text,
+    )
@@ -1,8 +1,19 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
 from pydantic import BaseModel, Field
-from typing import List
-from config.llm_factory import parsing_user_data_llm
+from typing import Any, List, cast
+from config.llm_factory import get_task_chat_model
+from config.settings import settings
+from config.tenancy import tenant_slot
 from models.input_models import Experience
+from tools.experience_chunker import merge_experiences, split_experience_chunks
+
+# 청크 내용 해시 -> 파싱된 경험 목록 (프로세스 공용, LRU)
+_chunk_cache: "OrderedDict[str, List[Experience]]" = OrderedDict()
+_chunk_cache_lock = threading.Lock()
 
 # Pydantic 모델 정의 (출력 파싱용)
 class ExperienceList(BaseModel):
@@ -13,7 +24,7 @@ def create_experience_parsing_chain():
     """비정형 텍스트에서 경험 정보를 추출하는 체인"""
     
     # 최신 LangChain: with_structured_output() 사용
-    structured_llm = parsing_user_data_llm.with_structured_output(ExperienceList)
+    structured_llm = get_task_chat_model("parsing", temperature=0).with_structured_output(ExperienceList)
     
     prompt = ChatPromptTemplate.from_messages([
         ("system", """당신은 이력서 데이터 구조화 전문가입니다.
@@ -31,9 +42,12 @@ def create_experience_parsing_chain():
     chain = prompt | structured_llm
     return chain
 
-def parse_experiences_from_text(text: str) -> List[dict]:
+def parse_experiences_from_text(text: str) -> List[Experience]:
     """텍스트를 파싱하여 경험 리스트 딕셔너리로 반환
     
+    프로젝트/기간 경계로 나눈 청크를 병렬로 파싱한 뒤 병합합니다.
+    청크별 결과는 내용 해시로 캐시하므로, 수정된 청크만 다시 파싱합니다.
+    
     Args:
         text: 파싱할 비정형 텍스트
         
@@ -46,13 +60,58 @@ def parse_experiences_from_text(text: str) -> List[dict]:
     chain = create_experience_parsing_chain()
     if not chain:
         raise ValueError("LLM 설정 오류: API Key를 확인해주세요.")
-        
-    try:
-        result = chain.invoke({"text": text})
-        # Pydantic 모델을 dict로 변환
-        return [exp.model_dump() if hasattr(exp, 'model_dump') else exp.dict() 
-                for exp in result.experiences] # type: ignore
-    except Exception as e:
-        # 실제 운영시에는 로깅 필요
-        print(f"Parsing error: {e}")
-        raise ValueError(f"AI 파싱 실패: {str(e)}")
+    
+    chunks = split_experience_chunks(text, settings.experience_chunk_max_chars)
+    keys = [_chunk_key(chunk) for chunk in chunks]
+    cached = {key: _get_cached_chunk(key) for key in keys}
+    missing = list(dict.fromkeys(
+        (key, chunk) for key, chunk in zip(keys, chunks) if cached[key] is None
+    ))
+    
+    if missing:
+        def parse_chunk(inputs: dict[str, str]) -> Any:
+            # 청크 호출마다 사용자 슬롯을 얻어 다른 작업과 합쳐도 사용자별 동시 호출 한도를 넘지 않음
+            with tenant_slot():
+                return chain.invoke(inputs)
+
+        outputs = RunnableLambda[dict[str, str], Any](parse_chunk).batch(
+            [{"text": chunk} for _, chunk in missing],
+            config={"max_concurrency": settings.experience_parse_concurrency},
+            return_exceptions=True,
+        )
+        errors = []
+        for (key, _), output in zip(missing, outputs):
+            if isinstance(output, Exception):
+                errors.append(output)
+                continue
+            parsed = _to_dicts(output.experiences)  # type: ignore[union-attr]
+            cached[key] = parsed
+            _put_cached_chunk(key, parsed)
+        if errors:
+            # 실제 운영시에는 로깅 필요 (성공한 청크는 캐시되어 재시도 시 다시 호출하지 않음)
+            print(f"Parsing error: {errors[0]}")
+            raise ValueError(f"AI 파싱 실패 ({len(errors)}/{len(missing)}개 청크): {str(errors[0])}")
+    
+    return merge_experiences([cached[key] or [] for key in keys])
+
+def _to_dicts(experiences) -> List[Experience]:
+    # Experience는 TypedDict라 이미 dict로 검증되지만, 모델 객체가 오는 경우도 처리
+    return [cast(Experience, exp.model_dump() if hasattr(exp, 'model_dump') else dict(exp)) for exp in experiences]
+
+def _chunk_key(chunk: str) -> str:
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+def _get_cached_chunk(key: str) -> List[Experience] | None:
+    with _chunk_cache_lock:
+        if key not in _chunk_cache:
+            return None
+        _chunk_cache.move_to_end(key)
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환
+        return [Experience(**exp) for exp in _chunk_cache[key]]
+
+def _put_cached_chunk(key: str, experiences: List[Experience]) -> None:
+    with _chunk_cache_lock:
+        _chunk_cache[key] = [Experience(**exp) for exp in experiences]
+        _chunk_cache.move_to_end(key)
+        while len(_chunk_cache) > settings.experience_chunk_cache_size:
+            _chunk_cache.popitem(last=False)
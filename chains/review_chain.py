@@ -1,23 +1,54 @@
 import asyncio
 from dataclasses import dataclass
+from typing import Literal, Optional
 
+from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import (
     SystemMessage, 
     HumanMessage, 
     BaseMessage, 
     AnyMessage
 )
+from pydantic import ValidationError
 from tools.llm_util import (
     parse_llm_response_content,
-    format_messages_to_text
+    format_messages_to_text,
+    estimate_tokens
 )
 from models.state import ResumeState
 from config.prompts import (
     REVIEW_SYSTEM_PROMPT, 
     REVIEW_HUMAN_PROMPT, 
+    REVIEW_PATCH_HUMAN_PROMPT,
     DEFAULT_GUIDELINE_TEXT
 )
-from config.llm_factory import final_llm
+from config.llm_factory import get_chat_model, get_task_chat_model
+from config.model_router import route_model
+from config.settings import settings
+from config.tenancy import async_tenant_slot
+from chains.experience_context import experiences_for_question
+from models.output_models import EssayPatch
+from tools.draft_scorer import score_draft
+from tools.guideline_linter import get_linter, violation_summary
+from tools.llm_util import get_provider_for_model
+from tools.text_patch import PatchApplyError, apply_edits
+
+NO_DRAFT_TEXT = "선택된 초안이 없습니다."
+NO_FEEDBACK_TEXT = "별도의 수정 요청사항 없음 (자연스럽게 다듬어주세요)"
+
+# 문장 단위 수정으로는 반영하기 어려운 구조 변경 요청 (전체 재작성으로 처리)
+_STRUCTURAL_FEEDBACK_KEYWORDS = (
+    "구조", "순서", "재구성", "흐름을 바", "전면", "처음부터", "다시 써", "다시 작성", "새로 써", "새로 작성",
+    "통째로", "전체적으로 바", "다른 경험", "소재를 바", "소재 변경", "분량", "줄여", "늘려", "요약",
+)
+
+# 문장 다듬기 수준의 요청 (짧은 피드백에 이 표현만 있으면 flash 모델로 처리)
+_LIGHT_FEEDBACK_KEYWORDS = (
+    "오타", "맞춤법", "띄어쓰기", "문법", "비문", "어색", "다듬", "자연스럽", "매끄럽",
+    "어투", "말투", "어조", "톤", "표현", "단어", "조사", "문장부호",
+)
+
+TriageDecision = Literal["accept", "light", "full"]
 
 @dataclass
 class ReviewContext:
@@ -28,29 +59,80 @@ class ReviewContext:
     company_name: str
     position_name: str
     user_experiences: str
+    char_limit: Optional[int] = None
+    has_feedback: bool = True
+
+@dataclass
+class ReviewTriage:
+    """문항별 검토 경로 결정 (accept: 호출 없이 채택, light: flash 모델, full: pro 모델)"""
+    decision: TriageDecision
+    reason: str
+    model: Optional[str] = None
+
+def plan_final_reviews(state: ResumeState) -> dict[str, ReviewTriage]:
+    """문항별로 최종 검토 호출 여부와 모델을 결정 (LLM 호출 없음)
+
+    - 피드백 없음: 글자 수 제한과 금지 표현 검사를 통과하면 그대로 채택,
+      금지 표현만 있으면 다듬기(light), 글자 수 초과는 분량 조정이 필요하므로 full
+    - 짧은 문장 다듬기 요청(오타/어색한 표현 등): light ("review_light" 라우팅, flash 모델)
+    - 그 외 내용/구조 피드백: full ("review" 라우팅, pro 모델)
+
+    settings.review_triage_enabled가 False이면 모든 문항을 full로 처리합니다.
 
-def generate_final_essays(state: ResumeState) -> dict[str, str]:
+    Args:
+        state: 현재 세션 상태
+
+    Returns:
+        문항 번호(1-based 문자열) -> ReviewTriage
+    """
+    plan = {}
+    for i, _ in enumerate(state.get("essay_questions", [])):
+        context = _initialize_context(state, i)
+        if settings.review_triage_enabled:
+            decision, reason = _triage(context)
+        else:
+            decision, reason = "full", "분류 비활성화"
+
+        model = None
+        if decision != "accept":
+            input_tokens = sum(estimate_tokens(str(m.content)) for m in _make_prompt(context))
+            model = route_model("review_light" if decision == "light" else "review", input_tokens)
+        plan[str(i + 1)] = ReviewTriage(decision=decision, reason=reason, model=model)
+    return plan
+
+def generate_final_essays(
+    state: ResumeState, plan: Optional[dict[str, ReviewTriage]] = None
+) -> dict[str, str]:
     """
-    Step 6에서 선택된 초안과 피드백을 바탕으로 최종 초안 생성을 위한 프롬프트를 반환합니다.
-    (실제 LLM 호출 대신 프롬프트 텍스트를 반환, 비동기 구조 유지)
+    Step 6에서 선택된 초안과 피드백을 바탕으로 최종 초안을 생성합니다.
+    문항별로 `plan_final_reviews`의 결정에 따라 초안을 그대로 채택하거나 flash/pro 모델로 다듬습니다.
     
     Args:
         state (ResumeState): 현재 세션 상태
+        plan: 문항별 검토 경로 (없으면 `plan_final_reviews`로 결정)
         
     Returns:
-        Dict[str, str]: 문항 번호(ID)를 키로 하고, 생성된 프롬프트 텍스트를 값으로 하는 딕셔너리
+        Dict[str, str]: 문항 번호(ID)를 키로 하고, 최종본을 값으로 하는 딕셔너리
     """
     questions = state.get("essay_questions", [])
+    plan = plan if plan is not None else plan_final_reviews(state)
     final_results = {}
     
+    async def _accept(q_idx: str, draft: str) -> tuple[str, str]:
+        return (q_idx, draft)
+    
     async def _process_all_questions():
         tasks = []
         for i, q in enumerate(questions):
             # 1-based index string for keys
             q_idx = str(i + 1)
             context = _initialize_context(state, i)
-            # tasks.append(_generate_single_final_draft_test(q_idx, context))
-            tasks.append(_generate_single_final_draft(q_idx, context))
+            triage = plan.get(q_idx)
+            if triage is not None and triage.decision == "accept":
+                tasks.append(_accept(q_idx, context.draft))
+            else:
+                # tasks.append(_generate_single_final_draft_test(q_idx, context))
+                tasks.append(_generate_single_final_draft(q_idx, context, triage.model if triage else None))
         
         # [(q_idx, text), (q_idx, text), ...]
         results = await asyncio.gather(*tasks)
@@ -90,17 +172,96 @@ async def _generate_single_final_draft_test(
     return (q_idx, full_prompt_text)
 
 async def _generate_single_final_draft(
-    q_idx: str, context: ReviewContext
+    q_idx: str, context: ReviewContext, model: Optional[str] = None
 ) -> tuple[str, str]:
-    """단일 문항에 대한 피드백을 반영하여 최종 초안 생성"""
+    """단일 문항에 대한 피드백을 반영하여 최종 초안 생성
+
+    settings.review_mode가 "patch"이고 구조 변경 피드백이 아니면 수정 연산만 받아 로컬에서 적용하고,
+    연산을 적용하지 못하면 전체 재작성으로 다시 생성합니다.
+
+    Args:
+        q_idx: 문항 번호
+        context: 검토 컨텍스트
+        model: 사용할 모델 (None이면 라우터가 "review" 정책으로 선택)
+    """
+    if settings.review_mode == "patch" and not needs_full_rewrite(context):
+        try:
+            return (q_idx, await _generate_patched_draft(context, model))
+        except (PatchApplyError, OutputParserException, ValidationError):
+            # 문구 불일치, 형식 오류(빈 응답, 스키마 불일치)는 전체 재작성으로 복구
+            pass
+    return (q_idx, await _generate_rewritten_draft(context, model))
+
+
+def needs_full_rewrite(context: ReviewContext) -> bool:
+    """수정 연산 대신 전체 재작성이 필요한지 여부 (초안이 없거나 구조 변경 피드백)"""
+    if not context.draft.strip() or context.draft == NO_DRAFT_TEXT:
+        return True
+    return any(keyword in context.feedback for keyword in _STRUCTURAL_FEEDBACK_KEYWORDS)
+
+
+async def _generate_patched_draft(context: ReviewContext, model: Optional[str] = None) -> str:
+    """수정 연산(EssayPatch)을 받아 선택된 초안에 적용
+
+    Raises:
+        PatchApplyError: 수정 연산의 문구를 초안에서 찾지 못한 경우
+        OutputParserException: 모델이 수정 연산을 반환하지 않은 경우
+        ValidationError: 수정 연산이 EssayPatch 스키마에 맞지 않는 경우
+    """
+    messages = _make_prompt(context, REVIEW_PATCH_HUMAN_PROMPT)
+    patch_llm = _review_llm(messages, model).with_structured_output(EssayPatch)
+
+    async with async_tenant_slot():
+        patch = await patch_llm.ainvoke(messages)
+
+    if patch is None:
+        raise OutputParserException("수정 연산 응답이 비어 있습니다.")
+    return apply_edits(context.draft, EssayPatch.model_validate(patch).edits)
+
+
+async def _generate_rewritten_draft(context: ReviewContext, model: Optional[str] = None) -> str:
+    """초안 전체를 다시 작성"""
     messages = _make_prompt(context)
+    final_llm = _review_llm(messages, model)
 
-    response = final_llm.invoke(messages)
+    # 동기 invoke는 이벤트 루프를 막아 문항별 생성이 순차 실행되므로 비동기로 호출
+    async with async_tenant_slot():
+        response = await final_llm.ainvoke(messages)
     
     # 유틸리티 함수를 사용하여 안전하게 텍스트 추출
-    result = parse_llm_response_content(response.content)
+    return parse_llm_response_content(response.content)
+
+
+def _review_llm(messages: list[BaseMessage | AnyMessage], model: Optional[str]):
+    """지정 모델 또는 "review" 라우팅 모델 인스턴스"""
+    if model:
+        return get_chat_model(get_provider_for_model(model), model, temperature=0.7)
+    return get_task_chat_model(
+        "review", temperature=0.7, input_tokens=sum(estimate_tokens(str(m.content)) for m in messages)
+    )
+
+
+def _triage(context: ReviewContext) -> tuple[TriageDecision, str]:
+    """검토 경로와 사유"""
+    if context.draft == NO_DRAFT_TEXT or not context.draft.strip():
+        return "full", "선택된 초안 없음"
 
-    return (q_idx, result)
+    if not context.has_feedback:
+        score = score_draft(context.draft, context.char_limit, [], get_linter(context.guidelines))
+        if score.char_fit == 0:
+            return "full", f"글자 수 초과 ({score.char_count}/{context.char_limit})"
+        if score.violations:
+            return "light", f"가이드라인 위반 {len(score.violations)}건: {', '.join(score.violations)}"
+        return "accept", "피드백 없음, 로컬 검사 통과"
+
+    if needs_full_rewrite(context):
+        return "full", "구조 변경 피드백"
+    if (
+        len(context.feedback) <= settings.review_light_feedback_max_chars
+        and any(keyword in context.feedback for keyword in _LIGHT_FEEDBACK_KEYWORDS)
+    ):
+        return "light", "문장 다듬기 피드백"
+    return "full", "내용 수정 피드백"
 
 
 def _initialize_context(state: ResumeState, idx: int) -> ReviewContext:
@@ -121,22 +282,28 @@ def _initialize_context(state: ResumeState, idx: int) -> ReviewContext:
     if draft_list and len(draft_list) > selected_idx:
         selected_draft = draft_list[selected_idx]
     else:
-        selected_draft = "선택된 초안이 없습니다."
+        selected_draft = NO_DRAFT_TEXT
         
     # 피드백 가져오기
     feedbacks = state.get("draft_feedbacks", {})
-    feedback_text = feedbacks.get(q_id, "")
-    if not feedback_text:
-        feedback_text = "별도의 수정 요청사항 없음 (자연스럽게 다듬어주세요)"
+    feedback_text = feedbacks.get(q_id, "").strip()
+    has_feedback = bool(feedback_text)
     
     # 추가 컨텍스트 정보
     guidelines = state.get("writing_guidelines")
     if not guidelines:
         guidelines = DEFAULT_GUIDELINE_TEXT
+    
+    if not has_feedback:
+        # 피드백이 없어도 가이드라인 위반이 있으면 그 부분만 고치도록 요청
+        violations = violation_summary(get_linter(guidelines).lint(selected_draft))
+        feedback_text = (
+            f"다음 가이드라인 위반 표현을 고쳐주세요: {', '.join(violations)}" if violations else NO_FEEDBACK_TEXT
+        )
         
     company_name = state.get("company_name", "회사명 미상")
     position_name = state.get("position_name", "직무 미상")
-    user_experiences = state.get("user_experiences", "")
+    user_experiences = experiences_for_question(state, question_text, q_id)
         
     return ReviewContext(
         question=question_text,
@@ -145,10 +312,14 @@ def _initialize_context(state: ResumeState, idx: int) -> ReviewContext:
         guidelines=guidelines,
         company_name=company_name,
         position_name=position_name,
-        user_experiences=user_experiences
+        user_experiences=user_experiences,
+        char_limit=question_item.get("char_limit"),
+        has_feedback=has_feedback,
     )
 
-def _make_prompt(context: ReviewContext) -> list[BaseMessage | AnyMessage]:
+def _make_prompt(
+    context: ReviewContext, human_prompt: str = REVIEW_HUMAN_PROMPT
+) -> list[BaseMessage | AnyMessage]:
     """Context를 기반으로 LangChain 메시지 리스트 생성"""
     
     # 시스템 메시지 (추가 정보 포맷팅)
@@ -161,7 +332,7 @@ def _make_prompt(context: ReviewContext) -> list[BaseMessage | AnyMessage]:
     system_msg = SystemMessage(content=system_content)
     
     # 사용자 메시지 (템플릿 적용)
-    human_content = REVIEW_HUMAN_PROMPT.format(
+    human_content = human_prompt.format(
         question=context.question,
         draft=context.draft,
         feedback=context.feedback
@@ -1,19 +1,26 @@
+from typing import Optional
+
 from config.llm_factory import get_chat_model
+from config.model_router import route_model
 from config.prompts import INITIAL_STRATEGY_PROMPT, FEEDBACK_STRATEGY_PROMPT, EXTRACTION_PROMPT
-from models.output_models import WritingStrategy, StrategyResponse
+from models.output_models import StrategyExtraction, WritingStrategy, StrategyResponse
+from models.state import get_content
+from tools.research_cache import condense_research
 from tools.llm_util import get_provider_for_model
+from tools.strategy_parser import parse_strategy_markdown
 
 def create_initial_strategy_chain(
-    model: str = "gemini-3-pro-preview",
+    model: Optional[str] = None,
 ):
     """초기 전략 수립 체인 생성 (with_structured_output 사용)
     
     Args:
-        model: 사용할 모델 (gemini-3-pro-preview, gemini-3-flash-preview, gemini-2.5-pro, gemini-2.5-flash)
+        model: 사용할 모델 (None이면 라우터가 "strategy" 정책으로 선택)
         
     Returns:
         Runnable chain
     """
+    model = model or route_model("strategy")
     llm = get_chat_model(
         provider=get_provider_for_model(model),
         model=model, temperature=0.7
@@ -24,17 +31,31 @@ def create_initial_strategy_chain(
         | llm.with_structured_output(StrategyResponse)
     )
 
+def build_initial_strategy_inputs(state) -> dict[str, str]:
+    """State에서 초기 전략 체인 입력값 구성 (UI와 API 공용)"""
+    c_content = get_content(state.get("company_research"), "리서치 정보 없음")
+    return {
+        "company_name": state["company_name"],
+        "position_name": state["position_name"],
+        "job_posting": state["job_posting"],
+        # 참고 문헌/URL 등 전략 수립에 불필요한 부분을 뺀 축약본 사용
+        "company_research": condense_research(c_content),
+        "essay_questions": "\n".join([f"{i+1}. {q['question_text']}" for i, q in enumerate(state["essay_questions"])]),
+        "user_experiences": state["user_experiences"]
+    }
+
 def create_feedback_strategy_chain(
-    model: str = "gemini-2.5-flash",
+    model: Optional[str] = None,
 ):
     """피드백 반영 전략 수정 체인 (채팅 히스토리 포함)
     
     Args:
-        model: 사용할 모델 (gemini-3-pro-preview, gemini-3-flash-preview, gemini-2.5-pro, gemini-2.5-flash)
+        model: 사용할 모델 (None이면 라우터가 "strategy_feedback" 정책으로 선택)
         
     Returns:
         Runnable chain
     """
+    model = model or route_model("strategy_feedback")
     llm = get_chat_model(
         provider=get_provider_for_model(model),
         model=model, temperature=0.7
@@ -46,20 +67,45 @@ def create_feedback_strategy_chain(
     )
 
 def create_strategy_extraction_chain(
-    model: str = "gemini-2.5-pro"
+    model: Optional[str] = None
 ):
     """전략 텍스트 -> 구조화된 데이터 변환 체인
     
+    모델은 추출 항목(StrategyExtraction)만 반환하고, 문서 원문은 호출한 쪽에서 채웁니다.
+    (원문을 다시 출력하게 하면 완료 토큰 대부분이 이미 가진 문서의 복사에 쓰임)
+    
     Args:
-        model: 사용할 모델
+        model: 사용할 모델 (None이면 라우터가 "strategy_extraction" 정책으로 선택)
         
     Returns:
         Runnable chain
     """
+    model = model or route_model("strategy_extraction")
     provider_name = get_provider_for_model(model)
     llm = get_chat_model(provider=provider_name, model=model, temperature=0)
     
     return (
         EXTRACTION_PROMPT
-        | llm.with_structured_output(WritingStrategy)
+        | llm.with_structured_output(StrategyExtraction)
     )
+
+def extract_writing_strategy(
+    content: str,
+    model: Optional[str] = None
+) -> WritingStrategy:
+    """전략 Markdown을 WritingStrategy로 변환 (로컬 파서 우선, 실패 시 LLM 추출)
+    
+    Args:
+        content: 확정된 전략 Markdown 문서
+        model: 로컬 파싱 실패 시 사용할 추출 모델 (None이면 라우터가 선택)
+        
+    Returns:
+        content에 원본 문서가 담긴 WritingStrategy
+    """
+    strategy = parse_strategy_markdown(content)
+    if strategy is not None:
+        return strategy
+    
+    extracted = create_strategy_extraction_chain(model).invoke({"content": content})
+    # 텍스트 원본은 모델 출력 대신 입력 문서로 채움
+    return WritingStrategy(**extracted.model_dump(), content=content)  # type: ignore[union-attr]
@@ -1,36 +1,73 @@
 from pydantic import BaseModel, Field
-from typing import List, Literal
-from config.llm_factory import input_validation_llm
-from config.prompts import INPUT_VALIDATION_PROMPT
+from typing import Any, Iterator, List, Literal, Optional
+from config.llm_factory import get_task_chat_model
+from config.prompts import INPUT_VALIDATION_PROMPT, PREPARED_POSTING_VALIDATION_PROMPT
+from config.settings import settings
 from models.state import ResumeState
+from tools.partial_json import StructuredOutputStream
+from tools.posting_index import get_posting_store
+from tools.research_cache import research_cache_key
 
 # 검증 결과 모델
 class ValidationItem(BaseModel):
     status: Literal["충분", "부족", "불명확"] = Field(description="항목의 상태")
     reason: str = Field(description="판단 이유")
 
-class ValidationResult(BaseModel):
+class ValidationJudgement(BaseModel):
+    """판정 항목만 담은 검증 결과 (이미 정리된 공고를 검증할 때의 출력 스키마)"""
     company_name: ValidationItem = Field(description="회사명 검증 결과")
     job_posting: ValidationItem = Field(description="채용공고 검증 결과")
+    overall_status: Literal["PASS", "FAIL"] = Field(description="전체 통과 여부")
+    additional_questions: List[str] = Field(description="부족하거나 불명확한 항목에 대해 사용자에게 물어볼 추가 질문 목록")
+
+class ValidationResult(ValidationJudgement):
     cleaned_job_posting: str = Field(
         description="채용공고에서 필요한 내용만 추출하여 정리한 결과. "
                     "회사 소개, 직무 설명, 주요 업무, 필수/우대 자격요건, 기대역량, "
                     "인재상, 복리후생 등 지원서 작성에 필요한 핵심 정보만 포함. "
                     "광고성 문구, 네비게이션 메뉴, 페이지 헤더/푸터, 중복 컨텐츠는 제거"
     )
-    overall_status: Literal["PASS", "FAIL"] = Field(description="전체 통과 여부")
-    additional_questions: List[str] = Field(description="부족하거나 불명확한 항목에 대해 사용자에게 물어볼 추가 질문 목록")
 
-def create_validation_chain():
-    """입력 데이터 충분성 검증 체인"""
+class PreparedPostingValidationStream:
+    """판정 필드를 스트리밍하고, 반복 종료 후 정리본(입력 공고 그대로)을 마지막 필드로 방출하는 스트림"""
+
+    def __init__(self, stream: StructuredOutputStream[ValidationJudgement], job_posting: str) -> None:
+        self._stream = stream
+        self.job_posting = job_posting
+        self.result: Optional[ValidationResult] = None
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        yield from self._stream
+        assert self._stream.result is not None
+        self.result = _with_prepared_posting(self._stream.result, self.job_posting)
+        yield "cleaned_job_posting", self.result.cleaned_job_posting
+
+def create_validation_chain(prepared_posting: bool = False):
+    """입력 데이터 충분성 검증 체인
+    
+    Args:
+        prepared_posting: True이면 공고 정리(cleaned_job_posting) 없이 판정만 출력
+    """
+    schema, prompt = _validation_schema_and_prompt(prepared_posting)
     
     # 최신 LangChain: with_structured_output 사용
-    structured_llm = input_validation_llm.with_structured_output(ValidationResult)
+    structured_llm = get_task_chat_model("validation", temperature=0).with_structured_output(schema)
         
     # 최신 LCEL: prompt | structured_llm
-    chain = INPUT_VALIDATION_PROMPT | structured_llm
+    chain = prompt | structured_llm
     return chain
 
+def _validation_schema_and_prompt(prepared_posting: bool):
+    """검증 출력 스키마와 프롬프트 (prepared_posting이면 판정만 요청)"""
+    if prepared_posting:
+        return ValidationJudgement, PREPARED_POSTING_VALIDATION_PROMPT
+    return ValidationResult, INPUT_VALIDATION_PROMPT
+
+def is_prepared_posting(state: ResumeState) -> bool:
+    """채용공고가 스크래핑한 구조화 데이터(JSON-LD) 정리본 그대로인지 (사용자가 수정했으면 False)"""
+    structured = state.get("structured_job_posting") or ""
+    return bool(structured) and structured.strip() == state.get("job_posting", "").strip()
+
 def validate_resume_input(state: ResumeState) -> ValidationResult:
     """ResumeState 데이터를 기반으로 검증 수행
     
@@ -43,6 +80,95 @@ def validate_resume_input(state: ResumeState) -> ValidationResult:
     Raises:
         ValueError: LLM 설정 오류 또는 필수 데이터 부족
     """
+    inputs = _prepare_validation_inputs(state)
+    
+    prepared = is_prepared_posting(state)
+    
+    # AI 검증 체인 실행 (회사명/직무명 교차 검증)
+    chain = create_validation_chain(prepared_posting=prepared)
+    if not chain:
+        raise ValueError("LLM 설정 오류")
+    
+    result = chain.invoke(inputs)
+    if prepared:
+        return _with_prepared_posting(result, inputs["job_posting"])  # type: ignore[arg-type]
+    
+    return result # type: ignore
+
+def stream_resume_input_validation(
+    state: ResumeState,
+) -> StructuredOutputStream[ValidationResult] | PreparedPostingValidationStream:
+    """검증 결과를 필드 단위로 스트리밍
+    
+    긴 cleaned_job_posting이 끝나기 전에 company_name/job_posting 판정을 먼저 받아볼 수 있습니다.
+    공고가 구조화 데이터 정리본이면 정리를 요청하지 않고 판정만 받은 뒤 정리본 필드를 로컬에서 채웁니다.
+    
+    Args:
+        state: 현재 워크플로우 상태
+        
+    Returns:
+        (필드명, 값)을 순서대로 방출하고 반복 종료 후 `result`에 ValidationResult를 담는 스트림
+        
+    Raises:
+        ValueError: 필수 데이터 부족
+    """
+    inputs = _prepare_validation_inputs(state)
+    llm = get_task_chat_model("validation", temperature=0)
+    if is_prepared_posting(state):
+        judgement = StructuredOutputStream(llm, PREPARED_POSTING_VALIDATION_PROMPT, inputs, ValidationJudgement)
+        return PreparedPostingValidationStream(judgement, inputs["job_posting"])
+    return StructuredOutputStream(llm, INPUT_VALIDATION_PROMPT, inputs, ValidationResult)
+
+def find_cached_validation(state: ResumeState) -> Optional[tuple[ValidationResult, float]]:
+    """이전에 검증한 근접 중복 공고의 검증 결과 조회
+    
+    검증 체인 입력은 회사명/직무명/채용공고뿐이므로, 회사명과 직무명이 같고
+    공고가 근접 중복(settings.posting_duplicate_threshold 이상)이면 결과를 그대로 재사용합니다.
+    통과(PASS)한 결과만 재사용하므로, 부족 판정을 받은 공고는 보완 후 다시 검증됩니다.
+    
+    Args:
+        state: 현재 워크플로우 상태
+        
+    Returns:
+        (검증 결과, 유사도) 또는 None
+        
+    Raises:
+        ValueError: 필수 데이터 부족 (검증 체인과 동일한 사전 검증)
+    """
+    inputs = _prepare_validation_inputs(state)
+    found = get_posting_store().find(
+        inputs["job_posting"],
+        research_cache_key(inputs["company_name"], inputs["position_name"]),
+        settings.posting_duplicate_threshold,
+    )
+    if found is None:
+        return None
+    payload, similarity = found
+    result = ValidationResult.model_validate(payload)
+    if result.overall_status != "PASS":
+        # 통과 결과만 색인하기 전에 저장된 항목
+        return None
+    return result, similarity
+
+def remember_validation(state: ResumeState, result: ValidationResult) -> None:
+    """통과한 검증 결과를 공고 원문과 정리본 양쪽 서명으로 색인 (State 업데이트 전에 호출)
+
+    FAIL 결과는 일시적인 판정(모델 오류, 사용자가 보완할 정보 부족)일 수 있으므로 색인하지 않습니다.
+    """
+    if result.overall_status != "PASS":
+        return
+    get_posting_store().remember(
+        [state.get("job_posting", ""), result.cleaned_job_posting],
+        research_cache_key(state.get("company_name", ""), state.get("position_name", "")),
+        result.model_dump(),
+    )
+
+def _with_prepared_posting(judgement: ValidationJudgement, job_posting: str) -> ValidationResult:
+    """판정 결과에 정리본(이미 정리된 입력 공고)을 채워 ValidationResult로 변환"""
+    return ValidationResult(**judgement.model_dump(), cleaned_job_posting=job_posting)
+
+def _prepare_validation_inputs(state: ResumeState) -> dict[str, str]:
+    """코드 레벨 사전 검증 후 검증 체인 입력값 구성"""
     # 1. 코드 레벨 사전 검증: 사용자 경험 존재 여부
     user_exp = state.get("user_experiences", "")
     if not user_exp or len(user_exp.strip()) < 50:
@@ -64,15 +190,8 @@ def validate_resume_input(state: ResumeState) -> ValidationResult:
             "채용공고 내용이 없습니다. 채용공고 URL을 스크래핑하거나 직접 입력해주세요."
         )
     
-    # 4. AI 검증 체인 실행 (회사명/직무명 교차 검증)
-    chain = create_validation_chain()
-    if not chain:
-        raise ValueError("LLM 설정 오류")
-    
-    result = chain.invoke({
+    return {
         "company_name": state.get("company_name", ""),
         "position_name": state.get("position_name", ""),
         "job_posting": job_posting,
-    })
-    
-    return result # type: ignore
+    }
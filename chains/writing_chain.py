@@ -1,4 +1,5 @@
 import asyncio
+from dataclasses import dataclass
 from typing import Dict, List, Any
 from langchain_core.messages import (
     BaseMessage,
@@ -12,7 +13,19 @@ from tools.llm_util import (
     format_messages_to_text
 )
 from config.llm_factory import get_chat_model
-from config.prompts import WRITER_SYSTEM_PROMPT, WRITER_HUMAN_PROMPT
+from config.tenancy import async_tenant_slot
+from config.prompts import WRITER_SYSTEM_PROMPT, WRITER_HUMAN_PROMPT, DEFAULT_GUIDELINE_TEXT
+from tools.draft_scorer import DraftScore, score_draft
+from tools.guideline_linter import get_linter
+from chains.experience_context import experiences_for_question
+from models.state import get_content
+
+@dataclass
+class DraftCandidate:
+    """토너먼트로 생성된 초안 후보"""
+    model: str
+    text: str
+    score: DraftScore
 
 async def _generate_single_draft_test(state: Dict[str, Any], question: Dict[str, Any], model_name: str) -> str:
     """
@@ -29,7 +42,8 @@ async def _generate_single_draft_test(state: Dict[str, Any], question: Dict[str,
 async def _generate_single_draft(
     state: Dict[str, Any],
     question: Dict[str, Any],
-    model_name: str
+    model_name: str,
+    question_key: str = ""
 ) -> str:
     """
     단일 문항, 단일 모델에 대한 초안 생성 (비동기 Task)
@@ -38,28 +52,27 @@ async def _generate_single_draft(
     provider = get_provider_for_model(model_name)
     llm = get_chat_model(provider, model_name, 1.0)
 
-    messages = _make_prompt(state, question)
+    messages = _make_prompt(state, question, question_key)
 
-    response = llm.invoke(messages)
+    # 비동기 호출이어야 다른 후보와 실제로 병렬 실행되고 취소도 가능함
+    # (사용자별 동시 호출 수를 넘는 후보는 슬롯이 빌 때까지 대기)
+    async with async_tenant_slot():
+        response = await llm.ainvoke(messages)
     result = parse_llm_response_content(response.content)
 
     return result
 
-def _make_prompt(state, question) -> list[BaseMessage | AnyMessage]:
+def _make_prompt(state, question, question_key: str = "") -> list[BaseMessage | AnyMessage]:
     job_posting = state.get("job_posting", "")
     writing_strategy = state.get("writing_strategy")
-    user_experiences = state.get("user_experiences", "")
+    # 파싱된 경험이 있으면 문항 관련 경험만 포함 (없으면 전체 텍스트)
+    user_experiences = experiences_for_question(
+        state, question.get("question_text", ""), question_key
+    )
     writing_guidelines = state.get("writing_guidelines", "")
     
     # 전략 내용 추출
-    strategy_content = ""
-    if writing_strategy:
-        if hasattr(writing_strategy, "content"):
-            strategy_content = writing_strategy.content
-        elif isinstance(writing_strategy, dict):
-            strategy_content = writing_strategy.get("content", "")
-        else:
-            strategy_content = str(writing_strategy)
+    strategy_content = get_content(writing_strategy)
 
     # 시스템 메시지 구성 - 반드시 키워드 인자로 전달
     system_prompt = WRITER_SYSTEM_PROMPT.format(
@@ -85,7 +98,6 @@ def generate_drafts(
     문항별로 주어진 모델 리스트를 사용하여 병렬로 초안을 생성합니다.
     """
     questions = state.get("essay_questions", [])
-    drafts = {}
     
     async def _process_all_questions():
         results = {}
@@ -96,7 +108,7 @@ def generate_drafts(
         
         for i, q in enumerate(questions):
             for j, model in enumerate(models):
-                task = _generate_single_draft(state, q, model)
+                task = _generate_single_draft(state, q, model, str(i + 1))
                 all_tasks.append(task)
                 task_metadata.append((i, j))
         
@@ -112,21 +124,97 @@ def generate_drafts(
         
         return results
 
-    # 비동기 실행 루프
+    return _run_coroutine(_process_all_questions)
+
+def generate_draft_candidates(
+    state: Dict[str, Any],
+    model_pool: List[str],
+    candidates_per_question: int,
+    min_good: int,
+    good_threshold: float,
+) -> Dict[str, List[DraftCandidate]]:
+    """
+    문항별로 모델 풀에서 N개의 초안 후보를 병렬 생성하고 로컬 채점기로 순위를 매깁니다.
+    
+    좋은 후보(good_threshold 이상, 글자 수 초과 없음)가 min_good개 모이면
+    해당 문항의 나머지 생성 작업은 취소하므로 가장 느린 모델을 기다리지 않습니다.
+    
+    Args:
+        state: 현재 세션 상태
+        model_pool: 순환 사용할 모델 목록 (후보 수가 더 많으면 처음부터 반복)
+        candidates_per_question: 문항별 후보 수
+        min_good: 조기 종료 기준 좋은 후보 수
+        good_threshold: 좋은 후보 기준 점수 (0~1)
+        
+    Returns:
+        문항 번호(1-based 문자열) -> 점수 내림차순 후보 리스트
+    """
+    questions = state.get("essay_questions", [])
+    models = [model_pool[i % len(model_pool)] for i in range(candidates_per_question)]
+    keywords = _strategy_keywords(state.get("writing_strategy"))
+    linter = get_linter(state.get("writing_guidelines") or DEFAULT_GUIDELINE_TEXT)
+
+    async def _run_tournament(question: Dict[str, Any], question_key: str) -> List[DraftCandidate]:
+        tasks = {
+            asyncio.create_task(_generate_single_draft(state, question, model, question_key)): model
+            for model in models
+        }
+        pending = set(tasks)
+        candidates: List[DraftCandidate] = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    model = tasks[task]
+                    try:
+                        text = task.result()
+                    except Exception as e:
+                        # 한 모델의 실패는 다른 후보로 대체
+                        print(f"Draft generation error ({model}): {e}")
+                        continue
+                    score = score_draft(text, question.get("char_limit"), keywords, linter)
+                    candidates.append(DraftCandidate(model=model, text=text, score=score))
+                
+                if sum(c.score.is_good(good_threshold) for c in candidates) >= min_good:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        candidates.sort(key=lambda c: c.score.total, reverse=True)
+        return candidates
+
+    async def _process_all_questions():
+        results = await asyncio.gather(*[_run_tournament(q, str(i + 1)) for i, q in enumerate(questions)])
+        return {str(i + 1): candidates for i, candidates in enumerate(results)}
+
+    return _run_coroutine(_process_all_questions)
+
+def _strategy_keywords(writing_strategy: Any) -> List[str]:
+    """작성 전략에서 핵심 역량 키워드 추출"""
+    if not writing_strategy:
+        return []
+    if hasattr(writing_strategy, "core_competencies"):
+        return list(writing_strategy.core_competencies)
+    if isinstance(writing_strategy, dict):
+        return list(writing_strategy.get("core_competencies", []))
+    return []
+
+def _run_coroutine(coro_factory):
+    """Streamlit 등 이미 이벤트 루프가 있는 환경까지 고려하여 코루틴 실행"""
     try:
         loop = asyncio.get_event_loop()
         if loop.is_running():
             # 이미 루프가 실행 중인 경우 (Streamlit 등)
             import nest_asyncio
             nest_asyncio.apply()
-            drafts = loop.run_until_complete(_process_all_questions())
-        else:
-            drafts = asyncio.run(_process_all_questions())
+            return loop.run_until_complete(coro_factory())
+        return asyncio.run(coro_factory())
     except RuntimeError:
         # "There is no current event loop in thread" or similar
-        drafts = asyncio.run(_process_all_questions())
+        return asyncio.run(coro_factory())
     except ImportError:
         # nest_asyncio가 없는 경우 (동기적으로 실행 시도하거나 에러)
-        drafts = asyncio.run(_process_all_questions())
-
-    return drafts
+        return asyncio.run(coro_factory())
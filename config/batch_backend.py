@@ -0,0 +1,437 @@
+"""Provider 배치 API 실행 백엔드 (대량 비대화형 작업용)
+
+여러 지원서의 초안/최종 검토처럼 지연은 중요하지 않고 비용과 처리량이 중요한 작업을 provider의 배치 엔드포인트로
+한 번에 제출하고, 완료될 때까지 폴링한 뒤 결과를 요청 ID(custom_id)별로 돌려줍니다. 배치 API는 보통 일반 호출의
+절반 가격이며 분당 요청 한도와 별개로 처리됩니다.
+
+- OpenAI 호환: JSONL 파일 업로드(`/files`) -> `/batches` 생성 -> 상태 폴링 -> 출력/오류 파일 다운로드
+- Gemini: 모델별 `models/{model}:batchGenerateContent`(인라인 요청) -> `batches/{id}` 폴링 -> 인라인 응답
+
+엔드포인트 주소는 settings.batch_*_base_url로 바꿀 수 있어, 로컬 대체 서버(tools/batch_stub_server.py)로
+네트워크 없이 전체 흐름을 실행할 수 있습니다.
+
+일반 호출과 같은 보호 장치를 거칩니다.
+- 사용자 토큰 한도(config.tenancy): 제출 전 추정 토큰으로 검사, 결과 수집 후 실제 사용량을 기록
+- 서킷 브레이커(config.model_health): 회로가 열린 모델의 요청은 제출하지 않고 실패로 처리
+  (배치는 완료까지 수 시간이 정상이므로 지연/결과는 브레이커에 기록하지 않음)
+- 카세트(config.cassette): 배치 결과를 녹화/재생
+- 제출한 배치는 tools/batch_store에 기록되어, 같은 요청을 다시 실행하면 기존 배치를 이어서 수집하고
+  제한 시간을 넘기면 provider 배치를 취소
+"""
+import hashlib
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional, Protocol
+
+import requests
+from langchain_core.messages import BaseMessage, SystemMessage
+
+from config.cassette import cassette_call, get_cassette
+from config.model_health import get_breaker
+from config.settings import settings
+from config.tenancy import check_token_quota, current_tenant, record_token_usage
+from tools.batch_store import get_batch_store
+from tools.llm_util import estimate_tokens, get_provider_for_model
+
+# 배치 상태 (provider별 상태값을 공통 값으로 변환, CANCELLED는 제한 시간 초과로 직접 취소한 배치)
+PENDING, SUCCEEDED, FAILED, CANCELLED = "pending", "succeeded", "failed", "cancelled"
+
+_OPENAI_TERMINAL = {"completed": SUCCEEDED, "failed": FAILED, "expired": SUCCEEDED, "cancelled": FAILED}
+_GEMINI_TERMINAL = {
+    "BATCH_STATE_SUCCEEDED": SUCCEEDED,
+    "JOB_STATE_SUCCEEDED": SUCCEEDED,
+    "BATCH_STATE_FAILED": FAILED,
+    "JOB_STATE_FAILED": FAILED,
+    "BATCH_STATE_CANCELLED": FAILED,
+    "JOB_STATE_CANCELLED": FAILED,
+    "BATCH_STATE_EXPIRED": FAILED,
+    "JOB_STATE_EXPIRED": FAILED,
+}
+
+
+class BatchError(RuntimeError):
+    """배치 제출/조회 실패 또는 제한 시간 초과"""
+
+
+@dataclass
+class BatchRequest:
+    """배치 요청 한 건 (json_schema가 있으면 JSON 응답 요청)"""
+    custom_id: str
+    model: str
+    messages: list[BaseMessage]
+    temperature: float = 0.7
+    json_schema: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class BatchResult:
+    """배치 응답 한 건 (실패한 요청은 text 없이 error만)"""
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    usage: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class BatchHandle:
+    """제출된 배치 (provider별 ID)"""
+    provider: str
+    batch_id: str
+    custom_ids: list[str]
+
+
+class BatchBackend(Protocol):
+    provider: str
+
+    def submit(self, batch: list[BatchRequest]) -> str: ...
+
+    def status(self, batch_id: str) -> str: ...
+
+    def results(self, batch_id: str) -> list[BatchResult]: ...
+
+    def cancel(self, batch_id: str) -> None: ...
+
+
+class OpenAIBatchBackend:
+    """OpenAI 호환 Batch API (`/v1/chat/completions` 요청 JSONL)"""
+
+    provider = "openai"
+
+    def __init__(self, base_url: str, api_key: str, timeout: float = 60.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._batches: dict[str, dict[str, Any]] = {}
+
+    def submit(self, batch: list[BatchRequest]) -> str:
+        lines = "\n".join(json.dumps(self._line(r), ensure_ascii=False) for r in batch)
+        uploaded = self._request(
+            "POST", "/files",
+            files={"file": ("batch.jsonl", lines.encode("utf-8"), "application/jsonl")},
+            data={"purpose": "batch"},
+        )
+        created = self._request("POST", "/batches", json={
+            "input_file_id": uploaded["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        return created["id"]
+
+    def status(self, batch_id: str) -> str:
+        batch = self._request("GET", f"/batches/{batch_id}")
+        self._batches[batch_id] = batch
+        return _OPENAI_TERMINAL.get(batch.get("status", ""), PENDING)
+
+    def results(self, batch_id: str) -> list[BatchResult]:
+        batch = self._batches.get(batch_id) or self._request("GET", f"/batches/{batch_id}")
+        results: list[BatchResult] = []
+        # 만료된 배치도 완료된 요청은 출력 파일에 남고, 나머지는 오류 파일에 기록됨
+        for file_key in ("output_file_id", "error_file_id"):
+            if batch.get(file_key):
+                for line in self._download(batch[file_key]).splitlines():
+                    if line.strip():
+                        results.append(self._parse_line(json.loads(line)))
+        return results
+
+    def cancel(self, batch_id: str) -> None:
+        self._request("POST", f"/batches/{batch_id}/cancel")
+
+    def _line(self, request: BatchRequest) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            "model": request.model,
+            "messages": [{"role": _openai_role(m), "content": str(m.content)} for m in request.messages],
+        }
+        # 추론 모델(gpt-5 등)은 기본 온도만 지원
+        if not request.model.startswith(("gpt-5", "o")):
+            body["temperature"] = request.temperature
+        if request.json_schema is not None:
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": request.json_schema.get("title", "response"), "schema": request.json_schema},
+            }
+        return {"custom_id": request.custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+
+    @staticmethod
+    def _parse_line(line: dict[str, Any]) -> BatchResult:
+        custom_id = line.get("custom_id", "")
+        response = line.get("response") or {}
+        error = line.get("error")
+        if error or response.get("status_code", 200) >= 400:
+            message = (error or response.get("body", {}).get("error") or {}).get("message", "unknown error")
+            return BatchResult(custom_id, error=message)
+        body = response.get("body", {})
+        usage = body.get("usage") or {}
+        return BatchResult(
+            custom_id,
+            text=body["choices"][0]["message"].get("content") or "",
+            usage={"input_tokens": usage.get("prompt_tokens", 0), "output_tokens": usage.get("completion_tokens", 0)},
+        )
+
+    def _download(self, file_id: str) -> str:
+        response = requests.get(f"{self.base_url}/files/{file_id}/content", headers=self._headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        response = requests.request(method, f"{self.base_url}{path}", headers=self._headers, timeout=self.timeout, **kwargs)
+        if response.status_code >= 400:
+            raise BatchError(f"OpenAI 배치 요청 실패 ({method} {path}): {response.status_code} {response.text[:200]}")
+        return response.json()
+
+
+class GeminiBatchBackend:
+    """Gemini Batch Mode (인라인 요청, 배치 하나는 모델 하나)"""
+
+    provider = "google_genai"
+
+    def __init__(self, base_url: str, api_key: str, timeout: float = 60.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._headers = {"x-goog-api-key": api_key}
+        self._batches: dict[str, dict[str, Any]] = {}
+
+    def submit(self, batch: list[BatchRequest]) -> str:
+        models = {r.model for r in batch}
+        if len(models) != 1:
+            raise BatchError(f"Gemini 배치는 모델 하나만 포함할 수 있습니다: {sorted(models)}")
+        created = self._request("POST", f"/models/{batch[0].model}:batchGenerateContent", json={
+            "batch": {
+                "display_name": f"resume-{uuid.uuid4().hex[:8]}",
+                "input_config": {"requests": {"requests": [
+                    {"request": self._request_body(r), "metadata": {"key": r.custom_id}} for r in batch
+                ]}},
+            }
+        })
+        return created["name"]
+
+    def status(self, batch_id: str) -> str:
+        batch = self._request("GET", f"/{batch_id}")
+        self._batches[batch_id] = batch
+        state = batch.get("metadata", {}).get("state", "")
+        if batch.get("error"):
+            return FAILED
+        return _GEMINI_TERMINAL.get(state, SUCCEEDED if batch.get("done") else PENDING)
+
+    def results(self, batch_id: str) -> list[BatchResult]:
+        batch = self._batches.get(batch_id) or self._request("GET", f"/{batch_id}")
+        output = batch.get("response") or batch.get("metadata", {}).get("output") or {}
+        inlined = output.get("inlinedResponses", {}).get("inlinedResponses", [])
+        return [self._parse_item(item) for item in inlined]
+
+    def cancel(self, batch_id: str) -> None:
+        self._request("POST", f"/{batch_id}:cancel")
+
+    @staticmethod
+    def _request_body(request: BatchRequest) -> dict[str, Any]:
+        system = [str(m.content) for m in request.messages if isinstance(m, SystemMessage)]
+        contents = [
+            {"role": "model" if m.type == "ai" else "user", "parts": [{"text": str(m.content)}]}
+            for m in request.messages if not isinstance(m, SystemMessage)
+        ]
+        config: dict[str, Any] = {"temperature": request.temperature}
+        if request.json_schema is not None:
+            config["responseMimeType"] = "application/json"
+            config["responseJsonSchema"] = request.json_schema
+        body: dict[str, Any] = {"contents": contents, "generationConfig": config}
+        if system:
+            body["systemInstruction"] = {"parts": [{"text": "\n\n".join(system)}]}
+        return body
+
+    @staticmethod
+    def _parse_item(item: dict[str, Any]) -> BatchResult:
+        custom_id = item.get("metadata", {}).get("key", "")
+        if item.get("error"):
+            return BatchResult(custom_id, error=item["error"].get("message", "unknown error"))
+        response = item.get("response", {})
+        candidates = response.get("candidates") or []
+        if not candidates:
+            return BatchResult(custom_id, error="응답 후보 없음 (안전 필터 등)")
+        parts = candidates[0].get("content", {}).get("parts", [])
+        usage = response.get("usageMetadata") or {}
+        return BatchResult(
+            custom_id,
+            text="".join(p.get("text", "") for p in parts if not p.get("thought")),
+            usage={"input_tokens": usage.get("promptTokenCount", 0), "output_tokens": usage.get("candidatesTokenCount", 0)},
+        )
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        response = requests.request(method, f"{self.base_url}{path}", headers=self._headers, timeout=self.timeout, **kwargs)
+        if response.status_code >= 400:
+            raise BatchError(f"Gemini 배치 요청 실패 ({method} {path}): {response.status_code} {response.text[:200]}")
+        return response.json()
+
+
+def get_batch_backend(provider: str) -> BatchBackend:
+    """provider별 배치 백엔드 (settings의 엔드포인트/API 키 사용)"""
+    if provider == "openai":
+        return OpenAIBatchBackend(settings.batch_openai_base_url, settings.openai_api_key or "")
+    if provider == "google_genai":
+        return GeminiBatchBackend(settings.batch_gemini_base_url, settings.google_api_key or "")
+    raise ValueError(f"배치 실행을 지원하지 않는 provider입니다: {provider}")
+
+
+def run_batch(
+    batch: list[BatchRequest],
+    on_status: Optional[Callable[[list[dict[str, Any]]], None]] = None,
+    backend_factory: Callable[[str], BatchBackend] = get_batch_backend,
+) -> dict[str, BatchResult]:
+    """요청을 provider(Gemini는 모델)별 배치로 나눠 제출하고, 모두 끝날 때까지 폴링하여 결과 수집
+
+    현재 사용자(config.tenancy)의 토큰 한도를 제출 전에 검사하고, 수집한 결과의 사용량을 기록합니다.
+    같은 사용자가 같은 요청을 이미 제출했다면(작업 중단 후 재실행) 새로 제출하지 않고 기존 배치를 이어서 수집합니다.
+
+    Args:
+        batch: 배치 요청 목록 (custom_id는 고유해야 함)
+        on_status: 폴링마다 배치별 상태 목록을 받는 콜백 (진행 표시용)
+        backend_factory: provider -> 배치 백엔드
+
+    Returns:
+        custom_id -> BatchResult (응답이 없는 요청은 error가 채워진 결과)
+
+    Raises:
+        BatchError: 제출 실패 또는 settings.batch_timeout_seconds 초과 (미완료 배치는 취소)
+        TenantLimitError: 새로 제출할 요청의 추정 토큰이 사용자 한도를 넘는 경우
+    """
+    tenant = current_tenant()
+    results: dict[str, BatchResult] = {}
+    allowed: list[BatchRequest] = []
+    for request in batch:
+        breaker = get_breaker(get_provider_for_model(request.model), request.model)
+        if breaker.state == "open":
+            error = f"{breaker.name} 회로가 열려 있어 제출하지 않았습니다."
+            results[request.custom_id] = BatchResult(request.custom_id, error=error)
+        else:
+            allowed.append(request)
+    if not allowed:
+        return results
+
+    # 재생은 녹화된 결과만 돌려주므로 제출/수집 없이 한도 검사와 사용량 기록만 수행
+    cassette = get_cassette()
+    replaying = cassette is not None and cassette.mode == "replay"
+    if replaying:
+        check_token_quota(tenant, _estimated_tokens(allowed))
+    entry = cassette_call("batch", _batch_key(tenant, allowed), lambda: {
+        "results": [asdict(r) for r in _submit_and_collect(allowed, tenant, on_status, backend_factory).values()]
+    })
+    collected = [BatchResult(**result) for result in entry["results"]]
+    if replaying:
+        record_token_usage(tenant, sum(_result_tokens(r) for r in collected))
+    results.update((r.custom_id, r) for r in collected)
+    return results
+
+
+def _submit_and_collect(
+    batch: list[BatchRequest],
+    tenant: str,
+    on_status: Optional[Callable[[list[dict[str, Any]]], None]],
+    backend_factory: Callable[[str], BatchBackend],
+) -> dict[str, BatchResult]:
+    groups: dict[tuple[str, str], list[BatchRequest]] = {}
+    for request in batch:
+        provider = get_provider_for_model(request.model)
+        # OpenAI는 한 배치에 여러 모델을 섞을 수 있지만 Gemini는 모델별 엔드포인트
+        group_key = (provider, request.model if provider == "google_genai" else "")
+        groups.setdefault(group_key, []).append(request)
+
+    store = get_batch_store()
+    chunks: list[tuple[str, str, list[BatchRequest]]] = []
+    size = settings.batch_max_requests
+    for (provider, _), requests_ in groups.items():
+        for start in range(0, len(requests_), size):
+            chunk = requests_[start:start + size]
+            chunks.append((provider, _batch_key(tenant, chunk), chunk))
+
+    # 이전 실행에서 제출해 둔 배치(진행 중 또는 완료)는 이어서 수집
+    handles: list[BatchHandle] = []
+    states: dict[str, str] = {}
+    submit: list[tuple[str, str, list[BatchRequest]]] = []
+    for provider, key, chunk in chunks:
+        stored = store.find(key)
+        if stored is not None and stored.state in (PENDING, SUCCEEDED):
+            handles.append(BatchHandle(provider, stored.batch_id, stored.custom_ids))
+            states[stored.batch_id] = PENDING
+        else:
+            submit.append((provider, key, chunk))
+    check_token_quota(tenant, sum(_estimated_tokens(chunk) for _, _, chunk in submit))
+
+    backends: dict[str, BatchBackend] = {}
+    for provider, key, chunk in submit:
+        backend = backends.setdefault(provider, backend_factory(provider))
+        handle = BatchHandle(provider, backend.submit(chunk), [r.custom_id for r in chunk])
+        store.save(key, tenant, provider, handle.batch_id, handle.custom_ids, PENDING)
+        handles.append(handle)
+        states[handle.batch_id] = PENDING
+    for handle in handles:
+        backends.setdefault(handle.provider, backend_factory(handle.provider))
+
+    deadline = time.monotonic() + settings.batch_timeout_seconds
+    while True:
+        for handle in handles:
+            if states[handle.batch_id] == PENDING:
+                states[handle.batch_id] = backends[handle.provider].status(handle.batch_id)
+                if states[handle.batch_id] != PENDING:
+                    store.update_state(handle.batch_id, states[handle.batch_id])
+        if on_status is not None:
+            on_status([
+                {"provider": h.provider, "batch_id": h.batch_id, "requests": len(h.custom_ids), "state": states[h.batch_id]}
+                for h in handles
+            ])
+        if PENDING not in states.values():
+            break
+        if time.monotonic() > deadline:
+            _cancel_pending(handles, states, backends)
+            raise BatchError(f"배치가 {settings.batch_timeout_seconds:.0f}초 안에 끝나지 않아 취소했습니다.")
+        time.sleep(settings.batch_poll_seconds)
+
+    results: dict[str, BatchResult] = {}
+    for handle in handles:
+        collected = backends[handle.provider].results(handle.batch_id) if states[handle.batch_id] == SUCCEEDED else []
+        if collected and store.mark_charged(handle.batch_id):
+            record_token_usage(tenant, sum(_result_tokens(r) for r in collected))
+        for result in collected:
+            results[result.custom_id] = result
+        for custom_id in handle.custom_ids:
+            results.setdefault(custom_id, BatchResult(custom_id, error=f"배치 {handle.batch_id} 응답 없음"))
+    return results
+
+
+def _cancel_pending(handles: list[BatchHandle], states: dict[str, str], backends: dict[str, BatchBackend]) -> None:
+    """제한 시간을 넘긴 배치 취소 (취소 요청이 실패해도 나머지 배치는 계속 취소)"""
+    store = get_batch_store()
+    for handle in handles:
+        if states[handle.batch_id] != PENDING:
+            continue
+        try:
+            backends[handle.provider].cancel(handle.batch_id)
+        except (BatchError, requests.RequestException) as e:
+            print(f"Batch cancel error ({handle.batch_id}): {e}")
+        store.update_state(handle.batch_id, CANCELLED)
+
+
+def _batch_key(tenant: str, batch: list[BatchRequest]) -> str:
+    """사용자와 요청 내용으로 정해지는 배치 키 (재실행 시 기존 배치 재사용, 카세트 키)"""
+    payload = [
+        {
+            "custom_id": r.custom_id,
+            "model": r.model,
+            "messages": [(m.type, str(m.content)) for m in r.messages],
+            "temperature": r.temperature,
+            "json_schema": r.json_schema,
+        }
+        for r in batch
+    ]
+    return hashlib.sha256(json.dumps([tenant, payload], ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _estimated_tokens(batch: list[BatchRequest]) -> int:
+    return sum(estimate_tokens(str(m.content)) for r in batch for m in r.messages)
+
+
+def _result_tokens(result: BatchResult) -> int:
+    return result.usage.get("input_tokens", 0) + result.usage.get("output_tokens", 0)
+
+
+def _openai_role(message: BaseMessage) -> str:
+    return {"system": "system", "ai": "assistant"}.get(message.type, "user")
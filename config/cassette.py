@@ -0,0 +1,300 @@
+"""모델/스크래핑 트래픽 녹화 및 재생 (카세트)
+
+실제 세션의 프롬프트와 응답을 그대로 녹화해 두었다가 네트워크 없이 재생하여, 8단계 파이프라인 전체를
+같은 입력/응답/지연으로 반복 벤치마크하거나 회귀 테스트할 수 있게 합니다.
+
+- record: 모델 호출(일반/스트리밍, 동기/비동기), 채용 페이지 HTTP 응답, provider 배치 결과를 gzip JSONL 카세트에 추가
+  (스트리밍은 청크별 도착 시각까지 기록)
+- replay: 같은 요청 키의 녹화분을 녹화 당시 속도(또는 settings.cassette_replay_speed 배율)로 돌려줌.
+  녹화분이 없는 요청은 실제 호출하지 않고 CassetteMissError
+
+모델 요청 키는 동일 요청 병합과 같은 기준(config/single_flight.request_key)이므로 메시지/모델 설정/호출 옵션
+(구조화 출력 스키마 포함)이 같아야 재생됩니다. 같은 키를 여러 번 녹화했다면 녹화 순서대로 돌려주고,
+마지막 녹화분은 이후 요청에도 계속 사용합니다.
+"""
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+import warnings
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_core.load import dumpd, load
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic_core import to_jsonable_python
+
+from config.settings import settings
+from config.single_flight import ChatModelT, message_to_chunk, model_label, request_key
+
+
+class CassetteMissError(RuntimeError):
+    """재생 모드에서 녹화되지 않은 요청"""
+
+
+class Cassette:
+    """gzip JSONL 카세트 (녹화는 항목마다 gzip 멤버를 이어 붙여 중간에 종료되어도 앞부분은 유지)"""
+
+    def __init__(self, path: str, mode: str, speed: float = 1.0) -> None:
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[tuple[str, str], deque]] = None
+
+    def record(self, kind: str, key: str, entry: dict[str, Any]) -> None:
+        line = json.dumps({"kind": kind, "key": key, **entry}, ensure_ascii=False, default=to_jsonable_python)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def find(self, kind: str, key: str) -> dict[str, Any]:
+        """재생할 녹화분 (녹화 순서대로, 마지막 항목은 반복 사용)
+
+        Raises:
+            CassetteMissError: 녹화되지 않은 요청
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            queue = self._entries.get((kind, key))
+            if not queue:
+                raise CassetteMissError(f"카세트({self.path})에 녹화되지 않은 {kind} 요청입니다: {key[:16]}")
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def delay(self, seconds: float) -> float:
+        """재생 속도를 반영한 대기 시간 (speed 0이면 대기 없음)"""
+        return seconds / self.speed if self.speed > 0 else 0.0
+
+    def _load(self) -> dict[tuple[str, str], deque]:
+        entries: dict[tuple[str, str], deque] = {}
+        if not os.path.exists(self.path):
+            return entries
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault((entry["kind"], entry["key"]), deque()).append(entry)
+        return entries
+
+
+_cassettes: dict[tuple[str, str, float], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """현재 설정(settings.cassette_*)의 카세트 (꺼져 있으면 None)"""
+    if settings.cassette_mode == "off":
+        return None
+    key = (settings.cassette_mode, settings.cassette_path, settings.cassette_replay_speed)
+    with _cassettes_lock:
+        if key not in _cassettes:
+            _cassettes[key] = Cassette(settings.cassette_path, settings.cassette_mode, settings.cassette_replay_speed)
+        return _cassettes[key]
+
+
+def cassette_http_get(url: str, fetch: Callable[[], tuple[int, str]]) -> tuple[int, str]:
+    """HTTP GET 응답(상태 코드, 본문)을 녹화/재생 (카세트가 꺼져 있으면 그대로 호출)"""
+    entry = cassette_call("http", url, lambda: dict(zip(("status", "body"), fetch())))
+    return entry["status"], entry["body"]
+
+
+def cassette_call(kind: str, key: str, fetch: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """JSON으로 저장할 수 있는 응답을 녹화/재생 (카세트가 꺼져 있으면 그대로 호출)
+
+    Args:
+        kind: 요청 종류 (http, batch 등)
+        key: 요청 키
+        fetch: 실제 호출 (응답 dict 반환)
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return fetch()
+    if cassette.mode == "replay":
+        entry = cassette.find(kind, key)
+        time.sleep(cassette.delay(entry["seconds"]))
+        return entry
+    started = time.perf_counter()
+    entry = fetch()
+    cassette.record(kind, key, {**entry, "seconds": time.perf_counter() - started})
+    return entry
+
+
+def enable_cassette(llm: ChatModelT) -> ChatModelT:
+    """모델 인스턴스의 호출을 카세트로 녹화/재생하도록 전환 (같은 인스턴스를 반환)"""
+    object.__setattr__(llm, "__class__", _cassette_class(type(llm)))
+    return llm
+
+
+_cassette_classes: dict[type, type] = {}
+_classes_lock = threading.Lock()
+
+
+def _cassette_class(cls: type) -> type:
+    if getattr(cls, "_cassette_enabled", False):
+        return cls
+    with _classes_lock:
+        if cls in _cassette_classes:
+            return _cassette_classes[cls]
+
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            cassette, key = get_cassette(), request_key(self, messages, stop, **kwargs)
+            if cassette is None:
+                return super(subclass, self)._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            if cassette.mode == "replay":
+                entry = cassette.find("llm", key)
+                if "chunks" in entry:
+                    return generate_from_stream(_replay_chunks(cassette, entry, None))
+                time.sleep(cassette.delay(entry["seconds"]))
+                return _decode_result(entry)
+            started = time.perf_counter()
+            result = super(subclass, self)._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            cassette.record("llm", key, _encode_result(self, result, time.perf_counter() - started))
+            return result
+
+        async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            cassette, key = get_cassette(), request_key(self, messages, stop, **kwargs)
+            if cassette is None:
+                return await super(subclass, self)._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            if cassette.mode == "replay":
+                entry = cassette.find("llm", key)
+                if "chunks" in entry:
+                    chunks = [chunk async for chunk in _areplay_chunks(cassette, entry, None)]
+                    return generate_from_stream(iter(chunks))
+                await asyncio.sleep(cassette.delay(entry["seconds"]))
+                return _decode_result(entry)
+            started = time.perf_counter()
+            result = await super(subclass, self)._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            cassette.record("llm", key, _encode_result(self, result, time.perf_counter() - started))
+            return result
+
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            cassette, key = get_cassette(), request_key(self, messages, stop, **kwargs)
+            if cassette is None:
+                yield from super(subclass, self)._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            elif cassette.mode == "replay":
+                yield from _replay_chunks(cassette, cassette.find("llm", key), run_manager)
+            else:
+                recorder = _StreamRecorder()
+                for chunk in super(subclass, self)._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    recorder.add(chunk)
+                    yield chunk
+                cassette.record("llm", key, recorder.entry(self))
+
+        async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+            cassette, key = get_cassette(), request_key(self, messages, stop, **kwargs)
+            if cassette is None:
+                async for chunk in super(subclass, self)._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    yield chunk
+            elif cassette.mode == "replay":
+                async for chunk in _areplay_chunks(cassette, cassette.find("llm", key), run_manager):
+                    yield chunk
+            else:
+                recorder = _StreamRecorder()
+                async for chunk in super(subclass, self)._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    recorder.add(chunk)
+                    yield chunk
+                cassette.record("llm", key, recorder.entry(self))
+
+        namespace: dict[str, Any] = {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_cassette_enabled": True,
+            "_generate": _generate,
+        }
+        # 구현하지 않은 메서드는 BaseChatModel 기본 동작(동기 메서드로 위임)을 유지해야 스트리밍 지원 판단이 바뀌지 않음
+        for name, method in (("_agenerate", _agenerate), ("_stream", _stream), ("_astream", _astream)):
+            if getattr(cls, name) is not getattr(BaseChatModel, name):
+                namespace[name] = method
+        subclass = type(cls.__name__, (cls,), namespace)
+        _cassette_classes[cls] = subclass
+        return subclass
+
+
+class _StreamRecorder:
+    """스트리밍 청크와 호출 시작 기준 도착 시각"""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self.chunks: list[dict[str, Any]] = []
+
+    def add(self, chunk: ChatGenerationChunk) -> None:
+        self.chunks.append({
+            "t": time.perf_counter() - self._started,
+            "message": dumpd(chunk.message),
+            "generation_info": chunk.generation_info,
+        })
+
+    def entry(self, llm: BaseChatModel) -> dict[str, Any]:
+        return {"model": model_label(llm), "seconds": time.perf_counter() - self._started, "chunks": self.chunks}
+
+
+def _replay_chunks(cassette: Cassette, entry: dict[str, Any], run_manager: Any) -> Iterator[ChatGenerationChunk]:
+    if "chunks" not in entry:
+        time.sleep(cassette.delay(entry["seconds"]))
+        yield from _result_chunks(entry)
+        return
+    started = time.perf_counter()
+    for recorded in entry["chunks"]:
+        time.sleep(max(cassette.delay(recorded["t"]) - (time.perf_counter() - started), 0.0))
+        chunk = _decode_chunk(recorded)
+        if run_manager:
+            run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+        yield chunk
+
+
+async def _areplay_chunks(cassette: Cassette, entry: dict[str, Any], run_manager: Any) -> AsyncIterator[ChatGenerationChunk]:
+    if "chunks" not in entry:
+        await asyncio.sleep(cassette.delay(entry["seconds"]))
+        for chunk in _result_chunks(entry):
+            yield chunk
+        return
+    started = time.perf_counter()
+    for recorded in entry["chunks"]:
+        await asyncio.sleep(max(cassette.delay(recorded["t"]) - (time.perf_counter() - started), 0.0))
+        chunk = _decode_chunk(recorded)
+        if run_manager:
+            await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+        yield chunk
+
+
+def _encode_result(llm: BaseChatModel, result: ChatResult, seconds: float) -> dict[str, Any]:
+    return {
+        "model": model_label(llm),
+        "seconds": seconds,
+        "generations": [
+            {"message": dumpd(g.message), "generation_info": g.generation_info} for g in result.generations
+        ],
+        "llm_output": result.llm_output,
+    }
+
+
+def _decode_result(entry: dict[str, Any]) -> ChatResult:
+    generations = [
+        ChatGeneration(message=_load(g["message"]), generation_info=g.get("generation_info"))
+        for g in entry["generations"]
+    ]
+    return ChatResult(generations=generations, llm_output=entry.get("llm_output"))
+
+
+def _result_chunks(entry: dict[str, Any]) -> Iterator[ChatGenerationChunk]:
+    # 일반 호출로 녹화된 응답을 스트리밍 요청에 재생: 결과 전체를 청크 하나로 전달
+    for generation in _decode_result(entry).generations:
+        yield ChatGenerationChunk(message=message_to_chunk(generation.message), generation_info=generation.generation_info)
+
+
+def _decode_chunk(recorded: dict[str, Any]) -> ChatGenerationChunk:
+    return ChatGenerationChunk(message=_load(recorded["message"]), generation_info=recorded.get("generation_info"))
+
+
+def _load(data: dict[str, Any]) -> Any:
+    with warnings.catch_warnings():
+        # langchain_core.load가 beta 경고를 호출마다 출력하므로 숨김
+        warnings.simplefilter("ignore")
+        return load(data)
+
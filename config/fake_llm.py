@@ -0,0 +1,201 @@
+"""부하 테스트용 가짜 채팅 모델
+
+네트워크 호출 없이 첫 토큰 지연과 청크 간 지연만 흉내내어, 실제 모델 비용 없이
+API 서버/동시성 제한/캐시 경로를 그대로 측정할 수 있게 합니다.
+`settings.llm_backend="fake"`이면 `get_chat_model`이 실제 모델 대신 이 모델을 만듭니다.
+
+- 일반 호출: 프롬프트 해시로 결정되는 한국어 문장을 청크 단위로 스트리밍
+- `with_structured_output`: 스키마 필드를 채운 JSON을 스트리밍하고 Pydantic 모델로 파싱
+- `bind(response_format=스키마)`: 같은 JSON을 본문으로 스트리밍 (tools.partial_json의 JSON 스키마 모드)
+"""
+import asyncio
+import hashlib
+import json
+import time
+import types
+import typing
+from typing import Any, AsyncIterator, Iterator, Literal, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableMap, RunnablePassthrough
+from pydantic import BaseModel
+
+from config.settings import settings
+from tools.llm_util import estimate_tokens
+
+_SENTENCES = (
+    "대규모 트래픽 환경에서 결제 API의 응답 시간을 40% 단축한 경험이 있습니다.",
+    "장애 원인을 로그와 지표로 추적하고 재발 방지 대책을 팀에 공유했습니다.",
+    "사용자 관점에서 문제를 정의하고 데이터로 개선 효과를 검증했습니다.",
+    "협업 과정에서 의견 차이를 문서화된 기준으로 조율해 일정을 지켰습니다.",
+    "입사 후에는 서비스 안정성과 개발 생산성을 함께 높이는 데 기여하겠습니다.",
+)
+
+# 스트리밍 청크 크기 (글자 수)
+_CHUNK_CHARS = 8
+
+
+class FakeChatModel(BaseChatModel):
+    """지연만 흉내내는 결정적 가짜 채팅 모델"""
+
+    model_name: str = "fake"
+    first_token_seconds: float = 0.3
+    chunk_seconds: float = 0.01
+    response_chars: int = 600
+    response_schema: Optional[Any] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        # 구조화 출력 스키마도 요청 식별에 포함 (config/single_flight.request_key)
+        return {"model_name": self.model_name, "response_schema": getattr(self.response_schema, "__name__", None)}
+
+    def with_structured_output(self, schema: Any, *, include_raw: bool = False, **kwargs: Any) -> Runnable:
+        """스키마 JSON을 생성하는 구조화 출력 체인 (실제 모델과 같은 raw/parsed 형태)"""
+        llm = self.model_copy(update={"response_schema": schema})
+        parser = PydanticOutputParser(pydantic_object=schema)
+        if not include_raw:
+            return llm | parser
+        # 실제 모델처럼 파싱 단계를 with_fallbacks로 감쌈 (이 때문에 체인 스트림은 파싱 단계에서 모아짐)
+        parse = RunnablePassthrough.assign(parsed=lambda x: parser.invoke(x["raw"]), parsing_error=lambda _: None)
+        parse_failed = RunnablePassthrough.assign(parsed=lambda _: None)
+        return RunnableMap(raw=llm) | parse.with_fallbacks([parse_failed], exception_key="parsing_error")
+
+    def bind(self, **kwargs: Any) -> Runnable:
+        """`response_format`(OpenAI JSON 스키마 모드)을 주면 스키마 JSON을 본문으로 스트리밍"""
+        schema = kwargs.pop("response_format", None)
+        llm = self.model_copy(update={"response_schema": schema}) if schema is not None else self
+        return super(FakeChatModel, llm).bind(**kwargs)
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Optional[str] = None, **kwargs: Any) -> Runnable:
+        """첫 도구 스키마의 JSON을 본문으로 스트리밍 (실제 모델의 도구 인자 스트림 대용)"""
+        return self.model_copy(update={"response_schema": tools[0]})
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.first_token_seconds + self.chunk_seconds * self._chunk_count(messages))
+        return self._result(messages)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.first_token_seconds + self.chunk_seconds * self._chunk_count(messages))
+        return self._result(messages)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.first_token_seconds)
+        for chunk in self._chunks(messages):
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+            time.sleep(self.chunk_seconds)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.first_token_seconds)
+        for chunk in self._chunks(messages):
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+            await asyncio.sleep(self.chunk_seconds)
+
+    def _response_text(self, messages: list[BaseMessage]) -> str:
+        prompt = self.model_name + "\n".join(str(m.content) for m in messages)
+        seed = int.from_bytes(hashlib.sha256(prompt.encode("utf-8")).digest()[:4], "big")
+        if self.response_schema is not None:
+            return json.dumps(_fake_value(self.response_schema, seed), ensure_ascii=False)
+        text = ""
+        i = seed
+        while len(text) < self.response_chars:
+            text += _SENTENCES[i % len(_SENTENCES)] + " "
+            i += 1
+        return text[:self.response_chars].strip()
+
+    def _chunks(self, messages: list[BaseMessage]) -> Iterator[ChatGenerationChunk]:
+        text = self._response_text(messages)
+        pieces = [text[i:i + _CHUNK_CHARS] for i in range(0, len(text), _CHUNK_CHARS)]
+        for i, piece in enumerate(pieces):
+            message = AIMessageChunk(content=piece)
+            if i == len(pieces) - 1:
+                message.usage_metadata = self._usage(messages, text)
+            yield ChatGenerationChunk(message=message)
+
+    def _chunk_count(self, messages: list[BaseMessage]) -> int:
+        return -(-len(self._response_text(messages)) // _CHUNK_CHARS)
+
+    def _result(self, messages: list[BaseMessage]) -> ChatResult:
+        text = self._response_text(messages)
+        message = AIMessage(content=text, usage_metadata=self._usage(messages, text))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @staticmethod
+    def _usage(messages: list[BaseMessage], text: str) -> Any:
+        input_tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        output_tokens = estimate_tokens(text)
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+
+def create_fake_chat_model(model: str, callbacks: Optional[list] = None) -> FakeChatModel:
+    """설정값(settings.fake_llm_*)을 적용한 가짜 모델 생성"""
+    return FakeChatModel(
+        model_name=model,
+        callbacks=callbacks,
+        first_token_seconds=settings.fake_llm_first_token_seconds,
+        chunk_seconds=settings.fake_llm_chunk_seconds,
+        response_chars=settings.fake_llm_response_chars,
+    )
+
+
+def _fake_value(annotation: Any, seed: int) -> Any:
+    """타입 어노테이션에 맞는 결정적 가짜 값 (Pydantic 모델은 필드별로 재귀 생성)"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {
+            name: _fake_value(field.annotation, seed + i)
+            for i, (name, field) in enumerate(annotation.model_fields.items())
+        }
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Literal:
+        return args[0]
+    if origin in (typing.Union, types.UnionType):
+        return _fake_value(next(a for a in args if a is not type(None)), seed)
+    if origin in (list, tuple, set):
+        return [_fake_value(args[0] if args else str, seed + i) for i in range(2)]
+    if origin is dict:
+        return {str(i + 1): _fake_value(args[1] if args else str, seed + i) for i in range(2)}
+    if annotation is bool:
+        return True
+    if annotation in (int, float):
+        return annotation(1)
+    return _SENTENCES[seed % len(_SENTENCES)]
@@ -1,22 +1,52 @@
+import threading
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableWithFallbacks
+from config.cassette import enable_cassette
+from config.fake_llm import create_fake_chat_model
+from config.model_health import CircuitBreakerCallbackHandler, get_breaker
+from config.model_router import TaskName, route_model
+from config.profiling import ProfilingCallbackHandler
 from config.settings import settings
+from config.single_flight import enable_coalescing
+from config.tenancy import TenantQuotaCallbackHandler
+from tools.llm_util import get_provider_for_model
+
+# 세션마다 클라이언트(HTTP 연결 풀)를 새로 만들지 않도록 설정별 모델 인스턴스를 프로세스에서 공유
+_models: dict[tuple, BaseChatModel | RunnableWithFallbacks] = {}
+_models_lock = threading.Lock()
+
+# 사용자 토큰 한도 검사는 자원을 점유하지 않으므로 모든 모델이 하나의 핸들러를 공유
+_tenant_quota_handler = TenantQuotaCallbackHandler()
+
+# 디버그 모드: 모델 호출 시간을 측정 중인 rerun에 기록 (config.profiling)
+_profiling_handler = ProfilingCallbackHandler()
 
 def get_chat_model(
     provider: str | None = None, 
     model: str | None = None, 
-    temperature: float | None = None
-) -> BaseChatModel:
+    temperature: float | None = None,
+    use_fallback: bool = True,
+) -> BaseChatModel | RunnableWithFallbacks:
     """
     통합 LLM 팩토리 함수 using init_chat_model
     
+    같은 설정의 모델 인스턴스는 프로세스 전체에서 공유합니다.
+    모든 모델에는 사용자별 토큰 한도 검사와 (provider, model)별 서킷 브레이커가 부착되고, 입력이 같은 동시 호출은
+    하나로 병합되며(settings.llm_request_coalescing, config.single_flight), settings.cassette_mode에 따라 호출을
+    카세트로 녹화/재생합니다(config.cassette). settings.model_fallbacks에
+    대체 모델이 지정되어 있으면 회로가 열렸거나 호출이 실패할 때 대체 모델로 자동 전환합니다.
+    (`with_structured_output` 등은 RunnableWithFallbacks가 양쪽 모델에 모두 적용)
+    
     Args:
         provider: 'openai', 'anthropic', 'google_genai' (default: settings.model_provider)
         model: 모델명 (default: settings.model_name)
         temperature: 온도 (default: settings.temperature)
+        use_fallback: 대체 모델 연결 여부
     
     Returns:
-        Configured ChatModel instance
+        Configured ChatModel instance (대체 모델이 있으면 RunnableWithFallbacks)
     """
     
     # 설정값 오버라이드 또는 기본값 사용
@@ -24,6 +54,15 @@ def get_chat_model(
     _model = model or settings.model_name
     _temperature = temperature if temperature is not None else settings.temperature
     
+    key = (
+        settings.llm_backend, _provider, _model, _temperature, use_fallback,
+        settings.llm_request_coalescing, settings.debug, settings.cassette_mode,
+    )
+    with _models_lock:
+        cached = _models.get(key)
+    if cached is not None:
+        return cached
+    
     # API Key 매핑
     api_key = None
     if _provider == "openai":
@@ -33,28 +72,65 @@ def get_chat_model(
     elif _provider == "google_genai":
         api_key = settings.google_api_key
     
-    if not api_key:
+    if not api_key and settings.cassette_mode == "replay":
+        # 카세트 재생은 실제 호출하지 않으므로 클라이언트 생성용 임시 키 사용
+        api_key = "cassette-replay"
+    elif not api_key:
         # 키가 없으면 실행 시점에 에러가 발생하도록 둡니다 (또는 UI에서 처리)
         pass
 
-    # init_chat_model 활용 (LangChain 최신 문법)
-    # 각 provider별 구체적인 클래스 대신 통합 인터페이스 사용
-    return init_chat_model(
-        model=_model,
-        model_provider=_provider,
-        temperature=_temperature,
-        api_key=api_key
-    )
-
-# 모델 정의
-# 이력서 파싱 llm
-parsing_user_data_llm = get_chat_model("google_genai", "gemini-2.5-flash", temperature=0)
-
-# 단일 문항 피드백 검토 및 최종생성 llm
-final_llm = get_chat_model("google_genai", "gemini-3-pro-preview", temperature=0.7)
-
-# 사용자 입력값 검증 llm
-input_validation_llm = get_chat_model("google_genai", "gemini-2.5-flash-lite", temperature=0)
+    callbacks = [
+        _tenant_quota_handler,
+        CircuitBreakerCallbackHandler(get_breaker(_provider, _model)),
+    ]
+    if settings.debug:
+        callbacks.append(_profiling_handler)
+    chat_model: BaseChatModel
+    if settings.llm_backend == "fake":
+        # 부하 테스트용: 네트워크 호출 없이 지연만 흉내냄
+        chat_model = create_fake_chat_model(_model, callbacks=callbacks)
+    else:
+        # init_chat_model 활용 (LangChain 최신 문법)
+        # 각 provider별 구체적인 클래스 대신 통합 인터페이스 사용
+        chat_model = init_chat_model(
+            model=_model,
+            model_provider=_provider,
+            temperature=_temperature,
+            api_key=api_key,
+            callbacks=callbacks,
+        )
+    if settings.cassette_mode != "off":
+        # 병합보다 안쪽에 적용: 병합된 요청은 한 번만 녹화/재생
+        chat_model = enable_cassette(chat_model)
+    if settings.llm_request_coalescing:
+        chat_model = enable_coalescing(chat_model)
+    
+    llm: BaseChatModel | RunnableWithFallbacks = chat_model
+    fallback_model = settings.model_fallbacks.get(_model) if use_fallback else None
+    if fallback_model and fallback_model != _model:
+        fallback_llm = get_chat_model(
+            provider=get_provider_for_model(fallback_model),
+            model=fallback_model,
+            temperature=_temperature,
+            use_fallback=False,
+        )
+        llm = chat_model.with_fallbacks([fallback_llm])
+    
+    with _models_lock:
+        # 동시에 만든 경우 먼저 등록된 인스턴스를 사용
+        return _models.setdefault(key, llm)
 
-# 초안 생성 llm
-draft_llm = get_chat_model("google_genai", "gemini-3-pro-preview", temperature=1.0)
+def get_task_chat_model(
+    task: TaskName,
+    temperature: float,
+    input_tokens: int | None = None,
+) -> BaseChatModel | RunnableWithFallbacks:
+    """작업별 라우터(config.model_router)가 고른 모델 인스턴스
+    
+    Args:
+        task: 작업 종류 (validation, parsing, review 등)
+        temperature: 온도
+        input_tokens: 예상 입력 토큰 수 (비용 추정용, 없으면 정책 기본값)
+    """
+    model = route_model(task, input_tokens)
+    return get_chat_model(get_provider_for_model(model), model, temperature)
@@ -0,0 +1,223 @@
+"""모델별 서킷 브레이커 및 상태 추적
+
+프리뷰 모델이 불안정할 때 모든 세션이 타임아웃까지 기다리지 않도록,
+(provider, model) 단위로 최근 호출의 오류율과 지연을 추적해 회로를 엽니다.
+열린 회로는 즉시 실패하므로 `with_fallbacks`에 등록된 대체 모델로 바로 넘어갑니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Literal
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config.settings import settings
+from config.single_flight import pop_coalesced_run
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어 호출을 즉시 거부함"""
+    pass
+
+
+@dataclass
+class _CallRecord:
+    ok: bool
+    latency: float
+
+
+class CircuitBreaker:
+    """슬라이딩 윈도우 기반 서킷 브레이커
+
+    - closed: 정상. 최근 `window_size`건 중 실패(오류 또는 느린 호출) 비율이
+      `error_rate_threshold` 이상이면 open으로 전환
+    - open: `open_seconds` 동안 모든 호출을 즉시 거부
+    - half_open: 시험 호출 1건만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 5,
+        error_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self._window: deque[_CallRecord] = deque(maxlen=window_size)
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 호출 1건만 허용)"""
+        with self._lock:
+            self._refresh_state()
+            if self._state == "closed":
+                return True
+            if self._state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self, latency: float) -> None:
+        """성공 기록 (임계 지연을 넘긴 호출은 실패로 집계)"""
+        if latency > self.slow_call_seconds:
+            self.record_failure(latency)
+            return
+        with self._lock:
+            if self._state == "half_open":
+                self._close()
+            self._window.append(_CallRecord(ok=True, latency=latency))
+
+    def record_failure(self, latency: float) -> None:
+        """실패 기록"""
+        with self._lock:
+            self._window.append(_CallRecord(ok=False, latency=latency))
+            if self._state == "half_open":
+                self._open()
+            elif self._state == "closed" and self._should_open():
+                self._open()
+
+    def record_cancelled(self) -> None:
+        """취소된 호출 (초안 토너먼트 조기 종료 등) - 성공/실패로 집계하지 않음"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """디버그 표시용 현재 상태"""
+        with self._lock:
+            self._refresh_state()
+            records = list(self._window)
+            latencies = sorted(r.latency for r in records)
+            return {
+                "model": self.name,
+                "state": self._state,
+                "calls": len(records),
+                "error_rate": round(self._error_rate(), 2),
+                "p50_latency_s": round(latencies[len(latencies) // 2], 2) if latencies else None,
+                "max_latency_s": round(latencies[-1], 2) if latencies else None,
+                "rejected": self._rejected,
+            }
+
+    def _refresh_state(self) -> None:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = "half_open"
+            self._probe_in_flight = False
+
+    def _should_open(self) -> bool:
+        return len(self._window) >= self.min_calls and self._error_rate() >= self.error_rate_threshold
+
+    def _error_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for r in self._window if not r.ok) / len(self._window)
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._probe_in_flight = False
+        self._window.clear()
+
+
+class CircuitBreakerCallbackHandler(BaseCallbackHandler):
+    """채팅 모델 인스턴스에 부착하여 호출 결과를 서킷 브레이커에 기록
+
+    모델 인스턴스의 callbacks로 등록하므로 `with_structured_output`, `bind_tools`로
+    감싼 경우에도 동일하게 동작합니다. 회로가 열려 있으면 호출 시작 시점에 예외를 던집니다.
+    (이 거부는 정상 동작이므로 LangChain이 남기는 "Error in ... callback" 경고는 `_CircuitOpenLogFilter`가 제외)
+    진행 중인 같은 호출에 합류한 요청(config.single_flight)은 실제 호출이 아니므로 결과를 기록하지 않습니다.
+    """
+
+    raise_error = True
+    run_inline = True
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self._started: dict[UUID, float] = {}
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self.breaker.name} 회로가 열려 있어 호출을 건너뜁니다.")
+        self._started[run_id] = time.monotonic()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None and not pop_coalesced_run(run_id):
+            self.breaker.record_success(time.monotonic() - started)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None or pop_coalesced_run(run_id):
+            return
+        if isinstance(error, asyncio.CancelledError):
+            self.breaker.record_cancelled()
+        else:
+            self.breaker.record_failure(time.monotonic() - started)
+
+
+class _CircuitOpenLogFilter(logging.Filter):
+    """콜백 관리자의 "Error in %s.%s callback: %s" 경고 중 회로 열림으로 인한 거부만 제외"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        return not (
+            isinstance(args, tuple)
+            and len(args) == 3
+            and args[0] == CircuitBreakerCallbackHandler.__name__
+            and str(args[2]).startswith(CircuitOpenError.__name__)
+        )
+
+
+logging.getLogger("langchain_core.callbacks.manager").addFilter(_CircuitOpenLogFilter())
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(provider: str, model: str) -> CircuitBreaker:
+    """(provider, model)별 프로세스 공용 서킷 브레이커 조회 (없으면 생성)"""
+    key = f"{provider}:{model}"
+    with _registry_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker(
+                key,
+                error_rate_threshold=settings.circuit_error_rate_threshold,
+                slow_call_seconds=settings.circuit_slow_call_seconds,
+                open_seconds=settings.circuit_open_seconds,
+            )
+        return _breakers[key]
+
+
+def breaker_snapshots() -> list[dict[str, Any]]:
+    """등록된 모든 서킷 브레이커의 상태 목록"""
+    with _registry_lock:
+        breakers = list(_breakers.values())
+    return [b.snapshot() for b in breakers]
@@ -0,0 +1,251 @@
+"""작업별 모델 라우터 (품질 등급, 지연 SLO, 비용 상한)
+
+작업 종류(검증, 파싱, 전략, 최종본 등)마다 정책을 두고, `MODEL_PROVIDER_MAP`의 모델 중
+정책을 만족하는 모델을 서킷 브레이커의 실시간 지연/오류율 통계를 반영해 고릅니다.
+
+1. 후보: API 키가 설정되어 있고 회로가 열려 있지 않은 모델 중 최소 품질 등급 이상
+2. 적격: 예상 지연(관측 p50, 표본이 적으면 사전값 × (1 + 오류율))이 SLO 이내이고 예상 비용이 상한 이내
+3. 선택: 정책의 최적화 기준(quality/cost/latency)으로 정렬, 동률이면 기본 모델 우선
+4. 적격 모델이 없으면 비용 → 지연 조건 순으로 완화하고, 그래도 없으면 기본 모델 사용
+
+모든 결정은 로그(logger, 최근 결정 목록, settings.model_routing_log_path JSONL)에 남겨 정책 조정에 사용합니다.
+"""
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional
+
+from config.model_health import get_breaker
+from config.settings import settings
+from tools.llm_util import MODEL_PROVIDER_MAP
+
+logger = logging.getLogger(__name__)
+
+TaskName = Literal[
+    "validation", "parsing", "strategy", "strategy_feedback", "strategy_extraction", "guideline",
+    "review", "review_light",
+]
+Optimize = Literal["quality", "cost", "latency"]
+
+# 관측 지연을 신뢰하기 위한 최소 호출 수 (미만이면 사전 지연값 사용)
+MIN_OBSERVED_CALLS = 3
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """모델 특성 (가격은 100만 토큰당 USD 추정치, 지연은 관측 전 사전값)"""
+    tier: int
+    input_cost: float
+    output_cost: float
+    prior_latency_s: float
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    """작업별 라우팅 정책"""
+    default: str
+    min_tier: int
+    latency_slo_s: float
+    max_cost_usd: float
+    optimize: Optimize
+    expected_input_tokens: int
+    expected_output_tokens: int
+
+
+MODEL_PROFILES: dict[str, ModelProfile] = {
+    "gemini-3-pro-preview": ModelProfile(tier=4, input_cost=2.0, output_cost=12.0, prior_latency_s=30.0),
+    "gpt-5": ModelProfile(tier=4, input_cost=1.25, output_cost=10.0, prior_latency_s=35.0),
+    "gemini-2.5-pro": ModelProfile(tier=3, input_cost=1.25, output_cost=10.0, prior_latency_s=20.0),
+    "gemini-3-flash-preview": ModelProfile(tier=3, input_cost=0.5, output_cost=3.0, prior_latency_s=8.0),
+    "gpt-4.1": ModelProfile(tier=3, input_cost=2.0, output_cost=8.0, prior_latency_s=12.0),
+    "gemini-2.5-flash": ModelProfile(tier=2, input_cost=0.3, output_cost=2.5, prior_latency_s=6.0),
+    "gemini-2.5-flash-lite": ModelProfile(tier=1, input_cost=0.1, output_cost=0.4, prior_latency_s=3.0),
+}
+
+DEFAULT_POLICIES: dict[str, RoutingPolicy] = {
+    # 입력 검증/공고 정리: 단순 판정이라 가장 싼 모델로 충분
+    "validation": RoutingPolicy(
+        default="gemini-2.5-flash-lite", min_tier=1, latency_slo_s=20.0, max_cost_usd=0.01,
+        optimize="cost", expected_input_tokens=6000, expected_output_tokens=2000,
+    ),
+    "parsing": RoutingPolicy(
+        default="gemini-2.5-flash", min_tier=2, latency_slo_s=30.0, max_cost_usd=0.02,
+        optimize="cost", expected_input_tokens=3000, expected_output_tokens=2000,
+    ),
+    "strategy": RoutingPolicy(
+        default="gemini-3-pro-preview", min_tier=3, latency_slo_s=90.0, max_cost_usd=0.15,
+        optimize="quality", expected_input_tokens=15000, expected_output_tokens=4000,
+    ),
+    "strategy_feedback": RoutingPolicy(
+        default="gemini-2.5-flash", min_tier=2, latency_slo_s=45.0, max_cost_usd=0.1,
+        optimize="latency", expected_input_tokens=8000, expected_output_tokens=4000,
+    ),
+    "strategy_extraction": RoutingPolicy(
+        default="gemini-2.5-pro", min_tier=3, latency_slo_s=60.0, max_cost_usd=0.05,
+        optimize="cost", expected_input_tokens=4000, expected_output_tokens=2000,
+    ),
+    "guideline": RoutingPolicy(
+        default="gemini-2.5-flash", min_tier=2, latency_slo_s=30.0, max_cost_usd=0.02,
+        optimize="cost", expected_input_tokens=2000, expected_output_tokens=1500,
+    ),
+    "review": RoutingPolicy(
+        default="gemini-3-pro-preview", min_tier=4, latency_slo_s=120.0, max_cost_usd=0.2,
+        optimize="quality", expected_input_tokens=8000, expected_output_tokens=2000,
+    ),
+    # 최종 검토 중 문장 다듬기 (피드백 분류 결과가 light인 문항)
+    "review_light": RoutingPolicy(
+        default="gemini-2.5-flash", min_tier=2, latency_slo_s=30.0, max_cost_usd=0.02,
+        optimize="cost", expected_input_tokens=8000, expected_output_tokens=500,
+    ),
+}
+
+
+@dataclass
+class RoutingDecision:
+    """라우팅 결정 기록"""
+    task: str
+    model: str
+    reason: str
+    expected_latency_s: Optional[float] = None
+    estimated_cost_usd: Optional[float] = None
+    candidates: list[dict[str, Any]] = field(default_factory=list)
+    timestamp: float = field(default_factory=time.time)
+
+
+_recent: deque[RoutingDecision] = deque(maxlen=200)
+_log_lock = threading.Lock()
+
+
+def get_policy(task: str) -> RoutingPolicy:
+    """작업 정책 (settings.model_routing_policy_overrides의 항목으로 덮어씀)
+
+    Raises:
+        KeyError: 정의되지 않은 작업인 경우
+    """
+    policy = DEFAULT_POLICIES[task]
+    overrides = settings.model_routing_policy_overrides.get(task)
+    return dataclasses.replace(policy, **overrides) if overrides else policy
+
+
+def route(task: TaskName, input_tokens: Optional[int] = None) -> RoutingDecision:
+    """작업에 사용할 모델 결정
+
+    Args:
+        task: 작업 종류
+        input_tokens: 예상 입력 토큰 수 (없으면 정책의 기본 추정치)
+
+    Returns:
+        RoutingDecision (model에 선택된 모델명)
+    """
+    policy = get_policy(task)
+    if not settings.model_routing_enabled:
+        return _record(RoutingDecision(task=task, model=policy.default, reason="routing_disabled"))
+
+    tokens_in = input_tokens if input_tokens is not None else policy.expected_input_tokens
+    candidates = [_evaluate(model, profile, policy, tokens_in) for model, profile in MODEL_PROFILES.items()]
+    usable = [c for c in candidates if c["rejected"] is None]
+
+    for reason, pool in (
+        ("policy", [c for c in usable if c["within_slo"] and c["within_cost"]]),
+        ("relaxed_cost", [c for c in usable if c["within_slo"]]),
+        ("relaxed_latency", usable),
+    ):
+        if pool:
+            best = min(pool, key=lambda c: _sort_key(c, policy))
+            return _record(RoutingDecision(
+                task=task,
+                model=best["model"],
+                reason=reason,
+                expected_latency_s=best["expected_latency_s"],
+                estimated_cost_usd=best["estimated_cost_usd"],
+                candidates=candidates,
+            ))
+    return _record(RoutingDecision(task=task, model=policy.default, reason="no_candidate", candidates=candidates))
+
+
+def route_model(task: TaskName, input_tokens: Optional[int] = None) -> str:
+    """`route`의 모델명만 반환"""
+    return route(task, input_tokens).model
+
+
+def recent_decisions(limit: int = 50) -> list[dict[str, Any]]:
+    """디버그 표시용 최근 결정 (최신순, 후보 목록 제외)"""
+    return [
+        {k: v for k, v in dataclasses.asdict(d).items() if k != "candidates"}
+        for d in list(_recent)[::-1][:limit]
+    ]
+
+
+def _evaluate(model: str, profile: ModelProfile, policy: RoutingPolicy, input_tokens: int) -> dict[str, Any]:
+    provider = MODEL_PROVIDER_MAP.get(model)
+    snapshot = get_breaker(provider, model).snapshot() if provider else {}
+    observed = snapshot.get("p50_latency_s") if snapshot.get("calls", 0) >= MIN_OBSERVED_CALLS else None
+    latency = (observed or profile.prior_latency_s) * (1 + snapshot.get("error_rate", 0.0))
+    cost = (input_tokens * profile.input_cost + policy.expected_output_tokens * profile.output_cost) / 1_000_000
+
+    rejected = None
+    if provider is None:
+        rejected = "unknown_provider"
+    elif not _has_api_key(provider):
+        rejected = "no_api_key"
+    elif profile.tier < policy.min_tier:
+        rejected = "tier"
+    elif snapshot.get("state") == "open":
+        rejected = "circuit_open"
+    return {
+        "model": model,
+        "tier": profile.tier,
+        "expected_latency_s": round(latency, 2),
+        "observed": observed is not None,
+        "estimated_cost_usd": round(cost, 5),
+        "within_slo": latency <= policy.latency_slo_s,
+        "within_cost": cost <= policy.max_cost_usd,
+        "rejected": rejected,
+        "is_default": model == policy.default,
+    }
+
+
+def _sort_key(candidate: dict[str, Any], policy: RoutingPolicy) -> tuple:
+    not_default = not candidate["is_default"]
+    if policy.optimize == "quality":
+        return (-candidate["tier"], not_default, candidate["estimated_cost_usd"])
+    if policy.optimize == "latency":
+        return (candidate["expected_latency_s"], not_default, -candidate["tier"])
+    return (candidate["estimated_cost_usd"], not_default, -candidate["tier"])
+
+
+def _has_api_key(provider: str) -> bool:
+    if settings.llm_backend == "fake":
+        return True
+    return bool({
+        "google_genai": settings.google_api_key,
+        "openai": settings.openai_api_key,
+        "anthropic": settings.anthropic_api_key,
+    }.get(provider))
+
+
+def _record(decision: RoutingDecision) -> RoutingDecision:
+    _recent.append(decision)
+    logger.info(
+        "model route task=%s model=%s reason=%s latency=%s cost=%s",
+        decision.task, decision.model, decision.reason,
+        decision.expected_latency_s, decision.estimated_cost_usd,
+    )
+    path = settings.model_routing_log_path
+    if path:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            line = json.dumps(dataclasses.asdict(decision), ensure_ascii=False)
+            with _log_lock, open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            # 로그 기록 실패가 모델 호출을 막지 않도록 경고만 남김
+            logger.warning("라우팅 로그 기록 실패: %s", e)
+    return decision
@@ -0,0 +1,268 @@
+"""rerun별 프로파일링 (settings.debug 전용)
+
+느린 화면이 우리 코드, Streamlit, 모델 중 어디에서 오는지 구분하기 위해 rerun 한 번을 구간별로 측정합니다.
+
+- `timed(name)`: rerun 안의 구간(render_stepN, render_sidebar 등) 실행 시간
+- `ProfilingCallbackHandler`: 모델 호출별 시간과 첫 토큰 지연 (llm_factory가 debug 모드에서 부착)
+- 선택한 rerun은 프로파일러도 실행
+  - cprofile: 함수별 누적 시간 상위 목록과 `.prof`(pstats) 내보내기 (snakeviz, flameprof 등).
+    Python 3.12+의 cProfile은 프로세스 전체에 적용되므로 동시에 실행 중인 다른 세션 호출도 섞일 수 있습니다.
+  - sampling: 스크립트 스레드의 호출 스택을 주기적으로 샘플링한 folded stacks 내보내기
+    (speedscope, flamegraph.pl, inferno에서 바로 flame graph로 열림). 모델 응답 대기도 그대로 보입니다.
+
+측정 중인 rerun은 contextvar로 전달하므로 같은 프로세스의 다른 세션 rerun과 섞이지 않습니다.
+백그라운드 작업(tools/background.py)은 제출한 rerun의 컨텍스트를 이어받지만, rerun이 끝난 뒤의 기록은 버립니다.
+"""
+import contextvars
+import cProfile
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Literal, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config.settings import settings
+
+ProfileMode = Literal["off", "cprofile", "sampling"]
+SpanKind = Literal["page", "llm"]
+
+# cProfile 상위 함수 표시 개수
+_TOP_FUNCTIONS = 30
+
+
+@dataclass
+class Span:
+    """rerun 안의 측정 구간 (시작 시각은 rerun 시작 기준 ms)"""
+    name: str
+    kind: SpanKind
+    start_ms: float
+    duration_ms: float
+    depth: int = 0
+    first_token_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class RerunProfile:
+    """rerun 한 번의 측정 결과"""
+    rerun: int
+    mode: ProfileMode
+    started_at: float = field(default_factory=time.time)
+    total_ms: float = 0.0
+    spans: list[Span] = field(default_factory=list)
+    note: str = ""
+    top_functions: list[dict[str, Any]] = field(default_factory=list)
+    pstats_data: Optional[bytes] = None
+    folded_stacks: Optional[str] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _closed: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def span_times(self, started: float) -> tuple[float, float]:
+        """perf_counter 시작 시각 -> (rerun 기준 시작 ms, 지금까지의 구간 ms)"""
+        return (started - self._started) * 1000, (time.perf_counter() - started) * 1000
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            if not self._closed:
+                self.spans.append(span)
+
+    def summary(self) -> dict[str, Any]:
+        """사이드바 표 한 줄 (최상위 화면 구간별 시간, 모델 호출 시간, 측정 구간 밖 시간)"""
+        with self._lock:
+            spans = list(self.spans)
+        pages = [s for s in spans if s.kind == "page" and s.depth == 0]
+        llm = [s for s in spans if s.kind == "llm"]
+        row: dict[str, Any] = {
+            "rerun": self.rerun,
+            "time": time.strftime("%H:%M:%S", time.localtime(self.started_at)),
+            "mode": self.mode,
+            "total_ms": round(self.total_ms, 1),
+        }
+        row.update({s.name: round(s.duration_ms, 1) for s in pages})
+        row["llm_calls"] = len(llm)
+        row["llm_ms"] = round(sum(s.duration_ms for s in llm), 1)
+        # Streamlit 스크립트 실행기/위젯 직렬화 등 측정 구간 밖의 시간
+        row["untimed_ms"] = round(max(self.total_ms - sum(s.duration_ms for s in pages), 0.0), 1)
+        return row
+
+    def _close(self) -> None:
+        with self._lock:
+            self.total_ms = (time.perf_counter() - self._started) * 1000
+            self._closed = True
+
+
+_current: contextvars.ContextVar[Optional[RerunProfile]] = contextvars.ContextVar("rerun_profile", default=None)
+_depth: contextvars.ContextVar[int] = contextvars.ContextVar("rerun_profile_depth", default=0)
+
+# cProfile은 프로세스에서 동시에 하나만 켤 수 있음 (sys.monitoring 도구 ID 공유)
+_cprofile_lock = threading.Lock()
+
+
+def current_profile() -> Optional[RerunProfile]:
+    """현재 측정 중인 rerun (측정 중이 아니면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def profile_rerun(history: deque, mode: ProfileMode = "off") -> Iterator[RerunProfile]:
+    """rerun 한 번을 측정하고 끝나면 history에 추가 (st.rerun/st.stop 예외로 끝나도 기록)
+
+    Args:
+        history: 최근 rerun 측정 결과 (maxlen으로 보관 개수 제한)
+        mode: 함께 실행할 프로파일러
+    """
+    profile = RerunProfile(rerun=history[-1].rerun + 1 if history else 1, mode=mode)
+    token = _current.set(profile)
+    profiler = _start_profiler(profile)
+    try:
+        yield profile
+    finally:
+        profile._close()
+        if profiler is not None:
+            profiler.stop(profile)
+        _current.reset(token)
+        history.append(profile)
+
+
+@contextmanager
+def timed(name: str, kind: SpanKind = "page") -> Iterator[None]:
+    """측정 중인 rerun에 구간 시간 기록 (측정 중이 아니면 아무것도 하지 않음)"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    depth = _depth.get()
+    token = _depth.set(depth + 1)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depth.reset(token)
+        profile.add(Span(name, kind, *profile.span_times(started), depth=depth))
+
+
+class ProfilingCallbackHandler(BaseCallbackHandler):
+    """모델 호출 시간과 첫 토큰 지연을 측정 중인 rerun에 기록
+
+    호출을 시작한 rerun을 run_id별로 기억하므로, 비동기 병렬 호출이나 rerun이 끝난 뒤 완료되는 호출도
+    올바른 rerun(또는 버림)으로 처리됩니다.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._runs: dict[UUID, tuple[RerunProfile, str, float, int]] = {}
+        self._first_tokens: dict[UUID, float] = {}
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        profile = _current.get()
+        if profile is None:
+            return
+        metadata = kwargs.get("metadata") or {}
+        name = metadata.get("ls_model_name") or (serialized.get("id") or ["llm"])[-1]
+        self._runs[run_id] = (profile, str(name), time.perf_counter(), _depth.get())
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        if run_id in self._runs and run_id not in self._first_tokens:
+            self._first_tokens[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, f"{type(error).__name__}: {error}")
+
+    def _finish(self, run_id: UUID, error: Optional[str] = None) -> None:
+        run = self._runs.pop(run_id, None)
+        first_token = self._first_tokens.pop(run_id, None)
+        if run is None:
+            return
+        profile, name, started, depth = run
+        profile.add(Span(
+            name, "llm", *profile.span_times(started),
+            depth=depth,
+            first_token_ms=(first_token - started) * 1000 if first_token is not None else None,
+            error=error,
+        ))
+
+
+class _CProfiler:
+    def __init__(self) -> None:
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self, profile: RerunProfile) -> None:
+        self._profiler.disable()
+        _cprofile_lock.release()
+        stats = pstats.Stats(self._profiler)
+        # Stats.dump_stats와 같은 형식 (pstats.Stats(파일), snakeviz 등에서 열 수 있음)
+        profile.pstats_data = marshal.dumps(stats.stats)  # type: ignore[attr-defined]
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)  # type: ignore[attr-defined]
+        profile.top_functions = [
+            {
+                "function": f"{func} ({os.path.basename(filename)}:{line})",
+                "calls": calls,
+                "tottime_ms": round(tottime * 1000, 2),
+                "cumtime_ms": round(cumtime * 1000, 2),
+            }
+            for (filename, line, func), (_, calls, tottime, cumtime, _) in rows[:_TOP_FUNCTIONS]
+        ]
+
+
+class _SamplingProfiler:
+    """스크립트 스레드의 호출 스택을 주기적으로 수집 (wall-clock, 대기 시간 포함)"""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._target = threading.get_ident()
+        self._interval = interval_seconds
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rerun-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, profile: RerunProfile) -> None:
+        self._stop.set()
+        self._thread.join()
+        profile.folded_stacks = "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self._stacks[_fold(frame)] += 1
+
+
+def _start_profiler(profile: RerunProfile) -> Optional[_CProfiler | _SamplingProfiler]:
+    if profile.mode == "cprofile":
+        if _cprofile_lock.acquire(blocking=False):
+            try:
+                return _CProfiler()
+            except ValueError:
+                # coverage 등 다른 프로파일링 도구가 이미 켜져 있음
+                _cprofile_lock.release()
+        profile.mode = "sampling"
+        profile.note = "cProfile을 사용할 수 없어(다른 세션/도구가 사용 중) 샘플링으로 대체"
+    if profile.mode == "sampling":
+        return _SamplingProfiler(settings.profiling_sample_interval_ms / 1000)
+    return None
+
+
+def _fold(frame: Any) -> str:
+    """프레임 체인을 folded stack 한 줄로 변환 (루트 -> 현재 함수, `;` 구분)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ","))
+        frame = frame.f_back
+    return ";".join(reversed(names))
@@ -1,4 +1,4 @@
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 # -------------------------
 # 기본 작성 가이드 템플릿
@@ -40,7 +40,11 @@ GUIDELINE_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
 
 {user_guideline}
 
-위 가이드라인의 문제점을 파악하고, 필요시 개선된 버전을 제안해주세요.""")
+위 가이드라인의 문제점을 파악하고, 필요시 개선안을 제안해주세요.
+개선안은 가이드라인 전체를 다시 쓰지 말고 바꿀 부분만 수정 연산(edits)으로 반환하세요.
+- replace: target 문구를 text로 교체 / insert: target 문구 바로 뒤에 text 삽입 (새 줄은 text를 줄바꿈으로 시작) / delete: target 문구 삭제
+- target은 위 가이드라인에 있는 문구를 글자 하나 바꾸지 말고 그대로 옮기세요.
+- 그대로 승인하는 경우 edits는 빈 목록으로 반환하세요.""")
 ])
 
 # -------------------------
@@ -110,7 +114,9 @@ FEEDBACK_STRATEGY_PROMPT = ChatPromptTemplate.from_messages([
 3. 전체 전략의 일관성을 유지하세요
 4. 필요하면 추가 제안도 해주세요
 
-답변은 Markdown 형식으로 작성하고, 이전과 동일한 섹션 구조를 유지하세요.""",), ("user", "{user_input}")
+답변은 Markdown 형식으로 작성하고, 이전과 동일한 섹션 구조를 유지하세요.""",),
+    MessagesPlaceholder("chat_history"),
+    ("user", "{user_input}")
 ])
 
 # 구조화된 데이터 추출용 프롬프트
@@ -122,8 +128,7 @@ EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
 # -------------------------
 # 입력값 검증
 # -------------------------
-INPUT_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", """당신은 채용 전문가입니다. 지원자가 입력한 정보가 자기소개서를 작성하기에 충분한지 검증하세요.
+_INPUT_VALIDATION_CRITERIA = """당신은 채용 전문가입니다. 지원자가 입력한 정보가 자기소개서를 작성하기에 충분한지 검증하세요.
 
 # 검증 기준
 1. 회사명 & 채용공고 교차 검증:
@@ -135,7 +140,9 @@ INPUT_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
    - 직무 설명, 주요 업무, 자격요건이 구체적으로 포함되어 있는가?
    - 너무 짧거나 제목/개요만 있으면 '부족'
 
-# 채용공고 정리 규칙 (cleaned_job_posting)
+"""
+
+_JOB_POSTING_CLEANING_RULES = """# 채용공고 정리 규칙 (cleaned_job_posting)
 원본 채용공고에서 아래 내용만 추출하여 깔금하게 정리하세요:
 
 **포함할 내용:**
@@ -161,12 +168,18 @@ INPUT_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
 
 최종 출력은 명료하고 구조화되어야 하며, 지원서 작성에 직접 활용할 수 있는 형태여야 합니다.
 
-# 출력 규칙
+"""
+
+_INPUT_VALIDATION_OUTPUT_RULES = """# 출력 규칙
 각 항목별로 '충분', '부족', '불명확' 중 하나로 판정하고 이유를 적으세요.
 부족하거나 불명확한 항목이 있다면, 이를 보완하기 위해 사용자에게 할 질문을 생성하세요.
 모든 항목이 '충분'이어야 overall_status가 'PASS'가 됩니다.
 
-중요: 회사명과 직무명이 채용공고와 일치하는지 교차 검증을 반드시 수행하세요.""",), ("user", """
+중요: 회사명과 직무명이 채용공고와 일치하는지 교차 검증을 반드시 수행하세요."""
+
+INPUT_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _INPUT_VALIDATION_CRITERIA + _JOB_POSTING_CLEANING_RULES + _INPUT_VALIDATION_OUTPUT_RULES),
+    ("user", """
 [입력 데이터]
 회사명: {company_name}
 지원 직무: {position_name}
@@ -175,6 +188,18 @@ INPUT_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
 {job_posting}""")
 ])
 
+# 채용 페이지의 구조화 데이터(JSON-LD)로 이미 정리된 공고: 정리 규칙 없이 판정만 요청
+PREPARED_POSTING_VALIDATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _INPUT_VALIDATION_CRITERIA + _INPUT_VALIDATION_OUTPUT_RULES),
+    ("user", """
+[입력 데이터]
+회사명: {company_name}
+지원 직무: {position_name}
+
+[채용공고 - 채용 페이지의 구조화 데이터에서 정리됨]
+{job_posting}""")
+])
+
 # -------------------------
 # 자기소개서 작성 프롬프트
 # -------------------------
@@ -257,4 +282,20 @@ REVIEW_HUMAN_PROMPT = """
 [사용자 피드백]
 {feedback}
 
-위 내용을 바탕으로 최종 자기소개서를 작성해주세요."""
\ No newline at end of file
+위 내용을 바탕으로 최종 자기소개서를 작성해주세요."""
+
+REVIEW_PATCH_HUMAN_PROMPT = """
+[문항]
+{question}
+
+[선택된 초안]
+{draft}
+
+[사용자 피드백]
+{feedback}
+
+[출력 형식]
+초안 전체를 다시 쓰지 말고, 피드백 반영과 교정에 필요한 부분만 수정 연산 목록(edits)으로 반환하세요.
+- replace: target 문구를 text로 교체 / insert: target 문구 바로 뒤에 text 삽입 / delete: target 문구 삭제
+- target은 [선택된 초안]에 있는 문구를 글자 하나 바꾸지 말고 그대로 옮기되, 위치를 특정할 수 있는 가장 짧은 범위로 지정하세요.
+- 수정 연산은 초안 앞쪽부터 순서대로 나열하고, 고칠 부분이 없으면 빈 목록을 반환하세요."""
@@ -1,8 +1,11 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
-from typing import Optional, Literal
+from typing import Any, Optional, Literal
 import os
 
+# 문항별 초안 후보 수 상한 (후보마다 모델을 호출하므로 비용을 제한하고, 화면의 옵션 A~H 표시와 맞춤)
+MAX_CANDIDATES_PER_QUESTION = 8
+
 class Settings(BaseSettings):
     """애플리케이션 설정
     
@@ -29,7 +32,160 @@ class Settings(BaseSettings):
     temperature: float = Field(default=0.7, ge=0.0, le=2.0, description="LLM temperature")
     max_tokens: int = Field(default=4000, gt=0, description="최대 토큰 수")
     debug: bool = Field(default=False, description="디버그 모드")
+    strategy_history_token_budget: int = Field(
+        default=8000, gt=0, description="전략 피드백 요청에 포함할 대화 이력 토큰 예산"
+    )
+    
+    # 초안 토너먼트 (6단계)
+    draft_model_pool: list[str] = Field(
+        default=["gemini-3-pro-preview", "gpt-4.1", "gemini-2.5-pro"],
+        description="초안 후보 생성에 순환 사용할 모델 목록"
+    )
+    draft_candidates_per_question: int = Field(
+        default=3, ge=1, le=MAX_CANDIDATES_PER_QUESTION, description="문항별 초안 후보 수"
+    )
+    draft_min_good_candidates: int = Field(
+        default=2, ge=1, description="이 수만큼 좋은 후보가 모이면 나머지 생성을 중단"
+    )
+    draft_good_score: float = Field(default=0.7, ge=0.0, le=1.0, description="좋은 후보 기준 점수")
+    # 최종 검토 (7단계)
+    review_mode: Literal["patch", "rewrite"] = Field(
+        default="patch",
+        description="patch: 수정 연산만 받아 로컬 적용 (구조 변경 피드백은 전체 재작성), rewrite: 항상 전체 재작성"
+    )
+    review_triage_enabled: bool = Field(
+        default=True, description="피드백 없는 통과 초안은 그대로 채택, 다듬기 요청은 flash 모델로 처리"
+    )
+    review_light_feedback_max_chars: int = Field(
+        default=80, gt=0, description="flash 모델로 보낼 다듬기 피드백의 최대 글자 수"
+    )
+    experience_top_k: int = Field(
+        default=3, ge=1, description="문항별 프롬프트에 넣을 관련 경험 수 (전략에서 언급된 경험은 추가 포함)"
+    )
     
+    # 경험 구조화 (청크 단위 병렬 파싱)
+    experience_chunk_max_chars: int = Field(default=3000, gt=0, description="경험 파싱 청크 최대 글자 수")
+    experience_parse_concurrency: int = Field(default=4, ge=1, description="동시에 파싱할 청크 수")
+    experience_chunk_cache_size: int = Field(default=512, ge=0, description="파싱된 청크 캐시 최대 항목 수")
+    profile_db_path: str = Field(default="data/profiles.db", description="사용자 프로필 저장소(SQLite) 경로")
+    research_cache_db_path: str = Field(
+        default="data/research_cache.db", description="회사/직무별 리서치 공용 캐시(SQLite) 경로"
+    )
+    research_cache_ttl_days: float = Field(default=30.0, gt=0, description="캐시된 리서치를 제안하는 최대 경과 일수")
+    posting_index_db_path: str = Field(
+        default="data/posting_index.db", description="검증된 채용공고 근접 중복 인덱스(SQLite) 경로"
+    )
+    posting_duplicate_threshold: float = Field(
+        default=0.9, gt=0.0, le=1.0, description="검증 결과를 재사용할 공고 유사도(MinHash 자카드 추정치)"
+    )
+    
+    # 채용공고 스크래핑 (iframe/탭 하위 페이지 병렬 수집)
+    scrape_follow_subpages: bool = Field(
+        default=True, description="iframe/탭으로 분리된 공고 하위 페이지를 함께 수집하여 병합"
+    )
+    scrape_max_subpages: int = Field(default=8, ge=0, description="공고 하나당 추가로 가져올 최대 하위 페이지 수")
+    scrape_max_depth: int = Field(default=2, ge=1, description="하위 페이지를 따라갈 최대 깊이 (iframe 안의 iframe 등)")
+    scrape_max_workers: int = Field(default=6, ge=1, description="하위 페이지 동시 요청 수")
+    scrape_per_domain_concurrency: int = Field(default=2, ge=1, description="도메인별 동시 요청 수")
+    
+    # 배치 실행 (대량 작업, config/batch_backend.py)
+    batch_openai_base_url: str = Field(
+        default="https://api.openai.com/v1", description="OpenAI 호환 Batch API 주소 (로컬 대체 서버 사용 시 변경)"
+    )
+    batch_gemini_base_url: str = Field(
+        default="https://generativelanguage.googleapis.com/v1beta", description="Gemini Batch API 주소"
+    )
+    batch_poll_seconds: float = Field(default=30.0, gt=0, description="배치 상태 폴링 간격")
+    batch_timeout_seconds: float = Field(default=86400.0, gt=0, description="배치 완료를 기다리는 최대 시간")
+    batch_max_requests: int = Field(default=1000, ge=1, description="배치 하나에 넣을 최대 요청 수")
+    batch_max_applications: int = Field(default=100, ge=1, description="배치 API 요청 하나에 넣을 최대 지원서 수")
+    batch_db_path: str = Field(
+        default="data/batches.db", description="제출한 배치 기록(SQLite) 경로 (중단된 작업 재개/수집용)"
+    )
+    
+    # rerun 프로파일링 (settings.debug일 때만, config/profiling.py)
+    profiling_history: int = Field(default=20, ge=1, description="사이드바에 표시할 최근 rerun 측정 결과 수")
+    profiling_sample_interval_ms: float = Field(default=5.0, gt=0, description="샘플링 프로파일러의 스택 수집 간격")
+    
+    # 녹화/재생 카세트 (오프라인 벤치마크/회귀 테스트, config/cassette.py)
+    cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off", description="record: 모델/스크래핑 요청과 응답을 카세트에 기록, replay: 네트워크 없이 카세트로 응답"
+    )
+    cassette_path: str = Field(default="data/cassettes/session.jsonl.gz", description="카세트 파일(gzip JSONL) 경로")
+    cassette_replay_speed: float = Field(
+        default=1.0, ge=0.0, description="재생 속도 배율 (1: 녹화 당시 지연, 10: 10배 빠르게, 0: 지연 없음)"
+    )
+    
+    # 동일 요청 병합 (config/single_flight.py)
+    llm_request_coalescing: bool = Field(
+        default=True, description="입력이 같은 LLM 호출이 진행 중이면 새로 호출하지 않고 결과(스트림 포함)를 공유"
+    )
+    
+
+    model_fallbacks: dict[str, str] = Field(
+        default={
+            "gemini-3-pro-preview": "gemini-2.5-pro",
+            "gemini-3-flash-preview": "gemini-2.5-flash",
+            "gemini-2.5-pro": "gemini-2.5-flash",
+            "gpt-5": "gpt-4.1",
+        },
+        description="회로가 열리거나 호출이 실패할 때 사용할 대체 모델 (MODEL_PROVIDER_MAP 내 모델)"
+    )
+    circuit_error_rate_threshold: float = Field(
+        default=0.5, gt=0.0, le=1.0, description="회로를 여는 최근 호출 실패율"
+    )
+    circuit_slow_call_seconds: float = Field(
+        default=60.0, gt=0, description="이 시간을 넘긴 호출은 실패로 집계"
+    )
+    circuit_open_seconds: float = Field(
+        default=30.0, gt=0, description="회로가 열린 뒤 시험 호출까지 대기 시간"
+    )
+
+    # 작업별 모델 라우팅 (config/model_router.py)
+    model_routing_enabled: bool = Field(
+        default=True, description="False이면 작업별 기본 모델만 사용"
+    )
+    model_routing_policy_overrides: dict[str, dict[str, Any]] = Field(
+        default={}, description="작업별 정책 덮어쓰기 (예: {\"review\": {\"max_cost_usd\": 0.1}})"
+    )
+    model_routing_log_path: str = Field(
+        default="", description="라우팅 결정 로그(JSONL) 경로 (예: data/model_routing.jsonl, 빈 값이면 기록 안 함)"
+    )
+
+    # 다중 사용자 실행 제한
+    tenant_max_concurrent_calls: int = Field(default=4, ge=1, description="사용자별 동시 LLM 호출 수")
+    global_max_concurrent_calls: int = Field(default=64, ge=1, description="프로세스 전체 동시 LLM 호출 수")
+    tenant_acquire_timeout_seconds: float = Field(
+        default=120.0, gt=0, description="호출 슬롯을 기다리는 최대 시간"
+    )
+    tenant_token_quota_per_hour: int = Field(
+        default=0, ge=0, description="사용자별 시간당 토큰 한도 (0이면 제한 없음)"
+    )
+    background_max_workers: int = Field(default=16, ge=1, description="백그라운드 작업 스레드 수")
+    session_max_strategy_messages: int = Field(
+        default=20, ge=2, description="세션에 보관할 전략 대화 메시지 최대 수"
+    )
+
+    # 모델 백엔드 (fake: 네트워크 없이 지연만 흉내내는 가짜 모델, 부하 테스트용)
+    llm_backend: Literal["live", "fake"] = Field(default="live", description="LLM 백엔드")
+    fake_llm_first_token_seconds: float = Field(default=0.3, ge=0, description="가짜 모델 첫 토큰 지연")
+    fake_llm_chunk_seconds: float = Field(default=0.01, ge=0, description="가짜 모델 청크 간 지연")
+    fake_llm_response_chars: int = Field(default=600, gt=0, description="가짜 모델 일반 응답 글자 수")
+
+    # HTTP API (api/)
+    api_max_jobs: int = Field(default=1000, ge=1, description="메모리에 보관할 최대 작업 수")
+    api_job_ttl_seconds: float = Field(default=3600.0, gt=0, description="완료된 작업 보관 시간")
+    api_job_workers: int = Field(
+        default=128, ge=1, description="작업 실행 스레드 수 (대부분 LLM 응답 대기이므로 CPU 수보다 크게)"
+    )
+    api_keys: dict[str, str] = Field(
+        default_factory=dict,
+        description="API 키 -> 사용자 ID (Authorization: Bearer <키>, 사용자별 한도/작업 조회 범위)",
+    )
+    access_key: Optional[str] = Field(
+        default=None, description="공용 접근 키 (Streamlit 로그인과 같은 ACCESS_KEY, API에서는 하나의 공용 사용자로 인증)"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
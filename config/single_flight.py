@@ -0,0 +1,345 @@
+"""동일 요청 병합 (single-flight)
+
+여러 세션이 같은 공고로 동시에 검증하거나, 더블 클릭 + rerun으로 같은 가이드라인 검토가 겹치는 경우처럼
+입력(메시지 + 모델 설정 + 호출 옵션)이 같은 호출이 진행 중이면 모델을 다시 부르지 않고 진행 중인 호출 하나를
+공유합니다. 결과를 저장하는 캐시가 아니므로 호출이 끝나면 다음 요청은 새로 호출합니다.
+
+- 일반 호출(`_generate`): 먼저 온 요청이 호출하고, 나머지는 같은 결과(또는 같은 예외)를 받습니다.
+- 스트리밍(`_stream`): 청크를 버퍼에 쌓으며 모든 구독자가 처음부터 같은 청크를 받습니다. 원본 스트림은
+  다음 청크가 필요한 구독자가 이어서 당겨오므로, 먼저 시작한 세션이 중간에 이탈(rerun 등)해도 나머지
+  세션은 끝까지 받습니다. 구독자가 모두 이탈하면 원본 스트림을 닫습니다.
+- 호출 방식이 달라도 합류합니다. 진행 중인 스트림에 합류한 일반 호출은 완료 후 청크를 합친 결과를, 진행 중인
+  일반 호출에 합류한 스트림은 완료 후 결과 전체를 청크 하나로 받습니다.
+
+`get_chat_model`이 만든 모델 인스턴스의 클래스를 `_generate`/`_stream`만 감싼 하위 클래스로 바꿔 적용하므로
+provider별 `with_structured_output`/`bind_tools` 구현은 그대로 사용됩니다. (동기 경로만 병합, 비동기 호출은 그대로)
+콜백(서킷 브레이커, 사용자 토큰 한도)은 합류한 요청에도 각각 실행되지만, 서킷 브레이커는 실제 호출 한 번만
+집계하도록 합류한 요청의 결과를 기록하지 않습니다(`pop_coalesced_run`).
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from uuid import UUID
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+# 클래스만 바꿔 같은 인스턴스를 돌려주는 래퍼(enable_coalescing, config.cassette.enable_cassette)의 모델 타입
+ChatModelT = TypeVar("ChatModelT", bound=BaseChatModel)
+
+# 합류한 요청 run_id 기록 상한 (콜백이 꺼내가지 않는 모델에서도 무한히 쌓이지 않도록)
+_MAX_COALESCED_RUNS = 4096
+
+
+@dataclass
+class _Flight:
+    """진행 중인 호출 하나 (stream이면 청크 버퍼, 아니면 최종 결과)"""
+    stream: bool
+    cond: threading.Condition = field(default_factory=threading.Condition)
+    chunks: list[ChatGenerationChunk] = field(default_factory=list)
+    result: Optional[ChatResult] = None
+    error: Optional[BaseException] = None
+    done: bool = False
+    # 스트리밍 전용: 원본 이터레이터와 현재 당겨오는 구독자 여부, 구독자 수
+    source: Optional[Iterator[ChatGenerationChunk]] = None
+    pulling: bool = False
+    subscribers: int = 0
+
+
+@dataclass
+class _ModelStats:
+    requests: int = 0
+    model_calls: int = 0
+    coalesced: int = 0
+    coalesced_streams: int = 0
+    max_waiters: int = 0
+
+
+class SingleFlight:
+    """키별 진행 중 호출 레지스트리와 병합 통계"""
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple[str, bool], _Flight] = {}
+        self._stats: dict[str, _ModelStats] = {}
+        self._lock = threading.Lock()
+
+    def generate(
+        self, model: str, key: str, call: Callable[[], ChatResult], run_id: Optional[UUID] = None
+    ) -> ChatResult:
+        """같은 키의 진행 중 호출(일반/스트리밍)에 합류하거나 직접 호출"""
+        with self._lock:
+            existing = self._flights.get((key, False)) or self._flights.get((key, True))
+            leader = existing is None
+            if existing is None:
+                flight = self._flights[(key, False)] = _Flight(stream=False)
+            else:
+                flight = existing
+                flight.subscribers += 1
+            self._record(model, leader, stream=False, waiters=flight.subscribers - int(flight.stream))
+        if not leader:
+            _mark_coalesced_run(run_id)
+
+        if flight.stream:
+            return self._generate_from_flight(flight, key)
+
+        if not leader:
+            with flight.cond:
+                flight.cond.wait_for(lambda: flight.done)
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[return-value]
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop((key, False), None)
+            with flight.cond:
+                flight.done = True
+                flight.cond.notify_all()
+        return flight.result
+
+    def stream(
+        self,
+        model: str,
+        key: str,
+        open_stream: Callable[[], Iterator[ChatGenerationChunk]],
+        run_id: Optional[UUID] = None,
+    ) -> Iterator[ChatGenerationChunk]:
+        """같은 키의 진행 중 스트림을 처음부터 구독하거나 새 스트림 시작"""
+        with self._lock:
+            existing = self._flights.get((key, True)) or self._flights.get((key, False))
+            leader = existing is None
+            if existing is None:
+                flight = self._flights[(key, True)] = _Flight(stream=True, source=open_stream())
+            else:
+                flight = existing
+            flight.subscribers += 1
+            self._record(model, leader, stream=True, waiters=flight.subscribers - int(flight.stream))
+        if not leader:
+            _mark_coalesced_run(run_id)
+        if not flight.stream:
+            return self._stream_from_result(flight)
+        return self._subscribe(flight, key)
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        """디버그 표시용 모델별 병합 통계"""
+        with self._lock:
+            items = list(self._stats.items())
+        return [
+            {
+                "model": model,
+                "requests": s.requests,
+                "model_calls": s.model_calls,
+                "coalesced": s.coalesced,
+                "coalesced_streams": s.coalesced_streams,
+                "dedup_rate": round(s.coalesced / s.requests, 3) if s.requests else 0.0,
+                "max_waiters": s.max_waiters,
+            }
+            for model, s in items
+        ]
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _generate_from_flight(self, flight: _Flight, key: str) -> ChatResult:
+        # 진행 중인 스트림에 구독자로 합류한 뒤 청크를 합쳐 일반 호출 결과로 변환
+        return generate_from_stream(self._subscribe(flight, key))
+
+    def _stream_from_result(self, flight: _Flight) -> Iterator[ChatGenerationChunk]:
+        # 진행 중인 일반 호출에 합류: 완료 후 결과 전체를 청크 하나로 전달
+        with flight.cond:
+            flight.cond.wait_for(lambda: flight.done)
+        if flight.error is not None:
+            raise flight.error
+        for generation in flight.result.generations:  # type: ignore[union-attr]
+            yield ChatGenerationChunk(message=message_to_chunk(generation.message), generation_info=generation.generation_info)
+
+    def _subscribe(self, flight: _Flight, key: str) -> Iterator[ChatGenerationChunk]:
+        index = 0
+        try:
+            while True:
+                with flight.cond:
+                    flight.cond.wait_for(lambda: index < len(flight.chunks) or flight.done or not flight.pulling)
+                    if index < len(flight.chunks):
+                        chunk = flight.chunks[index]
+                    elif flight.done:
+                        if flight.error is not None:
+                            raise flight.error
+                        return
+                    else:
+                        # 버퍼를 모두 받았고 아무도 당겨오지 않으면 이 구독자가 다음 청크를 가져옴
+                        flight.pulling = True
+                        chunk = None
+                if chunk is None:
+                    self._pull(flight, key)
+                    continue
+                index += 1
+                yield chunk
+        finally:
+            self._unsubscribe(flight, key)
+
+    def _pull(self, flight: _Flight, key: str) -> None:
+        chunk: Optional[ChatGenerationChunk] = None
+        finished = False
+        error: Optional[BaseException] = None
+        try:
+            chunk = next(flight.source)  # type: ignore[arg-type]
+        except StopIteration:
+            finished = True
+        except BaseException as e:
+            finished, error = True, e
+        if finished:
+            with self._lock:
+                self._flights.pop((key, True), None)
+        with flight.cond:
+            if chunk is not None:
+                flight.chunks.append(chunk)
+            flight.done = finished
+            flight.error = error
+            flight.pulling = False
+            flight.cond.notify_all()
+
+    def _unsubscribe(self, flight: _Flight, key: str) -> None:
+        with self._lock:
+            flight.subscribers -= 1
+            abandoned = flight.subscribers == 0 and not flight.done
+            if abandoned and self._flights.get((key, True)) is flight:
+                del self._flights[(key, True)]
+        if abandoned:
+            # 구독자가 모두 이탈: 원본 스트림(HTTP 응답)을 닫음
+            with flight.cond:
+                flight.done = True
+                flight.cond.notify_all()
+            close = getattr(flight.source, "close", None)
+            if close is not None:
+                close()
+
+    def _record(self, model: str, leader: bool, stream: bool, waiters: int) -> None:
+        stats = self._stats.setdefault(model, _ModelStats())
+        stats.requests += 1
+        if leader:
+            stats.model_calls += 1
+        else:
+            stats.coalesced += 1
+            if stream:
+                stats.coalesced_streams += 1
+        stats.max_waiters = max(stats.max_waiters, waiters)
+
+
+_single_flight = SingleFlight()
+
+
+_coalesced_runs: "OrderedDict[UUID, None]" = OrderedDict()
+_coalesced_lock = threading.Lock()
+
+
+def _mark_coalesced_run(run_id: Optional[UUID]) -> None:
+    if run_id is None:
+        return
+    with _coalesced_lock:
+        _coalesced_runs[run_id] = None
+        while len(_coalesced_runs) > _MAX_COALESCED_RUNS:
+            _coalesced_runs.popitem(last=False)
+
+
+def pop_coalesced_run(run_id: UUID) -> bool:
+    """진행 중인 호출에 합류한 요청이었는지 (확인한 run_id는 기록에서 제거)"""
+    with _coalesced_lock:
+        return _coalesced_runs.pop(run_id, False) is None
+
+
+def get_single_flight() -> SingleFlight:
+    """프로세스 공용 병합 레지스트리"""
+    return _single_flight
+
+
+def coalescing_snapshots() -> list[dict[str, Any]]:
+    """모델별 병합 통계 (요청 수, 실제 호출 수, 병합된 요청 수)"""
+    return _single_flight.snapshots()
+
+
+def request_key(llm: BaseChatModel, messages: list[BaseMessage], stop: Optional[list[str]], **kwargs: Any) -> str:
+    """LangChain LLM 캐시와 같은 기준(메시지 직렬화 + 모델 설정/호출 옵션)의 요청 키"""
+    llm_string = llm._get_llm_string(stop=stop, **kwargs)
+    return hashlib.sha256(f"{type(llm).__qualname__}\n{llm_string}\n{dumps(messages)}".encode("utf-8")).hexdigest()
+
+
+def enable_coalescing(llm: ChatModelT) -> ChatModelT:
+    """모델 인스턴스의 동기 호출을 single-flight로 병합하도록 전환 (같은 인스턴스를 반환)"""
+    object.__setattr__(llm, "__class__", _coalescing_class(type(llm)))
+    return llm
+
+
+_coalescing_classes: dict[type, type] = {}
+_classes_lock = threading.Lock()
+
+
+def _coalescing_class(cls: type) -> type:
+    if getattr(cls, "_single_flight_enabled", False):
+        return cls
+    with _classes_lock:
+        if cls in _coalescing_classes:
+            return _coalescing_classes[cls]
+
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            key = request_key(self, messages, stop, **kwargs)
+            return _single_flight.generate(
+                model_label(self), key,
+                lambda: super(subclass, self)._generate(messages, stop=stop, run_manager=run_manager, **kwargs),
+                run_id=run_manager.run_id if run_manager is not None else None,
+            )
+
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            key = request_key(self, messages, stop, **kwargs)
+            yield from _single_flight.stream(
+                model_label(self), key,
+                lambda: super(subclass, self)._stream(messages, stop=stop, run_manager=run_manager, **kwargs),
+                run_id=run_manager.run_id if run_manager is not None else None,
+            )
+
+        namespace: dict[str, Any] = {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_single_flight_enabled": True,
+            "_generate": _generate,
+        }
+        # 스트리밍을 구현하지 않은 모델에 _stream을 만들면 BaseChatModel이 스트리밍 지원으로 판단하므로 제외
+        if getattr(cls, "_stream") is not BaseChatModel._stream:
+            namespace["_stream"] = _stream
+        subclass = type(cls.__name__, (cls,), namespace)
+        _coalescing_classes[cls] = subclass
+        return subclass
+
+
+def message_to_chunk(message: BaseMessage) -> AIMessageChunk:
+    """완료된 응답 메시지를 스트리밍 청크 하나로 변환 (도구 호출 포함)"""
+    tool_call_chunks = [
+        tool_call_chunk(name=call["name"], args=json.dumps(call["args"], ensure_ascii=False), id=call.get("id"), index=i)
+        for i, call in enumerate(getattr(message, "tool_calls", None) or [])
+    ]
+    return AIMessageChunk(
+        content=message.content,
+        id=message.id,
+        additional_kwargs=message.additional_kwargs,
+        response_metadata=message.response_metadata,
+        usage_metadata=getattr(message, "usage_metadata", None),
+        tool_call_chunks=tool_call_chunks,
+    )
+
+
+def model_label(llm: BaseChatModel) -> str:
+    """통계/기록용 모델 이름 (Gemini의 models/ 접두사 제거)"""
+    name = getattr(llm, "model_name", None) or getattr(llm, "model", None) or llm._llm_type
+    return str(name).removeprefix("models/")
@@ -0,0 +1,253 @@
+"""다중 사용자(테넌트) 실행 제한
+
+한 서버에서 여러 사용자가 동시에 작업할 때 한 사용자가 LLM 호출을 독점하지 않도록
+사용자별 동시 호출 수와 시간당 토큰 사용량을, 프로세스 전체 동시 호출 수와 함께 제한합니다.
+
+- 사용자 식별: `tenant_context()`로 설정한 ContextVar (LangChain batch/async, 백그라운드 작업에 전파)
+- 동시 호출: 병렬 호출 지점(초안 토너먼트, 최종본 생성, 경험 파싱 등)에서 `tenant_slot()`/`async_tenant_slot()`
+- 토큰 한도: 모델에 부착한 `TenantQuotaCallbackHandler`가 호출 전 검사, 호출 후 사용량 기록
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Iterator
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from config.settings import settings
+from tools.llm_util import estimate_tokens
+
+ANONYMOUS_TENANT = "anonymous"
+
+# 토큰 사용량 집계 구간 (초)
+QUOTA_WINDOW_SECONDS = 3600
+
+# 비동기 슬롯 대기 시 재시도 간격 (이벤트 루프를 막지 않도록 폴링)
+_ASYNC_POLL_SECONDS = 0.05
+
+_current_tenant: ContextVar[str] = ContextVar("resume_tenant", default=ANONYMOUS_TENANT)
+
+
+class TenantLimitError(RuntimeError):
+    """사용자별 동시 호출 또는 토큰 한도 초과"""
+    pass
+
+
+class TenantUsage:
+    """사용자 한 명의 동시 호출 슬롯과 최근 토큰 사용량"""
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        # TenantRegistry의 잠금 안에서만 변경 (유휴 사용자 제거와 같은 잠금으로 판단)
+        self.in_flight = 0
+        self.last_active = time.monotonic()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._lock = threading.Lock()
+
+    def tokens_used(self) -> int:
+        """최근 QUOTA_WINDOW_SECONDS 동안 사용한 토큰 수"""
+        with self._lock:
+            self._expire(time.monotonic())
+            return sum(tokens for _, tokens in self._tokens)
+
+    def record_tokens(self, tokens: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._tokens.append((now, tokens))
+            self._expire(now)
+            self.last_active = now
+
+    def is_idle(self) -> bool:
+        return self.in_flight == 0 and self.tokens_used() == 0
+
+    def _expire(self, now: float) -> None:
+        while self._tokens and now - self._tokens[0][0] > QUOTA_WINDOW_SECONDS:
+            self._tokens.popleft()
+
+
+class TenantRegistry:
+    """사용자별 사용량 저장소 (유휴 사용자부터 제거하여 항목 수 제한)"""
+
+    def __init__(self, max_tenants: int = 1000) -> None:
+        self.max_tenants = max_tenants
+        self._tenants: "OrderedDict[str, TenantUsage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.global_slots = threading.BoundedSemaphore(settings.global_max_concurrent_calls)
+
+    def get(self, tenant: str) -> TenantUsage:
+        with self._lock:
+            usage = self._tenants.get(tenant)
+            if usage is None:
+                usage = TenantUsage(settings.tenant_max_concurrent_calls)
+                self._tenants[tenant] = usage
+                self._evict_idle()
+            self._tenants.move_to_end(tenant)
+            return usage
+
+    def begin_call(self, usage: TenantUsage) -> None:
+        """슬롯을 얻은 호출 시작 기록"""
+        with self._lock:
+            usage.in_flight += 1
+
+    def end_call(self, usage: TenantUsage) -> None:
+        """호출 종료 기록"""
+        with self._lock:
+            usage.in_flight -= 1
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        """디버그 표시용 사용자별 현황"""
+        with self._lock:
+            items = [(tenant, usage, usage.in_flight) for tenant, usage in self._tenants.items()]
+        return [
+            {"tenant": tenant, "in_flight": in_flight, "tokens_last_hour": usage.tokens_used()}
+            for tenant, usage, in_flight in items
+        ]
+
+    def _evict_idle(self) -> None:
+        overflow = len(self._tenants) - self.max_tenants
+        for tenant in list(self._tenants):
+            if overflow <= 0:
+                break
+            if self._tenants[tenant].is_idle():
+                del self._tenants[tenant]
+                overflow -= 1
+
+
+_registry = TenantRegistry()
+
+
+def current_tenant() -> str:
+    """현재 컨텍스트의 사용자 키"""
+    return _current_tenant.get()
+
+
+@contextmanager
+def tenant_context(tenant: str) -> Iterator[None]:
+    """블록 안에서 실행되는 LLM 호출을 해당 사용자 사용량으로 집계"""
+    token = _current_tenant.set(tenant or ANONYMOUS_TENANT)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+@contextmanager
+def tenant_slot() -> Iterator[None]:
+    """현재 사용자의 동시 호출 슬롯과 프로세스 전체 슬롯 획득 (동기)
+
+    Raises:
+        TenantLimitError: settings.tenant_acquire_timeout_seconds 안에 슬롯을 얻지 못한 경우
+    """
+    usage = _registry.get(current_tenant())
+    timeout = settings.tenant_acquire_timeout_seconds
+    if not usage.slots.acquire(timeout=timeout):
+        raise TenantLimitError("동시에 진행 중인 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+    try:
+        if not _registry.global_slots.acquire(timeout=timeout):
+            raise TenantLimitError("서버가 혼잡합니다. 잠시 후 다시 시도해주세요.")
+        _registry.begin_call(usage)
+        try:
+            yield
+        finally:
+            _registry.end_call(usage)
+            _registry.global_slots.release()
+    finally:
+        usage.slots.release()
+
+
+@asynccontextmanager
+async def async_tenant_slot() -> AsyncIterator[None]:
+    """`tenant_slot`의 비동기 버전 (대기 중에도 이벤트 루프를 막지 않음)"""
+    usage = _registry.get(current_tenant())
+    deadline = time.monotonic() + settings.tenant_acquire_timeout_seconds
+    await _acquire_polling(usage.slots, deadline, "동시에 진행 중인 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+    try:
+        await _acquire_polling(_registry.global_slots, deadline, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.")
+        _registry.begin_call(usage)
+        try:
+            yield
+        finally:
+            _registry.end_call(usage)
+            _registry.global_slots.release()
+    finally:
+        usage.slots.release()
+
+
+def check_token_quota(tenant: str, estimated_tokens: int) -> None:
+    """호출 전 토큰 한도 검사 (settings.tenant_token_quota_per_hour가 0이면 제한 없음)
+
+    Raises:
+        TenantLimitError: 최근 1시간 사용량 + 이번 요청 추정치가 한도를 넘는 경우
+    """
+    quota = settings.tenant_token_quota_per_hour
+    if not quota:
+        return
+    used = _registry.get(tenant).tokens_used()
+    if used + estimated_tokens > quota:
+        raise TenantLimitError(
+            f"시간당 토큰 사용 한도({quota:,})를 초과했습니다. (최근 1시간 {used:,} 사용) 잠시 후 다시 시도해주세요."
+        )
+
+
+def record_token_usage(tenant: str, tokens: int) -> None:
+    _registry.get(tenant).record_tokens(tokens)
+
+
+def tenant_snapshots() -> list[dict[str, Any]]:
+    return _registry.snapshots()
+
+
+class TenantQuotaCallbackHandler(BaseCallbackHandler):
+    """채팅 모델 호출마다 사용자별 토큰 한도를 검사하고 사용량을 기록
+
+    호출 전 검사는 자원을 점유하지 않으므로 다른 콜백(서킷 브레이커)과 순서에 무관합니다.
+    """
+
+    raise_error = True
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._runs: dict[UUID, tuple[str, int]] = {}
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: list, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        tenant = current_tenant()
+        estimated = sum(estimate_tokens(str(m.content)) for batch in messages for m in batch)
+        check_token_quota(tenant, estimated)
+        self._runs[run_id] = (tenant, estimated)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        tenant, estimated = run
+        record_token_usage(tenant, _response_tokens(response) or estimated)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is not None and not isinstance(error, asyncio.CancelledError):
+            # 실패한 호출도 입력 토큰은 과금될 수 있으므로 추정치로 기록
+            record_token_usage(*run)
+
+
+def _response_tokens(response: Any) -> int:
+    """LLMResult의 usage_metadata 합계 (없으면 0)"""
+    total = 0
+    for generations in getattr(response, "generations", []):
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    return total
+
+
+async def _acquire_polling(semaphore: threading.BoundedSemaphore, deadline: float, message: str) -> None:
+    while not semaphore.acquire(blocking=False):
+        if time.monotonic() >= deadline:
+            raise TenantLimitError(message)
+        await asyncio.sleep(_ASYNC_POLL_SECONDS)
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Literal
 from pydantic import BaseModel, Field
 
 class CompanyResearch(BaseModel):
@@ -12,12 +12,27 @@ class StrategyResponse(BaseModel):
                     "핵심 역량 매칭, 문항별 전략, 주의사항 등을 모두 포함한 Markdown 형식의 전략 문서"
     )
 
-class WritingStrategy(BaseModel):
-    """지원서 작성 전략"""
+class StrategyExtraction(BaseModel):
+    """전략 문서에서 추출한 구조화 항목 (모델 출력용, 문서 원문은 로컬에서 채움)"""
     core_competencies: List[str] = Field(description="핵심 직무 역량")
     talent_traits: List[str] = Field(description="기업의 선호 인재상")
     user_strengths: List[str] = Field(description="사용자의 강점 (직무/인재상 부합)")
     user_gaps: List[str] = Field(description="사용자의 약점/부족한 점 (보완 필요)")
     question_strategy: Dict[str, str] = Field(description="문항별 작성 포인트 (Key: 문항ID/Index, Value: 전략)")
     cautions: List[str] = Field(description="작성 시 주의사항 및 피해야 할 표현")
+
+class WritingStrategy(StrategyExtraction):
+    """지원서 작성 전략"""
     content: str = Field(description="전략 전체 텍스트 (채팅/설명 포함)")
+
+class TextEdit(BaseModel):
+    """원문에 대한 수정 연산 (위치는 원문에 있는 그대로의 문구로 지정)"""
+    op: Literal["replace", "insert", "delete"] = Field(
+        description="replace: target을 text로 교체, insert: target 바로 뒤에 text 삽입, delete: target 삭제"
+    )
+    target: str = Field(description="원문에 그대로 존재하는 문구 (한 문장 이내로 짧게, 원문과 글자 하나까지 동일)")
+    text: str = Field(default="", description="교체/삽입할 새 문구 (delete이면 빈 문자열)")
+
+class EssayPatch(BaseModel):
+    """초안 수정 연산 목록 (전체 재작성 대신 바뀌는 부분만 반환)"""
+    edits: List[TextEdit] = Field(description="원문 앞쪽부터 순서대로 적용할 수정 연산 목록")
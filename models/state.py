@@ -1,4 +1,4 @@
-from typing import TypedDict, List, Optional, Annotated, Literal
+from typing import Any, TypedDict, List, Optional, Annotated, Literal
 from langgraph.graph.message import add_messages
 from models.input_models import EssayQuestion
 from models.output_models import CompanyResearch, WritingStrategy
@@ -13,6 +13,10 @@ class ResumeState(TypedDict):
     position_name: str                  # 지원 직무명
     essay_questions: List[EssayQuestion]  # 자기소개서 문항 목록
     user_experiences: str               # 사용자 경험/경력 (자유 텍스트)
+    structured_job_posting: Optional[str]  # 채용 페이지 JSON-LD로 정리한 공고 (job_posting과 같으면 검증 시 정리 생략)
+    # 1단계 저장 시 백그라운드 파싱 후 6단계 진입 시 반영
+    # parsed_experiences: List[Experience]  # 구조화된 경험 목록 (문항별 검색용)
+    # parsed_experiences_hash: str          # 파싱 대상 user_experiences 해시
     
     # 2단계: 검증 결과
     validation_status: dict             # 각 항목별 충분/부족/불명확
@@ -39,3 +43,13 @@ class ResumeState(TypedDict):
     completed_steps: List[int]          # 완료된 단계 목록
     step_status: Literal["진행중", "대기중", "완료"]
     messages: Annotated[list, add_messages]  # 대화 이력
+
+def get_content(value: Any, default: str = "") -> str:
+    """State에 Pydantic 객체 또는 dict로 저장된 리서치/전략의 본문 텍스트"""
+    if not value:
+        return default
+    if hasattr(value, "content"):
+        return value.content
+    if isinstance(value, dict):
+        return value.get("content", default)
+    return str(value)
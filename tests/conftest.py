@@ -0,0 +1,55 @@
+from typing import ClassVar
+
+import pytest
+
+import config.model_router as model_router
+from config.fake_llm import FakeChatModel
+from config.settings import settings
+
+
+class CountingFakeModel(FakeChatModel):
+    """실제 모델 호출(_generate/_stream) 횟수를 세는 가짜 모델"""
+
+    calls: ClassVar[int] = 0
+
+    def _generate(self, *args, **kwargs):
+        CountingFakeModel.calls += 1
+        return super()._generate(*args, **kwargs)
+
+    def _stream(self, *args, **kwargs):
+        CountingFakeModel.calls += 1
+        yield from super()._stream(*args, **kwargs)
+
+
+class _FakeBreaker:
+    def __init__(self, snapshot: dict) -> None:
+        self._snapshot = snapshot
+
+    def snapshot(self) -> dict:
+        return self._snapshot
+
+
+@pytest.fixture(autouse=True)
+def _no_routing_log(monkeypatch):
+    """.env에 라우팅 로그 경로가 있어도 테스트의 라우팅 결정은 파일에 기록하지 않음"""
+    monkeypatch.setattr(settings, "model_routing_log_path", "")
+
+
+@pytest.fixture
+def counting_model() -> type[CountingFakeModel]:
+    """호출 횟수를 0으로 초기화한 CountingFakeModel 클래스"""
+    CountingFakeModel.calls = 0
+    return CountingFakeModel
+
+
+@pytest.fixture
+def router_stats(monkeypatch) -> dict[str, dict]:
+    """모델 라우터가 보는 모델별 서킷 브레이커 통계 (Google 키만 있는 설정, 비어 있으면 관측 없음)
+
+    반환한 dict에 {모델명: snapshot}을 넣으면 라우팅에 바로 반영됩니다.
+    """
+    stats: dict[str, dict] = {}
+    monkeypatch.setattr(model_router, "get_breaker", lambda provider, model: _FakeBreaker(stats.get(model, {})))
+    monkeypatch.setattr(settings, "google_api_key", "key")
+    monkeypatch.setattr(settings, "openai_api_key", None)
+    return stats
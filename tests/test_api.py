@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from api.server import create_app
+from config.settings import settings
+
+DRAFT_REQUEST = {
+    "company_name": "카카오",
+    "position_name": "백엔드 개발",
+    "job_posting": "결제 플랫폼 백엔드 개발자를 채용합니다. " * 5,
+    "essay_questions": [{"question_text": "지원 동기를 작성해주세요.", "char_limit": 800}],
+    "user_experiences": "결제 API 성능 개선 프로젝트를 진행했습니다. " * 5,
+    "writing_strategy": "# 전략\n- 결제 도메인 경험 강조",
+    "model_pool": ["gemini-2.5-flash"],
+    "candidates_per_question": 2,
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "llm_backend", "fake")
+    monkeypatch.setattr(settings, "fake_llm_first_token_seconds", 0.0)
+    monkeypatch.setattr(settings, "fake_llm_chunk_seconds", 0.0)
+    monkeypatch.setattr(settings, "api_keys", {"tester-key": "tester", "other-key": "other"})
+    with TestClient(create_app()) as client:
+        yield client
+
+
+def test_drafts_job_same_idempotency_key_returns_same_job_and_streams_tokens(client):
+    headers = {"Idempotency-Key": "draft-1", "Authorization": "Bearer tester-key"}
+    first = client.post("/v1/drafts", json=DRAFT_REQUEST, headers=headers)
+    retry = client.post("/v1/drafts", json=DRAFT_REQUEST, headers=headers)
+    conflict = client.post("/v1/drafts", json={**DRAFT_REQUEST, "company_name": "네이버"}, headers=headers)
+
+    assert (first.status_code, retry.status_code, conflict.status_code) == (202, 200, 409)
+    assert retry.json()["job_id"] == first.json()["job_id"]
+
+    with client.stream("GET", first.json()["events_url"], headers=headers) as response:
+        events = [line.removeprefix("event: ") for line in response.iter_lines() if line.startswith("event: ")]
+    assert events.count("token") > 0
+    assert events[-2:] == ["result", "status"]
+
+    job = client.get(f"/v1/jobs/{first.json()['job_id']}", headers=headers).json()
+    assert job["status"] == "succeeded"
+    assert [c["model"] for c in job["result"]["1"]] == ["gemini-2.5-flash", "gemini-2.5-flash"]
+    other = {"Authorization": "Bearer other-key"}
+    assert client.get(f"/v1/jobs/{first.json()['job_id']}", headers=other).status_code == 404
+
+
+def test_requests_without_valid_key_or_with_unbounded_options_are_rejected(client):
+    bad_key = {"Authorization": "Bearer guessed-key"}
+    headers = {"Authorization": "Bearer tester-key"}
+
+    assert client.post("/v1/drafts", json=DRAFT_REQUEST).status_code == 401
+    assert client.post("/v1/drafts", json=DRAFT_REQUEST, headers=bad_key).status_code == 401
+    # 클라이언트가 보낸 사용자 ID 헤더로는 다른 사용자가 될 수 없음
+    assert client.post("/v1/drafts", json=DRAFT_REQUEST, headers={"X-User-Id": "tester"}).status_code == 401
+    assert client.post("/v1/drafts", json={**DRAFT_REQUEST, "candidates_per_question": 1000}, headers=headers).status_code == 422
+    assert client.post("/v1/drafts", json={**DRAFT_REQUEST, "model_pool": ["gpt-99"]}, headers=headers).status_code == 422
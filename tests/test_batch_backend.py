@@ -0,0 +1,127 @@
+import json
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from chains.batch_chain import run_bulk_drafts, run_bulk_reviews
+from config.batch_backend import BatchError, BatchRequest, run_batch
+from config.settings import settings
+from config.tenancy import TenantLimitError, tenant_context, tenant_snapshots
+from tools.batch_store import get_batch_store
+from tools.batch_stub_server import ERROR_MARKER, BatchStubServer, fake_response
+
+DRAFT_MODEL_POOL = ["gemini-2.5-flash", "gpt-4.1"]
+
+
+def _application(company: str, questions: list[str], drafts: dict[str, str] | None = None) -> dict:
+    return {
+        "company_name": company,
+        "position_name": "백엔드 개발",
+        "job_posting": "결제 플랫폼 백엔드 개발자를 채용합니다. " * 5,
+        "essay_questions": [{"question_text": q, "char_limit": 800} for q in questions],
+        "user_experiences": "결제 API 성능 개선 프로젝트를 진행했습니다. " * 5,
+        "writing_strategy": {"core_competencies": ["결제"]},
+        "generated_drafts": {key: [draft] for key, draft in (drafts or {}).items()},
+        "draft_feedbacks": {key: "어색한 표현을 다듬어주세요" for key in (drafts or {})},
+    }
+
+
+def _stub(monkeypatch, tmp_path, server: BatchStubServer) -> BatchStubServer:
+    monkeypatch.setattr(settings, "batch_db_path", str(tmp_path / "batches.db"))
+    monkeypatch.setattr(settings, "batch_openai_base_url", server.openai_base_url)
+    monkeypatch.setattr(settings, "batch_gemini_base_url", server.gemini_base_url)
+    monkeypatch.setattr(settings, "batch_poll_seconds", 0.05)
+    return server
+
+
+@pytest.fixture
+def stub(monkeypatch, tmp_path):
+    with BatchStubServer(complete_after_polls=2) as server:
+        yield _stub(monkeypatch, tmp_path, server)
+
+
+def test_bulk_drafts_mixed_providers_map_results_back_to_application_question_model(stub):
+    applications = {
+        "kakao": _application("카카오", ["지원 동기를 작성해주세요.", f"실패 경험을 작성해주세요. {ERROR_MARKER}"]),
+        "naver": _application("네이버", ["협업 경험을 작성해주세요."]),
+    }
+    statuses = []
+
+    drafts = run_bulk_drafts(applications, DRAFT_MODEL_POOL, 2, on_status=statuses.append)
+
+    # OpenAI 배치 1개 + Gemini(모델별) 배치 1개
+    assert sorted(stub.submitted) == [("google_genai", 3), ("openai", 3)]
+    assert statuses[-1] and all(batch["state"] == "succeeded" for batch in statuses[-1])
+    assert sorted(c.model for c in drafts["kakao"]["1"]) == DRAFT_MODEL_POOL
+    assert sorted(c.model for c in drafts["naver"]["1"]) == DRAFT_MODEL_POOL
+    # 실패한 요청은 후보에서 제외
+    assert drafts["kakao"]["2"] == []
+    scores = [c.score.total for c in drafts["kakao"]["1"]]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_bulk_reviews_unapplicable_patch_falls_back_to_rewrite_batch(monkeypatch, tmp_path):
+    def responder(model, messages, json_schema):
+        if json_schema is None:
+            return fake_response(model, messages, None)
+        # 카카오 초안에는 있는 문구, 네이버 초안에는 없는 문구를 고치는 수정 연산
+        return json.dumps({"edits": [{"op": "replace", "target": "열심히 했습니다", "text": "주도했습니다"}]})
+
+    applications = {
+        "kakao": _application("카카오", ["지원 동기"], {"1": "결제 시스템 개선을 열심히 했습니다."}),
+        "naver": _application("네이버", ["지원 동기"], {"1": "검색 품질 개선에 참여했습니다."}),
+    }
+    monkeypatch.setattr(settings, "review_mode", "patch")
+    with BatchStubServer(responder=responder) as server:
+        _stub(monkeypatch, tmp_path, server)
+        finals = run_bulk_reviews(applications)
+
+    assert finals["kakao"]["1"] == "결제 시스템 개선을 주도했습니다."
+    assert finals["naver"]["1"] and finals["naver"]["1"] != "검색 품질 개선에 참여했습니다."
+    # 패치 배치 후 적용 실패한 문항만 재작성 배치로 다시 제출
+    assert [count for _, count in server.submitted][-1] == 1
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _interrupt(batches):
+    raise _Interrupted
+
+
+def _requests(prompt: str) -> list[BatchRequest]:
+    return [BatchRequest(f"req-{i}", "gpt-4.1", [HumanMessage(f"{prompt} {i}")]) for i in range(3)]
+
+
+def _tokens_used(tenant: str) -> int:
+    return next(t["tokens_last_hour"] for t in tenant_snapshots() if t["tenant"] == tenant)
+
+
+def test_rerun_after_interruption_collects_stored_batch_and_charges_usage_once(stub):
+    with tenant_context("batch-resume"):
+        with pytest.raises(_Interrupted):
+            run_batch(_requests("지원 동기"), on_status=_interrupt)
+        first = run_batch(_requests("지원 동기"))
+        charged = _tokens_used("batch-resume")
+        again = run_batch(_requests("지원 동기"))
+
+    # 재실행은 새로 제출하지 않고 기존 배치를 수집, 사용량은 한 번만 기록
+    assert stub.submitted == [("openai", 3)]
+    assert all(r.text for r in first.values()) and again == first
+    assert charged > 0 and _tokens_used("batch-resume") == charged
+
+
+def test_timeout_cancels_provider_batch_and_quota_blocks_submit(monkeypatch, tmp_path):
+    with BatchStubServer(complete_after_polls=1000) as server:
+        _stub(monkeypatch, tmp_path, server)
+        monkeypatch.setattr(settings, "batch_timeout_seconds", 0.1)
+        with pytest.raises(BatchError):
+            run_batch(_requests("협업 경험"))
+        assert len(server.cancelled) == 1
+        assert [b.state for b in get_batch_store().for_tenant("anonymous")] == ["cancelled"]
+
+        monkeypatch.setattr(settings, "tenant_token_quota_per_hour", 1)
+        with tenant_context("batch-quota"), pytest.raises(TenantLimitError):
+            run_batch(_requests("실패 경험"))
+        assert len(server.submitted) == 1
@@ -0,0 +1,70 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from config.cassette import CassetteMissError, enable_cassette
+from config.settings import settings
+from models.output_models import EssayPatch
+from tools.web_scraper import scrape_job_posting_page
+
+
+def _use_cassette(monkeypatch, tmp_path, mode: str, speed: float = 1.0) -> None:
+    monkeypatch.setattr(settings, "cassette_mode", mode)
+    monkeypatch.setattr(settings, "cassette_path", str(tmp_path / "session.jsonl.gz"))
+    monkeypatch.setattr(settings, "cassette_replay_speed", speed)
+
+
+def _stream_text(llm, prompt: str) -> tuple[str, float | None]:
+    started = time.perf_counter()
+    first_token = None
+    text = ""
+    for chunk in llm.stream(prompt):
+        first_token = first_token or time.perf_counter() - started
+        text += chunk.content
+    return text, first_token
+
+
+def test_replay_returns_recorded_stream_invoke_and_structured_output_without_model_calls(
+    monkeypatch, tmp_path, counting_model
+):
+    llm = enable_cassette(counting_model(model_name="cassette", first_token_seconds=0.1, chunk_seconds=0.001))
+    _use_cassette(monkeypatch, tmp_path, "record")
+    recorded_stream, _ = _stream_text(llm, "초안 생성")
+    recorded_invoke = llm.invoke("공고 검증").content
+    recorded_patch = llm.with_structured_output(EssayPatch).invoke("최종 검토")
+    assert counting_model.calls == 3
+
+    counting_model.calls = 0
+    _use_cassette(monkeypatch, tmp_path, "replay")
+    replayed_stream, first_token = _stream_text(llm, "초안 생성")
+    assert (replayed_stream, first_token >= 0.09) == (recorded_stream, True)
+
+    _use_cassette(monkeypatch, tmp_path, "replay", speed=0)
+    _, fast_first_token = _stream_text(llm, "초안 생성")
+    assert fast_first_token < 0.05
+    assert llm.invoke("공고 검증").content == recorded_invoke
+    assert llm.with_structured_output(EssayPatch).invoke("최종 검토") == recorded_patch
+    assert counting_model.calls == 0
+    with pytest.raises(CassetteMissError):
+        llm.invoke("녹화하지 않은 요청")
+
+
+def test_scraper_replays_recorded_pages_without_network(monkeypatch, tmp_path):
+    html = "<html><head><title>백엔드 개발자 채용</title></head><body><p>결제 플랫폼 개발</p></body></html>"
+    monkeypatch.setattr(settings, "scrape_follow_subpages", False)
+    monkeypatch.setattr(requests, "get", lambda url, **kwargs: SimpleNamespace(status_code=200, text=html))
+    _use_cassette(monkeypatch, tmp_path, "record")
+    recorded = scrape_job_posting_page("https://jobs.example.com/1")
+
+    def offline(url, **kwargs):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(requests, "get", offline)
+    _use_cassette(monkeypatch, tmp_path, "replay", speed=0)
+    replayed = scrape_job_posting_page("https://jobs.example.com/1")
+
+    assert replayed is not None and replayed.text == recorded.text and "결제 플랫폼 개발" in replayed.text
+    # 녹화되지 않은 URL은 네트워크로 나가지 않고 실패 처리
+    assert scrape_job_posting_page("https://jobs.example.com/2") is None
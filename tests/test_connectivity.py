@@ -20,7 +20,8 @@ def test_all_models():
         display_name = MODEL_DISPLAY_NAMES.get(model_name, model_name)
         try:
             # 팩토리 함수를 통해 모델 인스턴스 생성
-            llm = get_chat_model(provider=provider, model=model_name, temperature=0)
+            # 대체 모델로 넘어가면 해당 모델의 실패가 가려지므로 fallback 없이 생성
+            llm = get_chat_model(provider=provider, model=model_name, temperature=0, use_fallback=False)
             
             # 간단한 호출 테스트
             response = llm.invoke("Hi, please respond with only your model name and 'OK'.")
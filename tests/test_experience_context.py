@@ -0,0 +1,49 @@
+from chains.experience_context import experiences_for_question, store_parsed_experiences
+from tools.experience_index import ExperienceIndex
+
+EXPERIENCES = [
+    {
+        "id": "1", "project_name": "주문 시스템 MSA 전환", "role": "백엔드 개발",
+        "description": "모놀리식 주문 서비스를 Kafka 기반 MSA로 분리", "technologies": ["Kafka", "Spring"],
+        "achievements": "주문 처리 속도 50% 향상", "period": "2023.01 - 2023.12",
+    },
+    {
+        "id": "2", "project_name": "사내 동아리 운영", "role": "회장",
+        "description": "개발 스터디 동아리를 운영하며 갈등을 조율", "technologies": [],
+        "achievements": "회원 수 2배 증가", "period": "2021",
+    },
+    {
+        "id": "3", "project_name": "물류 대시보드", "role": "풀스택",
+        "description": "배송 현황 시각화 대시보드 개발", "technologies": ["React"],
+        "achievements": "", "period": "2022",
+    },
+]
+
+
+def test_experience_index_search_relevant_query_ranks_matching_first():
+    index = ExperienceIndex(EXPERIENCES)
+
+    results = index.search("팀 내 갈등을 조율했던 경험을 기술하시오", k=2)
+
+    assert results[0][0]["id"] == "2"
+
+
+def test_experiences_for_question_parsed_state_includes_strategy_named_experience():
+    state = {
+        "user_experiences": "원문 경험 텍스트",
+        "writing_strategy": {"question_strategy": {"문항 1": "물류 대시보드 경험을 보조 소재로 활용"}},
+    }
+    store_parsed_experiences(state, EXPERIENCES, state["user_experiences"])
+
+    text = experiences_for_question(state, "Kafka 기반 대용량 처리 경험을 서술하시오", "1")
+
+    assert "주문 시스템 MSA 전환" in text
+    assert "물류 대시보드" in text
+    assert "사내 동아리 운영" not in text
+
+
+def test_experiences_for_question_stale_parse_returns_full_text():
+    state = {"user_experiences": "원문 경험 텍스트"}
+    store_parsed_experiences(state, EXPERIENCES, "수정 전 경험 텍스트")
+
+    assert experiences_for_question(state, "지원 동기", "1") == "원문 경험 텍스트"
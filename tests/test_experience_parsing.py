@@ -0,0 +1,110 @@
+import threading
+import time
+
+from langchain_core.runnables import RunnableLambda
+
+from chains import parsing_chain
+from chains.parsing_chain import ExperienceList, parse_experiences_from_text
+from config.settings import settings
+from config.tenancy import tenant_context, tenant_slot
+from models.input_models import Experience
+from tools.experience_chunker import merge_experiences, split_experience_chunks
+
+PROJECT_A = """[주문 시스템 MSA 전환]
+2023.01 - 2023.12 / 백엔드 개발
+모놀리식 주문 서비스를 Kafka 기반 MSA로 분리하여 주문 처리 속도를 50% 향상시켰습니다."""
+
+PROJECT_B = """[물류 대시보드 개발]
+2022.03 - 2022.09 / 풀스택
+React와 FastAPI로 배송 현황 시각화 대시보드를 만들어 운영팀 조회 시간을 줄였습니다."""
+
+
+def _exp(name: str, period: str, techs: list[str], description: str = "") -> Experience:
+    return Experience(
+        id="", project_name=name, role="", description=description,
+        technologies=techs, achievements="", period=period,
+    )
+
+
+def test_split_experience_chunks_project_headers_split_per_project():
+    chunks = split_experience_chunks(f"{PROJECT_A}\n\n{PROJECT_B}", max_chars=3000)
+
+    # 제목 줄 다음 기간 줄은 같은 청크의 머리글로 유지
+    assert chunks == [PROJECT_A, PROJECT_B]
+
+
+def test_split_experience_chunks_numbered_achievements_stay_with_project_numbered_headers_split():
+    project = (
+        "1. 주문 시스템 MSA 전환 (2023.01 - 2023.12)\n"
+        "모놀리식 주문 서비스를 Kafka 기반 MSA로 분리했습니다. 주요 성과는 다음과 같습니다.\n"
+        "1. 주문 처리 속도 50% 향상\n"
+        "2. 2023년 장애 건수 70% 감소\n"
+        "3. 배포 시간 30분에서 5분으로 단축"
+    )
+    second = (
+        "2. 물류 대시보드 개발\n2022.03 - 2022.09\n"
+        "React와 FastAPI로 배송 현황 시각화 대시보드를 만들어 운영팀의 배송 조회 시간을 하루 2시간 줄였습니다."
+    )
+
+    chunks = split_experience_chunks(f"{project}\n\n{second}", max_chars=3000)
+
+    assert chunks == [project, second]
+
+
+def test_merge_experiences_duplicate_project_merges_fields():
+    merged = merge_experiences([
+        [_exp("주문 시스템", "2023.01 - 2023.12", ["Kafka"])],
+        [_exp("주문 시스템 ", "2023.01-2023.12", ["Spring", "Kafka"], "상세 설명"), _exp("대시보드", "2022", [])],
+    ])
+
+    assert [e["id"] for e in merged] == ["1", "2"]
+    assert merged[0]["technologies"] == ["Kafka", "Spring"]
+    assert merged[0]["description"] == "상세 설명"
+
+
+def test_parse_experiences_from_text_edited_chunk_reparses_only_that_chunk(monkeypatch):
+    calls: list[str] = []
+
+    def fake_parse(inputs: dict) -> ExperienceList:
+        calls.append(inputs["text"])
+        name = inputs["text"].splitlines()[0].strip("[]")
+        return ExperienceList(experiences=[_exp(name, "", [])])
+
+    monkeypatch.setattr(parsing_chain, "create_experience_parsing_chain", lambda: RunnableLambda(fake_parse))
+    parsing_chain._chunk_cache.clear()
+
+    first = parse_experiences_from_text(f"{PROJECT_A}\n\n{PROJECT_B}")
+    edited_b = PROJECT_B.replace("줄였습니다", "30% 줄였습니다")
+    second = parse_experiences_from_text(f"{PROJECT_A}\n\n{edited_b}")
+
+    assert [e["project_name"] for e in first] == ["주문 시스템 MSA 전환", "물류 대시보드 개발"]
+    assert len(second) == 2
+    assert len(calls) == 3
+    assert "30%" in calls[-1]
+
+
+def test_parse_experiences_chunk_calls_share_tenant_concurrency_limit_with_other_work(monkeypatch):
+    monkeypatch.setattr(settings, "tenant_max_concurrent_calls", 3)
+    monkeypatch.setattr(settings, "experience_parse_concurrency", 8)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def fake_parse(inputs: dict) -> ExperienceList:
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+        return ExperienceList(experiences=[_exp(inputs["text"].splitlines()[0].strip("[]"), "", [])])
+
+    monkeypatch.setattr(parsing_chain, "create_experience_parsing_chain", lambda: RunnableLambda(fake_parse))
+    parsing_chain._chunk_cache.clear()
+    text = "\n\n".join(PROJECT_A.replace("주문 시스템", f"주문 시스템 {i}") for i in range(8))
+
+    # 같은 사용자의 다른 호출이 슬롯 하나를 쓰는 동안에는 남은 2개만 사용
+    with tenant_context("parse-slot-user"), tenant_slot():
+        parsed = parse_experiences_from_text(text)
+
+    assert len(parsed) == 8
+    assert in_flight["max"] == 2
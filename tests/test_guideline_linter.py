@@ -0,0 +1,36 @@
+import pytest
+
+import tools.guideline_linter as guideline_linter
+from config.prompts import DEFAULT_GUIDELINE_TEXT
+from tools.guideline_linter import GuidelineLinter, enabled_regex_rules, extract_banned_phrases, get_linter
+
+ESSAY = "저는 열정적인 자세로 결제 시스템(Payment) 개선에 최선을 다하는 개발자입니다 🚀 ※ 참고"
+
+
+def test_lint_default_guideline_essay_reports_phrases_and_format_rules_in_order():
+    violations = get_linter(DEFAULT_GUIDELINE_TEXT).lint(ESSAY)
+
+    assert [(v.rule, v.text) for v in violations] == [
+        ("banned_phrase", "열정적인"),
+        ("english_gloss", "(Payment)"),
+        ("banned_phrase", "최선을 다하는"),
+        ("emoji", "🚀"),
+        ("special_char", "※"),
+    ]
+    assert all(ESSAY[v.start:v.end] == v.text for v in violations)
+
+
+@pytest.mark.parametrize("aho_corasick_min_phrases", [1, 1000])
+def test_lint_user_edited_guideline_adds_phrases_and_drops_removed_rules(monkeypatch, aho_corasick_min_phrases):
+    monkeypatch.setattr(guideline_linter, "AHO_CORASICK_MIN_PHRASES", aho_corasick_min_phrases)
+    guidelines = "- 상투적 표현 금지 (예: '열정적인', '개선에', '개선에 최선')\n- 이모지 사용 금지"
+    linter = GuidelineLinter(extract_banned_phrases(guidelines), enabled_regex_rules(guidelines))
+
+    violations = linter.lint(ESSAY)
+
+    # 겹치는 금지 표현은 먼저 시작하는 긴 표현 하나로 보고, 영어 병기/특수문자 규칙은 꺼짐
+    assert [(v.rule, v.text) for v in violations] == [
+        ("banned_phrase", "열정적인"),
+        ("banned_phrase", "개선에 최선"),
+        ("emoji", "🚀"),
+    ]
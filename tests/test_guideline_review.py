@@ -0,0 +1,31 @@
+from chains.guideline_chain import GuidelineReview, apply_guideline_review
+from models.output_models import TextEdit
+
+GUIDELINE = "- 톤: 업무 문서 수준\n- 글자 수: 제한에 근접하게 작성"
+
+
+def test_apply_guideline_review_applies_edits_and_reports_unmatched():
+    review = GuidelineReview(
+        is_valid=False,
+        issues=["톤 기준이 모호함"],
+        edits=[
+            TextEdit(op="replace", target="업무 문서 수준", text="업무 문서 수준 (감정 표현 최소화)"),
+            TextEdit(op="insert", target="근접하게 작성", text="\n- 두괄식으로 작성"),
+            TextEdit(op="delete", target="원문에 없는 문구"),
+        ],
+    )
+
+    result = apply_guideline_review(GUIDELINE, review)
+
+    assert result.improved_guideline == (
+        "- 톤: 업무 문서 수준 (감정 표현 최소화)\n- 글자 수: 제한에 근접하게 작성\n- 두괄식으로 작성"
+    )
+    assert len(result.edits) == 2
+    assert "1건" in result.issues[-1]
+
+
+def test_apply_guideline_review_approved_without_edits_keeps_original():
+    result = apply_guideline_review(GUIDELINE, GuidelineReview(is_valid=True))
+
+    assert result.improved_guideline == GUIDELINE
+    assert result.issues == []
@@ -0,0 +1,116 @@
+import logging
+
+import pytest
+
+import config.model_health as model_health
+from config import llm_factory
+from config.fake_llm import FakeChatModel
+from config.model_health import CircuitBreaker, CircuitBreakerCallbackHandler, CircuitOpenError, get_breaker
+from config.settings import settings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(model_health.time, "monotonic", clock)
+    return clock
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    return CircuitBreaker("test", min_calls=4, error_rate_threshold=0.5, slow_call_seconds=10.0, open_seconds=30.0, **kwargs)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        breaker.record_failure(1.0)
+
+
+def test_breaker_opens_on_error_rate_only_after_min_calls(clock):
+    breaker = _breaker()
+    breaker.record_success(1.0)
+    breaker.record_failure(1.0)
+    breaker.record_failure(1.0)
+    assert breaker.state == "closed"
+
+    breaker.record_success(1.0)
+    breaker.record_failure(1.0)
+
+    assert breaker.state == "open"
+
+
+def test_breaker_counts_slow_successes_as_failures(clock):
+    breaker = _breaker()
+    for latency in (1.0, 1.0, 11.0, 12.0):
+        breaker.record_success(latency)
+
+    assert breaker.state == "open"
+    assert breaker.snapshot()["error_rate"] == 0.5
+
+
+def test_open_breaker_fails_fast_without_calling_model_and_without_callback_warning(clock, caplog):
+    breaker = _breaker()
+    _open(breaker)
+    llm = FakeChatModel(model_name="open", first_token_seconds=0, chunk_seconds=0,
+                        callbacks=[CircuitBreakerCallbackHandler(breaker)])
+
+    with caplog.at_level(logging.WARNING), pytest.raises(CircuitOpenError):
+        llm.invoke("공고 검증")
+
+    assert breaker.snapshot()["rejected"] == 1
+    assert breaker.snapshot()["calls"] == breaker.min_calls
+    assert "Error in" not in caplog.text
+
+
+def test_half_open_allows_single_probe_and_closes_on_success(clock):
+    breaker = _breaker()
+    _open(breaker)
+    clock.now += 30
+
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.record_success(1.0)
+
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["calls"] == 1
+
+
+def test_half_open_probe_failure_reopens_for_another_open_period(clock):
+    breaker = _breaker()
+    _open(breaker)
+    clock.now += 30
+    assert breaker.allow_request() is True
+
+    breaker.record_failure(1.0)
+    clock.now += 29
+
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+    clock.now += 1
+    assert breaker.state == "half_open"
+
+
+def test_get_chat_model_open_circuit_switches_to_settings_fallback(monkeypatch, clock):
+    monkeypatch.setattr(model_health, "_breakers", {})
+    monkeypatch.setattr(llm_factory, "_models", {})
+    monkeypatch.setattr(settings, "llm_backend", "fake")
+    monkeypatch.setattr(settings, "fake_llm_first_token_seconds", 0)
+    monkeypatch.setattr(settings, "fake_llm_chunk_seconds", 0)
+    monkeypatch.setattr(settings, "model_fallbacks", {"gemini-3-pro-preview": "gemini-2.5-pro"})
+    _open(get_breaker("google_genai", "gemini-3-pro-preview"))
+
+    llm = llm_factory.get_chat_model(provider="google_genai", model="gemini-3-pro-preview", temperature=0)
+    response = llm.invoke("전략 수립")
+
+    expected = FakeChatModel(model_name="gemini-2.5-pro", first_token_seconds=0, chunk_seconds=0).invoke("전략 수립")
+    assert response.content == expected.content
+    assert get_breaker("google_genai", "gemini-3-pro-preview").snapshot()["rejected"] == 1
+    assert get_breaker("google_genai", "gemini-2.5-pro").snapshot()["calls"] == 1
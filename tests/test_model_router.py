@@ -0,0 +1,22 @@
+from config.model_router import route
+
+
+def test_route_only_google_key_picks_policy_models_and_skips_openai(router_stats):
+    assert route("validation").model == "gemini-2.5-flash-lite"
+    assert route("strategy").model == "gemini-3-pro-preview"
+    decision = route("review")
+    rejected = {c["model"]: c["rejected"] for c in decision.candidates}
+    assert rejected["gpt-5"] == "no_api_key"
+    assert decision.reason == "policy"
+
+
+def test_route_observed_latency_over_slo_or_open_circuit_moves_to_next_model(router_stats):
+    router_stats.update({
+        "gemini-2.5-flash": {"state": "closed", "calls": 10, "p50_latency_s": 80.0, "error_rate": 0.0},
+        "gemini-3-flash-preview": {"state": "open", "calls": 10, "p50_latency_s": 5.0, "error_rate": 0.6},
+    })
+
+    decision = route("strategy_feedback")
+
+    assert decision.model == "gemini-2.5-pro"
+    assert decision.reason == "policy"
@@ -0,0 +1,107 @@
+import json
+import time
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.runnables import RunnableWithFallbacks
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from chains.validation_chain import ValidationResult
+from config.fake_llm import FakeChatModel
+from config.prompts import INPUT_VALIDATION_PROMPT
+from tools.partial_json import PartialJsonFieldParser, StructuredOutputStream, bind_json_schema
+
+SAMPLE = {
+    "company_name": {"status": "충분", "reason": "괄호 } 와 \"따옴표\" 포함"},
+    "cleaned_job_posting": "줄바꿈\n[대괄호] {중괄호}",
+    "score": 12.5,
+    "is_valid": True,
+    "issues": ["a", "b"],
+}
+
+INPUTS = {"company_name": "예시페이", "position_name": "백엔드 개발자", "job_posting": "결제 API 설계 및 운영"}
+
+
+class FinalToolCallModel(FakeChatModel):
+    """Gemini처럼 도구 호출 인자를 마지막 청크 하나에 한 번에 보내는 가짜 모델"""
+
+    tool_call: bool = False
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        return self.model_copy(update={"response_schema": tools[0], "tool_call": True})
+
+    def _chunks(self, messages):
+        chunks = list(super()._chunks(messages))
+        if not self.tool_call:
+            yield from chunks
+            return
+        for _ in chunks[:-1]:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=""))
+        args = "".join(chunk.text for chunk in chunks)
+        name = self.response_schema.__name__
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk(name=name, args=args, id="1", index=0)])
+        )
+
+
+def _feed_in_chunks(text: str, size: int) -> list[tuple[int, str]]:
+    parser = PartialJsonFieldParser()
+    emitted = []
+    for offset in range(0, len(text), size):
+        for key, _ in parser.feed(text[offset:offset + size]):
+            emitted.append((offset, key))
+    return emitted
+
+
+def test_feed_small_chunks_emits_all_fields_in_order():
+    text = json.dumps(SAMPLE, ensure_ascii=False, indent=2)
+    parser = PartialJsonFieldParser()
+    fields = []
+    for offset in range(0, len(text), 3):
+        fields.extend(parser.feed(text[offset:offset + 3]))
+
+    assert dict(fields) == SAMPLE
+    assert [k for k, _ in fields] == list(SAMPLE)
+    assert parser.done
+
+
+def test_feed_nested_field_closed_emits_before_document_ends():
+    text = json.dumps(SAMPLE, ensure_ascii=False)
+    emitted = _feed_in_chunks(text, 4)
+
+    first_offset, first_key = emitted[0]
+    assert first_key == "company_name"
+    assert first_offset < text.index("cleaned_job_posting")
+
+
+def test_feed_code_fence_prefix_ignored():
+    text = "```json\n" + json.dumps(SAMPLE, ensure_ascii=False) + "\n```"
+    parser = PartialJsonFieldParser()
+
+    assert dict(parser.feed(text)) == SAMPLE
+
+
+def test_structured_output_stream_emits_fields_before_response_ends():
+    llm = FinalToolCallModel(first_token_seconds=0, chunk_seconds=0.01)
+    # 실제 모델과 같이 구조화 출력 체인은 파싱 단계(RunnableWithFallbacks)에서 스트림이 모아짐
+    assert isinstance(llm.with_structured_output(ValidationResult, include_raw=True).last, RunnableWithFallbacks)
+
+    stream = StructuredOutputStream(llm, INPUT_VALIDATION_PROMPT, INPUTS, ValidationResult)
+    started = time.perf_counter()
+    arrivals = [(name, time.perf_counter() - started) for name, _ in stream]
+
+    assert [name for name, _ in arrivals] == list(ValidationResult.model_fields)
+    assert arrivals[0][1] < arrivals[-1][1] / 2
+    assert isinstance(stream.result, ValidationResult)
+
+
+def test_bind_json_schema_gemini_uses_json_schema_mode_not_tools():
+    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", api_key="key")
+
+    bound = bind_json_schema(llm.with_fallbacks([FakeChatModel()]), ValidationResult)
+
+    assert bound.runnable.kwargs["response_mime_type"] == "application/json"
+    assert bound.runnable.kwargs["response_json_schema"] == ValidationResult.model_json_schema()
+    assert "tools" not in bound.runnable.kwargs
+    assert bound.fallbacks[0].bound.response_schema is ValidationResult
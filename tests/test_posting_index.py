@@ -0,0 +1,29 @@
+from tools.posting_index import PostingDedupStore, PostingIndex
+
+POSTING = """[카카오] 백엔드 개발자 채용
+주요 업무: 대규모 트래픽을 처리하는 결제 플랫폼 서버 개발 및 운영, MSA 기반 서비스 설계
+자격 요건: Java/Kotlin, Spring 기반 서버 개발 경력 3년 이상, RDBMS 및 캐시 설계 경험
+우대 사항: Kafka 등 메시지 큐 운영 경험, 대용량 데이터 처리 경험, 클라우드 인프라 이해
+복리후생: 유연 근무제, 자기계발 지원, 건강검진"""
+
+
+def test_posting_index_near_duplicate_matches_and_unrelated_does_not():
+    index = PostingIndex()
+    index.add(POSTING, "kakao")
+    index.add("프론트엔드 개발자 모집: React, TypeScript 기반 웹 서비스 개발 및 디자인 시스템 운영", "other")
+
+    edited = "https://jobs.example.com/123\n" + POSTING.replace("건강검진", "건강검진 및 사내 식당")
+    matches = index.query(edited, threshold=0.8)
+
+    assert [payload for payload, _ in matches] == ["kakao"]
+    assert index.query("물류 센터 운영 관리자 채용 공고입니다. 재고 관리 경험 우대", threshold=0.5) == []
+
+
+def test_posting_dedup_store_reload_restores_index_and_scopes_by_key(tmp_path):
+    db_path = str(tmp_path / "postings.db")
+    PostingDedupStore(db_path).remember([POSTING], "카카오|백엔드", {"overall_status": "PASS"})
+
+    store = PostingDedupStore(db_path)
+
+    assert store.find(POSTING, "카카오|백엔드", 0.9) == ({"overall_status": "PASS"}, 1.0)
+    assert store.find(POSTING, "네이버|백엔드", 0.9) is None
@@ -0,0 +1,80 @@
+import pytest
+
+from tools.profile_store import ProfileAccessError, ProfileStore, apply_profile_to_state
+
+
+def test_profile_store_saved_profile_reloads_artifacts(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    parsed = [{"id": "1", "project_name": "주문 시스템", "technologies": ["Kafka"]}]
+
+    store.save_experiences("user", "경험 원문", parsed, "hash-1")
+    store.save_guidelines("user", "나만의 가이드")
+    store.add_essays("user", "A사", "백엔드", [("지원 동기", "확정본")])
+    profile = store.load("user")
+
+    assert profile is not None
+    assert profile.parsed_experiences == parsed
+    assert profile.writing_guidelines == "나만의 가이드"
+    assert [(e.company_name, e.essay_text) for e in profile.essays] == [("A사", "확정본")]
+
+    state: dict = {}
+    apply_profile_to_state(profile, state)
+    assert state["parsed_experiences_hash"] == "hash-1"
+
+
+def test_profile_store_changed_experiences_clears_parsed_result(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    store.save_experiences("user", "경험 원문", [{"id": "1"}], "hash-1")
+
+    store.save_experiences("user", "경험 원문")
+    assert store.load("user").parsed_experiences == [{"id": "1"}]
+
+    store.save_experiences("user", "수정된 경험")
+    profile = store.load("user")
+    assert profile.parsed_experiences is None
+    assert store.load("unknown") is None
+
+
+def test_profile_store_wrong_passphrase_rejected_and_reconfirm_replaces_essay(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+
+    assert store.open("홍길동", "correct horse") is False
+    assert store.open("홍길동", "correct horse") is True
+    with pytest.raises(ProfileAccessError):
+        store.open("홍길동", "guess")
+
+    store.add_essays("홍길동", "A사", "백엔드", [("지원 동기", "첫 확정본")])
+    store.add_essays("홍길동", "A사", "백엔드", [("지원 동기", "다시 확정한 본")])
+    assert [e.essay_text for e in store.load("홍길동").essays] == ["다시 확정한 본"]
+
+
+class _SessionState(dict):
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
+
+
+def test_step1_submit_with_unopened_profile_name_writes_nothing(tmp_path, monkeypatch):
+    import tools.profile_store as profile_store
+    import ui.pages.step1_input as step1_input
+
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    session_state = _SessionState(
+        resume_state={},
+        input_company_name="A사",
+        input_position_name="백엔드",
+        input_job_posting_url="https://example.com/job",
+        input_job_posting="공고 내용",
+        input_user_experiences="경험 원문",
+        input_profile_key="홍길동",
+    )
+    monkeypatch.setattr(profile_store, "_store", store)
+    monkeypatch.setattr(step1_input.st, "session_state", session_state)
+    monkeypatch.setattr(step1_input.st, "rerun", lambda: None)
+    monkeypatch.setattr(step1_input, "submit_background", lambda *args, **kwargs: None)
+
+    step1_input._save_and_proceed()
+
+    assert session_state["resume_state"]["current_step"] == 2
+    assert "profile_key" not in session_state
+    assert store.load("홍길동") is None
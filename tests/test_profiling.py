@@ -0,0 +1,45 @@
+import time
+from collections import deque
+
+from config.fake_llm import FakeChatModel
+from config.profiling import ProfilingCallbackHandler, profile_rerun, timed
+
+
+def _render_step6(llm: FakeChatModel) -> None:
+    with timed("draft_panel"):
+        time.sleep(0.02)
+    for _ in llm.stream("초안 생성"):
+        pass
+
+
+def test_profile_rerun_records_page_and_model_spans_and_folded_stacks():
+    history: deque = deque(maxlen=2)
+    llm = FakeChatModel(first_token_seconds=0.03, chunk_seconds=0, callbacks=[ProfilingCallbackHandler()])
+
+    with profile_rerun(history, "sampling"):
+        with timed("render_sidebar"):
+            pass
+        with timed("render_step6"):
+            _render_step6(llm)
+
+    profile = history[-1]
+    spans = {s.name: s for s in profile.spans}
+    assert (spans["render_step6"].depth, spans["draft_panel"].depth, spans["fake"].depth) == (0, 1, 1)
+    assert spans["fake"].kind == "llm" and spans["fake"].first_token_ms >= 30
+    assert spans["render_step6"].duration_ms >= spans["draft_panel"].duration_ms + spans["fake"].duration_ms
+    summary = profile.summary()
+    assert summary["rerun"] == 1 and summary["llm_calls"] == 1 and "render_sidebar" in summary
+    # folded stack: 루트 -> 현재 함수, 마지막은 샘플 수
+    assert any("_render_step6" in line and line.rsplit(" ", 1)[1].isdigit() for line in profile.folded_stacks.splitlines())
+
+
+def test_timed_outside_profiled_rerun_records_nothing_and_history_is_bounded():
+    history: deque = deque(maxlen=2)
+    with timed("render_step1"):
+        pass
+    for _ in range(3):
+        with profile_rerun(history):
+            pass
+
+    assert [p.rerun for p in history] == [2, 3]
+    assert all(p.spans == [] and p.folded_stacks is None for p in history)
@@ -0,0 +1,40 @@
+from tools.research_cache import ResearchCache, condense_research, research_cache_key
+
+REPORT = """# 기업 개요
+카카오는 플랫폼 기업입니다[1, 2]. 자세한 내용은 (https://example.com/a) 참고.
+
+
+
+# 참고 문헌
+1. https://example.com/a
+"""
+
+
+def test_research_cache_key_corporate_marker_normalizes_to_same_key():
+    assert research_cache_key("(주)카카오 ", "백엔드 개발") == research_cache_key("카카오", "백엔드개발")
+    assert research_cache_key("Kakao Corp.", "Backend") == research_cache_key("kakao", "backend")
+    assert research_cache_key("Acme Co., Ltd.", "QA") == research_cache_key("ACME", "qa")
+
+
+def test_research_cache_key_marker_inside_word_is_kept():
+    assert research_cache_key("Vincent", "디자이너").startswith("vincent|")
+    assert research_cache_key("Corpus Labs", "백엔드") != research_cache_key("us Labs", "백엔드")
+
+
+def test_research_cache_save_same_content_keeps_version_and_expires_by_ttl(tmp_path):
+    cache = ResearchCache(str(tmp_path / "research.db"))
+
+    assert cache.save("㈜카카오", "백엔드", REPORT) == 1
+    assert cache.save("카카오", "백엔드", REPORT) == 1
+    assert cache.save("카카오", "백엔드", REPORT + "추가") == 2
+
+    cached = cache.latest("카카오", "백엔드", ttl_days=30)
+    assert cached is not None
+    assert (cached.version, cached.content) == (2, REPORT + "추가")
+    assert cache.latest("카카오", "백엔드", ttl_days=-1) is None
+
+
+def test_condense_research_report_strips_references_and_urls():
+    condensed = condense_research(REPORT)
+
+    assert condensed == "# 기업 개요\n카카오는 플랫폼 기업입니다. 자세한 내용은  참고."
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+import chains.review_chain as review_chain
+from chains.review_chain import ReviewContext, plan_final_reviews
+from config.settings import settings
+
+DRAFT = "결제 API의 p99 응답 시간을 40% 단축했습니다. 입사 후 정산 자동화에 기여하겠습니다."
+
+
+def _state(feedbacks: dict, drafts: list[str], char_limit: int = 500) -> dict:
+    return {
+        "company_name": "테스트",
+        "position_name": "백엔드",
+        "user_experiences": "결제 시스템 개발",
+        "essay_questions": [{"question_text": f"문항 {i + 1}", "char_limit": char_limit} for i in range(len(drafts))],
+        "generated_drafts": {str(i + 1): [d] for i, d in enumerate(drafts)},
+        "draft_selections": {},
+        "draft_feedbacks": feedbacks,
+    }
+
+
+def test_plan_final_reviews_feedback_kinds_route_accept_flash_and_pro(router_stats):
+    state = _state(
+        {"2": "오타와 어색한 표현만 다듬어 주세요.", "3": "협업 경험을 정산 프로젝트 사례로 구체화해 주세요."},
+        [DRAFT, DRAFT, DRAFT],
+    )
+
+    plan = plan_final_reviews(state)
+
+    assert (plan["1"].decision, plan["1"].model) == ("accept", None)
+    assert (plan["2"].decision, plan["2"].model) == ("light", "gemini-2.5-flash")
+    assert (plan["3"].decision, plan["3"].model) == ("full", "gemini-3-pro-preview")
+
+
+def test_plan_final_reviews_no_feedback_but_local_check_fails_is_not_accepted(router_stats):
+    state = _state({}, [DRAFT + " 열정적인 자세로 임하겠습니다.", DRAFT * 20])
+
+    plan = plan_final_reviews(state)
+
+    assert plan["1"].decision == "light"
+    assert "열정적인" in plan["1"].reason
+    assert plan["2"].decision == "full"
+
+
+class _PatchFailingModel:
+    """수정 연산 응답이 비었거나 스키마에 맞지 않고, 전체 재작성은 성공하는 모델"""
+
+    def __init__(self, patch: object) -> None:
+        self.patch = patch
+
+    def with_structured_output(self, schema):
+        return RunnableLambda(lambda messages: self.patch)
+
+    async def ainvoke(self, messages):
+        return AIMessage(content="전체 재작성본")
+
+
+@pytest.mark.parametrize("patch", [None, {"edits": [{"op": "move", "target": "결제"}]}])
+def test_patch_review_empty_or_invalid_patch_falls_back_to_rewrite(monkeypatch, patch):
+    monkeypatch.setattr(settings, "review_mode", "patch")
+    monkeypatch.setattr(review_chain, "_review_llm", lambda messages, model: _PatchFailingModel(patch))
+    context = ReviewContext(
+        question="지원 동기", draft=DRAFT, feedback="표현을 다듬어 주세요.", guidelines="",
+        company_name="테스트", position_name="백엔드", user_experiences="결제 시스템 개발",
+    )
+
+    assert asyncio.run(review_chain._generate_single_final_draft("1", context)) == ("1", "전체 재작성본")
@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.fake_llm import FakeChatModel
+from config.model_health import CircuitBreaker, CircuitBreakerCallbackHandler
+from config.single_flight import coalescing_snapshots, enable_coalescing
+
+
+def _model(model_cls: type[FakeChatModel], name: str, callbacks: list | None = None) -> FakeChatModel:
+    return enable_coalescing(
+        model_cls(model_name=name, first_token_seconds=0.3, chunk_seconds=0.005, callbacks=callbacks)
+    )
+
+
+def _stats(name: str) -> dict:
+    return next(s for s in coalescing_snapshots() if s["model"] == name)
+
+
+def test_invoke_concurrent_identical_requests_share_one_call(counting_model):
+    llm = _model(counting_model, "coalesce-invoke")
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: llm.invoke("같은 공고 검증").content, range(5)))
+    different = llm.invoke("다른 공고 검증").content
+
+    assert counting_model.calls == 2
+    assert len(set(results)) == 1 and results[0] != different
+    stats = _stats("coalesce-invoke")
+    assert (stats["requests"], stats["model_calls"], stats["coalesced"]) == (6, 2, 4)
+
+
+def test_stream_first_subscriber_leaves_early_others_still_receive_full_stream(counting_model):
+    llm = _model(counting_model, "coalesce-stream")
+    expected = FakeChatModel(model_name="coalesce-stream", first_token_seconds=0, chunk_seconds=0).invoke("가이드라인 검토")
+    streaming = threading.Event()
+
+    def consume(stop_after: int | None) -> str:
+        text = ""
+        for i, chunk in enumerate(llm.stream("가이드라인 검토")):
+            streaming.set()
+            if stop_after is not None and i >= stop_after:
+                break
+            text += chunk.content
+        return text
+
+    def final() -> str:
+        # 스트림이 시작된 뒤 같은 입력의 일반 호출이 합류
+        streaming.wait()
+        return llm.invoke("가이드라인 검토").content
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        early = executor.submit(consume, 2)
+        full = [executor.submit(consume, None) for _ in range(2)]
+        joined = executor.submit(final)
+        early_text = early.result()
+        full_texts = [f.result() for f in full]
+        final_text = joined.result()
+
+    assert counting_model.calls == 1
+    assert full_texts == [expected.content, expected.content]
+    assert final_text == expected.content
+    assert expected.content.startswith(early_text) and early_text != expected.content
+    assert _stats("coalesce-stream")["coalesced"] == 3
+
+
+def test_circuit_breaker_records_shared_call_once_not_per_follower(counting_model):
+    breaker = CircuitBreaker("coalesce-breaker")
+    llm = _model(counting_model, "coalesce-breaker", callbacks=[CircuitBreakerCallbackHandler(breaker)])
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: llm.invoke("같은 공고 검증"), range(5)))
+
+    assert counting_model.calls == 1
+    assert breaker.snapshot()["calls"] == 1
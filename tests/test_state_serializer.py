@@ -0,0 +1,82 @@
+import zlib
+
+import ormsgpack
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from models.output_models import CompanyResearch, WritingStrategy
+from tools import state_serializer
+from tools.state_serializer import dumps, loads
+from ui.components.session_io import load_snapshot
+
+STRATEGY_DOC = "# 1. 핵심 직무 역량\n- 대용량 트래픽 처리\n\n# 2. 문항별 작성 전략\n- 문항 1: 주문 시스템"
+
+
+def _snapshot() -> dict:
+    strategy = WritingStrategy(
+        core_competencies=["대용량 트래픽"], talent_traits=[], user_strengths=[], user_gaps=[],
+        question_strategy={"1": "주문 시스템 경험"}, cautions=[], content=STRATEGY_DOC,
+    )
+    return {
+        "resume_state": {
+            "company_name": "카카오",
+            "company_research": CompanyResearch(content="리서치 리포트 본문 " * 10),
+            "writing_strategy": strategy,
+            "draft_selections": {"1": 0},
+            "draft_scores": {"1": [{"total": 0.8, "violations": ["열정적인"]}]},
+            "completed_steps": [1, 2, 3],
+            "messages": [],
+        },
+        "strategy_messages": [AIMessage(content=STRATEGY_DOC), HumanMessage(content="문항 1 수정")],
+    }
+
+
+def test_dumps_loads_full_snapshot_round_trips():
+    snapshot = _snapshot()
+
+    restored = loads(dumps(snapshot))
+
+    assert restored == snapshot
+    assert isinstance(restored["resume_state"]["writing_strategy"], WritingStrategy)
+    assert isinstance(restored["strategy_messages"][0], AIMessage)
+
+
+def test_dumps_repeated_long_text_interned_once(monkeypatch):
+    data = dumps({"a": STRATEGY_DOC, "b": [STRATEGY_DOC] * 50})
+
+    assert len(data) < len(STRATEGY_DOC.encode("utf-8")) + 100
+    # zstandard가 없는 환경의 zlib 경로도 복원 가능
+    monkeypatch.setattr(state_serializer, "zstandard", None)
+    assert loads(dumps({"a": STRATEGY_DOC}))["a"] == STRATEGY_DOC
+
+
+def test_loads_future_schema_version_raises():
+    data = bytearray(dumps({"a": 1}))
+    data[3] = state_serializer.SCHEMA_VERSION + 1
+
+    with pytest.raises(ValueError):
+        loads(bytes(data))
+
+
+@pytest.mark.parametrize("body", [
+    b"\xc1",  # msgpack에서 쓰지 않는 바이트
+    ormsgpack.packb({"data": {"a": 1}}),  # strings 누락
+    ormsgpack.packb({"strings": [], "data": {"$s": 3}}),  # 없는 인턴 번호
+], ids=["invalid_msgpack", "missing_strings", "unknown_string_index"])
+def test_loads_corrupt_body_raises_value_error(body):
+    header = b"RST" + bytes([state_serializer.SCHEMA_VERSION, 0])
+
+    with pytest.raises(ValueError):
+        loads(header + zlib.compress(body))
+    with pytest.raises(ValueError):
+        loads(dumps({"a": "x" * 100})[:-4])
+
+
+@pytest.mark.parametrize("value", [
+    ["resume_state"],
+    {"strategy_messages": []},
+    {"resume_state": "텍스트"},
+], ids=["not_dict", "missing_resume_state", "resume_state_not_dict"])
+def test_load_snapshot_well_formed_non_snapshot_raises_value_error(value):
+    with pytest.raises(ValueError):
+        load_snapshot(dumps(value))
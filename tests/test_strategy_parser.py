@@ -0,0 +1,43 @@
+from tools.strategy_parser import parse_strategy_markdown
+
+STRATEGY_MARKDOWN = """전략을 정리했습니다.
+
+# 1. 핵심 직무 역량 & 인재상 매칭
+- **핵심 키워드**: 대용량 트래픽, MSA 전환
+- **인재상**: 주도성 · 협업
+- **매칭되는 강점**:
+  - 주문 처리 속도 50% 향상
+  - 문제 해결 역량
+- **보완이 필요한 약점(Gap)**: 쿠버네티스 실무 경험 부족
+
+# 2. 문항별 작성 전략
+- **문항 1**: 지원 동기
+- **소재 추천**: 이커머스 리팩토링
+
+- **문항 2**: 기술적 챌린지
+- **작성 포인트**: Kafka 도입
+
+# 3. 전체적인 작성 컨셉 및 주의사항
+- 담백한 업무 문서 톤 유지
+"""
+
+
+def test_parse_strategy_markdown_valid_document_extracts_sections():
+    strategy = parse_strategy_markdown(STRATEGY_MARKDOWN)
+
+    assert strategy is not None
+    assert strategy.core_competencies == ["대용량 트래픽", "MSA 전환"]
+    assert strategy.talent_traits == ["주도성", "협업"]
+    # 일반 항목에 포함된 '역량'은 라벨로 오인하지 않음
+    assert strategy.user_strengths == ["주문 처리 속도 50% 향상", "문제 해결 역량"]
+    assert strategy.user_gaps == ["쿠버네티스 실무 경험 부족"]
+    assert set(strategy.question_strategy) == {"1", "2"}
+    assert "Kafka" in strategy.question_strategy["2"]
+    assert strategy.cautions == ["담백한 업무 문서 톤 유지"]
+    assert strategy.content == STRATEGY_MARKDOWN
+
+
+def test_parse_strategy_markdown_missing_section_returns_none():
+    without_questions = STRATEGY_MARKDOWN.split("# 2.")[0]
+
+    assert parse_strategy_markdown(without_questions) is None
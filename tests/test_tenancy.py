@@ -0,0 +1,51 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from config.settings import settings
+from config.tenancy import (
+    TenantLimitError,
+    TenantQuotaCallbackHandler,
+    async_tenant_slot,
+    tenant_context,
+)
+
+
+def test_tenant_quota_exceeded_raises_only_for_that_tenant(monkeypatch):
+    monkeypatch.setattr(settings, "tenant_token_quota_per_hour", 100)
+    handler = TenantQuotaCallbackHandler()
+    usage = {"input_tokens": 40, "output_tokens": 40, "total_tokens": 80}
+    result = LLMResult(generations=[[ChatGeneration(message=AIMessage(content="답변", usage_metadata=usage))]])
+
+    with tenant_context("quota-user-a"):
+        run_id = uuid4()
+        handler.on_chat_model_start({}, [[HumanMessage(content="질문")]], run_id=run_id)
+        handler.on_llm_end(result, run_id=run_id)
+        with pytest.raises(TenantLimitError):
+            handler.on_chat_model_start({}, [[HumanMessage(content="질문 " * 20)]], run_id=uuid4())
+
+    with tenant_context("quota-user-b"):
+        handler.on_chat_model_start({}, [[HumanMessage(content="질문 " * 20)]], run_id=uuid4())
+
+
+def test_async_tenant_slot_many_tasks_caps_in_flight_per_tenant(monkeypatch):
+    monkeypatch.setattr(settings, "tenant_max_concurrent_calls", 2)
+    in_flight = {"now": 0, "max": 0}
+
+    async def call():
+        async with async_tenant_slot():
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+
+    async def run_all():
+        with tenant_context("slot-user"):
+            await asyncio.gather(*[call() for _ in range(6)])
+
+    asyncio.run(run_all())
+
+    assert in_flight["max"] == 2
@@ -0,0 +1,35 @@
+import pytest
+
+from models.output_models import TextEdit
+from tools.text_patch import PatchApplyError, apply_edits
+
+DRAFT = "저는 결제 API의 응답 시간을 40% 단축했습니다.\n이 과정에서 팀과 협업했습니다. 입사 후 기여하겠습니다."
+
+
+def test_apply_edits_replace_insert_delete_applies_in_order_ignoring_whitespace_diff():
+    edits = [
+        TextEdit(op="replace", target="응답 시간을  40%\n단축했습니다.", text="p99 응답 시간을 40% 단축했습니다."),
+        TextEdit(op="insert", target="협업했습니다.", text=" 주간 지표 회의를 주도했습니다."),
+        TextEdit(op="delete", target="입사 후 기여하겠습니다."),
+    ]
+
+    result = apply_edits(DRAFT, edits)
+
+    assert result == (
+        "저는 결제 API의 p99 응답 시간을 40% 단축했습니다.\n"
+        "이 과정에서 팀과 협업했습니다. 주간 지표 회의를 주도했습니다."
+    )
+
+
+def test_apply_edits_target_not_in_text_raises_patch_apply_error():
+    with pytest.raises(PatchApplyError):
+        apply_edits(DRAFT, [TextEdit(op="replace", target="초안에 없는 문장", text="x")])
+
+
+def test_apply_edits_tidies_spaces_only_around_edited_spans():
+    text = "1.  성과\n    - 응답 시간  40% 단축 (p99 기준)\n협업했습니다  ."
+
+    result = apply_edits(text, [TextEdit(op="delete", target="(p99 기준)")])
+
+    # 편집하지 않은 번호/들여쓰기/공백은 그대로, 삭제 자리의 줄 끝 공백만 정리
+    assert result == "1.  성과\n    - 응답 시간  40% 단축\n협업했습니다  ."
@@ -0,0 +1,63 @@
+import tools.posting_index as posting_index
+from chains.validation_chain import (
+    PreparedPostingValidationStream,
+    ValidationResult,
+    find_cached_validation,
+    remember_validation,
+    stream_resume_input_validation,
+)
+from config.settings import settings
+
+POSTING = "[회사] 예시페이\n\n[모집 직무] 백엔드 개발자\n\n[직무 설명]\n결제 API 설계 및 운영"
+
+
+def test_stream_validation_structured_posting_skips_cleaning_and_fills_locally(monkeypatch):
+    monkeypatch.setattr(settings, "llm_backend", "fake")
+    monkeypatch.setattr(settings, "fake_llm_first_token_seconds", 0.0)
+    monkeypatch.setattr(settings, "fake_llm_chunk_seconds", 0.0)
+    state = {
+        "company_name": "예시페이",
+        "position_name": "백엔드 개발자",
+        "job_posting": POSTING,
+        "structured_job_posting": POSTING,
+        "user_experiences": (
+            "결제 시스템 백엔드 개발 3년. 정산 배치 성능을 개선하여 처리 시간을 40% 단축했고, "
+            "장애 대응 자동화로 평균 복구 시간을 절반으로 줄였습니다."
+        ),
+        "essay_questions": [{"question_text": "지원 동기", "char_limit": 500}],
+    }
+
+    stream = stream_resume_input_validation(state)
+    names = [name for name, _ in stream]
+
+    assert names[-1] == "cleaned_job_posting"
+    assert isinstance(stream.result, ValidationResult)
+    assert stream.result.cleaned_job_posting == POSTING
+
+    # 사용자가 공고를 고치면 정리본이 아니므로 기존 정리 경로
+    state["job_posting"] = POSTING + "\n우대: Kafka 경험"
+    assert not isinstance(stream_resume_input_validation(state), PreparedPostingValidationStream)
+
+
+def test_remember_validation_fail_result_not_reused_pass_result_reused(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "posting_index_db_path", str(tmp_path / "postings.db"))
+    monkeypatch.setattr(posting_index, "_store", None)
+    state = {
+        "company_name": "예시페이",
+        "position_name": "백엔드 개발자",
+        "job_posting": POSTING,
+        "user_experiences": "결제 시스템 백엔드 개발 3년. 정산 배치 성능을 개선하여 처리 시간을 40% 단축했습니다.",
+        "essay_questions": [{"question_text": "지원 동기", "char_limit": 500}],
+    }
+    item = {"status": "충분", "reason": "명시됨"}
+    result = ValidationResult(
+        company_name=item, job_posting=item, overall_status="FAIL",
+        additional_questions=["주요 업무를 알려주세요"], cleaned_job_posting=POSTING,
+    )
+
+    remember_validation(state, result)
+    assert find_cached_validation(state) is None
+
+    remember_validation(state, result.model_copy(update={"overall_status": "PASS", "additional_questions": []}))
+    cached = find_cached_validation(state)
+    assert cached is not None and cached[0].overall_status == "PASS"
@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.settings import settings
+from tools.web_scraper import parse_job_posting_html, scrape_job_posting_page
+
+DESCRIPTION = "<p>결제 플랫폼의 백엔드 API를 설계하고 운영합니다.</p>" + "<p>대용량 트래픽 처리와 장애 대응을 담당합니다.</p>" * 10
+
+
+def _page(head: str, body: str = "<nav>메뉴 로그인</nav><main>공고 본문</main>") -> str:
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def test_parse_job_posting_html_json_ld_graph_builds_clean_posting():
+    json_ld = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebPage", "name": "채용"},
+            {
+                "@type": "JobPosting",
+                "title": "백엔드 개발자",
+                "hiringOrganization": {"@type": "Organization", "name": "예시페이"},
+                "description": DESCRIPTION,
+                "qualifications": ["Python 3년 이상", "RDBMS 설계 경험"],
+                "jobLocation": {"@type": "Place", "address": {"@type": "PostalAddress", "addressRegion": "서울"}},
+            },
+        ],
+    }
+    html = _page(
+        '<script type="application/ld+json">{broken</script>'
+        f'<script type="application/ld+json">{json.dumps(json_ld, ensure_ascii=False)}</script>'
+    )
+
+    page = parse_job_posting_html(html)
+
+    assert page.structured is not None and page.structured.is_complete
+    assert page.structured.company_name == "예시페이"
+    assert page.posting_text.startswith("[회사] 예시페이\n\n[모집 직무] 백엔드 개발자")
+    assert "[자격 요건]\n- Python 3년 이상\n- RDBMS 설계 경험" in page.posting_text
+    assert "[근무지] 서울" in page.posting_text
+    assert "메뉴 로그인" not in page.posting_text
+    assert "<p>" not in page.posting_text
+
+
+def test_parse_job_posting_html_open_graph_only_prefills_without_replacing_text():
+    html = _page(
+        '<meta property="og:title" content="데이터 엔지니어 | 예시커머스">'
+        '<meta property="og:site_name" content="예시커머스">'
+    )
+
+    page = parse_job_posting_html(html)
+
+    assert page.structured is not None and not page.structured.is_complete
+    assert (page.structured.title, page.structured.company_name) == ("데이터 엔지니어", "예시커머스")
+    assert page.posting_text == page.text
+    assert "공고 본문" in page.text
+
+
+class FixtureSite:
+    """경로별 HTML을 응답하는 로컬 채용 사이트 (요청마다 delay초 대기, 최대 동시 요청 수 기록)"""
+
+    def __init__(self, routes: dict[str, str], delay: float = 0.0) -> None:
+        self.routes = routes
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.in_flight += 1
+                    site.max_in_flight = max(site.max_in_flight, site.in_flight)
+                time.sleep(site.delay)
+                body = site.routes.get(self.path)
+                with site._lock:
+                    site.in_flight -= 1
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.end_headers()
+                self.wfile.write((body or "not found").encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def sites():
+    opened: list[FixtureSite] = []
+
+    def open_site(routes: dict[str, str], delay: float = 0.0) -> FixtureSite:
+        opened.append(FixtureSite(routes, delay))
+        return opened[-1]
+
+    yield open_site
+    for site in opened:
+        site.close()
+
+
+def test_scrape_job_posting_page_iframe_and_tabs_merged_without_duplicates(sites):
+    header = "<header>예시페이 채용</header>\n<nav>채용공고 인재상 FAQ</nav>\n"
+    ats = sites({
+        "/embed/1": _page("", header + "<p>결제 API 설계 및 운영</p>\n<iframe src='/embed/1/benefits'></iframe>"),
+        "/embed/1/benefits": _page("", header + "<p>복리후생: 자율 출퇴근</p>"),
+    })
+    portal = sites({
+        "/jobs/1": _page("", header + (
+            f"<iframe src='{ats.url}/embed/1'></iframe>"
+            "<iframe src='https://www.youtube.com/embed/x'></iframe>"
+            "<ul role='tablist'><a href='#intro'>소개</a><a href='/jobs/1/requirements'>자격요건</a></ul>"
+            "<div data-url='/jobs/1/process'></div><img data-src='/logo.png'>"
+        )),
+        "/jobs/1/requirements": _page("", header + "<p>Python 3년 이상</p>"),
+        "/jobs/1/process": _page("", "<p>전형 절차: 서류 - 면접</p>"),
+    })
+
+    page = scrape_job_posting_page(f"{portal.url}/jobs/1")
+
+    assert page is not None
+    for text in ("결제 API 설계 및 운영", "Python 3년 이상", "전형 절차: 서류 - 면접", "복리후생: 자율 출퇴근"):
+        assert text in page.text
+    assert page.text.count("예시페이 채용") == 1
+    assert page.sources == [
+        f"{portal.url}/jobs/1",
+        f"{ats.url}/embed/1",
+        f"{portal.url}/jobs/1/requirements",
+        f"{portal.url}/jobs/1/process",
+        f"{ats.url}/embed/1/benefits",
+    ]
+
+
+def test_scrape_job_posting_page_subpages_fetched_concurrently_within_domain_cap(sites, monkeypatch):
+    monkeypatch.setattr(settings, "scrape_per_domain_concurrency", 2)
+    monkeypatch.setattr(settings, "scrape_max_workers", 6)
+    frames = "".join(f"<iframe src='/section/{i}'></iframe>" for i in range(6))
+    routes = {f"/section/{i}": _page("", f"<p>섹션 {i}</p>") for i in range(6)}
+    portal = sites({"/jobs/2": _page("", frames), **routes}, delay=0.1)
+
+    page = scrape_job_posting_page(f"{portal.url}/jobs/2")
+
+    assert page is not None and all(f"섹션 {i}" in page.text for i in range(6))
+    assert portal.max_in_flight == 2
@@ -0,0 +1,39 @@
+"""백그라운드 작업 실행기
+
+Streamlit 스크립트 재실행과 무관하게 이어져야 하는 LLM 호출을 프로세스 공용 스레드 풀에서 실행합니다.
+작업 함수 안에서는 `st.*` API를 호출하지 않아야 합니다 (ScriptRunContext 없음).
+"""
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from config.settings import settings
+from config.tenancy import tenant_slot
+
+_executor = ThreadPoolExecutor(max_workers=settings.background_max_workers, thread_name_prefix="resume-bg")
+
+
+def submit_background(fn: Callable[..., Any], *args: Any, hold_slot: bool = True, **kwargs: Any) -> Future:
+    """함수를 백그라운드 스레드 풀에 제출
+
+    제출한 세션의 사용자 컨텍스트를 그대로 이어받고, 사용자별 동시 호출 슬롯 안에서 실행됩니다.
+
+    Args:
+        fn: 실행할 함수
+        *args: 위치 인자
+        hold_slot: 작업 전체를 슬롯 하나로 실행할지 여부
+            (안에서 병렬 호출마다 슬롯을 직접 얻는 작업은 False로 두어야 한도를 넘지 않고 교착되지도 않음)
+        **kwargs: 키워드 인자
+
+    Returns:
+        결과를 담을 Future
+    """
+    context = contextvars.copy_context()
+    if not hold_slot:
+        return _executor.submit(context.run, fn, *args, **kwargs)
+    return _executor.submit(context.run, _run_in_slot, fn, *args, **kwargs)
+
+
+def _run_in_slot(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    with tenant_slot():
+        return fn(*args, **kwargs)
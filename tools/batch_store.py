@@ -0,0 +1,131 @@
+"""제출한 provider 배치 기록 (SQLite)
+
+배치는 수 분~24시간 뒤에 끝나므로 제출한 배치 ID를 요청 내용 키와 함께 저장합니다.
+작업이 중간에 끊겨도(서버 재시작 등) 같은 요청을 다시 실행하면 새로 제출하지 않고
+기존 배치를 이어서 폴링하고 결과를 수집합니다(config/batch_backend.run_batch).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Optional
+
+from config.settings import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    request_key TEXT PRIMARY KEY,
+    tenant TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    batch_id TEXT NOT NULL,
+    custom_ids TEXT NOT NULL,
+    state TEXT NOT NULL,
+    charged INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_tenant_state ON batches (tenant, state);
+"""
+
+
+@dataclass
+class StoredBatch:
+    """저장된 배치 한 건"""
+    request_key: str
+    tenant: str
+    provider: str
+    batch_id: str
+    custom_ids: list[str]
+    state: str
+    charged: bool
+    created_at: float
+
+
+class BatchStore:
+    """요청 내용 키별 제출 배치 저장소"""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def find(self, request_key: str) -> Optional[StoredBatch]:
+        """같은 요청으로 제출한 배치 조회"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM batches WHERE request_key = ?", (request_key,)
+            ).fetchone()
+        return _to_batch(row) if row is not None else None
+
+    def save(self, request_key: str, tenant: str, provider: str, batch_id: str, custom_ids: list[str], state: str) -> None:
+        """새로 제출한 배치 기록 (같은 키의 실패/취소된 배치 기록은 덮어씀)"""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO batches (request_key, tenant, provider, batch_id, custom_ids, state, charged, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?) "
+                "ON CONFLICT (request_key) DO UPDATE SET tenant = excluded.tenant, provider = excluded.provider, "
+                "batch_id = excluded.batch_id, custom_ids = excluded.custom_ids, state = excluded.state, "
+                "charged = 0, created_at = excluded.created_at, updated_at = excluded.updated_at",
+                (request_key, tenant, provider, batch_id, json.dumps(custom_ids), state, now, now),
+            )
+
+    def update_state(self, batch_id: str, state: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE batches SET state = ?, updated_at = ? WHERE batch_id = ?", (state, time.time(), batch_id)
+            )
+
+    def mark_charged(self, batch_id: str) -> bool:
+        """결과 사용량을 사용자에게 기록했음을 표시
+
+        Returns:
+            이번에 처음 표시했으면 True (이미 기록한 배치를 다시 수집한 경우 False)
+        """
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "UPDATE batches SET charged = 1, updated_at = ? WHERE batch_id = ? AND charged = 0",
+                (time.time(), batch_id),
+            )
+            return cursor.rowcount > 0
+
+    def for_tenant(self, tenant: str, state: Optional[str] = None) -> list[StoredBatch]:
+        """사용자가 제출한 배치 목록 (최근 제출 순)"""
+        query = f"SELECT {_COLUMNS} FROM batches WHERE tenant = ?"
+        params: tuple = (tenant,)
+        if state is not None:
+            query += " AND state = ?"
+            params += (state,)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " ORDER BY created_at DESC", params).fetchall()
+        return [_to_batch(row) for row in rows]
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+
+_COLUMNS = "request_key, tenant, provider, batch_id, custom_ids, state, charged, created_at"
+
+
+def _to_batch(row: tuple) -> StoredBatch:
+    request_key, tenant, provider, batch_id, custom_ids, state, charged, created_at = row
+    return StoredBatch(request_key, tenant, provider, batch_id, json.loads(custom_ids), state, bool(charged), created_at)
+
+
+_store: Optional[BatchStore] = None
+_store_lock = threading.Lock()
+
+
+def get_batch_store() -> BatchStore:
+    """프로세스 공용 배치 저장소 (settings.batch_db_path)"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.db_path != settings.batch_db_path:
+            _store = BatchStore(settings.batch_db_path)
+        return _store
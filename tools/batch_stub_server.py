@@ -0,0 +1,335 @@
+"""로컬 배치 API 대체 서버 (오프라인 테스트용)
+
+OpenAI 호환 Batch API(`/v1/files`, `/v1/batches`)와 Gemini Batch Mode(`/v1beta/models/{model}:batchGenerateContent`,
+`/v1beta/batches/{id}`)의 필요한 부분만 메모리에서 흉내냅니다. 배치는 상태 조회가 `complete_after_polls`번
+들어오면 완료되고, 응답은 가짜 모델(config/fake_llm)과 같은 결정적 문장(JSON 스키마 요청이면 스키마 형태의 JSON)입니다.
+요청 본문에 `[BATCH_STUB_ERROR]`가 있으면 해당 요청만 실패로 응답합니다.
+
+실행:
+    python -m tools.batch_stub_server --port 8765
+    BATCH_OPENAI_BASE_URL=http://127.0.0.1:8765/v1 BATCH_GEMINI_BASE_URL=http://127.0.0.1:8765/v1beta ...
+"""
+import argparse
+import email
+import email.policy
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+from config.fake_llm import FakeChatModel
+from tools.llm_util import estimate_tokens
+
+ERROR_MARKER = "[BATCH_STUB_ERROR]"
+
+# (모델, [(역할, 내용)], JSON 스키마) -> 응답 텍스트
+Responder = Callable[[str, list[tuple[str, str]], Optional[dict[str, Any]]], str]
+
+
+def fake_response(model: str, messages: list[tuple[str, str]], json_schema: Optional[dict[str, Any]]) -> str:
+    """기본 응답: 스키마가 있으면 스키마 형태의 JSON, 없으면 가짜 모델 문장"""
+    if json_schema is not None:
+        return json.dumps(_fake_json(json_schema, json_schema.get("$defs", {})), ensure_ascii=False)
+    llm = FakeChatModel(model_name=model, first_token_seconds=0, chunk_seconds=0)
+    return str(llm.invoke(messages).content)
+
+
+class BatchStubServer:
+    """두 provider의 배치 API를 흉내내는 스레드 HTTP 서버
+
+    Example:
+        ```python
+        with BatchStubServer() as server:
+            settings.batch_openai_base_url = server.openai_base_url
+            settings.batch_gemini_base_url = server.gemini_base_url
+        ```
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        complete_after_polls: int = 1,
+        responder: Responder = fake_response,
+    ) -> None:
+        self.complete_after_polls = complete_after_polls
+        self.responder = responder
+        # 제출된 배치 기록: (provider, 요청 수) 목록
+        self.submitted: list[tuple[str, int]] = []
+        # 취소 요청된 배치 ID 목록
+        self.cancelled: list[str] = []
+        self._files: dict[str, str] = {}
+        self._batches: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    @property
+    def gemini_base_url(self) -> str:
+        return f"{self.url}/v1beta"
+
+    def start(self) -> "BatchStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "BatchStubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # --- OpenAI 호환 ---
+
+    def upload_file(self, content: str) -> dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._files[file_id] = content
+        return {"id": file_id, "object": "file", "purpose": "batch", "bytes": len(content.encode("utf-8"))}
+
+    def create_openai_batch(self, body: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            lines = [json.loads(line) for line in self._files[body["input_file_id"]].splitlines() if line.strip()]
+            batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+            self._batches[batch_id] = {"provider": "openai", "requests": lines, "polls": 0, "public": {
+                "id": batch_id, "object": "batch", "endpoint": body.get("endpoint"), "status": "validating",
+                "input_file_id": body["input_file_id"], "output_file_id": None, "error_file_id": None,
+                "request_counts": {"total": len(lines), "completed": 0, "failed": 0},
+            }}
+            self.submitted.append(("openai", len(lines)))
+            return self._batches[batch_id]["public"]
+
+    def get_openai_batch(self, batch_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            if batch is None:
+                return None
+            batch["polls"] += 1
+            public = batch["public"]
+            if public["status"] in ("validating", "in_progress") and batch["polls"] >= self.complete_after_polls:
+                self._complete_openai(batch)
+            elif public["status"] == "validating":
+                public["status"] = "in_progress"
+            return public
+
+    def cancel_batch(self, batch_id: str) -> Optional[dict[str, Any]]:
+        """배치 취소 (완료 전이면 provider별 취소 상태로 전환)"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            if batch is None:
+                return None
+            self.cancelled.append(batch_id)
+            public = batch["public"]
+            if batch["provider"] == "openai" and public["status"] != "completed":
+                public["status"] = "cancelled"
+            elif batch["provider"] == "google_genai" and not public.get("done"):
+                public["metadata"]["state"] = "BATCH_STATE_CANCELLED"
+                public["done"] = True
+            return public
+
+    def file_content(self, file_id: str) -> Optional[str]:
+        with self._lock:
+            return self._files.get(file_id)
+
+    def _complete_openai(self, batch: dict[str, Any]) -> None:
+        outputs, errors = [], []
+        for line in batch["requests"]:
+            body = line["body"]
+            messages = [(m["role"], m["content"]) for m in body["messages"]]
+            schema = (body.get("response_format") or {}).get("json_schema", {}).get("schema")
+            request_id = f"req_{uuid.uuid4().hex[:8]}"
+            if any(ERROR_MARKER in content for _, content in messages):
+                errors.append({"id": request_id, "custom_id": line["custom_id"], "response": None,
+                               "error": {"code": "stub_error", "message": "stub failure"}})
+                continue
+            text = self.responder(body["model"], messages, schema)
+            usage = {
+                "prompt_tokens": sum(estimate_tokens(c) for _, c in messages),
+                "completion_tokens": estimate_tokens(text),
+            }
+            outputs.append({"id": request_id, "custom_id": line["custom_id"], "error": None, "response": {
+                "status_code": 200,
+                "body": {"model": body["model"], "choices": [{"index": 0, "message": {"role": "assistant", "content": text}}],
+                         "usage": usage},
+            }})
+        public = batch["public"]
+        public["status"] = "completed"
+        public["request_counts"].update(completed=len(outputs), failed=len(errors))
+        public["output_file_id"] = self._store_jsonl(outputs)
+        public["error_file_id"] = self._store_jsonl(errors) if errors else None
+
+    def _store_jsonl(self, lines: list[dict[str, Any]]) -> str:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        self._files[file_id] = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+        return file_id
+
+    # --- Gemini ---
+
+    def create_gemini_batch(self, model: str, body: dict[str, Any]) -> dict[str, Any]:
+        requests_ = body["batch"]["input_config"]["requests"]["requests"]
+        with self._lock:
+            name = f"batches/{uuid.uuid4().hex[:12]}"
+            self._batches[name] = {"provider": "google_genai", "model": model, "requests": requests_, "polls": 0,
+                                   "public": {"name": name, "metadata": {"state": "BATCH_STATE_PENDING", "model": f"models/{model}"}}}
+            self.submitted.append(("google_genai", len(requests_)))
+            return self._batches[name]["public"]
+
+    def get_gemini_batch(self, name: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            batch = self._batches.get(name)
+            if batch is None:
+                return None
+            batch["polls"] += 1
+            public = batch["public"]
+            if not public.get("done") and batch["polls"] >= self.complete_after_polls:
+                self._complete_gemini(batch)
+            elif not public.get("done"):
+                public["metadata"]["state"] = "BATCH_STATE_RUNNING"
+            return public
+
+    def _complete_gemini(self, batch: dict[str, Any]) -> None:
+        responses = []
+        for item in batch["requests"]:
+            request = item["request"]
+            messages = [("system", p["text"]) for p in request.get("systemInstruction", {}).get("parts", [])]
+            messages += [
+                ("assistant" if c.get("role") == "model" else "user", "".join(p.get("text", "") for p in c["parts"]))
+                for c in request["contents"]
+            ]
+            if any(ERROR_MARKER in content for _, content in messages):
+                responses.append({"error": {"code": 400, "message": "stub failure"}, "metadata": item.get("metadata", {})})
+                continue
+            schema = request.get("generationConfig", {}).get("responseJsonSchema")
+            text = self.responder(batch["model"], messages, schema)
+            responses.append({"metadata": item.get("metadata", {}), "response": {
+                "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+                "usageMetadata": {
+                    "promptTokenCount": sum(estimate_tokens(c) for _, c in messages),
+                    "candidatesTokenCount": estimate_tokens(text),
+                },
+            }})
+        public = batch["public"]
+        public["metadata"]["state"] = "BATCH_STATE_SUCCEEDED"
+        public["done"] = True
+        public["response"] = {"inlinedResponses": {"inlinedResponses": responses}}
+
+
+_GEMINI_CREATE = re.compile(r"^/v1beta/models/([^/:]+):batchGenerateContent$")
+_OPENAI_CANCEL = re.compile(r"^/v1/batches/([^/]+)/cancel$")
+_GEMINI_CANCEL = re.compile(r"^/v1beta/(batches/[^/:]+):cancel$")
+
+
+def _make_handler(stub: BatchStubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            path = self.path.split("?", 1)[0]
+            if path == "/v1/files":
+                self._send(200, stub.upload_file(_multipart_file(self.headers.get("Content-Type", ""), raw)))
+            elif path == "/v1/batches":
+                self._send(200, stub.create_openai_batch(json.loads(raw)))
+            elif match := _GEMINI_CREATE.match(path):
+                self._send(200, stub.create_gemini_batch(match.group(1), json.loads(raw)))
+            elif match := (_OPENAI_CANCEL.match(path) or _GEMINI_CANCEL.match(path)):
+                batch = stub.cancel_batch(match.group(1))
+                self._send(200, batch) if batch is not None else self._send(404, {"error": {"message": "not found"}})
+            else:
+                self._send(404, {"error": {"message": f"unknown path {path}"}})
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path.startswith("/v1/files/") and path.endswith("/content"):
+                content = stub.file_content(path.removeprefix("/v1/files/").removesuffix("/content"))
+                return self._send_text(content) if content is not None else self._send(404, {})
+            if path.startswith("/v1/batches/"):
+                batch = stub.get_openai_batch(path.removeprefix("/v1/batches/"))
+            elif path.startswith("/v1beta/batches/"):
+                batch = stub.get_gemini_batch(path.removeprefix("/v1beta/"))
+            else:
+                batch = None
+            self._send(200, batch) if batch is not None else self._send(404, {"error": {"message": "not found"}})
+
+        def _send(self, status: int, payload: Any) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_text(self, text: str) -> None:
+            body = text.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/jsonl; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _multipart_file(content_type: str, raw: bytes) -> str:
+    """multipart/form-data 본문에서 file 파트 내용 추출"""
+    message = email.message_from_bytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + raw, policy=email.policy.default
+    )
+    for part in message.iter_parts():  # type: ignore[attr-defined]
+        if part.get_param("name", header="content-disposition") == "file":
+            payload = part.get_payload(decode=True)
+            if isinstance(payload, bytes):
+                return payload.decode("utf-8")
+    raise ValueError("file 파트가 없습니다.")
+
+
+def _fake_json(schema: dict[str, Any], defs: dict[str, Any]) -> Any:
+    """JSON 스키마 형태의 최소 값 (배열은 빈 배열)"""
+    if "$ref" in schema:
+        return _fake_json(defs[schema["$ref"].rsplit("/", 1)[-1]], defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "anyOf" in schema:
+        return _fake_json(next(s for s in schema["anyOf"] if s.get("type") != "null"), defs)
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: _fake_json(prop, defs) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return []
+    if kind == "boolean":
+        return True
+    if kind in ("integer", "number"):
+        return 1
+    return schema.get("default", "")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 배치 API 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--complete-after-polls", type=int, default=2)
+    args = parser.parse_args()
+
+    server = BatchStubServer(args.host, args.port, args.complete_after_polls)
+    print(f"OpenAI 호환: {server.openai_base_url}\nGemini: {server.gemini_base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,87 @@
+"""전략 피드백용 대화 이력 관리
+
+4단계 AI 메시지는 매번 전체 전략 문서이므로 이력을 그대로 보내면 요청 크기가 턴 수에 비례해 커집니다.
+최신 전략 문서 한 부와 이전 피드백 요청의 누적 요약만 토큰 예산 안에서 유지합니다.
+"""
+from typing import Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from tools.llm_util import estimate_tokens, parse_llm_response_content
+
+# 요약에 남길 피드백 요청 한 건의 최대 글자 수
+MAX_REQUEST_CHARS = 300
+
+_SUMMARY_HEADER = "[이전 대화 요약]"
+
+
+def build_strategy_feedback_history(
+    messages: Sequence[BaseMessage],
+    token_budget: int,
+) -> list[BaseMessage]:
+    """피드백 체인에 전달할 제한된 대화 이력 생성
+
+    결과는 항상 `[HumanMessage(요약), AIMessage(최신 전략)]` 두 개의 메시지입니다.
+    이전 버전의 전략 문서는 버리고, 사용자의 피드백 요청만 오래된 순으로 요약에 남기되
+    예산을 넘으면 가장 오래된 요청부터 생략합니다. 최신 전략 문서는 예산과 무관하게 유지합니다.
+
+    Args:
+        messages: 지금까지의 전략 대화 (이번 사용자 입력 제외)
+        token_budget: 요약 + 최신 전략에 허용할 추정 토큰 수
+
+    Returns:
+        제한된 대화 이력 (AI 메시지가 없으면 빈 리스트)
+    """
+    latest_idx = next(
+        (i for i in range(len(messages) - 1, -1, -1) if isinstance(messages[i], AIMessage)),
+        None,
+    )
+    if latest_idx is None:
+        return []
+
+    latest_strategy = parse_llm_response_content(messages[latest_idx].content)
+    requests = [
+        _truncate(parse_llm_response_content(msg.content))
+        for msg in messages[:latest_idx]
+        if isinstance(msg, HumanMessage)
+    ]
+    version_count = sum(1 for msg in messages if isinstance(msg, AIMessage))
+
+    remaining = token_budget - estimate_tokens(latest_strategy)
+    summary = _build_summary(requests, version_count, remaining)
+
+    return [HumanMessage(content=summary), AIMessage(content=latest_strategy)]
+
+
+def _build_summary(requests: list[str], version_count: int, token_budget: int) -> str:
+    """예산 안에서 최근 요청부터 채워 넣은 누적 요약 텍스트"""
+    lines = [
+        _SUMMARY_HEADER,
+        f"- 지금까지 전략 문서가 {version_count}차례 작성되었으며, 아래 AI 답변이 최신 버전입니다.",
+    ]
+    if not requests:
+        lines.append("- 초기 전략 수립 이후 반영된 피드백은 아직 없습니다.")
+        return "\n".join(lines)
+
+    kept: list[str] = []
+    used = estimate_tokens("\n".join(lines))
+    for request in reversed(requests):
+        cost = estimate_tokens(request) + 4
+        if kept and used + cost > token_budget:
+            break
+        kept.append(request)
+        used += cost
+
+    omitted = len(requests) - len(kept)
+    lines.append("- 이미 반영된 사용자 피드백 (오래된 순):")
+    if omitted:
+        lines.append(f"  - (이전 요청 {omitted}건 생략)")
+    lines.extend(f"  - {request}" for request in reversed(kept))
+    return "\n".join(lines)
+
+
+def _truncate(text: str) -> str:
+    text = " ".join(text.split())
+    if len(text) <= MAX_REQUEST_CHARS:
+        return text
+    return text[:MAX_REQUEST_CHARS] + "…"
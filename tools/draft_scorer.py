@@ -0,0 +1,83 @@
+"""자기소개서 초안 로컬 채점기
+
+LLM 호출 없이 글자 수 적합도, 핵심 역량 키워드 반영도, 가이드라인 위반(tools.guideline_linter)을 점수화합니다.
+초안 토너먼트에서 충분히 좋은 후보가 모였는지 판단하는 데 사용합니다.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from tools.guideline_linter import GuidelineLinter, violation_summary
+
+# 글자 수 제한 대비 이 비율 이상이면 만점 ("제한 글자 수에 최대한 근접하게 작성")
+FULL_FIT_RATIO = 0.9
+
+# 위반 1건당 곱해지는 감점 계수
+VIOLATION_PENALTY = 0.7
+
+
+@dataclass
+class DraftScore:
+    """초안 채점 결과"""
+    total: float
+    char_fit: float
+    keyword_coverage: float
+    char_count: int
+    violations: list[str] = field(default_factory=list)
+
+    def is_good(self, threshold: float) -> bool:
+        """글자 수 제한을 넘지 않고 기준 점수 이상인지 여부"""
+        return self.char_fit > 0 and self.total >= threshold
+
+
+def score_draft(
+    text: str,
+    char_limit: Optional[int],
+    keywords: Sequence[str],
+    linter: GuidelineLinter,
+) -> DraftScore:
+    """초안 한 건을 채점
+
+    Args:
+        text: 초안 본문
+        char_limit: 문항 글자 수 제한 (None 또는 0이면 제한 없음)
+        keywords: 반영되어야 할 핵심 역량 (WritingStrategy.core_competencies)
+        linter: 가이드라인 위반 검사기 (`get_linter(가이드라인)`)
+
+    Returns:
+        DraftScore (total = 글자 수 적합도와 키워드 반영도의 평균 × 위반 건수만큼 감점)
+    """
+    body = text.strip()
+    char_count = len(body)
+    char_fit = _char_fit(char_count, char_limit)
+    coverage = _keyword_coverage(body, keywords)
+    violations = violation_summary(linter.lint(body))
+
+    total = (char_fit + coverage) / 2 * (VIOLATION_PENALTY ** len(violations))
+    return DraftScore(
+        total=round(total, 3),
+        char_fit=round(char_fit, 3),
+        keyword_coverage=round(coverage, 3),
+        char_count=char_count,
+        violations=violations,
+    )
+
+
+def _char_fit(char_count: int, char_limit: Optional[int]) -> float:
+    if not char_limit:
+        return 1.0 if char_count else 0.0
+    ratio = char_count / char_limit
+    if ratio > 1.0:
+        return 0.0
+    return min(1.0, ratio / FULL_FIT_RATIO)
+
+
+def _keyword_coverage(text: str, keywords: Sequence[str]) -> float:
+    """역량별로 구성 단어(2자 이상)가 본문에 등장한 비율의 평균"""
+    scores = []
+    for keyword in keywords:
+        words = [w for w in re.split(r"[\s,/·()]+", keyword) if len(w) >= 2]
+        if not words:
+            continue
+        scores.append(sum(1 for w in words if w in text) / len(words))
+    return sum(scores) / len(scores) if scores else 1.0
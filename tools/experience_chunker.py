@@ -0,0 +1,147 @@
+"""경험/경력 텍스트 청크 분할 및 병합
+
+긴 경력 기술서를 한 번의 구조화 출력 호출로 보내면 느리고 출력이 잘리는 경우가 있어,
+프로젝트/기간 경계에서 텍스트를 나눠 청크별로 파싱한 뒤 결과를 합칩니다.
+청크는 프로젝트 단위로 고정되므로 한 프로젝트만 수정하면 해당 청크만 내용 해시가 바뀝니다.
+"""
+import re
+from typing import Literal
+
+from models.input_models import Experience
+
+# 병합 시 더 긴 쪽을 사용하는 서술형 필드
+_TEXT_FIELDS: tuple[Literal["role", "description", "achievements"], ...] = ("role", "description", "achievements")
+
+# 기간으로 시작하는 줄 (2023.01 ~, (2023년 3월 ~)
+_PERIOD_LINE_RE = re.compile(r"^[\(\[]?\s*(19|20)\d{2}\s*(\.|-|/|년)")
+
+# 프로젝트/기간 경계로 보는 줄
+_BOUNDARY_PATTERNS = [
+    re.compile(r"^#{1,6}\s"),                                   # Markdown 제목
+    re.compile(r"^[\[【■◆●▶]"),                                 # [프로젝트명], ■ 프로젝트명
+    _PERIOD_LINE_RE,
+    re.compile(r"^(프로젝트|회사|소속|경력)\s*(명)?\s*[:：]"),   # 프로젝트명: ...
+]
+
+# 번호 줄 (1. 프로젝트명). 성과 목록도 같은 형식이므로 머리글처럼 보일 때만 경계로 봄 (_is_numbered_header)
+_NUMBERED_RE = re.compile(r"^\d{1,2}[.)]\s")
+# 줄 안의 기간 범위 (2023.01 - 2023.12, 2023년 3월 ~)
+_PERIOD_RANGE_RE = re.compile(r"(19|20)\d{2}\s*[.\-/년]\s*(\d{1,2}\s*월?\s*)?[~\-–]")
+
+# 이 글자 수보다 짧은 조각(머리말 등)은 다음 조각과 합침
+MIN_CHUNK_CHARS = 80
+
+
+def split_experience_chunks(text: str, max_chars: int) -> list[str]:
+    """경험 텍스트를 프로젝트/기간 경계에서 청크로 분할
+
+    경계 줄이 연속되면(제목 다음 기간 줄 등) 하나의 머리글로 보고 나누지 않습니다.
+    번호 줄은 기간이 함께 적혀 있거나 다음 줄이 기간일 때, 또는 빈 줄 뒤의 단독 항목일 때만 경계로 봅니다
+    (프로젝트 안의 번호 매긴 성과 목록은 나누지 않음).
+    `max_chars`를 넘는 청크는 빈 줄 기준으로 한 번 더 나눕니다.
+
+    Args:
+        text: 사용자 경험/경력 원문
+        max_chars: 청크 최대 글자 수
+
+    Returns:
+        청크 목록 (원문이 비어 있으면 빈 리스트)
+    """
+    segments: list[list[str]] = []
+    current: list[str] = []
+    current_has_body = False
+
+    lines = text.strip().splitlines()
+    for i, line in enumerate(lines):
+        boundary = _is_boundary(lines, i)
+        if boundary and current_has_body:
+            segments.append(current)
+            current, current_has_body = [], False
+        current.append(line)
+        if line.strip() and not boundary:
+            current_has_body = True
+    if current:
+        segments.append(current)
+
+    chunks: list[str] = []
+    carry = ""
+    for segment in segments:
+        chunk = "\n".join(segment).strip()
+        if carry:
+            chunk = f"{carry}\n\n{chunk}"
+        if len(chunk) < MIN_CHUNK_CHARS:
+            carry = chunk
+            continue
+        carry = ""
+        chunks.extend(_split_oversized(chunk, max_chars))
+    if carry:
+        if chunks and len(chunks[-1]) + len(carry) <= max_chars:
+            chunks[-1] = chunks[-1] + "\n\n" + carry
+        else:
+            chunks.append(carry)
+    return chunks
+
+
+def merge_experiences(chunk_results: list[list[Experience]]) -> list[Experience]:
+    """청크별 파싱 결과를 합치고 중복 경험을 병합
+
+    같은 (프로젝트명, 기간) 경험이 여러 청크에 걸쳐 추출되면 하나로 합치고,
+    설명/성과는 더 긴 쪽을, 기술 스택은 합집합을 사용합니다. id는 병합 후 순서대로 부여합니다.
+    """
+    merged: dict[tuple[str, str], Experience] = {}
+    for experiences in chunk_results:
+        for exp in experiences:
+            key = (_normalize(exp.get("project_name", "")), _normalize(exp.get("period", "")))
+            if key not in merged:
+                merged[key] = Experience(**{**exp, "technologies": list(exp.get("technologies") or [])})
+                continue
+            target = merged[key]
+            for field in _TEXT_FIELDS:
+                if len(exp.get(field) or "") > len(target.get(field) or ""):
+                    target[field] = exp[field]
+            for tech in exp.get("technologies") or []:
+                if tech not in target["technologies"]:
+                    target["technologies"].append(tech)
+
+    results = list(merged.values())
+    for i, exp in enumerate(results, start=1):
+        exp["id"] = str(i)
+    return results
+
+
+def _is_boundary(lines: list[str], i: int) -> bool:
+    line = lines[i]
+    if any(pattern.match(line) for pattern in _BOUNDARY_PATTERNS):
+        return True
+    return bool(_NUMBERED_RE.match(line)) and _is_numbered_header(lines, i)
+
+
+def _is_numbered_header(lines: list[str], i: int) -> bool:
+    """번호 줄이 프로젝트 머리글인지 (성과 목록 항목이 아닌지)"""
+    next_line = lines[i + 1] if i + 1 < len(lines) else ""
+    if _PERIOD_RANGE_RE.search(lines[i]) or _PERIOD_LINE_RE.match(next_line):
+        return True
+    # 빈 줄 뒤에서 시작하고 다음 줄이 번호 항목이 아니면 목록이 아닌 제목으로 봄
+    after_blank = i == 0 or not lines[i - 1].strip()
+    return after_blank and bool(next_line.strip()) and not _NUMBERED_RE.match(next_line)
+
+
+def _split_oversized(chunk: str, max_chars: int) -> list[str]:
+    """최대 글자 수를 넘는 청크를 빈 줄 기준 문단 단위로 분할"""
+    if len(chunk) <= max_chars:
+        return [chunk]
+    parts: list[str] = []
+    buffer = ""
+    for paragraph in re.split(r"\n\s*\n", chunk):
+        if buffer and len(buffer) + len(paragraph) + 2 > max_chars:
+            parts.append(buffer)
+            buffer = paragraph
+        else:
+            buffer = f"{buffer}\n\n{paragraph}" if buffer else paragraph
+    if buffer:
+        parts.append(buffer)
+    return parts
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"[\s~\-–.·/]+", "", text or "").lower()
@@ -0,0 +1,125 @@
+"""경험/경력 로컬 검색 인덱스 (BM25)
+
+문항마다 전체 경험 텍스트를 프롬프트에 붙이는 대신, 파싱된 Experience 목록에서
+문항과 관련 있는 경험만 골라 넣기 위한 인덱스입니다. GPU나 네트워크 없이 동작합니다.
+"""
+import math
+import re
+from collections import Counter
+from typing import Sequence
+
+from models.input_models import Experience
+
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+# 검색 대상 필드와 가중치 (프로젝트명/기술 스택이 문항 키워드와 직접 겹치는 경우가 많음)
+_FIELD_WEIGHTS = {
+    "project_name": 2,
+    "role": 1,
+    "description": 1,
+    "technologies": 2,
+    "achievements": 1,
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """검색용 토큰화
+
+    형태소 분석기 없이 한국어 조사 변화를 흡수하기 위해 한글 단어는 음절 bigram을 함께 생성합니다.
+    """
+    tokens = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        tokens.append(word)
+        if _HANGUL_RE.search(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class ExperienceIndex:
+    """Experience 목록에 대한 BM25 인덱스"""
+
+    def __init__(self, experiences: Sequence[Experience], k1: float = 1.5, b: float = 0.75) -> None:
+        self.experiences = list(experiences)
+        self.k1 = k1
+        self.b = b
+        self._doc_terms = [Counter(tokenize(_document_text(exp))) for exp in self.experiences]
+        self._doc_lengths = [sum(terms.values()) for terms in self._doc_terms]
+        self._avg_length = (sum(self._doc_lengths) / len(self._doc_lengths)) if self._doc_lengths else 0.0
+
+        doc_freq: Counter[str] = Counter()
+        for terms in self._doc_terms:
+            doc_freq.update(terms.keys())
+        n_docs = len(self.experiences)
+        self._idf = {
+            term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def search(self, query: str, k: int) -> list[tuple[Experience, float]]:
+        """질의와 관련도가 높은 경험 상위 k개
+
+        Args:
+            query: 검색 질의 (문항 + 문항별 전략 등)
+            k: 반환할 최대 개수
+
+        Returns:
+            (경험, 점수) 리스트 (점수 내림차순, 점수 0인 경험 제외)
+        """
+        query_terms = Counter(tokenize(query))
+        scored = []
+        for exp, terms, length in zip(self.experiences, self._doc_terms, self._doc_lengths):
+            score = 0.0
+            for term, qf in query_terms.items():
+                tf = terms.get(term)
+                if not tf:
+                    continue
+                norm = tf + self.k1 * (1 - self.b + self.b * length / (self._avg_length or 1))
+                score += self._idf[term] * tf * (self.k1 + 1) / norm * qf
+            if score > 0:
+                scored.append((exp, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:k]
+
+
+def find_named_experiences(experiences: Sequence[Experience], text: str) -> list[Experience]:
+    """텍스트(문항별 전략 등)에 프로젝트명이 언급된 경험 목록"""
+    normalized = _normalize(text)
+    return [
+        exp for exp in experiences
+        if exp.get("project_name") and _normalize(exp["project_name"]) in normalized
+    ]
+
+
+def format_experiences(experiences: Sequence[Experience]) -> str:
+    """프롬프트 삽입용 경험 목록 텍스트"""
+    blocks = []
+    for exp in experiences:
+        header = f"- {exp.get('project_name', '')}"
+        if exp.get("period"):
+            header += f" ({exp['period']})"
+        if exp.get("role"):
+            header += f" / {exp['role']}"
+        lines = [header]
+        if exp.get("description"):
+            lines.append(f"  내용: {exp['description']}")
+        if exp.get("technologies"):
+            lines.append(f"  기술: {', '.join(exp['technologies'])}")
+        if exp.get("achievements"):
+            lines.append(f"  성과: {exp['achievements']}")
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def _document_text(exp: Experience) -> str:
+    parts = []
+    for field, weight in _FIELD_WEIGHTS.items():
+        value = exp.get(field) or ""
+        if isinstance(value, list):
+            value = " ".join(value)
+        parts.extend([str(value)] * weight)
+    return " ".join(parts)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text).lower()
@@ -0,0 +1,210 @@
+"""작성 가이드라인 위반 로컬 검사기
+
+LLM 호출 없이 초안/최종본에서 가이드라인 위반을 찾습니다.
+
+- 금지 표현: 가이드라인의 '금지'/'지양' 문장에 따옴표로 예시된 표현을 찾습니다. 표현이 많으면
+  Aho-Corasick 오토마톤 하나로 컴파일하여 표현 수와 무관하게 본문을 한 번만 훑고, 기본 가이드처럼
+  몇 개뿐이면 C로 구현된 `str.find` 반복이 더 빠르므로 그대로 사용합니다.
+- 형식 규칙: 괄호 안 영어 병기, 이모지, 특수문자, Markdown 강조를 정규식으로 검사합니다.
+  각 규칙은 가이드라인에 해당 항목(예: '영어 병기', '이모지')이 있을 때만 켜지므로,
+  사용자가 5단계에서 수정한 가이드라인에 금지 표현을 추가하거나 항목을 지우면 그대로 반영됩니다.
+
+가이드라인 텍스트별 검사기는 `get_linter`가 캐시하므로 초안마다 다시 컴파일하지 않습니다.
+"""
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
+
+from config.prompts import DEFAULT_GUIDELINE_TEXT
+
+# 금지 표현이 이 수 이상이면 Aho-Corasick 사용 (benchmarks/bench_guideline_linter.py 기준 손익분기 약 200개)
+AHO_CORASICK_MIN_PHRASES = 200
+
+# 가이드라인의 금지 예시 표기: (예: '도움이 되겠습니다', '열정적인', ...)
+_QUOTED_RE = re.compile(r"['‘\"“]([^'’\"”\n]{2,30})['’\"”]")
+
+
+@dataclass(frozen=True)
+class RegexRule:
+    """가이드라인 항목에 연결된 형식 규칙"""
+    name: str
+    triggers: tuple[str, ...]
+    pattern: re.Pattern
+    message: str
+
+
+REGEX_RULES: tuple[RegexRule, ...] = (
+    RegexRule(
+        name="english_gloss",
+        triggers=("영어 병기", "영문 병기"),
+        pattern=re.compile(r"\([^()\n]*[A-Za-z][^()\n]*\)"),
+        message="괄호 안 영어 병기",
+    ),
+    RegexRule(
+        name="emoji",
+        triggers=("이모지", "이모티콘"),
+        pattern=re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\uFE0F]"),
+        message="이모지·그림 문자",
+    ),
+    RegexRule(
+        name="special_char",
+        triggers=("특수문자",),
+        pattern=re.compile(r"[※■□▲△▶▷▼▽◆◇●○◎→←↑↓⇒]"),
+        message="특수문자",
+    ),
+    RegexRule(
+        name="markdown",
+        triggers=("순수 텍스트",),
+        pattern=re.compile(r"\*\*|__|^#{1,6}\s", re.MULTILINE),
+        message="Markdown 서식",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class LintViolation:
+    """위반 한 건 (start/end는 본문 내 글자 위치)"""
+    rule: str
+    text: str
+    start: int
+    end: int
+    message: str
+
+
+class AhoCorasick:
+    """다중 문자열 검색 오토마톤 (본문 길이에 선형, 패턴 수와 무관)"""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (index,)
+
+        # 실패 링크는 BFS로 계산하고, 출력 목록에 실패 링크 쪽 출력을 합쳐 검색 중 따라가지 않게 함
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterable[tuple[int, int, int]]:
+        """(시작, 끝, 패턴 번호)를 끝 위치 순으로 반환 (겹치는 일치 포함)"""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                end = pos + 1
+                yield end - len(patterns[index]), end, index
+
+
+class GuidelineLinter:
+    """금지 표현 + 형식 규칙 검사기"""
+
+    def __init__(self, banned_phrases: Sequence[str], regex_rules: Sequence[RegexRule] = ()) -> None:
+        self.banned_phrases = list(dict.fromkeys(p for p in banned_phrases if p))
+        self.regex_rules = list(regex_rules)
+        self._automaton = (
+            AhoCorasick(self.banned_phrases) if len(self.banned_phrases) >= AHO_CORASICK_MIN_PHRASES else None
+        )
+
+    def lint(self, text: str) -> list[LintViolation]:
+        """본문의 위반 목록 (위치순, 겹치는 금지 표현은 먼저 시작하는 긴 것만)
+
+        Args:
+            text: 초안/최종본 본문
+
+        Returns:
+            LintViolation 목록
+        """
+        violations = []
+        last_end = -1
+        matches = sorted(self._find_phrases(text), key=lambda m: (m[0], -m[1]))
+        for start, end, index in matches:
+            if start < last_end:
+                continue
+            violations.append(LintViolation("banned_phrase", self.banned_phrases[index], start, end, "금지 표현"))
+            last_end = end
+
+        for rule in self.regex_rules:
+            for match in rule.pattern.finditer(text):
+                violations.append(LintViolation(rule.name, match.group(), match.start(), match.end(), rule.message))
+
+        violations.sort(key=lambda v: (v.start, v.end))
+        return violations
+
+    def _find_phrases(self, text: str) -> Iterable[tuple[int, int, int]]:
+        """금지 표현의 (시작, 끝, 표현 번호) (겹치는 일치 포함)"""
+        if self._automaton is not None:
+            yield from self._automaton.finditer(text)
+            return
+        for index, phrase in enumerate(self.banned_phrases):
+            start = text.find(phrase)
+            while start >= 0:
+                yield start, start + len(phrase), index
+                start = text.find(phrase, start + 1)
+
+
+def extract_banned_phrases(guideline_text: str) -> list[str]:
+    """가이드라인의 '금지' 문장에 따옴표로 예시된 표현을 추출
+
+    Args:
+        guideline_text: 작성 가이드라인 (기본값 또는 사용자 편집본)
+
+    Returns:
+        금지 표현 목록 (중복 제거, 등장 순서 유지)
+    """
+    phrases: list[str] = []
+    for line in guideline_text.splitlines():
+        if "금지" not in line and "지양" not in line:
+            continue
+        for phrase in _QUOTED_RE.findall(line):
+            phrase = phrase.strip()
+            if phrase and phrase not in phrases:
+                phrases.append(phrase)
+    return phrases
+
+
+def enabled_regex_rules(guideline_text: str) -> list[RegexRule]:
+    """가이드라인에 항목이 있는 형식 규칙만 선택"""
+    return [rule for rule in REGEX_RULES if any(t in guideline_text for t in rule.triggers)]
+
+
+@lru_cache(maxsize=64)
+def get_linter(guideline_text: str) -> GuidelineLinter:
+    """가이드라인 텍스트로 만든 검사기 (텍스트별 캐시)"""
+    return GuidelineLinter(extract_banned_phrases(guideline_text), enabled_regex_rules(guideline_text))
+
+
+def lint_text(text: str, guideline_text: Optional[str]) -> list[LintViolation]:
+    """가이드라인 기준 위반 목록 (가이드라인이 없으면 기본 가이드 사용)"""
+    return get_linter(guideline_text or DEFAULT_GUIDELINE_TEXT).lint(text)
+
+
+def violation_summary(violations: Sequence[LintViolation]) -> list[str]:
+    """표시용 위반 요약 (규칙별 고유 문구, 등장 순서 유지)"""
+    return list(dict.fromkeys(
+        v.text if v.rule == "banned_phrase" else f"{v.message} {v.text}" for v in violations
+    ))
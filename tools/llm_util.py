@@ -77,6 +77,22 @@ def parse_llm_response_content(content: Any) -> str:
         
     return str(content)
 
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수를 근사 추정
+    
+    영문/기호는 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1.5자당 1토큰으로 계산합니다.
+    요청 크기 예산 관리용이므로 정확도보다 속도를 우선합니다.
+    
+    Args:
+        text: 추정할 텍스트
+        
+    Returns:
+        추정 토큰 수
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    return int(ascii_chars / 4 + other_chars / 1.5) + 1
+
 def format_messages_to_text(messages: list[BaseMessage | AnyMessage]) -> str:
     """메시지 리스트를 하나의 보기 좋은 텍스트로 변환"""
     formatted_text = ""
@@ -0,0 +1,261 @@
+"""구조화 출력 스트리밍용 부분 JSON 파서
+
+`with_structured_output`은 JSON 전체가 도착해야 결과를 돌려주므로,
+원문 토큰 스트림을 직접 스캔하여 최상위 필드가 닫히는 즉시 꺼내 씁니다.
+"""
+import json
+from typing import Any, Generic, Iterator, TypeVar
+
+from langchain_core.runnables import Runnable, RunnableWithFallbacks
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# `response_format`(OpenAI JSON 스키마 모드)로 구조화 출력을 본문에 스트리밍하는 모델 종류 (_llm_type)
+_RESPONSE_FORMAT_LLM_TYPES = frozenset({"openai-chat", "azure-openai-chat", "fake-chat"})
+
+
+class PartialJsonFieldParser:
+    """최상위 JSON 객체의 필드가 완성되는 즉시 (키, 값)을 반환하는 증분 파서
+
+    도착한 텍스트는 한 번씩만 스캔하며, 값이 닫히는 시점(문자열의 닫는 따옴표,
+    중첩 객체/배열의 닫는 괄호, 숫자·리터럴 뒤의 구분자)에 해당 구간만
+    `json.loads`로 해석합니다. 첫 `{` 이전의 텍스트(코드 펜스 등)는 무시합니다.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_start = -1
+        self._expect_key = True
+        self._current_key: str | None = None
+        self._value_start = -1
+        self._scalar_pending = False
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        """텍스트 조각을 추가하고 이번에 완성된 최상위 필드 목록을 반환
+
+        Args:
+            text: 새로 도착한 응답 텍스트 조각
+
+        Returns:
+            (필드명, JSON 디코딩된 값) 튜플 리스트 (도착 순서)
+        """
+        self._buffer += text
+        completed: list[tuple[str, Any]] = []
+        buf = self._buffer
+
+        while self._pos < len(buf) and not self._done:
+            ch = buf[self._pos]
+
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        raw = buf[self._string_start:self._pos + 1]
+                        if self._string_is_key:
+                            self._current_key = json.loads(raw)
+                        else:
+                            self._emit(raw, completed)
+                self._pos += 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._string_is_key = self._expect_key
+                    self._string_start = self._pos
+            elif ch in "{[":
+                if self._depth == 1:
+                    self._value_start = self._pos
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._value_start >= 0:
+                    self._emit(buf[self._value_start:self._pos + 1], completed)
+                elif self._depth == 0:
+                    self._flush_scalar(completed)
+                    self._done = True
+            elif self._depth == 1:
+                if ch == ":":
+                    self._expect_key = False
+                elif ch == ",":
+                    self._flush_scalar(completed)
+                    self._expect_key = True
+                elif not ch.isspace() and not self._expect_key and not self._scalar_pending:
+                    # 숫자, true/false/null 등 따옴표 없는 값의 시작
+                    self._scalar_pending = True
+                    self._value_start = self._pos
+            self._pos += 1
+
+        return completed
+
+    def _flush_scalar(self, completed: list[tuple[str, Any]]) -> None:
+        """구분자를 만나 끝난 스칼라 값을 방출"""
+        if self._scalar_pending:
+            self._emit(self._buffer[self._value_start:self._pos].strip(), completed)
+
+    def _emit(self, raw: str, completed: list[tuple[str, Any]]) -> None:
+        key = self._current_key
+        self._current_key = None
+        self._value_start = -1
+        self._scalar_pending = False
+        if key is None:
+            return
+        try:
+            completed.append((key, json.loads(raw)))
+        except json.JSONDecodeError:
+            # 깨진 값은 최종 파싱 결과로 보완되도록 건너뜀
+            pass
+
+
+class StructuredOutputStream(Generic[SchemaT]):
+    """채팅 모델의 원문 스트림에서 구조화 출력 필드를 완성되는 순서대로 반환
+
+    `with_structured_output` 체인은 마지막 파싱 단계(RunnableWithFallbacks)가 스트림을 모았다가
+    한 번에 넘기므로, JSON 스키마 모드로 바인딩한 채팅 모델의 본문을 직접 스트리밍하고 부분 파서로 필드를 꺼냅니다.
+    (Gemini는 도구 호출 인자를 마지막 청크에 한 번에 보내므로 도구 바인딩으로는 필드가 먼저 도착하지 않음)
+    각 필드는 Pydantic 모델의 필드 타입으로 개별 검증된 후 방출되며,
+    반복이 끝나면 전체 응답을 모델로 검증한 인스턴스가 `result`에 채워집니다.
+
+    Example:
+        ```python
+        stream = StructuredOutputStream(llm, prompt, inputs, ValidationResult)
+        for name, value in stream:
+            placeholders[name].write(value)
+        result = stream.result
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: Runnable,
+        prompt: Runnable,
+        inputs: dict[str, Any],
+        schema: type[SchemaT],
+    ) -> None:
+        self.llm = llm
+        self.prompt = prompt
+        self.inputs = inputs
+        self.schema = schema
+        self.fields: dict[str, Any] = {}
+        self.result: SchemaT | None = None
+        self._adapters: dict[str, TypeAdapter[Any]] = {
+            name: TypeAdapter(field.annotation)
+            for name, field in schema.model_fields.items()
+        }
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        parser = PartialJsonFieldParser()
+        # JSON 모드는 본문, 도구 호출 방식은 인자 문자열로 스트리밍됨 (_chunk_text가 둘 다 처리)
+        llm = bind_json_schema(self.llm, self.schema)
+        message: Any = None
+
+        for chunk in llm.stream(self.prompt.invoke(self.inputs)):
+            message = chunk if message is None else message + chunk
+            for name, value in parser.feed(_chunk_text(chunk)):
+                validated = self._validate_field(name, value)
+                if validated is not None:
+                    yield name, validated
+
+        parsed = self._parse_message(message)
+        for name in self.schema.model_fields:
+            if name not in self.fields:
+                self.fields[name] = getattr(parsed, name)
+                yield name, self.fields[name]
+        self.result = parsed
+
+    def _parse_message(self, message: Any) -> SchemaT:
+        """완성된 응답 메시지를 스키마로 검증 (파싱할 수 없으면 스트리밍 중 모은 필드로 검증)"""
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            return self.schema.model_validate(tool_calls[0]["args"])
+        try:
+            return self.schema.model_validate(parse_json_markdown(_chunk_text(message)))
+        except (ValueError, TypeError):
+            return self.schema.model_validate(self.fields)
+
+    def _validate_field(self, name: str, value: Any) -> Any:
+        adapter = self._adapters.get(name)
+        if adapter is None or name in self.fields:
+            return None
+        try:
+            validated = adapter.validate_python(value)
+        except ValidationError:
+            return None
+        self.fields[name] = validated
+        return validated
+
+
+def bind_json_schema(llm: Runnable, schema: type[BaseModel]) -> Runnable:
+    """스키마로 제약한 JSON을 본문 텍스트로 생성하도록 채팅 모델을 바인딩
+
+    provider별 `with_structured_output(method="json_schema")`와 같은 호출 옵션을 사용합니다.
+    JSON 스키마 모드가 없는 모델(Anthropic 등, 도구 인자를 조각으로 스트리밍)은 스키마를 도구로 바인딩하며,
+    대체 모델이 연결된 경우(RunnableWithFallbacks) 각 모델에 따로 적용합니다.
+
+    Args:
+        llm: 채팅 모델 (`get_chat_model` 반환값)
+        schema: 응답 스키마
+
+    Returns:
+        스트리밍하면 스키마 JSON이 도착하는 Runnable
+    """
+    if isinstance(llm, RunnableWithFallbacks):
+        return RunnableWithFallbacks(
+            runnable=bind_json_schema(llm.runnable, schema),
+            fallbacks=[bind_json_schema(fallback, schema) for fallback in llm.fallbacks],
+            exceptions_to_handle=llm.exceptions_to_handle,
+            exception_key=llm.exception_key,
+        )
+    llm_type = getattr(llm, "_llm_type", "")
+    if llm_type == "chat-google-generative-ai":
+        return llm.bind(response_mime_type="application/json", response_json_schema=schema.model_json_schema())
+    if llm_type in _RESPONSE_FORMAT_LLM_TYPES:
+        return llm.bind(response_format=schema)
+    return llm.bind_tools([schema], tool_choice=schema.__name__)  # type: ignore[attr-defined]
+
+
+def _chunk_text(chunk: Any) -> str:
+    """스트리밍 메시지 청크에서 원문 JSON 텍스트를 추출
+
+    `parse_llm_response_content`는 파트를 줄바꿈으로 이어 붙이므로
+    JSON 문자열 내부가 깨지지 않도록 텍스트 파트만 그대로 연결합니다.
+    """
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str) and content:
+        return content
+    if isinstance(content, list) and content:
+        parts = []
+        for item in content:
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, dict) and item.get("type", "text") == "text":
+                parts.append(item.get("text", ""))
+        return "".join(parts)
+    # 도구 호출 방식의 구조화 출력은 인자 문자열이 스트리밍됨
+    tool_chunks = getattr(chunk, "tool_call_chunks", None) or []
+    return "".join(tc.get("args") or "" for tc in tool_chunks)
@@ -0,0 +1,181 @@
+"""채용공고 근접 중복 탐지 (shingling + MinHash/LSH)
+
+같은 공고가 다른 URL/채용 플랫폼에서 약간 수정된 채 다시 들어와도 이전 검증 결과를
+재사용할 수 있도록, 정규화한 공고 텍스트의 MinHash 서명을 LSH 버킷으로 색인합니다.
+서명 계산과 유사도 추정은 NumPy로 벡터화되어 있어 네트워크/모델 호출이 없습니다.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config.settings import settings
+
+# 2^32 미만의 소수 (MinHash 해시 함수 (a*x + b) mod p)
+_PRIME = np.uint64((1 << 32) - 5)
+_ROLLING_BASE = 1_000_003
+
+_URL_RE = re.compile(r"https?://\S+")
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_posting(text: str) -> str:
+    """비교용 공고 정규화 (URL, 공백, 기호 제거 및 소문자화)"""
+    return _NON_WORD_RE.sub("", _URL_RE.sub("", text.lower()))
+
+
+class MinHasher:
+    """문자 k-shingle 기반 MinHash 서명 생성기"""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1) -> None:
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # a*x + b가 uint64를 넘지 않도록 계수는 2^31 미만으로 제한
+        self._a = rng.integers(1, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, size=(num_perm, 1), dtype=np.uint64)
+        self._powers = np.array(
+            [pow(_ROLLING_BASE, shingle_size - 1 - i, 1 << 32) for i in range(shingle_size)],
+            dtype=np.uint64,
+        )
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        """정규화된 텍스트의 k-shingle 32비트 해시 (중복 제거)"""
+        normalized = normalize_posting(text)
+        if len(normalized) < self.shingle_size:
+            normalized = normalized.ljust(self.shingle_size, "_")
+        codepoints = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        windows = sliding_window_view(codepoints, self.shingle_size)
+        hashes = (windows * self._powers).sum(axis=1) & np.uint64(0xFFFFFFFF)
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 서명 (uint32, 길이 num_perm)"""
+        hashes = self.shingle_hashes(text)
+        return ((self._a * hashes[None, :] + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+class PostingIndex:
+    """MinHash 서명에 대한 LSH 인덱스
+
+    서명을 `bands`개 구간으로 나눠 구간이 하나라도 같으면 후보로 보고, 후보에 대해서만
+    서명 일치 비율(자카드 유사도 추정치)을 계산합니다.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 5) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._payloads: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def add(self, text: str, payload: Any) -> np.ndarray:
+        """공고 텍스트를 색인하고 계산된 서명 반환"""
+        signature = self.hasher.signature(text)
+        self.add_signature(signature, payload)
+        return signature
+
+    def add_signature(self, signature: np.ndarray, payload: Any) -> None:
+        """미리 계산된 서명 색인 (저장소에서 복원할 때 사용)"""
+        idx = len(self._payloads)
+        if idx == len(self._signatures):
+            self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+        self._signatures[idx] = signature
+        self._payloads.append(payload)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(idx)
+
+    def query(self, text: str, threshold: float) -> list[tuple[Any, float]]:
+        """유사도가 threshold 이상인 색인 항목 (유사도 내림차순)"""
+        return self.query_signature(self.hasher.signature(text), threshold)
+
+    def query_signature(self, signature: np.ndarray, threshold: float) -> list[tuple[Any, float]]:
+        candidates: set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        if not candidates:
+            return []
+
+        ids = np.fromiter(candidates, dtype=np.int64)
+        similarities = (self._signatures[ids] == signature).mean(axis=1)
+        order = np.argsort(-similarities)
+        return [
+            (self._payloads[ids[i]], float(similarities[i]))
+            for i in order
+            if similarities[i] >= threshold
+        ]
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [signature[b * self.rows:(b + 1) * self.rows].tobytes() for b in range(self.bands)]
+
+
+class PostingDedupStore:
+    """검증을 마친 공고의 서명과 결과(JSON)를 SQLite에 보관하고 메모리 인덱스로 조회"""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self.index = PostingIndex()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(sqlite3.connect(db_path, timeout=10)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, scope_key TEXT NOT NULL, "
+                "signature BLOB NOT NULL, payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            rows = conn.execute("SELECT scope_key, signature, payload FROM postings ORDER BY id").fetchall()
+        for scope_key, signature, payload in rows:
+            self.index.add_signature(
+                np.frombuffer(signature, dtype=np.uint32), (scope_key, json.loads(payload))
+            )
+
+    def find(self, text: str, scope_key: str, threshold: float) -> Optional[tuple[dict, float]]:
+        """같은 범위(scope_key)에서 가장 유사한 이전 공고의 결과
+
+        Returns:
+            (저장된 결과 dict, 유사도) 또는 None
+        """
+        with self._lock:
+            matches = self.index.query(text, threshold)
+        for (key, payload), similarity in matches:
+            if key == scope_key:
+                return payload, similarity
+        return None
+
+    def remember(self, texts: list[str], scope_key: str, payload: dict) -> None:
+        """공고 텍스트(원문, 정리본 등) 각각을 같은 결과로 색인"""
+        with self._lock, closing(sqlite3.connect(self.db_path, timeout=10)) as conn, conn:
+            for text in dict.fromkeys(t for t in texts if t.strip()):
+                signature = self.index.add(text, (scope_key, payload))
+                conn.execute(
+                    "INSERT INTO postings (scope_key, signature, payload, created_at) VALUES (?, ?, ?, ?)",
+                    (scope_key, signature.tobytes(), json.dumps(payload, ensure_ascii=False), time.time()),
+                )
+
+
+_store: Optional[PostingDedupStore] = None
+_store_lock = threading.Lock()
+
+
+def get_posting_store() -> PostingDedupStore:
+    """프로세스 공용 공고 중복 탐지 저장소 (settings.posting_index_db_path)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PostingDedupStore(settings.posting_index_db_path)
+        return _store
@@ -0,0 +1,271 @@
+"""사용자 프로필 로컬 저장소 (SQLite)
+
+지원서마다 같은 경험/경력을 다시 붙여넣고 다시 파싱하지 않도록, 사용자별로
+경험 원문, 구조화된 경험 목록, 마지막 작성 가이드, 확정된 자기소개서를 보관합니다.
+프로필 이름만으로는 다른 사용자의 프로필을 열 수 없도록 프로필마다 비밀 문구를 두고 해시(scrypt)로 저장합니다.
+"""
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from config.settings import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    user_key TEXT PRIMARY KEY,
+    user_experiences TEXT NOT NULL DEFAULT '',
+    parsed_experiences TEXT,
+    parsed_experiences_hash TEXT,
+    writing_guidelines TEXT,
+    passphrase_hash TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS essays (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_key TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    position_name TEXT NOT NULL,
+    question_text TEXT NOT NULL,
+    essay_text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_essays_user ON essays (user_key, created_at);
+"""
+
+# 이전 버전 DB 보정: 비밀 문구 열 추가, 중복 확정본은 최신 것만 남기고 (사용자, 회사, 직무, 문항) 고유 제약 추가
+_MIGRATIONS = """
+DELETE FROM essays WHERE id NOT IN (
+    SELECT MAX(id) FROM essays GROUP BY user_key, company_name, position_name, question_text
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_essays_question
+    ON essays (user_key, company_name, position_name, question_text);
+"""
+
+# scrypt 파라미터 (약 16MiB 메모리, 로그인 한 번에 수십 ms)
+_SCRYPT_PARAMS = {"n": 2 ** 14, "r": 8, "p": 1}
+
+
+class ProfileAccessError(ValueError):
+    """프로필 비밀 문구 불일치"""
+    pass
+
+
+@dataclass
+class ConfirmedEssay:
+    """과거에 확정한 자기소개서 문항 하나"""
+    company_name: str
+    position_name: str
+    question_text: str
+    essay_text: str
+    created_at: float
+
+
+@dataclass
+class UserProfile:
+    """저장된 사용자 프로필"""
+    user_key: str
+    user_experiences: str = ""
+    parsed_experiences: Optional[list[dict]] = None
+    parsed_experiences_hash: Optional[str] = None
+    writing_guidelines: Optional[str] = None
+    essays: list[ConfirmedEssay] = field(default_factory=list)
+
+
+class ProfileStore:
+    """사용자 키 단위 프로필 저장소
+
+    Streamlit 스크립트 스레드와 백그라운드 스레드에서 함께 쓰므로 호출마다 연결을 새로 엽니다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(profiles)")}
+            if "passphrase_hash" not in columns:
+                conn.execute("ALTER TABLE profiles ADD COLUMN passphrase_hash TEXT")
+            conn.executescript(_MIGRATIONS)
+
+    def open(self, user_key: str, passphrase: str) -> bool:
+        """비밀 문구를 확인하고 프로필 사용 시작 (없는 프로필이면 이 비밀 문구로 새로 만듦)
+
+        비밀 문구 없이 저장된 이전 버전 프로필은 처음 연 비밀 문구로 잠급니다.
+
+        Args:
+            user_key: 사용자 키 (프로필 이름)
+            passphrase: 프로필 비밀 문구
+
+        Returns:
+            기존 프로필이면 True, 새로 만들었으면 False
+
+        Raises:
+            ProfileAccessError: 기존 프로필의 비밀 문구와 다른 경우
+        """
+        with closing(self._connect()) as conn, conn:
+            # 같은 이름을 동시에 만드는 경우에도 한쪽만 비밀 문구를 정하도록 쓰기 잠금을 먼저 획득
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT passphrase_hash FROM profiles WHERE user_key = ?", (user_key,)).fetchone()
+            if row is not None and row[0]:
+                if not _verify_passphrase(passphrase, row[0]):
+                    raise ProfileAccessError("프로필 이름 또는 비밀 문구가 올바르지 않습니다.")
+                return True
+            self._ensure_row(conn, user_key)
+            conn.execute(
+                "UPDATE profiles SET passphrase_hash = ?, updated_at = ? WHERE user_key = ?",
+                (_hash_passphrase(passphrase), time.time(), user_key),
+            )
+            return row is not None
+
+    def load(self, user_key: str, essay_limit: int = 20) -> Optional[UserProfile]:
+        """프로필 조회 (`open`으로 비밀 문구를 확인한 프로필만 조회할 것)
+
+        Args:
+            user_key: 사용자 키 (프로필 이름)
+            essay_limit: 함께 불러올 최근 확정 자기소개서 수
+
+        Returns:
+            UserProfile (저장된 프로필이 없으면 None)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT user_experiences, parsed_experiences, parsed_experiences_hash, writing_guidelines "
+                "FROM profiles WHERE user_key = ?",
+                (user_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            essays = conn.execute(
+                "SELECT company_name, position_name, question_text, essay_text, created_at "
+                "FROM essays WHERE user_key = ? ORDER BY created_at DESC LIMIT ?",
+                (user_key, essay_limit),
+            ).fetchall()
+
+        return UserProfile(
+            user_key=user_key,
+            user_experiences=row[0],
+            parsed_experiences=json.loads(row[1]) if row[1] else None,
+            parsed_experiences_hash=row[2],
+            writing_guidelines=row[3],
+            essays=[ConfirmedEssay(*essay) for essay in essays],
+        )
+
+    def save_experiences(
+        self,
+        user_key: str,
+        user_experiences: str,
+        parsed_experiences: Optional[list[dict]] = None,
+        parsed_experiences_hash: Optional[str] = None,
+    ) -> None:
+        """경험 원문 저장 (파싱 결과가 주어지지 않으면 원문이 바뀐 경우에만 기존 파싱 결과를 비움)"""
+        with closing(self._connect()) as conn, conn:
+            self._ensure_row(conn, user_key)
+            if parsed_experiences is None:
+                conn.execute(
+                    "UPDATE profiles SET "
+                    "parsed_experiences = CASE WHEN user_experiences = ? THEN parsed_experiences END, "
+                    "parsed_experiences_hash = CASE WHEN user_experiences = ? THEN parsed_experiences_hash END, "
+                    "user_experiences = ?, updated_at = ? WHERE user_key = ?",
+                    (user_experiences, user_experiences, user_experiences, time.time(), user_key),
+                )
+            else:
+                conn.execute(
+                    "UPDATE profiles SET user_experiences = ?, parsed_experiences = ?, "
+                    "parsed_experiences_hash = ?, updated_at = ? WHERE user_key = ?",
+                    (
+                        user_experiences,
+                        json.dumps(parsed_experiences, ensure_ascii=False),
+                        parsed_experiences_hash,
+                        time.time(),
+                        user_key,
+                    ),
+                )
+
+    def save_guidelines(self, user_key: str, writing_guidelines: str) -> None:
+        """마지막으로 확정한 작성 가이드 저장"""
+        with closing(self._connect()) as conn, conn:
+            self._ensure_row(conn, user_key)
+            conn.execute(
+                "UPDATE profiles SET writing_guidelines = ?, updated_at = ? WHERE user_key = ?",
+                (writing_guidelines, time.time(), user_key),
+            )
+
+    def add_essays(
+        self,
+        user_key: str,
+        company_name: str,
+        position_name: str,
+        essays: list[tuple[str, str]],
+    ) -> None:
+        """확정된 자기소개서 저장 (같은 회사/직무/문항의 기존 확정본은 새 확정본으로 교체)
+
+        Args:
+            user_key: 사용자 키
+            company_name: 지원 회사명
+            position_name: 지원 직무명
+            essays: (문항, 확정본) 목록
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            self._ensure_row(conn, user_key)
+            conn.executemany(
+                "INSERT INTO essays (user_key, company_name, position_name, question_text, essay_text, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (user_key, company_name, position_name, question_text) "
+                "DO UPDATE SET essay_text = excluded.essay_text, created_at = excluded.created_at",
+                [(user_key, company_name, position_name, q, text, now) for q, text in essays],
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    @staticmethod
+    def _ensure_row(conn: sqlite3.Connection, user_key: str) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO profiles (user_key, updated_at) VALUES (?, ?)",
+            (user_key, time.time()),
+        )
+
+
+def _hash_passphrase(passphrase: str) -> str:
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(passphrase.encode("utf-8"), salt=salt, **_SCRYPT_PARAMS)
+    return f"scrypt${salt.hex()}${digest.hex()}"
+
+
+def _verify_passphrase(passphrase: str, stored: str) -> bool:
+    _, salt, digest = stored.split("$")
+    candidate = hashlib.scrypt(passphrase.encode("utf-8"), salt=bytes.fromhex(salt), **_SCRYPT_PARAMS)
+    return hmac.compare_digest(candidate.hex(), digest)
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    """프로세스 공용 프로필 저장소 (settings.profile_db_path)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ProfileStore(settings.profile_db_path)
+        return _store
+
+
+def apply_profile_to_state(profile: UserProfile, state: Any) -> None:
+    """저장된 프로필을 State에 미리 채움 (이미 파싱된 경험은 재파싱 없이 재사용)"""
+    state["user_experiences"] = profile.user_experiences
+    if profile.parsed_experiences is not None and profile.parsed_experiences_hash:
+        state["parsed_experiences"] = profile.parsed_experiences
+        state["parsed_experiences_hash"] = profile.parsed_experiences_hash
+    if profile.writing_guidelines:
+        state["writing_guidelines"] = profile.writing_guidelines
@@ -0,0 +1,176 @@
+"""기업 리서치 공용 캐시 (SQLite)
+
+같은 회사/직무에 지원하는 사용자들이 각자 Deep Research 리포트를 다시 만들지 않도록,
+정규화된 (회사명, 직무명) 키로 리포트를 버전별로 보관합니다.
+원문은 zlib으로 압축해 저장합니다. 사용자가 리포트를 고칠 수 있으므로 프롬프트용 축약본(출처/URL 제거)은
+저장하지 않고 전략 수립 시점에 `condense_research`로 만듭니다.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Optional
+
+from config.settings import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cache_key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    company_name TEXT NOT NULL,
+    position_name TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    content_z BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE (cache_key, version)
+);
+CREATE INDEX IF NOT EXISTS idx_research_key ON research_reports (cache_key, version DESC);
+"""
+
+# 회사명 정규화 시 제거할 법인 표기
+# (영문 표기는 단어 경계에서만 제거: "Vincent"의 "inc", "Corpus"의 "corp"는 유지)
+_CORP_MARKERS_RE = re.compile(
+    r"\(주\)|\(유\)|㈜|주식회사|유한회사|\bco\.?,?\s*ltd\b\.?|\binc\b\.?|\bcorp\b\.?", re.IGNORECASE
+)
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+
+# 축약본에서 제거할 요소 (Deep Research 리포트의 인용 번호, URL, 참고 문헌 섹션)
+_CITATION_RE = re.compile(r"\[\d+(?:\s*[,\-–]\s*\d+)*\]")
+_URL_RE = re.compile(r"\(?https?://\S+\)?")
+_REFERENCE_HEADER_RE = re.compile(
+    r"^\s*(?:#+\s*)?(?:\d+\.\s*)?(참고\s*문헌|참고\s*자료|출처|인용\s*자료|references|sources|works cited)\s*:?\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass
+class CachedResearch:
+    """캐시된 리서치 리포트"""
+    company_name: str
+    position_name: str
+    version: int
+    content: str
+    created_at: float
+
+    @property
+    def age_days(self) -> float:
+        return (time.time() - self.created_at) / 86400
+
+
+def research_cache_key(company_name: str, position_name: str) -> str:
+    """정규화된 (회사명, 직무명) 캐시 키 ('(주)카카오 ' 와 '카카오'는 같은 키)"""
+    company = _NON_WORD_RE.sub("", _CORP_MARKERS_RE.sub("", company_name).lower())
+    position = _NON_WORD_RE.sub("", position_name.lower())
+    return f"{company}|{position}"
+
+
+def condense_research(content: str) -> str:
+    """프롬프트용 리서치 축약본 (참고 문헌 섹션, 인용 번호, URL, 중복 빈 줄 제거)"""
+    match = _REFERENCE_HEADER_RE.search(content)
+    if match:
+        content = content[:match.start()]
+    content = _CITATION_RE.sub("", content)
+    content = _URL_RE.sub("", content)
+    lines = [line.rstrip() for line in content.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+class ResearchCache:
+    """회사/직무별 리서치 리포트 버전 저장소"""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(research_reports)")}
+            if "condensed" in columns:
+                # 읽지 않는 축약본 열 제거 (이전 버전 DB)
+                conn.execute("ALTER TABLE research_reports DROP COLUMN condensed")
+
+    def latest(self, company_name: str, position_name: str, ttl_days: float) -> Optional[CachedResearch]:
+        """TTL 이내의 최신 버전 리포트 조회
+
+        Args:
+            company_name: 회사명 (정규화 전)
+            position_name: 직무명 (정규화 전)
+            ttl_days: 신선도 기준 (이보다 오래된 리포트는 반환하지 않음)
+
+        Returns:
+            CachedResearch (없거나 만료되었으면 None)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT company_name, position_name, version, content_z, created_at "
+                "FROM research_reports WHERE cache_key = ? AND created_at >= ? "
+                "ORDER BY version DESC LIMIT 1",
+                (research_cache_key(company_name, position_name), time.time() - ttl_days * 86400),
+            ).fetchone()
+        if row is None:
+            return None
+        company, position, version, content_z, created_at = row
+        return CachedResearch(
+            company_name=company,
+            position_name=position,
+            version=version,
+            content=zlib.decompress(content_z).decode("utf-8"),
+            created_at=created_at,
+        )
+
+    def save(self, company_name: str, position_name: str, content: str) -> int:
+        """리포트 저장 (최신 버전과 내용이 같으면 새 버전을 만들지 않음)
+
+        Returns:
+            저장된(또는 동일 내용의 기존) 버전 번호
+        """
+        key = research_cache_key(company_name, position_name)
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        with closing(self._connect()) as conn, conn:
+            # 여러 세션이 동시에 저장해도 버전 번호가 겹치지 않도록 쓰기 잠금을 먼저 획득
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT version, content_hash FROM research_reports WHERE cache_key = ? "
+                "ORDER BY version DESC LIMIT 1",
+                (key,),
+            ).fetchone()
+            if row is not None and row[1] == content_hash:
+                return row[0]
+            version = (row[0] + 1) if row else 1
+            conn.execute(
+                "INSERT INTO research_reports (cache_key, version, company_name, position_name, "
+                "content_hash, content_z, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    version,
+                    company_name,
+                    position_name,
+                    content_hash,
+                    zlib.compress(content.encode("utf-8"), 9),
+                    time.time(),
+                ),
+            )
+        return version
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+
+_cache: Optional[ResearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_research_cache() -> ResearchCache:
+    """프로세스 공용 리서치 캐시 (settings.research_cache_db_path)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResearchCache(settings.research_cache_db_path)
+        return _cache
@@ -0,0 +1,150 @@
+"""ResumeState 스키마 버전 직렬화 (msgpack + zstd)
+
+ResumeState는 Pydantic 객체(CompanyResearch, WritingStrategy)와 dict, LangChain 메시지가 섞여 있어
+pickle로 저장하면 크고 코드 변경에 취약합니다. 여기서는 다음 형식으로 저장합니다.
+
+- 헤더: b"RST" + 스키마 버전(1바이트) + 압축 방식(1바이트)
+- 본문: ormsgpack으로 직렬화한 {"strings": 인턴 테이블, "data": 인코딩된 값}
+  - 일정 길이 이상의 문자열은 인턴 테이블에 한 번만 저장 (전략 문서가 state와 대화 이력에 중복 등장)
+  - Pydantic 모델과 메시지는 타입 태그가 붙은 dict로 변환
+- 압축: zstandard가 있으면 zstd, 없으면 zlib
+"""
+import zlib
+from typing import Any, Callable
+
+import ormsgpack
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+from pydantic import BaseModel
+
+from models.output_models import CompanyResearch, StrategyResponse, WritingStrategy
+
+try:
+    import zstandard
+except ImportError:  # zstandard는 langsmith의 전이 의존성이므로 없을 때는 zlib 사용
+    zstandard = None  # type: ignore[assignment]
+
+SCHEMA_VERSION = 1
+
+_MAGIC = b"RST"
+_CODEC_ZLIB = 0
+_CODEC_ZSTD = 1
+
+# 이 길이 이상의 문자열만 인턴 (짧은 키/상태값은 참조보다 그대로 쓰는 편이 작음)
+INTERN_MIN_CHARS = 32
+
+# 타입 태그 (일반 dict 키와 겹치지 않도록 '$' 접두사 사용)
+_TAG_STRING = "$s"
+_TAG_MODEL = "$m"
+_TAG_MESSAGES = "$msgs"
+_TAG_TUPLE = "$t"
+
+# 손상된 데이터를 복원할 때 나는 오류 (loads가 ValueError로 감싸 호출부가 한 종류만 처리하도록 함)
+_CORRUPT_DATA_ERRORS: tuple[type[Exception], ...] = (
+    zlib.error, ormsgpack.MsgpackDecodeError, KeyError, IndexError, TypeError, AttributeError,
+) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+_MODELS: dict[str, type[BaseModel]] = {
+    cls.__name__: cls for cls in (CompanyResearch, WritingStrategy, StrategyResponse)
+}
+
+# 이전 스키마 버전 데이터를 다음 버전으로 올리는 함수 {이전 버전: 변환 함수}
+_MIGRATIONS: dict[int, Callable[[Any], Any]] = {}
+
+
+def dumps(value: Any, level: int = 3) -> bytes:
+    """State 스냅샷 직렬화
+
+    Args:
+        value: 직렬화할 값 (보통 {"resume_state": ..., "strategy_messages": [...]})
+        level: 압축 레벨
+
+    Returns:
+        헤더가 포함된 직렬화 바이트
+
+    Raises:
+        TypeError: 지원하지 않는 타입이 포함된 경우
+    """
+    strings: list[str] = []
+    index: dict[str, int] = {}
+    data = _encode(value, strings, index)
+    body = ormsgpack.packb({"strings": strings, "data": data}, option=ormsgpack.OPT_NON_STR_KEYS)
+
+    if zstandard is not None:
+        codec, payload = _CODEC_ZSTD, zstandard.ZstdCompressor(level=level).compress(body)
+    else:
+        codec, payload = _CODEC_ZLIB, zlib.compress(body, level)
+    return _MAGIC + bytes([SCHEMA_VERSION, codec]) + payload
+
+
+def loads(data: bytes) -> Any:
+    """`dumps`로 만든 바이트를 복원 (이전 스키마 버전은 순서대로 마이그레이션)
+
+    Raises:
+        ValueError: 형식이 다르거나 지원하지 않는 버전/압축 방식이거나 데이터가 손상된 경우
+    """
+    if data[:3] != _MAGIC or len(data) < 5:
+        raise ValueError("ResumeState 직렬화 형식이 아닙니다.")
+    version, codec = data[3], data[4]
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 스키마 버전입니다: {version} (현재 {SCHEMA_VERSION})")
+
+    payload = data[5:]
+    if codec == _CODEC_ZSTD and zstandard is None:
+        raise ValueError("zstd로 압축된 데이터이지만 zstandard 패키지가 없습니다.")
+    if codec not in (_CODEC_ZSTD, _CODEC_ZLIB):
+        raise ValueError(f"알 수 없는 압축 방식입니다: {codec}")
+
+    try:
+        if codec == _CODEC_ZSTD:
+            body = zstandard.ZstdDecompressor().decompress(payload)
+        else:
+            body = zlib.decompress(payload)
+        unpacked = ormsgpack.unpackb(body, option=ormsgpack.OPT_NON_STR_KEYS)
+        value = _decode(unpacked["data"], unpacked["strings"])
+        for from_version in range(version, SCHEMA_VERSION):
+            value = _MIGRATIONS[from_version](value)
+    except _CORRUPT_DATA_ERRORS as e:
+        raise ValueError(f"손상된 ResumeState 데이터입니다: {type(e).__name__}: {e}") from e
+    return value
+
+
+def _encode(value: Any, strings: list[str], index: dict[str, int]) -> Any:
+    if isinstance(value, str):
+        if len(value) < INTERN_MIN_CHARS:
+            return value
+        if value not in index:
+            index[value] = len(strings)
+            strings.append(value)
+        return {_TAG_STRING: index[value]}
+    if value is None or isinstance(value, (bool, int, float, bytes)):
+        return value
+    if isinstance(value, BaseModel):
+        name = type(value).__name__
+        if name not in _MODELS:
+            raise TypeError(f"직렬화를 지원하지 않는 모델입니다: {name}")
+        return {_TAG_MODEL: name, "d": _encode(value.model_dump(), strings, index)}
+    if isinstance(value, list) and value and all(isinstance(v, BaseMessage) for v in value):
+        return {_TAG_MESSAGES: _encode(messages_to_dict(value), strings, index)}
+    if isinstance(value, tuple):
+        return {_TAG_TUPLE: [_encode(v, strings, index) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v, strings, index) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode(v, strings, index) for k, v in value.items()}
+    raise TypeError(f"직렬화를 지원하지 않는 타입입니다: {type(value).__name__}")
+
+
+def _decode(value: Any, strings: list[str]) -> Any:
+    if isinstance(value, list):
+        return [_decode(v, strings) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1 and _TAG_STRING in value:
+        return strings[value[_TAG_STRING]]
+    if _TAG_MODEL in value:
+        return _MODELS[value[_TAG_MODEL]].model_validate(_decode(value["d"], strings))
+    if len(value) == 1 and _TAG_MESSAGES in value:
+        return messages_from_dict(_decode(value[_TAG_MESSAGES], strings))
+    if len(value) == 1 and _TAG_TUPLE in value:
+        return tuple(_decode(v, strings) for v in value[_TAG_TUPLE])
+    return {k: _decode(v, strings) for k, v in value.items()}
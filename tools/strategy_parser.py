@@ -0,0 +1,136 @@
+"""전략 Markdown 로컬 파서
+
+INITIAL_STRATEGY_PROMPT가 강제하는 `# 1.` / `# 2.` / `# 3.` 섹션 구조를 정규식으로 읽어
+WritingStrategy를 구성합니다. LLM 추출 체인은 이 파서가 실패할 때만 사용합니다.
+"""
+import re
+from typing import Optional
+
+from models.output_models import WritingStrategy
+
+_SECTION_RE = re.compile(r"^#{1,3}\s*([123])\.\s*(.*)$", re.MULTILINE)
+_QUESTION_RE = re.compile(r"^[ \t]*(?:[-*][ \t]*)?(?:\*\*)?[ \t]*\[?문항[ \t]*\[?(\d+)", re.MULTILINE)
+_BULLET_RE = re.compile(r"^(\s*)(?:[-*+]|\d+\.)\s+(.*)$")
+_SUBHEADING_RE = re.compile(r"^#{2,6}\s+(.*)$")
+
+# 1번 섹션 라벨 키워드 -> WritingStrategy 필드 (앞에서부터 우선 매칭)
+_SECTION1_LABELS = [
+    (("약점", "gap", "보완"), "user_gaps"),
+    (("강점",), "user_strengths"),
+    (("인재상",), "talent_traits"),
+    (("키워드", "역량"), "core_competencies"),
+]
+
+
+def parse_strategy_markdown(content: str) -> Optional[WritingStrategy]:
+    """전략 Markdown 문서를 WritingStrategy로 변환
+
+    Args:
+        content: INITIAL_STRATEGY_PROMPT/FEEDBACK_STRATEGY_PROMPT 형식의 전략 문서
+
+    Returns:
+        WritingStrategy (필수 섹션이나 문항별 전략, 핵심 역량을 찾지 못하면 None)
+    """
+    sections = _split_sections(content)
+    if set(sections) != {"1", "2", "3"}:
+        return None
+
+    lists = _parse_matching_section(sections["1"])
+    question_strategy = _parse_question_section(sections["2"])
+    if not question_strategy or not lists["core_competencies"]:
+        return None
+
+    return WritingStrategy(
+        core_competencies=lists["core_competencies"],
+        talent_traits=lists["talent_traits"],
+        user_strengths=lists["user_strengths"],
+        user_gaps=lists["user_gaps"],
+        question_strategy=question_strategy,
+        cautions=_collect_bullets(sections["3"]),
+        content=content,
+    )
+
+
+def _split_sections(content: str) -> dict[str, str]:
+    matches = list(_SECTION_RE.finditer(content))
+    sections: dict[str, str] = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        # 같은 번호가 반복되면 첫 섹션만 사용
+        sections.setdefault(match.group(1), content[match.end():end])
+    return sections
+
+
+def _parse_matching_section(text: str) -> dict[str, list[str]]:
+    """1번 섹션: 라벨 줄(최상위 불릿/소제목) 아래의 값을 필드별로 수집"""
+    lists: dict[str, list[str]] = {field: [] for _, field in _SECTION1_LABELS}
+    current: Optional[str] = None
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        subheading = _SUBHEADING_RE.match(line.strip())
+        bullet = _BULLET_RE.match(line)
+
+        # 라벨 후보: 소제목 또는 굵게/콜론으로 표시된 최상위 불릿 (일반 항목의 '역량' 등 오인 방지)
+        is_label_bullet = bool(
+            bullet and not bullet.group(1)
+            and (bullet.group(2).startswith("**") or ":" in bullet.group(2))
+        )
+        if subheading or is_label_bullet:
+            body = subheading.group(1) if subheading else bullet.group(2)  # type: ignore[union-attr]
+            label, _, value = _clean(body).partition(":")
+            field = _classify_label(label)
+            if field is not None:
+                current = field
+                lists[field].extend(_split_items(value))
+                continue
+            if subheading:
+                current = None
+                continue
+
+        if current is not None:
+            item = _clean(bullet.group(2) if bullet else line)
+            if item:
+                lists[current].append(item)
+
+    return lists
+
+
+def _parse_question_section(text: str) -> dict[str, str]:
+    """2번 섹션: `문항 N` 표기를 기준으로 블록을 나눔"""
+    matches = list(_QUESTION_RE.finditer(text))
+    strategy: dict[str, str] = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        block = text[match.start():end].strip()
+        if block:
+            strategy.setdefault(match.group(1), block)
+    return strategy
+
+
+def _collect_bullets(text: str) -> list[str]:
+    items = []
+    for line in text.splitlines():
+        bullet = _BULLET_RE.match(line)
+        if bullet:
+            item = _clean(bullet.group(2))
+            if item:
+                items.append(item)
+    return items
+
+
+def _classify_label(label: str) -> Optional[str]:
+    lowered = label.lower()
+    for keywords, field in _SECTION1_LABELS:
+        if any(keyword in lowered for keyword in keywords):
+            return field
+    return None
+
+
+def _split_items(value: str) -> list[str]:
+    return [item for item in (_clean(v) for v in re.split(r"[,，·/]", value)) if item]
+
+
+def _clean(text: str) -> str:
+    return text.replace("**", "").replace("__", "").strip(" \t-*`")
@@ -0,0 +1,94 @@
+"""문구 기반 수정 연산 적용기
+
+LLM이 원문 전체를 다시 출력하는 대신 반환한 수정 연산(TextEdit: replace/insert/delete)을
+로컬에서 원문에 적용합니다. 위치는 글자 오프셋 대신 원문에 있는 문구(target)로 지정하므로
+모델이 오프셋을 잘못 세어도 안전하고, 찾지 못하면 PatchApplyError로 전체 재작성에 넘길 수 있습니다.
+"""
+import re
+from typing import Optional, Sequence
+
+from models.output_models import TextEdit
+
+
+class PatchApplyError(ValueError):
+    """수정 연산의 target을 원문에서 찾지 못한 경우"""
+
+
+def apply_edits(text: str, edits: Sequence[TextEdit]) -> str:
+    """수정 연산을 순서대로 적용
+
+    각 연산의 target은 직전 연산 위치 이후에서 먼저 찾고, 없으면 원문 처음부터 찾습니다.
+    정확히 일치하는 문구가 없으면 공백/줄바꿈 차이만 무시하고 한 번 더 찾습니다.
+    공백 정리는 수정한 구간과 그 경계에만 적용하므로 나머지 원문의 서식은 그대로 유지됩니다.
+
+    Args:
+        text: 원문
+        edits: 적용할 수정 연산 목록
+
+    Returns:
+        수정된 텍스트
+
+    Raises:
+        PatchApplyError: target이 비어 있거나 원문에서 찾지 못한 경우
+    """
+    cursor = 0
+    for i, edit in enumerate(edits):
+        if not edit.target:
+            raise PatchApplyError(f"{i + 1}번째 수정 연산의 target이 비어 있습니다.")
+        span = _find_span(text, edit.target, cursor) or _find_span(text, edit.target, 0)
+        if span is None:
+            raise PatchApplyError(f"{i + 1}번째 수정 연산의 문구를 원문에서 찾지 못했습니다: {edit.target[:40]!r}")
+
+        start, end = span
+        if edit.op == "replace":
+            replacement = edit.text
+        elif edit.op == "insert":
+            replacement = text[start:end] + edit.text
+        else:
+            replacement = ""
+        text, cursor = _splice(text, start, end, replacement)
+
+    return text
+
+
+def _find_span(text: str, target: str, start: int) -> Optional[tuple[int, int]]:
+    """target의 원문 내 위치 (정확 일치 우선, 다음으로 공백 차이 무시)"""
+    pos = text.find(target, start)
+    if pos >= 0:
+        return pos, pos + len(target)
+
+    words = target.split()
+    if not words:
+        return None
+    match = re.compile(r"\s+".join(re.escape(w) for w in words)).search(text, start)
+    return match.span() if match else None
+
+
+def _splice(text: str, start: int, end: int, replacement: str) -> tuple[str, int]:
+    """text[start:end]를 replacement로 바꾸고 바뀐 구간과 양옆 공백만 정리
+
+    Returns:
+        (수정된 텍스트, 정리한 구간의 끝 위치)
+    """
+    left = start
+    while left > 0 and text[left - 1] in " \t":
+        left -= 1
+    if left == 0 or text[left - 1] == "\n":
+        # 줄 앞 들여쓰기는 건드리지 않음
+        left = start
+    right = end
+    while right < len(text) and text[right] in " \t":
+        right += 1
+
+    segment = _tidy_spaces(text[left:start] + replacement + text[end:right])
+    if left == 0 or text[left - 1] == "\n":
+        segment = segment.lstrip(" \t")
+    if right == len(text) or text[right] in "\n.,!?":
+        segment = segment.rstrip(" \t")
+    return text[:left] + segment + text[right:], left + len(segment)
+
+
+def _tidy_spaces(text: str) -> str:
+    """삭제/교체로 생긴 연속 공백, 구두점/줄바꿈 앞 공백 정리 (줄바꿈은 유지)"""
+    text = re.sub(r"[ \t]{2,}", " ", text)
+    return re.sub(r"[ \t]+([.,!?\n])", r"\1", text)
@@ -1,46 +1,414 @@
-"""웹 스크래핑 도구"""
+"""웹 스크래핑 도구
+
+채용 페이지에 schema.org `JobPosting` JSON-LD가 있으면 LLM 없이 회사명/직무명/공고 본문을 구조적으로
+추출하고, 없으면 OpenGraph 메타데이터로 회사명/직무명만 채웁니다. 페이지 전체 텍스트는 항상 함께 반환합니다.
+
+채용 포털은 실제 공고를 iframe에 넣거나 탭(상세/자격요건/복리후생)별 URL에서 따로 불러오는 경우가 많아,
+최상위 문서에서 iframe/frame과 탭 URL을 찾아 하위 페이지를 병렬로 가져온 뒤 줄 단위로 중복을 제거해
+합칩니다. 한 포털에 요청이 몰리지 않도록 도메인별 동시 요청 수를 제한합니다.
+"""
+import html
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+from urllib.parse import urldefrag, urljoin, urlsplit
+
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional
+from bs4 import BeautifulSoup, Tag
 
+from config.cassette import cassette_http_get
+from config.settings import settings
+
+# 구조화 공고 본문이 이 길이 이상이어야 LLM 정리 없이 사용 (제목/개요만 있는 JSON-LD 제외)
+MIN_STRUCTURED_DESCRIPTION_CHARS = 200
+
+# OpenGraph 제목에서 회사명/사이트명을 분리하는 구분자
+_TITLE_SEPARATORS = (" | ", " - ", " – ", " :: ", " : ")
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# 탭 패널을 비동기로 불러오는 요소의 URL 속성 (img/script의 data-src는 제외)
+_TAB_URL_ATTRS = ("data-url", "data-href", "data-src", "data-load")
+
+# 공고와 무관한 임베드(동영상, 지도, 광고/분석)는 따라가지 않음
+_IGNORED_HOSTS = (
+    "youtube.com", "youtube-nocookie.com", "vimeo.com", "google.com", "doubleclick.net",
+    "googletagmanager.com", "facebook.com", "map.naver.com", "map.kakao.com",
+)
+_IGNORED_EXTENSIONS = (".js", ".css", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".pdf", ".mp4")
+
+
+@dataclass
+class JobPostingData:
+    """페이지에 포함된 구조화 채용 정보 (source: "json-ld" 또는 "opengraph")"""
+    source: str
+    title: str = ""
+    company_name: str = ""
+    description: str = ""
+    sections: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        """LLM 정리 없이 공고 본문으로 쓸 수 있는지 (JSON-LD이고 회사/직무/충분한 설명 포함)"""
+        return (
+            self.source == "json-ld"
+            and bool(self.title and self.company_name)
+            and len(self.description) >= MIN_STRUCTURED_DESCRIPTION_CHARS
+        )
+
+    def to_posting_text(self) -> str:
+        """검증/작성 단계에 넘길 정리된 공고 본문"""
+        parts = [f"[회사] {self.company_name}", f"[모집 직무] {self.title}"]
+        if self.description:
+            parts.append(f"[직무 설명]\n{self.description}")
+        for label, text in self.sections.items():
+            parts.append(f"[{label}]\n{text}" if "\n" in text else f"[{label}] {text}")
+        return "\n\n".join(parts)
+
+
+@dataclass
+class ScrapedPosting:
+    """스크래핑 결과 (페이지 전체 텍스트 + 구조화 데이터)
+
+    하위 페이지를 합친 경우 text는 중복 줄을 제거한 병합본이고, sources는 가져온 페이지 URL 목록입니다.
+    """
+    text: str
+    structured: Optional[JobPostingData] = None
+    sources: list[str] = field(default_factory=list)
+
+    @property
+    def posting_text(self) -> str:
+        """공고 본문으로 쓸 텍스트 (구조화 데이터가 충분하면 정리본, 아니면 페이지 텍스트)"""
+        if self.structured is not None and self.structured.is_complete:
+            return self.structured.to_posting_text()
+        return self.text
+
+
+# JSON-LD 속성 -> 정리본 섹션 라벨 (표시 순서)
+_JSON_LD_SECTIONS = [
+    ("responsibilities", "주요 업무"),
+    ("qualifications", "자격 요건"),
+    ("skills", "기술/역량"),
+    ("experienceRequirements", "경력"),
+    ("educationRequirements", "학력"),
+    ("employmentType", "고용 형태"),
+    ("jobLocation", "근무지"),
+    ("validThrough", "마감일"),
+]
+
+
+def scrape_job_posting_page(url: str, timeout: int = 10) -> Optional[ScrapedPosting]:
+    """채용 공고 URL에서 페이지 텍스트와 구조화 채용 정보 추출
+
+    settings.scrape_follow_subpages가 켜져 있으면 iframe/탭 하위 페이지까지 병렬로 가져와 합칩니다.
 
-def scrape_job_posting(url: str, timeout: int = 10) -> Optional[str]:
-    """채용 공고 URL에서 텍스트 추출
-    
     Args:
         url: 채용 공고 URL
         timeout: 요청 타임아웃 (초)
-        
+
     Returns:
-        추출된 텍스트 (실패 시 None)
-        
-    Raises:
-        requests.RequestException: 네트워크 오류
+        ScrapedPosting (최상위 페이지를 가져오지 못하면 None, 하위 페이지 실패는 건너뜀)
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # script, style 태그 제거
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # 텍스트 추출 및 정리
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = "\n".join(chunk for chunk in chunks if chunk)
-        
-        return text
-        
+        page_html = _fetch_html(url, timeout)
+        if not settings.scrape_follow_subpages:
+            return parse_job_posting_html(page_html)
+
+        soup = BeautifulSoup(page_html, "html.parser")
+        links = discover_subpage_urls(soup, url)
+        pages = [(url, _parse_soup(soup))] + _fetch_subpages(links, url, timeout)
+        return merge_scraped_pages(pages)
+
     except requests.RequestException as e:
         print(f"웹 스크래핑 오류: {e}")
         return None
     except Exception as e:
         print(f"파싱 오류: {e}")
         return None
+
+
+def scrape_job_posting(url: str, timeout: int = 10) -> Optional[str]:
+    """채용 공고 URL에서 텍스트 추출
+
+    Args:
+        url: 채용 공고 URL
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        추출된 텍스트 (구조화 채용 정보가 충분하면 정리본, 실패 시 None)
+    """
+    page = scrape_job_posting_page(url, timeout)
+    return page.posting_text if page else None
+
+
+def parse_job_posting_html(html: str) -> ScrapedPosting:
+    """HTML에서 구조화 채용 정보와 페이지 텍스트 추출"""
+    return _parse_soup(BeautifulSoup(html, "html.parser"))
+
+
+def discover_subpage_urls(soup: BeautifulSoup, base_url: str) -> list[str]:
+    """공고 본문이 들어 있을 수 있는 하위 페이지 URL (iframe/frame, 탭 링크, 탭 패널 로드 URL)
+
+    Args:
+        soup: 파싱된 페이지
+        base_url: 페이지 URL (상대 경로 해석 기준)
+
+    Returns:
+        절대 URL 목록 (등장 순서, 중복/자기 자신/무관한 임베드 제외)
+    """
+    candidates: list[str] = []
+    for frame in soup.find_all(["iframe", "frame"]):
+        candidates.append(_attr(frame, "src"))
+    for tab in soup.select('a[role="tab"][href], [role="tablist"] a[href]'):
+        candidates.append(_attr(tab, "href"))
+    for element in soup.find_all(lambda tag: tag.name not in ("img", "script", "source", "video")):
+        for attr in _TAB_URL_ATTRS:
+            if element.get(attr):
+                candidates.append(_attr(element, attr))
+
+    page_url = urldefrag(base_url).url
+    urls: list[str] = []
+    for candidate in candidates:
+        candidate = candidate.strip()
+        if not candidate or candidate.startswith(("#", "javascript:", "about:", "mailto:", "data:")):
+            continue
+        absolute = urldefrag(urljoin(base_url, candidate)).url
+        if absolute != page_url and absolute not in urls and _is_followable(absolute):
+            urls.append(absolute)
+    return urls
+
+
+def merge_scraped_pages(pages: list[tuple[str, ScrapedPosting]]) -> ScrapedPosting:
+    """페이지별 스크래핑 결과를 하나로 병합
+
+    텍스트는 페이지 순서대로 이어 붙이되 이미 나온 줄(공통 헤더/메뉴/푸터 등)은 제외하고,
+    구조화 정보는 정리본으로 쓸 수 있는 첫 페이지(없으면 최상위 페이지 우선 첫 결과)를 사용합니다.
+
+    Args:
+        pages: (URL, 스크래핑 결과) 목록, 첫 항목이 최상위 페이지
+
+    Returns:
+        병합된 ScrapedPosting
+    """
+    seen: set[str] = set()
+    lines: list[str] = []
+    for _, page in pages:
+        for line in page.text.splitlines():
+            if line not in seen:
+                seen.add(line)
+                lines.append(line)
+
+    found = [page.structured for _, page in pages if page.structured is not None]
+    complete = [data for data in found if data.is_complete]
+    structured = complete[0] if complete else (found[0] if found else None)
+    return ScrapedPosting(text="\n".join(lines), structured=structured, sources=[url for url, _ in pages])
+
+
+def _fetch_html(url: str, timeout: int) -> str:
+    def fetch() -> tuple[int, str]:
+        with _domain_slot(url):
+            response = requests.get(url, headers=_HEADERS, timeout=timeout)
+        return response.status_code, response.text
+
+    # settings.cassette_mode에 따라 응답을 녹화하거나 네트워크 없이 재생 (config.cassette)
+    status, text = cassette_http_get(url, fetch)
+    if status >= 400:
+        raise requests.HTTPError(f"{status} Error for url: {url}")
+    return text
+
+
+def _fetch_subpages(links: list[str], root_url: str, timeout: int) -> list[tuple[str, ScrapedPosting]]:
+    """하위 페이지를 깊이 단위로 병렬 수집 (실패한 페이지는 건너뛰고, 발견 순서 유지)"""
+    visited = {urldefrag(root_url).url}
+    pages: list[tuple[str, ScrapedPosting]] = []
+    budget = settings.scrape_max_subpages
+    depth = 1
+    with ThreadPoolExecutor(max_workers=settings.scrape_max_workers, thread_name_prefix="scrape") as executor:
+        while links and budget > 0 and depth <= settings.scrape_max_depth:
+            level = [link for link in dict.fromkeys(links) if link not in visited][:budget]
+            visited.update(level)
+            budget -= len(level)
+            links = []
+            for link, result in zip(level, executor.map(lambda u: _fetch_subpage(u, timeout), level)):
+                if result is None:
+                    continue
+                page, child_links = result
+                pages.append((link, page))
+                links.extend(child_links)
+            depth += 1
+    return pages
+
+
+def _fetch_subpage(url: str, timeout: int) -> Optional[tuple[ScrapedPosting, list[str]]]:
+    try:
+        soup = BeautifulSoup(_fetch_html(url, timeout), "html.parser")
+        return _parse_soup(soup), discover_subpage_urls(soup, url)
+    except Exception as e:
+        print(f"하위 페이지 스크래핑 오류 ({url}): {e}")
+        return None
+
+
+def _parse_soup(soup: BeautifulSoup) -> ScrapedPosting:
+    # script 태그를 지우기 전에 JSON-LD/메타데이터부터 읽음
+    structured = extract_job_posting_data(soup)
+
+    # script, style 태그 제거
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # 텍스트 추출 및 정리
+    text = soup.get_text()
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = "\n".join(chunk for chunk in chunks if chunk)
+
+    return ScrapedPosting(text=text, structured=structured)
+
+
+def _is_followable(url: str) -> bool:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    if parts.path.lower().endswith(_IGNORED_EXTENSIONS):
+        return False
+    host = parts.hostname.lower()
+    return not any(host == ignored or host.endswith("." + ignored) for ignored in _IGNORED_HOSTS)
+
+
+# 도메인(host:port)별 동시 요청 슬롯 (프로세스 전체 공유: 여러 사용자가 같은 포털을 스크래핑해도 제한 유지)
+_domain_slots: dict[str, threading.BoundedSemaphore] = defaultdict(
+    lambda: threading.BoundedSemaphore(settings.scrape_per_domain_concurrency)
+)
+_domain_slots_lock = threading.Lock()
+
+
+@contextmanager
+def _domain_slot(url: str) -> Iterator[None]:
+    with _domain_slots_lock:
+        slot = _domain_slots[urlsplit(url).netloc.lower()]
+    with slot:
+        yield
+
+
+def extract_job_posting_data(soup: BeautifulSoup) -> Optional[JobPostingData]:
+    """JSON-LD `JobPosting`(우선) 또는 OpenGraph 메타데이터 추출
+
+    Args:
+        soup: 파싱된 페이지 (script 태그가 남아 있어야 함)
+
+    Returns:
+        JobPostingData (둘 다 없으면 None)
+    """
+    for node in _json_ld_nodes(soup):
+        if _is_job_posting(node):
+            return _from_json_ld(node)
+    return _from_open_graph(soup)
+
+
+def _json_ld_nodes(soup: BeautifulSoup) -> list[dict[str, Any]]:
+    """페이지의 모든 JSON-LD 객체 (배열과 @graph는 펼침, 형식 오류 블록은 건너뜀)"""
+    nodes: list[dict[str, Any]] = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or script.get_text() or "", strict=False)
+        except ValueError:
+            continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop(0)
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                nodes.append(item)
+                if isinstance(item.get("@graph"), list):
+                    stack.extend(item["@graph"])
+    return nodes
+
+
+def _is_job_posting(node: dict[str, Any]) -> bool:
+    types = node.get("@type")
+    types = types if isinstance(types, list) else [types]
+    return any(isinstance(t, str) and t.rsplit("/", 1)[-1] == "JobPosting" for t in types)
+
+
+def _from_json_ld(node: dict[str, Any]) -> JobPostingData:
+    sections = {}
+    for key, label in _JSON_LD_SECTIONS:
+        text = _to_text(node.get(key))
+        if text:
+            sections[label] = text
+    return JobPostingData(
+        source="json-ld",
+        title=_to_text(node.get("title")),
+        company_name=_to_text(node.get("hiringOrganization")),
+        description=_to_text(node.get("description")),
+        sections=sections,
+    )
+
+
+def _to_text(value: Any) -> str:
+    """JSON-LD 값(HTML 문자열, 객체, 배열)을 평문으로 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        texts = [_to_text(v) for v in value]
+        return "\n".join(f"- {t}" for t in texts if t) if len(texts) > 1 else "".join(texts)
+    if isinstance(value, dict):
+        if "address" in value:
+            return _to_text(value["address"])
+        if value.get("@type") == "PostalAddress":
+            parts = [value.get(k) for k in ("addressRegion", "addressLocality", "streetAddress")]
+            return " ".join(str(p) for p in parts if p)
+        if "monthsOfExperience" in value:
+            return f"{value['monthsOfExperience']}개월 이상"
+        for key in ("name", "description", "credentialCategory"):
+            if value.get(key):
+                return _to_text(value[key])
+        return ""
+    text = str(value)
+    if "&lt;" in text:
+        # HTML이 한 번 더 이스케이프된 설명 (일부 채용 사이트)
+        text = html.unescape(text)
+    if "<" in text and ">" in text:
+        text = BeautifulSoup(text, "html.parser").get_text("\n")
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _attr(tag: Tag, name: str) -> str:
+    """속성 값 문자열 (class처럼 여러 값인 속성은 공백으로 연결, 없으면 빈 문자열)"""
+    value = tag.get(name)
+    if isinstance(value, list):
+        return " ".join(value)
+    return value or ""
+
+
+def _from_open_graph(soup: BeautifulSoup) -> Optional[JobPostingData]:
+    meta = {
+        _attr(tag, "property") or _attr(tag, "name"): _attr(tag, "content").strip()
+        for tag in soup.find_all("meta")
+        if (_attr(tag, "property") or _attr(tag, "name")).startswith("og:")
+    }
+    title = meta.get("og:title", "")
+    if not title:
+        return None
+
+    company = meta.get("og:site_name", "")
+    # "백엔드 개발자 | 회사명" 형태의 제목에서 사이트명 부분 제거
+    for separator in _TITLE_SEPARATORS:
+        parts = [p.strip() for p in title.split(separator)]
+        if company and company in parts[1:]:
+            title = separator.join(p for p in parts if p != company)
+            break
+    return JobPostingData(
+        source="opengraph",
+        title=title,
+        company_name=company,
+        description=meta.get("og:description", ""),
+    )
@@ -0,0 +1,36 @@
+import html
+from typing import Optional
+
+import streamlit as st
+
+from tools.guideline_linter import LintViolation, lint_text, violation_summary
+
+
+def render_guideline_violations(text: str, guidelines: Optional[str], expanded: bool = False):
+    """본문의 가이드라인 위반을 요약하고, 위반 위치를 강조한 본문을 표시 (위반이 없으면 표시 안 함)"""
+    violations = lint_text(text, guidelines)
+    if not violations:
+        return
+
+    with st.expander(f"⚠️ 가이드라인 위반 {len(violations)}건: {', '.join(violation_summary(violations))}", expanded=expanded):
+        st.markdown(
+            f'<div style="white-space: pre-wrap; line-height: 1.7;">{highlight_violations(text, violations)}</div>',
+            unsafe_allow_html=True
+        )
+
+
+def highlight_violations(text: str, violations: list[LintViolation]) -> str:
+    """위반 구간을 <mark>로 감싼 HTML (본문은 이스케이프, 겹치는 구간은 앞의 것만)"""
+    parts = []
+    pos = 0
+    for v in violations:
+        if v.start < pos:
+            continue
+        parts.append(html.escape(text[pos:v.start]))
+        parts.append(
+            f'<mark style="background-color: #ffd6d6;" title="{html.escape(v.message)}">'
+            f"{html.escape(text[v.start:v.end])}</mark>"
+        )
+        pos = v.end
+    parts.append(html.escape(text[pos:]))
+    return "".join(parts)
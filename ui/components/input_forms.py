@@ -2,7 +2,7 @@ import streamlit as st
 from typing import List
 import uuid
 from models.input_models import EssayQuestion
-from tools.web_scraper import scrape_job_posting
+from tools.web_scraper import scrape_job_posting_page
 
 def render_job_details_form(disabled: bool = False):
     """기본 채용 정보 입력 폼"""
@@ -44,11 +44,14 @@ def render_job_details_form(disabled: bool = False):
                 st.warning("⚠️ URL을 먼저 입력해주세요.")
             else:
                 with st.spinner("채용공고를 불러오는 중..."):
-                    scraped_content = scrape_job_posting(url)
-                    if scraped_content:
+                    page = scrape_job_posting_page(url)
+                    if page:
                         # 성공: 텍스트 영역에 자동 입력
+                        scraped_content = page.posting_text
                         st.session_state["input_job_posting"] = scraped_content
-                        st.success(f"✅ 스크래핑 성공! ({len(scraped_content)}글자)")
+                        _prefill_from_structured_data(page.structured)
+                        merged = f", 하위 페이지 {len(page.sources) - 1}개 병합" if len(page.sources) > 1 else ""
+                        st.success(f"✅ 스크래핑 성공! ({len(scraped_content)}글자{merged})")
                         st.rerun()
                     else:
                         # 실패: 사용자에게 직접 복사 안내
@@ -65,7 +68,22 @@ def render_job_details_form(disabled: bool = False):
         placeholder="위 '스크래핑' 버튼을 눌러 자동으로 불러오거나, 직접 복사해서 붙여넣으세요.",
         disabled=disabled
     )
-    st.caption("💡 팁: URL을 입력하고 '스크래핑' 버튼을 누르면 자동으로 내용이 채워집니다.")
+    if st.session_state.get("scraped_structured_posting"):
+        st.caption("🧩 채용 페이지의 구조화 데이터(JSON-LD)로 정리한 공고입니다. 그대로 두면 2단계에서 공고 정리를 생략합니다.")
+    else:
+        st.caption("💡 팁: URL을 입력하고 '스크래핑' 버튼을 누르면 자동으로 내용이 채워집니다.")
+
+def _prefill_from_structured_data(structured):
+    """구조화 채용 정보로 비어 있는 회사명/직무명을 채우고, 정리본으로 쓸 수 있으면 기록"""
+    if structured is not None:
+        if not st.session_state.get("input_company_name", "").strip() and structured.company_name:
+            st.session_state["input_company_name"] = structured.company_name
+        if not st.session_state.get("input_position_name", "").strip() and structured.title:
+            st.session_state["input_position_name"] = structured.title
+    # 2단계 검증에서 공고가 이 정리본 그대로인지 비교하는 데 사용
+    st.session_state["scraped_structured_posting"] = (
+        structured.to_posting_text() if structured is not None and structured.is_complete else None
+    )
 
 def render_essay_questions_form(disabled: bool = False):
     """자기소개서 문항 입력 폼 (동적 추가/삭제)"""
@@ -0,0 +1,60 @@
+import streamlit as st
+from tools.profile_store import ProfileAccessError, apply_profile_to_state, get_profile_store
+
+def current_profile_key() -> str:
+    """현재 세션에 연결된 프로필 키 (없으면 빈 문자열)"""
+    return st.session_state.get("profile_key", "")
+
+def render_profile_form(disabled: bool = False):
+    """저장된 프로필 불러오기 폼"""
+    st.subheader("내 프로필")
+    
+    col_key, col_secret, col_btn = st.columns([2, 2, 1])
+    with col_key:
+        st.text_input(
+            "프로필 이름",
+            key="input_profile_key",
+            value=current_profile_key(),
+            placeholder="예: 홍길동 (입력하면 경험/가이드/확정본이 이 이름으로 저장됩니다)",
+            disabled=disabled
+        )
+    with col_secret:
+        st.text_input(
+            "비밀 문구",
+            key="input_profile_passphrase",
+            type="password",
+            placeholder="새 프로필이면 지금 입력한 문구로 잠깁니다",
+            disabled=disabled
+        )
+    with col_btn:
+        st.markdown("<br>", unsafe_allow_html=True)  # 버튼 정렬을 위한 여백
+        if st.button("📂 불러오기", key="load_profile_btn", use_container_width=True, disabled=disabled):
+            profile_key = st.session_state.get("input_profile_key", "").strip()
+            passphrase = st.session_state.get("input_profile_passphrase", "")
+            if not profile_key or not passphrase:
+                st.warning("⚠️ 프로필 이름과 비밀 문구를 먼저 입력해주세요.")
+                return
+            store = get_profile_store()
+            try:
+                existing = store.open(profile_key, passphrase)
+            except ProfileAccessError as e:
+                st.error(f"❌ {e}")
+                return
+            st.session_state.profile_key = profile_key
+            profile = store.load(profile_key) if existing else None
+            if profile is None:
+                st.info("새 프로필을 만들었습니다. 1단계를 저장하면 이 프로필에 저장됩니다.")
+            else:
+                apply_profile_to_state(profile, st.session_state.resume_state)
+                # 입력 위젯에도 바로 반영
+                st.session_state["input_user_experiences"] = profile.user_experiences
+                st.session_state.profile_essays = profile.essays
+                st.rerun()
+    
+    essays = st.session_state.get("profile_essays", [])
+    if essays:
+        with st.expander(f"이전에 확정한 자기소개서 ({len(essays)}건)", expanded=False):
+            for essay in essays:
+                st.markdown(f"**{essay.company_name} / {essay.position_name}** - {essay.question_text}")
+                st.text(essay.essay_text)
+                st.markdown("---")
@@ -0,0 +1,56 @@
+import streamlit as st
+from config.settings import settings
+from tools.state_serializer import dumps, loads
+
+# 내보내기/불러오기 대상 세션 키 (resume_state 외에 4단계 대화 이력 포함)
+SNAPSHOT_KEYS = ("resume_state", "strategy_messages")
+
+def render_session_export():
+    """현재 작업 상태를 파일로 내보내는 다운로드 버튼"""
+    snapshot = {key: st.session_state[key] for key in SNAPSHOT_KEYS if key in st.session_state}
+    st.download_button(
+        "📦 작업 상태 내보내기",
+        data=dumps(snapshot),
+        file_name="resume_state.rst",
+        mime="application/octet-stream",
+        on_click="ignore",  # 다운로드만 하고 페이지는 다시 실행하지 않음
+    )
+
+def render_session_import():
+    """내보낸 작업 상태 파일을 불러와 세션을 복원"""
+    with st.expander("📦 저장된 작업 불러오기", expanded=False):
+        uploaded = st.file_uploader("작업 상태 파일 (.rst)", type=["rst"], key="session_import_file")
+        if uploaded is not None and st.button("불러오기", key="session_import_btn"):
+            try:
+                snapshot = load_snapshot(uploaded.getvalue())
+            except ValueError as e:
+                st.error(f"❌ 파일을 불러오지 못했습니다: {str(e)}")
+                return
+            for key, value in snapshot.items():
+                if key in SNAPSHOT_KEYS:
+                    st.session_state[key] = value
+            # 입력 위젯이 이전 값을 유지하지 않도록 경험 입력 키 갱신
+            st.session_state["input_user_experiences"] = snapshot["resume_state"].get("user_experiences", "")
+            st.rerun()
+
+def load_snapshot(data: bytes) -> dict:
+    """내보낸 작업 상태 파일을 복원하고 형식(resume_state를 담은 dict)을 확인
+
+    Raises:
+        ValueError: 직렬화 형식이 아니거나 손상되었거나, 작업 상태 형식이 아닌 경우
+    """
+    snapshot = loads(data)
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("resume_state"), dict):
+        raise ValueError("작업 상태 파일 형식이 아닙니다.")
+    return snapshot
+
+def trim_session_state(session_state) -> None:
+    """세션 메모리 상한 유지 (동시 사용자가 많을 때 세션별 메모리 증가 방지)
+
+    - 전략 대화 이력은 최근 settings.session_max_strategy_messages개만 보관
+      (프롬프트에는 토큰 예산만큼만 들어가고, 확정 시에는 마지막 AI 메시지만 사용)
+    """
+    messages = session_state.get("strategy_messages")
+    limit = settings.session_max_strategy_messages
+    if messages and len(messages) > limit:
+        session_state["strategy_messages"] = messages[-limit:]
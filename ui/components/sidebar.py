@@ -57,5 +57,96 @@ def render_sidebar():
     from config.settings import settings
     if settings.debug:
         st.markdown("---")
-        with st.expander("Debug Info"):
-            st.json(state)
+        _render_debug_info()
+
+@st.fragment
+def _render_debug_info():
+    """디버그 정보 (fragment: 토글/새로고침 시 사이드바의 이 부분만 재실행)"""
+    from config.model_health import breaker_snapshots
+    from config.model_router import recent_decisions
+    from config.single_flight import coalescing_snapshots
+    
+    # State 전체 JSON은 커서 켰을 때만 렌더링
+    if st.toggle("Debug Info", key="show_debug_info"):
+        st.json(st.session_state.resume_state)
+        
+        # 모델별 서킷 브레이커 상태 (프로세스 공용)
+        st.markdown("**모델 상태 (Circuit Breaker)**")
+        st.button("🔄 새로고침", key="refresh_debug_info")
+        snapshots = breaker_snapshots()
+        if snapshots:
+            st.dataframe(snapshots, hide_index=True, use_container_width=True)
+        else:
+            st.caption("아직 호출된 모델이 없습니다.")
+        
+        # 작업별 모델 라우팅 결정 (최신순)
+        st.markdown("**모델 라우팅 결정**")
+        decisions = recent_decisions()
+        if decisions:
+            st.dataframe(decisions, hide_index=True, use_container_width=True)
+        else:
+            st.caption("아직 라우팅된 작업이 없습니다.")
+        
+        # 동일 요청 병합 통계 (프로세스 공용)
+        st.markdown("**동일 요청 병합 (Single-flight)**")
+        coalescing = coalescing_snapshots()
+        if coalescing:
+            st.dataframe(coalescing, hide_index=True, use_container_width=True)
+        else:
+            st.caption("아직 병합 대상 호출이 없습니다.")
+        
+        _render_rerun_profiles()
+
+def _render_rerun_profiles():
+    """최근 rerun 구간별 시간과 선택한 rerun의 프로파일러 결과 (세션별)"""
+    st.markdown("**rerun 프로파일링**")
+    col_mode, col_apply = st.columns([2, 1])
+    with col_mode:
+        mode = st.selectbox(
+            "프로파일러", ["cprofile", "sampling"], key="profile_mode_choice", label_visibility="collapsed"
+        )
+    with col_apply:
+        # fragment 안의 버튼은 이 부분만 재실행하므로, 다음 전체 rerun(화면 조작)에 적용됨
+        if st.button("다음 rerun", key="profile_next_rerun_btn", use_container_width=True):
+            st.session_state.profile_next_rerun = mode
+    if st.session_state.get("profile_next_rerun"):
+        st.caption(f"다음 화면 조작 시 {st.session_state.profile_next_rerun}로 프로파일링합니다.")
+    
+    history = list(st.session_state.get("rerun_profiles", []))
+    if not history:
+        st.caption("아직 측정된 rerun이 없습니다.")
+        return
+    st.dataframe([p.summary() for p in reversed(history)], hide_index=True, use_container_width=True)
+    
+    profiles = {p.rerun: p for p in reversed(history)}
+    selected = st.selectbox(
+        "상세 보기", list(profiles), key="profile_detail_choice",
+        format_func=lambda rerun: f"rerun {rerun} ({profiles[rerun].mode}, {profiles[rerun].total_ms:.0f}ms)",
+    )
+    profile = profiles[selected]
+    if profile.note:
+        st.caption(profile.note)
+    st.dataframe(
+        [
+            {
+                "name": "  " * s.depth + s.name, "kind": s.kind, "start_ms": round(s.start_ms, 1),
+                "duration_ms": round(s.duration_ms, 1),
+                "first_token_ms": round(s.first_token_ms, 1) if s.first_token_ms is not None else None,
+                "error": s.error,
+            }
+            for s in sorted(profile.spans, key=lambda s: s.start_ms)
+        ],
+        hide_index=True, use_container_width=True,
+    )
+    if profile.top_functions:
+        st.dataframe(profile.top_functions, hide_index=True, use_container_width=True)
+        st.download_button(
+            "⬇️ pstats (.prof)", profile.pstats_data, file_name=f"rerun-{profile.rerun}.prof",
+            key=f"download_pstats_{profile.rerun}",
+        )
+    if profile.folded_stacks:
+        st.download_button(
+            "⬇️ folded stacks (flame graph)", profile.folded_stacks, file_name=f"rerun-{profile.rerun}.folded",
+            key=f"download_folded_{profile.rerun}",
+        )
+        st.caption("speedscope.app, flamegraph.pl, inferno-flamegraph에서 열 수 있습니다.")
@@ -4,11 +4,22 @@ from ui.components.input_forms import (
     render_essay_questions_form,
     render_experience_form
 )
+from ui.components.profile_form import current_profile_key, render_profile_form
+from ui.components.session_io import render_session_import
+from tools.profile_store import get_profile_store
+from chains.experience_context import experience_text_hash, has_parsed_experiences, store_parsed_experiences
+from chains.parsing_chain import parse_experiences_from_text
+from tools.background import submit_background
 
 def render_step1():
     st.header("1단계: 기본 정보 입력")
     st.markdown("---")
     
+    # 0. 저장된 프로필 (경험/가이드 미리 채우기) 또는 내보낸 작업 상태
+    render_profile_form()
+    render_session_import()
+    st.markdown("---")
+    
     # 1. 채용 정보
     render_job_details_form()
     st.markdown("---")
@@ -46,6 +57,8 @@ def _save_and_proceed():
     state["position_name"] = position_name
     state["job_posting"] = job_content
     state["job_posting_url"] = job_url
+    # 스크래핑한 구조화 데이터 정리본 (공고가 그대로면 2단계에서 정리 생략)
+    state["structured_job_posting"] = st.session_state.get("scraped_structured_posting")
     
     # Dynamic lists -> State mapping
     if "temp_questions" in st.session_state:
@@ -55,6 +68,19 @@ def _save_and_proceed():
     user_exp = st.session_state.get("input_user_experiences", "").strip()
     state["user_experiences"] = user_exp
     
+    # 비밀 문구로 연 프로필이 있을 때만 경험 원문을 저장 (원문이 같으면 기존 파싱 결과 유지)
+    # 프로필 이름 입력칸 값은 검증 전이므로 사용하지 않음
+    profile_key = current_profile_key()
+    if profile_key:
+        get_profile_store().save_experiences(profile_key, user_exp)
+    
+    # 문항별 관련 경험 검색을 위해 경험 구조화는 백그라운드에서 미리 수행 (6단계에서 사용)
+    if user_exp and not has_parsed_experiences(state):
+        st.session_state.experience_parsing = (
+            experience_text_hash(user_exp),
+            submit_background(parse_experiences_from_text, user_exp, hold_slot=False),
+        )
+    
     # 검증이 필요함을 표시하는 플래그 설정 (step2에서 자동 검증 트리거)
     st.session_state.need_validation = True
     
@@ -73,3 +99,35 @@ def _save_and_proceed():
     
     # 2단계 진입 시 검증 로직이 다시 실행되도록 플래그 초기화 (필요 시)
     st.rerun()
+
+def resolve_experience_parsing(state, wait: bool = False):
+    """백그라운드 경험 파싱이 끝났으면 결과를 State에 반영
+
+    Args:
+        state: 현재 세션 상태
+        wait: True면 파싱이 끝날 때까지 대기 (6단계 초안 생성 직전)
+    """
+    pending = st.session_state.get("experience_parsing")
+    if pending is None:
+        return
+    text_hash, future = pending
+    if not wait and not future.done():
+        return
+    del st.session_state["experience_parsing"]
+    
+    try:
+        experiences = future.result()
+    except Exception as e:
+        # 파싱 결과가 없으면 문항별로 전체 경험 텍스트를 사용
+        print(f"Experience parsing error: {e}")
+        return
+    
+    # 파싱 도중 경험 내용이 수정된 경우 이전 결과는 버림
+    user_exp = state.get("user_experiences", "")
+    if experience_text_hash(user_exp) == text_hash:
+        store_parsed_experiences(state, experiences, user_exp)
+        # 다음 지원서에서 재파싱 없이 재사용
+        if current_profile_key():
+            get_profile_store().save_experiences(
+                current_profile_key(), user_exp, experiences, state["parsed_experiences_hash"]
+            )
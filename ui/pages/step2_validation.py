@@ -1,5 +1,10 @@
 import streamlit as st
-from workflow.nodes.validation_node import validate_info
+from chains.validation_chain import (
+    find_cached_validation,
+    remember_validation,
+    stream_resume_input_validation
+)
+from workflow.nodes.validation_node import build_validation_update
 
 def render_step2():
     st.header("2단계: 필수 정보 검증")
@@ -13,7 +18,7 @@ def render_step2():
         # 검증 수행 중 UI 비활성화
         with st.spinner("입력하신 정보를 분석하고 있습니다..."):
             try:
-                result = validate_info(state)
+                result = _run_streaming_validation(state)
                 
                 # 상태 업데이트
                 state.update(result)
@@ -92,6 +97,41 @@ def render_step2():
                     
                 st.rerun()
 
+def _run_streaming_validation(state) -> dict:
+    """검증 결과를 필드 단위로 받아 판정 카드를 먼저 표시하고 State 업데이트 dict 반환
+    
+    이전에 검증한 공고와 근접 중복이면 LLM 호출 없이 기존 결과를 재사용합니다.
+    """
+    cached = find_cached_validation(state)
+    if cached is not None:
+        result, similarity = cached
+        st.toast(f"♻️ 이전에 검증한 공고와 거의 같아(유사도 {similarity:.0%}) 검증 결과를 재사용했습니다.")
+        return build_validation_update(result)
+    
+    col1, col2 = st.columns(2)
+    placeholders = {
+        "company_name": (col1.empty(), "회사명 / 직무명"),
+        "job_posting": (col2.empty(), "채용공고"),
+    }
+    progress_placeholder = st.empty()
+    progress_placeholder.caption("⏳ 항목별 판정을 기다리는 중입니다...")
+    
+    stream = stream_resume_input_validation(state)
+    for name, value in stream:
+        if name in placeholders:
+            placeholder, title = placeholders[name]
+            with placeholder.container():
+                _render_status_card(title, value.status)
+                st.caption(value.reason)
+            progress_placeholder.caption("⏳ 채용공고 내용을 정리하는 중입니다...")
+        elif name == "cleaned_job_posting":
+            progress_placeholder.caption(f"✅ 채용공고 정리 완료 ({len(value)}자)")
+    
+    assert stream.result is not None
+    # State의 공고가 정리본으로 바뀌기 전에 원문 기준으로 색인
+    remember_validation(state, stream.result)
+    return build_validation_update(stream.result)
+
 def _render_status_card(title, status):
     """상태 카드 렌더링 헬퍼"""
     colors = {
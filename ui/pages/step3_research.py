@@ -1,6 +1,9 @@
 import streamlit as st
 from models.output_models import CompanyResearch
+from models.state import get_content
 from config.prompts import DEEP_RESEARCH_PROMPT
+from config.settings import settings
+from tools.research_cache import get_research_cache
 
 def render_step3():
     st.header("3단계: 기업 리서치 (Deep Research)")
@@ -24,17 +27,23 @@ def render_step3():
     # 2. 결과 입력 섹션
     st.subheader("2. 리서치 결과 입력")
     
+    # 같은 회사/직무로 다른 지원서에서 저장한 리서치가 있으면 바로 사용 제안
+    cached = _latest_cached_research(state.get("company_name", ""), state.get("position_name", ""))
+    
     # 기존에 저장된 값이 있으면 불러오기
-    current_content = ""
-    if state.get("company_research"):
-        company_research = state["company_research"]
-
-        if isinstance(company_research, CompanyResearch):
-            current_content = company_research.content
-        elif isinstance(company_research, dict):
-            current_content = company_research.get("content", "")
-        else:
-            current_content = str(company_research)
+    current_content = get_content(state.get("company_research"))
+    
+    if cached and cached.content != current_content:
+        col_info, col_btn = st.columns([3, 1])
+        with col_info:
+            st.success(
+                f"📚 '{cached.company_name} / {cached.position_name}' 리서치 리포트가 저장되어 있습니다. "
+                f"(v{cached.version}, {cached.age_days:.0f}일 전, {len(cached.content):,}자)"
+            )
+        with col_btn:
+            if st.button("저장된 리포트 사용", use_container_width=True):
+                state["company_research"] = CompanyResearch(content=cached.content)
+                st.rerun()
         
     research_content = st.text_area(
         "리서치 리포트 내용을 여기에 붙여넣으세요:",
@@ -59,6 +68,9 @@ def render_step3():
             else:
                 # 결과 저장
                 state["company_research"] = CompanyResearch(content=research_content)
+                # 다른 지원자도 재사용할 수 있도록 공용 캐시에 저장 (내용이 같으면 버전 유지)
+                get_research_cache().save(state["company_name"], state["position_name"], research_content)
+                _latest_cached_research.clear()
                 
                 # 다음 단계로 이동
                 state["current_step"] = 4
@@ -71,6 +83,11 @@ def render_step3():
                     
                 st.rerun()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _latest_cached_research(company_name: str, position_name: str):
+    """공용 캐시 조회 결과 (매 실행마다 SQLite 조회/압축 해제를 반복하지 않도록 캐시)"""
+    return get_research_cache().latest(company_name, position_name, settings.research_cache_ttl_days)
+
 def _generate_research_prompt(state) -> str:
     """Deep Research용 프롬프트 생성"""
     company = state.get("company_name", "")
@@ -1,15 +1,23 @@
 import streamlit as st
 from langchain_core.messages import HumanMessage, AIMessage
 from chains.strategy_chain import (
+    build_initial_strategy_inputs,
     create_initial_strategy_chain, 
     create_feedback_strategy_chain,
-    create_strategy_extraction_chain,
+    extract_writing_strategy,
     get_provider_for_model
 )
+from config.model_router import route_model
+from config.settings import settings
+from models.output_models import WritingStrategy
+from models.state import get_content
+from tools.background import submit_background
+from tools.chat_history import build_strategy_feedback_history
 from tools.llm_util import (
     MODEL_PROVIDER_MAP,
     MODEL_DISPLAY_NAMES
 )
+from tools.strategy_parser import parse_strategy_markdown
 
 
 @st.dialog("⚠️ 전략 저장 확인")
@@ -28,31 +36,57 @@ def show_overwrite_dialog(last_ai_message, state):
             _save_strategy(last_ai_message, state)
 
 def _save_strategy(content, state):
-    """전략 추출 및 저장 로직"""
-    with st.spinner("💾 전략을 시스템에 저장하고 다음 단계로 이동 중입니다..."):
-        try:
-            extraction_chain = create_strategy_extraction_chain()
-            structured_strategy = extraction_chain.invoke({"content": content})
-            
-            # 텍스트 원본도 포함
-            structured_strategy.content = content
-            
-            # State 저장
-            state["writing_strategy"] = structured_strategy
-            state["current_step"] = 5
+    """전략 저장 및 단계 이동
+    
+    다음 단계에서는 전략 원문(content)만 사용하므로 로컬 파서로 즉시 구조화하고,
+    로컬 파싱이 실패한 경우에만 LLM 추출을 백그라운드로 돌린 채 바로 이동합니다.
+    """
+    structured_strategy = parse_strategy_markdown(content)
+    if structured_strategy is None:
+        structured_strategy = WritingStrategy(
+            core_competencies=[],
+            talent_traits=[],
+            user_strengths=[],
+            user_gaps=[],
+            question_strategy={},
+            cautions=[],
+            content=content,
+        )
+        st.session_state.strategy_extraction = submit_background(extract_writing_strategy, content)
+    else:
+        st.session_state.pop("strategy_extraction", None)
+    
+    # State 저장
+    state["writing_strategy"] = structured_strategy
+    state["current_step"] = 5
 
-            # 4단계 완료 처리
-            if "completed_steps" not in state:
-                state["completed_steps"] = []
+    # 4단계 완료 처리
+    if "completed_steps" not in state:
+        state["completed_steps"] = []
 
-            if 4 not in state["completed_steps"]:
-                state["completed_steps"].append(4)
-            
-            st.rerun()
-        except Exception as e:
-            
-            
-            st.error(f"❌ 데이터 저장 중 오류가 발생했습니다: {e}")
+    if 4 not in state["completed_steps"]:
+        state["completed_steps"].append(4)
+    
+    st.rerun()
+
+def resolve_strategy_extraction(state):
+    """백그라운드 전략 추출이 끝났으면 결과를 State에 반영 (매 실행마다 호출)"""
+    future = st.session_state.get("strategy_extraction")
+    if future is None or not future.done():
+        return
+    del st.session_state["strategy_extraction"]
+    
+    try:
+        extracted = future.result()
+    except Exception as e:
+        # 원문(content)은 이미 저장되어 있으므로 구조화 목록만 비어 있는 상태로 진행
+        print(f"Strategy extraction error: {e}")
+        return
+    
+    # 추출 도중 전략이 다시 저장된 경우 이전 결과는 버림
+    current = state.get("writing_strategy")
+    if current is not None and getattr(current, "content", None) == extracted.content:
+        state["writing_strategy"] = extracted
 
 def render_step4():
     st.header("4단계: 지원서 작성 전략 수립")
@@ -62,14 +96,7 @@ def render_step4():
     
     # 선행 단계 데이터 검증
     # company_research가 Pydantic 모델인지 dict인지 확인하여 content 추출
-    research_obj = state.get("company_research")
-    research_content = None
-    if research_obj:
-        if hasattr(research_obj, "content"):
-            research_content = research_obj.content
-        elif isinstance(research_obj, dict):
-            research_content = research_obj.get("content")
-            
+    research_content = get_content(state.get("company_research"))
     has_research = bool(research_content)
     has_posting = state.get("job_posting")
     
@@ -87,6 +114,10 @@ def render_step4():
         st.session_state.strategy_messages = []
         st.session_state.strategy_initial_generated = False
     
+    # 모델 선택 기본값은 라우터가 "strategy" 정책(품질 등급, 지연 SLO, 비용 상한)으로 결정
+    if "strategy_model_index" not in st.session_state:
+        st.session_state.strategy_model_index = list(MODEL_PROVIDER_MAP).index(route_model("strategy"))
+    
     # 채팅 컨테이너
     chat_container = st.container()
     
@@ -108,33 +139,14 @@ def render_step4():
         with chat_container:
             with st.chat_message("ai"):
                 # 현재 선택된 모델 가져오기 (기본값 또는 세션값)
-                current_index = st.session_state.get("strategy_model_index", 0)
+                current_index = st.session_state.strategy_model_index
                 model_keys = list(MODEL_PROVIDER_MAP.keys())
                 current_model = model_keys[current_index]
 
                 with st.spinner(f"🤖 AI가 채용공고와 리서치 결과를 분석하여 전략을 수립 중입니다... ({MODEL_DISPLAY_NAMES.get(current_model, current_model)})"):
                     try:
                         chain = create_initial_strategy_chain(model=current_model)
-                        
-                        # 리서치 콘텐츠 안전하게 추출
-                        c_research = state.get("company_research")
-                        c_content = "리서치 정보 없음"
-                        if c_research:
-                            if hasattr(c_research, "content"):
-                                c_content = c_research.content
-                            elif isinstance(c_research, dict):
-                                c_content = c_research.get("content", "리서치 정보 없음")
-
-                        input_data = {
-                            "company_name": state["company_name"],
-                            "position_name": state["position_name"],
-                            "job_posting": state["job_posting"],
-                            "company_research": c_content,
-                            "essay_questions": "\n".join([f"{i+1}. {q['question_text']}" for i, q in enumerate(state["essay_questions"])]),
-                            "user_experiences": state["user_experiences"]
-                        }
-                        
-                        result = chain.invoke(input_data)
+                        result = chain.invoke(build_initial_strategy_inputs(state))
                         ai_content = result.content
                         
                         # 화면에 즉시 표시 및 상태 저장
@@ -163,7 +175,6 @@ def render_step4():
                 "사용할 AI 모델",
                 options=range(len(model_keys)),
                 format_func=lambda i: model_labels[i],
-                index=st.session_state.get("strategy_model_index", 0),
                 key="strategy_model_index",
                 help="더 강력한 모델일수록 응답 품질이 높지만 속도가 느릴 수 있습니다."
             )
@@ -209,7 +220,7 @@ def render_step4():
         with chat_container:
             with st.chat_message("ai"):
                 # 현재 선택된 모델 가져오기
-                current_index = st.session_state.get("strategy_model_index", 0)
+                current_index = st.session_state.strategy_model_index
                 model_keys = list(MODEL_PROVIDER_MAP.keys())
                 current_model = model_keys[current_index]
                 
@@ -218,7 +229,11 @@ def render_step4():
                         feedback_chain = create_feedback_strategy_chain(model=current_model)
                         
                         # 채팅 히스토리 변환 (마지막 사용자 메시지 제외)
-                        chat_history = st.session_state.strategy_messages[:-1]
+                        # 최신 전략 문서 + 이전 요청 요약만 예산 내에서 전달
+                        chat_history = build_strategy_feedback_history(
+                            st.session_state.strategy_messages[:-1],
+                            token_budget=settings.strategy_history_token_budget,
+                        )
                         
                         result = feedback_chain.invoke({
                             "chat_history": chat_history,
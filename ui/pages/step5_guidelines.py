@@ -2,8 +2,10 @@ import streamlit as st
 
 from chains.guideline_chain import (
     DEFAULT_GUIDELINE_TEXT,
-    ai_validate_guidelines
+    stream_guideline_validation
 )
+from tools.profile_store import get_profile_store
+from ui.components.profile_form import current_profile_key
 
 def render_step5():
     st.header("5단계: 작성 요령 가이드 확인")
@@ -37,13 +39,26 @@ def render_step5():
     if update_submitted:
         if edited_guidelines and edited_guidelines != state["writing_guidelines"]:
             with st.spinner("🤖 AI가 수정된 가이드를 검토하고 업데이트 중입니다..."):
-                updated_text = ai_validate_guidelines(edited_guidelines).improved_guideline
-                state["writing_guidelines"] = updated_text
+                result = _stream_guideline_review(edited_guidelines)
+                state["writing_guidelines"] = result.improved_guideline
+                st.session_state.guideline_review = {
+                    "issues": result.issues,
+                    "suggestions": result.suggestions,
+                    "edits": [_format_edit(e) for e in result.edits],
+                }
                 st.success("✅ 가이드라인이 업데이트되었습니다!")
                 st.rerun()
         else:
             st.info("변경된 내용이 없습니다.")
 
+    # 직전 AI 검수 결과 (재실행 후에도 확인 가능하도록 유지)
+    review = st.session_state.get("guideline_review")
+    if review and (review["issues"] or review["suggestions"] or review.get("edits")):
+        with st.expander("🔎 직전 AI 검수 결과", expanded=False):
+            _render_review_items("발견된 문제점", review["issues"])
+            _render_review_items("개선 제안", review["suggestions"])
+            _render_review_items("반영된 수정", review.get("edits", []))
+
     # 2. 하단 네비게이션
     st.markdown("---")
     nav_col1, nav_col2 = st.columns([1, 3])
@@ -57,7 +72,42 @@ def render_step5():
         if st.button("✅ 가이드 확정 및 초안 작성 (다음) 👉", type="primary", use_container_width=True):
             # 최종 확정된 내용을 상태에 저장 (이미 폼 제출 시 저장되지만 확신을 위해)
             state["writing_guidelines"] = edited_guidelines
+            # 다음 지원서에서 마지막 가이드를 기본값으로 사용
+            if current_profile_key():
+                get_profile_store().save_guidelines(current_profile_key(), edited_guidelines)
             state["current_step"] = 6
             if 5 not in state["completed_steps"]:
                 state["completed_steps"].append(5)
             st.rerun()
+
+def _stream_guideline_review(user_text: str):
+    """검수 결과를 필드 단위로 받아 문제점/제안을 개선본보다 먼저 표시"""
+    issues_placeholder = st.empty()
+    suggestions_placeholder = st.empty()
+    
+    stream = stream_guideline_validation(user_text)
+    for name, value in stream:
+        if name == "issues":
+            with issues_placeholder.container():
+                _render_review_items("발견된 문제점", value)
+        elif name == "suggestions":
+            with suggestions_placeholder.container():
+                _render_review_items("개선 제안", value)
+    
+    return stream.result
+
+def _format_edit(edit) -> str:
+    """수정 연산 한 건의 표시 문자열"""
+    if edit.op == "replace":
+        return f"~~{edit.target}~~ → {edit.text}"
+    if edit.op == "insert":
+        return f"{edit.target} 뒤에 추가: {edit.text.strip()}"
+    return f"~~{edit.target}~~ 삭제"
+
+def _render_review_items(title: str, items: list[str]):
+    """검수 항목 목록 렌더링 헬퍼"""
+    if not items:
+        return
+    st.markdown(f"**{title}**")
+    for item in items:
+        st.markdown(f"- {item}")
@@ -1,5 +1,12 @@
 import streamlit as st
-from chains.writing_chain import generate_drafts
+from chains.writing_chain import generate_draft_candidates
+from config.settings import settings
+from ui.components.display import render_guideline_violations
+from ui.pages.step1_input import resolve_experience_parsing
+
+def option_label(index: int) -> str:
+    """후보 번호(0부터) -> 옵션 표시 문자 (A, B, C, ...)"""
+    return chr(ord("A") + index)
 
 def render_step6():
     st.header("6단계: 초안 작성 및 선택")
@@ -23,17 +30,29 @@ def render_step6():
 
     # 1. 초안 생성 (최초 1회)
     if "generated_drafts" not in state:
-        # 사용할 모델 정의 (비교용)
-        models_to_use = ["gemini-3-pro-preview", "gpt-4.1"]
+        # 모델 풀에서 문항별 후보를 생성하고 로컬 채점기로 순위 결정
+        candidate_count = settings.draft_candidates_per_question
         
-        with st.spinner("🤖 수집된 모든 정보(경험, 리서치, 전략, 가이드)를 바탕으로 2가지 초안을 작성 중입니다..."):
+        with st.spinner(f"🤖 수집된 모든 정보(경험, 리서치, 전략, 가이드)를 바탕으로 문항별 초안 후보 {candidate_count}개를 작성 중입니다..."):
+            # 문항별 관련 경험 선택에 필요한 경험 구조화 결과 대기
+            resolve_experience_parsing(state, wait=True)
             try:
-                # chains/writing_chain.py의 함수 호출 (모델 리스트 전달)
-                drafts = generate_drafts(state, models=models_to_use)
+                candidates = generate_draft_candidates(
+                    state,
+                    model_pool=settings.draft_model_pool,
+                    candidates_per_question=candidate_count,
+                    min_good=settings.draft_min_good_candidates,
+                    good_threshold=settings.draft_good_score,
+                )
+                drafts = {k: [c.text for c in v] for k, v in candidates.items()}
                 state["generated_drafts"] = drafts
-                state["draft_models"] = models_to_use  # 사용된 모델 정보 저장
+                # 문항별로 완주한 모델이 다르므로 문항 단위로 저장
+                state["draft_models"] = {k: [c.model for c in v] for k, v in candidates.items()}
+                state["draft_scores"] = {
+                    k: [vars(c.score) for c in v] for k, v in candidates.items()
+                }
                 
-                # 선택 상태 초기화 (기본값: 옵션 A(0))
+                # 선택 상태 초기화 (기본값: 최고 점수 후보(0))
                 state["draft_selections"] = {k: 0 for k in drafts.keys()}
                 # 피드백 상태 초기화
                 state["draft_feedbacks"] = {k: "" for k in drafts.keys()}
@@ -44,84 +63,25 @@ def render_step6():
                 st.error(f"❌ 초안 생성 중 오류 발생: {e}")
                 return
 
-    drafts = state["generated_drafts"]
-    models_used = state.get("draft_models", ["Model A", "Model B"])
     questions = state.get("essay_questions", [])
     
-    st.info("💡 각 문항별로 AI가 생성한 2가지 버전의 초안입니다. 더 적절한 내용을 선택하고, 수정이 필요한 부분은 피드백을 남겨주세요.")
+    st.info("💡 각 문항별로 AI가 생성한 초안 후보입니다 (로컬 채점 점수 순). 더 적절한 내용을 선택하고, 수정이 필요한 부분은 피드백을 남겨주세요.")
 
     # 2. 문항별 초안 비교 및 선택 UI
-    with st.form(key="draft_selection_form"):
-        for i, q in enumerate(questions):
-            q_idx = str(i + 1)
-            q_text = q.get("question_text", f"문항 {q_idx}")
-            
-            # 질문 문항 강조 표시 (텍스트 영역 밖)
-            st.markdown(f"#### 📝 문항 {q_idx}")
-            st.info(f"**질문:** {q_text}")
-            
-            current_drafts = drafts.get(q_idx, ["내용 없음", "내용 없음"])
-            
-            # 2열 비교 레이아웃
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"##### 🅰️ 옵션 A ({models_used[0]})")
-                st.code(
-                    current_drafts[0],
-                    height=350
-                )
-            
-            with col2:
-                st.markdown(f"##### 🅱️ 옵션 B ({models_used[1]})")
-                st.code(
-                    current_drafts[1],
-                    height=350
-                )
-            
-            # 선택 및 피드백 영역
-            sel_col, feed_col = st.columns([1, 2])
-            
-            with sel_col:
-                st.radio(
-                    f"Q{q_idx} 선택",
-                    options=[0, 1],
-                    format_func=lambda x: f"옵션 A ({models_used[0]})" if x == 0 else f"옵션 B ({models_used[1]})",
-                    key=f"sel_{i}", # 임시 키 (form_submit 시 state 업데이트용)
-                    index=state["draft_selections"].get(q_idx, 0)
-                )
-                
-            with feed_col:
-                st.text_area(
-                    "💬 피드백 (수정 요청 사항)",
-                    value=state["draft_feedbacks"].get(q_idx, ""),
-                    placeholder="선택한 옵션에서 보완하고 싶은 내용이나 수정 요청사항을 적어주세요. (다음 단계에서 반영됩니다)",
-                    height=100,
-                    key=f"feed_{i}"
-                )
-            
-            st.markdown("---")
-        
-        # 제출 버튼
-        submit_col1, submit_col2 = st.columns([1, 3])
-        with submit_col2:
-            submitted = st.form_submit_button("✅ 선택 및 피드백 완료 (다음 단계로) 👉", type="primary", use_container_width=True)
+    # 문항마다 독립된 fragment로 렌더링하여 선택/피드백 변경 시 해당 문항만 다시 그림
+    for i, q in enumerate(questions):
+        _render_question_panel(i, q)
+    
+    # 3. 제출 처리 (선택/피드백은 위젯 변경 시 이미 state에 반영됨)
+    submit_col1, submit_col2 = st.columns([1, 3])
+    with submit_col2:
+        submitted = st.button("✅ 선택 및 피드백 완료 (다음 단계로) 👉", type="primary", use_container_width=True)
 
-    # 3. 폼 제출 처리
     if submitted:
-        # 폼 내부의 위젯 값들을 state에 저장
-        for i, q in enumerate(questions):
-            q_idx = str(i + 1)
-            
-            # 선택값 저장 (session_state 키 규칙에 따름)
-            selected_option = st.session_state.get(f"sel_{i}", 0)
-            state["draft_selections"][q_idx] = selected_option
-            
-            # 피드백 저장
-            feedback_text = st.session_state.get(f"feed_{i}", "")
-            state["draft_feedbacks"][q_idx] = feedback_text
-            # (선택된 텍스트 자체를 별도로 저장해두면 7단계에서 쓰기 편함)
-            # 여기서는 selections 인덱스만 저장하고 7단계에서 drafts[idx][selected] 로 접근하도록 함
+        # 마지막 입력이 아직 on_change로 반영되지 않았을 수 있으므로 한 번 더 동기화
+        for i in range(len(questions)):
+            _store_selection(i)
+            _store_feedback(i)
         
         if 6 not in state["completed_steps"]:
             state["completed_steps"].append(6)
@@ -130,7 +90,96 @@ def render_step6():
         state["current_step"] = 7
         st.rerun()
 
-    # 하단 이전 버튼 (폼 밖)
+    # 하단 이전 버튼
     if st.button("👈 이전 단계"):
         state["current_step"] = 5
         st.rerun()
+
+@st.fragment
+def _render_question_panel(i: int, q: dict):
+    """문항 하나의 후보 비교/선택/피드백 패널 (fragment: 이 패널의 위젯 변경은 패널만 재실행)"""
+    state = st.session_state.resume_state
+    q_idx = str(i + 1)
+    q_text = q.get("question_text", f"문항 {q_idx}")
+    
+    # 질문 문항 강조 표시 (텍스트 영역 밖)
+    st.markdown(f"#### 📝 문항 {q_idx}")
+    st.info(f"**질문:** {q_text}")
+    
+    current_drafts = state["generated_drafts"].get(q_idx) or ["내용 없음"]
+    models_used = _models_for_question(state, q_idx, len(current_drafts))
+    scores = state.get("draft_scores", {}).get(q_idx, [])
+    
+    # 후보 비교 레이아웃 (후보 수만큼 열 생성)
+    columns = st.columns(len(current_drafts))
+    for j, (col, draft) in enumerate(zip(columns, current_drafts)):
+        with col:
+            st.markdown(f"##### 옵션 {option_label(j)} ({models_used[j]})")
+            if j < len(scores):
+                _render_score_caption(scores[j])
+            st.code(
+                draft,
+                height=350
+            )
+            render_guideline_violations(draft, state.get("writing_guidelines"))
+    
+    # 선택 및 피드백 영역
+    sel_col, feed_col = st.columns([1, 2])
+    
+    with sel_col:
+        st.radio(
+            f"Q{q_idx} 선택",
+            options=list(range(len(current_drafts))),
+            format_func=lambda x: f"옵션 {option_label(x)} ({models_used[x]})",
+            key=f"sel_{i}",
+            index=min(state["draft_selections"].get(q_idx, 0), len(current_drafts) - 1),
+            on_change=_store_selection,
+            args=(i,)
+        )
+        
+    with feed_col:
+        st.text_area(
+            "💬 피드백 (수정 요청 사항)",
+            value=state["draft_feedbacks"].get(q_idx, ""),
+            placeholder="선택한 옵션에서 보완하고 싶은 내용이나 수정 요청사항을 적어주세요. (다음 단계에서 반영됩니다)",
+            height=100,
+            key=f"feed_{i}",
+            on_change=_store_feedback,
+            args=(i,)
+        )
+    
+    st.markdown("---")
+
+def _store_selection(i: int):
+    """선택한 후보 인덱스를 state에 반영"""
+    state = st.session_state.resume_state
+    if f"sel_{i}" in st.session_state:
+        state["draft_selections"][str(i + 1)] = st.session_state[f"sel_{i}"]
+
+def _store_feedback(i: int):
+    """피드백 입력을 state에 반영"""
+    state = st.session_state.resume_state
+    if f"feed_{i}" in st.session_state:
+        state["draft_feedbacks"][str(i + 1)] = st.session_state[f"feed_{i}"]
+
+def _models_for_question(state, q_idx: str, count: int) -> list[str]:
+    """문항별 모델 목록 조회 (이전 형식: 전 문항 공용 리스트도 지원)"""
+    draft_models = state.get("draft_models")
+    if isinstance(draft_models, dict):
+        models = list(draft_models.get(q_idx, []))
+    elif isinstance(draft_models, list):
+        models = list(draft_models)
+    else:
+        models = []
+    models += [f"Model {option_label(j)}" for j in range(len(models), count)]
+    return models
+
+def _render_score_caption(score: dict):
+    """로컬 채점 결과 요약 표시"""
+    caption = (
+        f"점수 {score['total']:.2f} · 글자 수 {score['char_count']}자"
+        f" · 키워드 반영 {score['keyword_coverage']:.0%}"
+    )
+    if score.get("violations"):
+        caption += f" · ⚠️ 가이드라인 위반 {len(score['violations'])}건"
+    st.caption(caption)
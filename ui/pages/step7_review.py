@@ -1,5 +1,16 @@
+from dataclasses import asdict
+
 import streamlit as st
-from chains.review_chain import generate_final_essays
+from chains.review_chain import generate_final_essays, plan_final_reviews
+from tools.profile_store import get_profile_store
+from ui.components.display import render_guideline_violations
+from ui.components.profile_form import current_profile_key
+
+TRIAGE_LABELS = {
+    "accept": "✅ 그대로 채택 (호출 없음)",
+    "light": "⚡ 가벼운 다듬기",
+    "full": "🧠 전체 검토",
+}
 
 def render_step7():
     st.header("7단계: 최종 초안 검토 (Review)")
@@ -32,7 +43,10 @@ def render_step7():
     if st.button("🚀 최종 초안 생성하기", type="primary", use_container_width=True):
         with st.spinner("피드백을 반영하여 최종안을 다듬고 있습니다..."):
             try:
-                final_essays = generate_final_essays(state)
+                # 문항별로 호출 생략/flash/pro 경로를 먼저 정하고 그대로 생성
+                plan = plan_final_reviews(state)
+                state["review_triage"] = {q_idx: asdict(triage) for q_idx, triage in plan.items()}
+                final_essays = generate_final_essays(state, plan)
                 state["confirmed_essays"] = final_essays
                 st.rerun()
             except Exception as e:
@@ -49,22 +63,46 @@ def render_step7():
             # 디버깅을 위해 선택된 원본이라도 보여줄 수 있는 로직이 있으면 좋겠지만,
             # 현재는 지시대로 빈 함수이므로 비어있음으로 처리
         
+        # 문항별 검토 경로 (어떤 문항이 어떤 모델로 처리되었는지)
+        triage_plan = state.get("review_triage", {})
+        if triage_plan:
+            with st.expander("🔀 문항별 검토 경로", expanded=False):
+                st.dataframe(
+                    [
+                        {
+                            "문항": q_idx,
+                            "처리": TRIAGE_LABELS.get(t["decision"], t["decision"]),
+                            "모델": t.get("model") or "-",
+                            "사유": t["reason"],
+                        }
+                        for q_idx, t in triage_plan.items()
+                    ],
+                    hide_index=True,
+                    use_container_width=True,
+                )
+        
         for i, q in enumerate(questions):
             q_idx = str(i + 1)
             q_text = q.get("question_text", f"문항 {q_idx}")
             
             st.markdown(f"#### 📝 문항 {q_idx}")
             st.write(f"**Q. {q_text}**")
+            if q_idx in triage_plan:
+                triage = triage_plan[q_idx]
+                model = f" · {triage['model']}" if triage.get("model") else ""
+                st.caption(f"{TRIAGE_LABELS.get(triage['decision'], triage['decision'])}{model} — {triage['reason']}")
             
             # 생성된 최종본 가져오기
             content = final_essays.get(q_idx, "내용이 생성되지 않았습니다.")
             
-            st.text_area(
+            edited = st.text_area(
                 f"최종안 - 문항 {q_idx}",
                 value=content,
                 height=400,
                 key=f"final_essay_{i}"
             )
+            # 직접 수정한 내용도 다시 검사 (text_area 변경 시 재실행)
+            render_guideline_violations(edited, state.get("writing_guidelines"), expanded=True)
             st.markdown("---")
 
         # 네비게이션
@@ -84,6 +122,18 @@ def render_step7():
                     if edited_content:
                         state["confirmed_essays"][q_idx] = edited_content
                 
+                # 확정본을 프로필에 보관
+                if current_profile_key():
+                    get_profile_store().add_essays(
+                        current_profile_key(),
+                        state.get("company_name", ""),
+                        state.get("position_name", ""),
+                        [
+                            (q.get("question_text", ""), state["confirmed_essays"].get(str(i + 1), ""))
+                            for i, q in enumerate(questions)
+                        ],
+                    )
+                
                 if 7 not in state["completed_steps"]:
                     state["completed_steps"].append(7)
                 
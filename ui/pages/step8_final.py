@@ -1,5 +1,6 @@
 import streamlit as st
-from models.state import ResumeState
+from models.state import ResumeState, get_content
+from ui.components.session_io import render_session_export
 
 def render_step8():
     st.header("8단계: 최종 결과 (Final Result)")
@@ -17,53 +18,11 @@ def render_step8():
 
     st.success("🎉 모든 과정이 완료되었습니다! 아래에서 전체 내용을 확인하고 복사하세요.")
 
-    # 1. 입력 정보 (토글 숨김)
-    with st.expander("1. 입력 정보 (Input Data)", expanded=False):
-        st.caption("사용자가 초기에 입력한 기본 정보입니다.")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.text_input("기업명", value=state.get("company_name", ""), disabled=True)
-        with col2:
-            st.text_input("직무명", value=state.get("position_name", ""), disabled=True)
-            
-        st.markdown("**채용 공고**")
-        st.text_area("채용 공고 내용", value=state.get("job_posting", ""), height=200, disabled=True)
-        
-        st.markdown("**사용자 경험/경력**")
-        st.text_area("경험/경력 내용", value=state.get("user_experiences", ""), height=200, disabled=True)
-
-    # 2. 리서치 결과 (토글 숨김)
-    with st.expander("2. 기업 리서치 결과 (Research)", expanded=False):
-        research = state.get("company_research")
-        content = ""
-        if research:
-            if hasattr(research, "content"):
-                content = research.content
-            elif isinstance(research, dict):
-                content = research.get("content", "")
-        
-        st.text_area("리서치 내용", value=content, height=300, disabled=True)
-
-    # 3. 작성 전략 (토글 숨김)
-    with st.expander("3. 작성 전략 (Strategy)", expanded=False):
-        strategy = state.get("writing_strategy")
-        content = ""
-        if strategy:
-            if hasattr(strategy, "content"):
-                content = strategy.content
-            elif isinstance(strategy, dict):
-                content = strategy.get("content", "")
-        
-        st.markdown(content) # 전략은 마크다운으로 보는게 가독성이 좋음
-        # 원본 텍스트 복사용
-        with st.popover("전략 텍스트 복사하기"):
-            st.code(content, language=None)
-
-    # 4. 작성 가이드 (토글 숨김)
-    with st.expander("4. 작성 가이드 (Guidelines)", expanded=False):
-        guidelines = state.get("writing_guidelines", "")
-        st.text_area("가이드라인", value=guidelines, height=200, disabled=True)
+    # 1~4. 참고 자료 (펼칠 때만 렌더링: 원문이 길어 매 실행마다 그리면 느림)
+    _render_lazy_section("1. 입력 정보 (Input Data)", "input", _render_input_section)
+    _render_lazy_section("2. 기업 리서치 결과 (Research)", "research", _render_research_section)
+    _render_lazy_section("3. 작성 전략 (Strategy)", "strategy", _render_strategy_section)
+    _render_lazy_section("4. 작성 가이드 (Guidelines)", "guidelines", _render_guidelines_section)
 
     # 5. 최종 자기소개서 (기본 열림)
     with st.expander("5. 최종 자기소개서 (Final Essays)", expanded=True):
@@ -81,7 +40,47 @@ def render_step8():
             st.code(content, language=None) # 복사하기 편하도록 code 블록 사용
             st.markdown("---")
 
+    # 작업 상태 파일로 보관 (1단계에서 불러오기 가능)
+    render_session_export()
+    
     # 홈으로 돌아가기 또는 초기화
     if st.button("🔄 처음부터 다시 하기 (데이터 초기화)"):
         st.session_state.clear()
         st.rerun()
+
+@st.fragment
+def _render_lazy_section(title: str, key: str, render_body):
+    """토글을 켰을 때만 내용을 그리는 섹션 (fragment: 토글 시 이 섹션만 재실행)"""
+    if st.toggle(title, key=f"show_final_{key}"):
+        with st.container(border=True):
+            render_body(st.session_state.resume_state)
+
+def _render_input_section(state):
+    st.caption("사용자가 초기에 입력한 기본 정보입니다.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.text_input("기업명", value=state.get("company_name", ""), disabled=True)
+    with col2:
+        st.text_input("직무명", value=state.get("position_name", ""), disabled=True)
+        
+    st.markdown("**채용 공고**")
+    st.text_area("채용 공고 내용", value=state.get("job_posting", ""), height=200, disabled=True)
+    
+    st.markdown("**사용자 경험/경력**")
+    st.text_area("경험/경력 내용", value=state.get("user_experiences", ""), height=200, disabled=True)
+
+def _render_research_section(state):
+    content = get_content(state.get("company_research"))
+    st.text_area("리서치 내용", value=content, height=300, disabled=True)
+
+def _render_strategy_section(state):
+    content = get_content(state.get("writing_strategy"))
+    st.markdown(content) # 전략은 마크다운으로 보는게 가독성이 좋음
+    # 원본 텍스트 복사용
+    with st.popover("전략 텍스트 복사하기"):
+        st.code(content, language=None)
+
+def _render_guidelines_section(state):
+    guidelines = state.get("writing_guidelines", "")
+    st.text_area("가이드라인", value=guidelines, height=200, disabled=True)